@@ -244,7 +244,15 @@ export default function DataFetcher({ onDataFetched }) {
         }
 
         if (onDataFetched) {
-          onDataFetched(formattedData, symbol.toUpperCase())
+          // Reference to the stored bars, so backtests can load them server-side
+          const dataRef = {
+            symbol: symbol.toUpperCase(),
+            start: startStr,
+            end: endStr,
+            interval: interval,
+            data_source: dataSource !== 'yahoo' ? dataSource : null,
+          }
+          onDataFetched(formattedData, symbol.toUpperCase(), dataRef)
         }
 
         // Reset success indicator after delay
@@ -35,6 +35,7 @@ import {
 
 export default function ResultsDisplay({
   data,
+  dataRef,
   symbol,
   strategy,
   config,
@@ -72,6 +73,7 @@ export default function ResultsDisplay({
 
       const response = await backtestService.runBacktest({
         data: data,
+        dataRef: dataRef,
         strategy: strategy,
         config: config,
         symbol: backtestSymbol,
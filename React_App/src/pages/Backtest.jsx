@@ -15,6 +15,7 @@ export default function Backtest() {
   const location = useLocation()
   const { isDark } = useThemeMode()
   const [data, setData] = useState(null)
+  const [dataRef, setDataRef] = useState(null)
   const [selectedSymbol, setSelectedSymbol] = useState(null)
   const [strategy, setStrategy] = useState(null)
   const [config, setConfig] = useState(null)
@@ -67,8 +68,9 @@ export default function Backtest() {
     }
   }, [data, strategy, config, results, userHasManuallyExpanded])
 
-  const handleDataFetched = (fetchedData, symbol) => {
+  const handleDataFetched = (fetchedData, symbol, fetchedDataRef = null) => {
     setData(fetchedData)
+    setDataRef(fetchedDataRef)
     setSelectedSymbol(symbol)
     setResults(null)
     // Reset config and strategy when new data is fetched
@@ -360,6 +362,7 @@ export default function Backtest() {
               <AccordionDetails sx={{ px: 2.5, pb: 2.5 }}>
                 <ResultsDisplay
                   data={data}
+                  dataRef={dataRef}
                   symbol={selectedSymbol}
                   strategy={strategy}
                   config={config}
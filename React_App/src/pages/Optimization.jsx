@@ -19,6 +19,7 @@ export default function Optimization() {
   const navigate = useNavigate()
   const { isDark } = useThemeMode()
   const [data, setData] = useState(null)
+  const [dataRef, setDataRef] = useState(null)
   const [selectedSymbol, setSelectedSymbol] = useState(null)
   const [strategy, setStrategy] = useState(null)
   const [config, setConfig] = useState(null)
@@ -66,8 +67,9 @@ export default function Optimization() {
     }
   }, [data, strategy, config, optimizationConfig, results, userHasManuallyExpanded])
 
-  const handleDataFetched = (fetchedData, symbol) => {
+  const handleDataFetched = (fetchedData, symbol, fetchedDataRef = null) => {
     setData(fetchedData)
+    setDataRef(fetchedDataRef)
     setSelectedSymbol(symbol)
     setResults(null)
     // Reset config and strategy when new data is fetched
@@ -145,6 +147,7 @@ export default function Optimization() {
         // Start workflow
         const workflow = await workflowService.createWorkflow({
           data,
+          dataRef,
           strategy,
           config,
           symbol: selectedSymbol,
@@ -174,6 +177,7 @@ export default function Optimization() {
         
         const response = await backtestService.optimizeParameters({
           data,
+          dataRef,
           strategy,
           config,
           symbol: selectedSymbol,
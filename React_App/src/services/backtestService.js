@@ -1,10 +1,13 @@
 import api from './api'
 
+// Send a reference to stored bars when available instead of uploading them
+const dataPayload = (data, dataRef) => (dataRef ? { data_ref: dataRef } : { data })
+
 export const backtestService = {
-  async runBacktest({ data, strategy, config, symbol, name }) {
+  async runBacktest({ data, dataRef = null, strategy, config, symbol, name }) {
     const response = await api.post('/api/backtest/run', {
       name,
-      data,
+      ...dataPayload(data, dataRef),
       strategy,
       config,
       symbol,
@@ -61,9 +64,9 @@ export const backtestService = {
     return response.data
   },
 
-  async optimizeParameters({ data, strategy, config, symbol, parameterRanges, objective = 'sharpe_ratio', optimizationType = 'grid', maxCombinations = 100 }) {
+  async optimizeParameters({ data, dataRef = null, strategy, config, symbol, parameterRanges, objective = 'sharpe_ratio', optimizationType = 'grid', maxCombinations = 100 }) {
     const response = await api.post('/api/backtest/optimize', {
-      data,
+      ...dataPayload(data, dataRef),
       strategy,
       config,
       symbol,
@@ -87,9 +90,9 @@ export const backtestService = {
 }
 
 export const workflowService = {
-  async createWorkflow({ data, strategy, config, symbol, parameterRanges, objective = 'sharpe_ratio', maxIterations = 100, nWorkers }) {
+  async createWorkflow({ data, dataRef = null, strategy, config, symbol, parameterRanges, objective = 'sharpe_ratio', maxIterations = 100, nWorkers }) {
     const response = await api.post('/api/workflows/create', {
-      data,
+      ...dataPayload(data, dataRef),
       strategy,
       config,
       symbol,
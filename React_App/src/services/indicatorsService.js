@@ -1,9 +1,9 @@
 import api from './api'
 
 export const indicatorsService = {
-  async calculateIndicators({ data, indicators }) {
+  async calculateIndicators({ data, dataRef = null, indicators }) {
     const response = await api.post('/api/indicators/calculate', {
-      data,
+      ...(dataRef ? { data_ref: dataRef } : { data }),
       indicators,
     })
     return response.data
@@ -12,6 +12,7 @@ if str(project_root) not in sys.path:
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import logging
 
 # Configure logging
@@ -57,6 +58,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (time series payloads) for clients sending Accept-Encoding: gzip
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 # Include routers
 app.include_router(database.router, prefix="/api/database", tags=["database"])
 app.include_router(data.router, prefix="/api/data", tags=["data"])
@@ -76,6 +80,12 @@ if DEPLOYMENT_AVAILABLE:
     app.include_router(deployment.router, prefix="/api/deployment", tags=["deployment"])
 
 
+@app.on_event("shutdown")
+async def shutdown_worker_pools():
+    from api.utils.optimization_pool import shutdown_optimization_pool
+    shutdown_optimization_pool()
+
+
 @app.get("/")
 async def root():
     return {"message": "QuantLib API", "version": "0.1.0"}
@@ -3,7 +3,7 @@ Pydantic models for request/response validation
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Union
 from datetime import date, datetime
 
 
@@ -41,11 +41,12 @@ class DataFetchRequest(BaseModel):
     force_refresh_all: bool = Field(False, description="Force refresh ALL data for symbol (deletes all existing data before inserting new data)")
     data_source: Optional[str] = Field(None, description="Data source (yahoo, alpha_vantage, polygon, iex_cloud). Defaults to DEFAULT_DATA_SOURCE env var or 'yahoo'")
     interval: Optional[str] = Field('1d', description="Data interval ('1d', '1h', '1m', '5m', '15m', '30m', '60m', etc.). Default '1d'")
+    format: str = Field('records', description="Response data format: 'records' (list of row dicts, default), 'columnar' (epoch-ms timestamps plus one array per column) or 'arrow' (Arrow IPC stream, requires pyarrow)")
 
 
 class DataFetchResponse(BaseModel):
     symbol: str
-    data: List[Dict[str, Any]]  # DataFrame serialized as list of dicts
+    data: Union[List[Dict[str, Any]], Dict[str, Any]]  # List of row dicts, or columnar dict
     start_date: str
     end_date: str
     row_count: int
@@ -78,9 +79,19 @@ class SymbolMetadataResponse(BaseModel):
     last_update: Optional[str] = None
 
 
+class DataReference(BaseModel):
+    """OHLCV data loaded server-side from the DataStore instead of sent inline"""
+    symbol: str = Field(..., description="Stock symbol (e.g., AAPL)")
+    start: str = Field(..., description="Start date (YYYY-MM-DD)")
+    end: str = Field(..., description="End date (YYYY-MM-DD)")
+    interval: str = Field('1d', description="Data interval ('1d', '1h', '1m', etc.)")
+    data_source: Optional[str] = Field(None, description="Data source (default 'yahoo')")
+
+
 class BacktestRequest(BaseModel):
     name: str = Field(..., min_length=1, max_length=255, description="Name for this backtest run")
-    data: List[Dict[str, Any]]  # DataFrame serialized as list of dicts
+    data: Optional[List[Dict[str, Any]]] = None  # DataFrame serialized as list of dicts
+    data_ref: Optional[DataReference] = None  # Alternative to data: load from the DataStore
     strategy: Dict[str, Any]  # Strategy name and parameters (or type='custom' with code field)
     config: Dict[str, Any]  # Backtest configuration
     symbol: str
@@ -159,7 +170,8 @@ class ParameterRange(BaseModel):
 
 class OptimizationRequest(BaseModel):
     """Request for parameter optimization"""
-    data: List[Dict[str, Any]]  # DataFrame serialized as list of dicts
+    data: Optional[List[Dict[str, Any]]] = None  # DataFrame serialized as list of dicts
+    data_ref: Optional[DataReference] = None  # Alternative to data: load from the DataStore
     strategy: Dict[str, Any]  # Strategy configuration (type and base params)
     config: Dict[str, Any]  # Backtest configuration
     symbol: str
@@ -167,6 +179,7 @@ class OptimizationRequest(BaseModel):
     objective: str = Field("sharpe_ratio", description="Objective metric to optimize (sharpe_ratio, sortino_ratio, total_return, etc.)")
     optimization_type: str = Field("grid", description="Optimization type: 'grid' or 'minimize'")
     max_combinations: Optional[int] = Field(100, description="Maximum combinations for grid search")
+    optimization_id: Optional[str] = Field(None, description="Client-chosen id for polling /optimize/{optimization_id}/progress")
 
 
 class OptimizationResult(BaseModel):
@@ -191,7 +204,8 @@ class OptimizationResponse(BaseModel):
 
 class WalkForwardRequest(BaseModel):
     """Request for walk-forward analysis"""
-    data: List[Dict[str, Any]]  # DataFrame serialized as list of dicts
+    data: Optional[List[Dict[str, Any]]] = None  # DataFrame serialized as list of dicts
+    data_ref: Optional[DataReference] = None  # Alternative to data: load from the DataStore
     strategy: Dict[str, Any]  # Strategy configuration
     config: Dict[str, Any]  # Backtest configuration
     symbol: str
@@ -247,7 +261,8 @@ class WorkflowStatus(str, Enum):
 
 class WorkflowRequest(BaseModel):
     """Request for agent workflow optimization"""
-    data: List[Dict[str, Any]] = Field(..., description="DataFrame serialized as list of dicts")
+    data: Optional[List[Dict[str, Any]]] = Field(None, description="DataFrame serialized as list of dicts")
+    data_ref: Optional[DataReference] = Field(None, description="Alternative to data: load from the DataStore")
     strategy: Dict[str, Any] = Field(..., description="Strategy configuration (type and base params)")
     config: Dict[str, Any] = Field(..., description="Backtest configuration")
     symbol: str = Field(..., description="Trading symbol")
@@ -9,7 +9,11 @@ import pandas as pd
 import numpy as np
 from typing import Dict, Any, Optional, List
 import uuid
+import asyncio
+import threading
+from functools import partial
 from itertools import product
+from concurrent.futures.process import BrokenProcessPool
 from scipy.optimize import minimize
 import logging
 
@@ -24,7 +28,7 @@ if str(project_root) not in sys.path:
 from quantlib.backtesting import BacktestEngine
 from quantlib.data import DataStore
 from quantlib.data.fetcher_registry import get_registry
-from quantlib.indicators import sma, rsi, bollinger_bands, macd
+from quantlib.indicators.streaming import SMA, RSI, BollingerBands, MACD
 from quantlib.risk import RiskCalculator
 from quantlib.risk.metrics import (
     sharpe_ratio,
@@ -36,6 +40,14 @@ from quantlib.risk.metrics import (
 )
 from quantlib.risk.drawdown import max_drawdown, max_drawdown_pct
 from quantlib.strategies import Strategy
+from quantlib.utils.frame_cache import CachedDataStore
+from quantlib.workflows.shared_data import SharedFrame, attach_frame
+from api.utils.optimization_pool import (
+    discard_optimization_pool,
+    get_optimization_pool,
+    optimization_pool_workers,
+)
+from api.utils.data_loader import resolve_request_data
 from api.models.schemas import (
     BacktestRequest,
     BacktestResponse,
@@ -81,7 +93,8 @@ class MovingAverageStrategy(Strategy):
         self.short_window = params.get('short_window', 20)
         self.long_window = params.get('long_window', 50)
         self.position = 0
-        self.prices = []
+        self.short_ma = SMA(self.short_window)
+        self.long_ma = SMA(self.long_window)
     
     def initialize(self, context):
         if hasattr(context, 'symbol'):
@@ -92,18 +105,15 @@ class MovingAverageStrategy(Strategy):
     def on_data(self, context, data):
         close_price = data.get('Close', 0)
         if close_price:
-            self.prices.append(close_price)
-            if len(self.prices) >= self.long_window:
-                prices_series = pd.Series(self.prices)
-                short_ma = sma(prices_series, self.short_window)
-                long_ma = sma(prices_series, self.long_window)
-                if len(short_ma.dropna()) > 0 and len(long_ma.dropna()) > 0:
-                    if short_ma.dropna().iloc[-1] > long_ma.dropna().iloc[-1] and self.position <= 0:
-                        context.place_order(self.symbol, 100, 'BUY')
-                        self.position = 100
-                    elif short_ma.dropna().iloc[-1] < long_ma.dropna().iloc[-1] and self.position > 0:
-                        context.place_order(self.symbol, 100, 'SELL')
-                        self.position = 0
+            short_ma = self.short_ma.update(close_price)
+            long_ma = self.long_ma.update(close_price)
+            if self.short_ma.ready and self.long_ma.ready:
+                if short_ma > long_ma and self.position <= 0:
+                    context.place_order(self.symbol, 100, 'BUY')
+                    self.position = 100
+                elif short_ma < long_ma and self.position > 0:
+                    context.place_order(self.symbol, 100, 'SELL')
+                    self.position = 0
 
 
 class RSIStrategy(Strategy):
@@ -113,7 +123,8 @@ class RSIStrategy(Strategy):
         self.rsi_oversold = params.get('rsi_oversold', 30)
         self.rsi_overbought = params.get('rsi_overbought', 70)
         self.position = 0
-        self.prices = []
+        self.rsi = RSI(self.rsi_window)
+        self.current_rsi = None
     
     def initialize(self, context):
         if hasattr(context, 'symbol'):
@@ -124,18 +135,17 @@ class RSIStrategy(Strategy):
     def on_data(self, context, data):
         close_price = data.get('Close', 0)
         if close_price:
-            self.prices.append(close_price)
-            if len(self.prices) >= self.rsi_window + 1:
-                prices_series = pd.Series(self.prices)
-                rsi_val = rsi(prices_series, self.rsi_window)
-                if len(rsi_val.dropna()) > 0:
-                    current_rsi = rsi_val.dropna().iloc[-1]
-                    if current_rsi < self.rsi_oversold and self.position <= 0:
-                        context.place_order(self.symbol, 100, 'BUY')
-                        self.position = 100
-                    elif current_rsi > self.rsi_overbought and self.position > 0:
-                        context.place_order(self.symbol, 100, 'SELL')
-                        self.position = 0
+            rsi_val = self.rsi.update(close_price)
+            if not np.isnan(rsi_val):
+                # Flat windows give NaN; keep acting on the last valid reading
+                self.current_rsi = rsi_val
+            if self.rsi.count >= self.rsi_window + 1 and self.current_rsi is not None:
+                if self.current_rsi < self.rsi_oversold and self.position <= 0:
+                    context.place_order(self.symbol, 100, 'BUY')
+                    self.position = 100
+                elif self.current_rsi > self.rsi_overbought and self.position > 0:
+                    context.place_order(self.symbol, 100, 'SELL')
+                    self.position = 0
 
 
 class BollingerBandsStrategy(Strategy):
@@ -144,7 +154,7 @@ class BollingerBandsStrategy(Strategy):
         self.bb_window = params.get('bb_window', 20)
         self.bb_std = params.get('bb_std', 2.0)
         self.position = 0
-        self.prices = []
+        self.bb = BollingerBands(self.bb_window, self.bb_std)
     
     def initialize(self, context):
         if hasattr(context, 'symbol'):
@@ -155,20 +165,14 @@ class BollingerBandsStrategy(Strategy):
     def on_data(self, context, data):
         close_price = data.get('Close', 0)
         if close_price:
-            self.prices.append(close_price)
-            if len(self.prices) >= self.bb_window:
-                prices_series = pd.Series(self.prices)
-                bb = bollinger_bands(prices_series, self.bb_window, self.bb_std)
-                if len(bb['lower'].dropna()) > 0 and len(bb['upper'].dropna()) > 0:
-                    current_price = close_price
-                    lower_band = bb['lower'].dropna().iloc[-1]
-                    upper_band = bb['upper'].dropna().iloc[-1]
-                    if current_price < lower_band and self.position <= 0:
-                        context.place_order(self.symbol, 100, 'BUY')
-                        self.position = 100
-                    elif current_price > upper_band and self.position > 0:
-                        context.place_order(self.symbol, 100, 'SELL')
-                        self.position = 0
+            self.bb.update(close_price)
+            if self.bb.ready:
+                if close_price < self.bb.lower and self.position <= 0:
+                    context.place_order(self.symbol, 100, 'BUY')
+                    self.position = 100
+                elif close_price > self.bb.upper and self.position > 0:
+                    context.place_order(self.symbol, 100, 'SELL')
+                    self.position = 0
 
 
 class MACDStrategy(Strategy):
@@ -178,7 +182,9 @@ class MACDStrategy(Strategy):
         self.macd_slow = params.get('macd_slow', 26)
         self.macd_signal = params.get('macd_signal', 9)
         self.position = 0
-        self.prices = []
+        self.macd = MACD(self.macd_fast, self.macd_slow, self.macd_signal)
+        self.prev_macd = None
+        self.prev_signal = None
     
     def initialize(self, context):
         if hasattr(context, 'symbol'):
@@ -189,21 +195,17 @@ class MACDStrategy(Strategy):
     def on_data(self, context, data):
         close_price = data.get('Close', 0)
         if close_price:
-            self.prices.append(close_price)
-            if len(self.prices) >= self.macd_slow + self.macd_signal:
-                prices_series = pd.Series(self.prices)
-                macd_result = macd(prices_series, self.macd_fast, self.macd_slow, self.macd_signal)
-                if len(macd_result['macd'].dropna()) > 0 and len(macd_result['signal'].dropna()) > 0:
-                    current_macd = macd_result['macd'].dropna().iloc[-1]
-                    current_signal = macd_result['signal'].dropna().iloc[-1]
-                    prev_macd = macd_result['macd'].dropna().iloc[-2] if len(macd_result['macd'].dropna()) > 1 else current_macd
-                    prev_signal = macd_result['signal'].dropna().iloc[-2] if len(macd_result['signal'].dropna()) > 1 else current_signal
-                    if current_macd > current_signal and prev_macd <= prev_signal and self.position <= 0:
-                        context.place_order(self.symbol, 100, 'BUY')
-                        self.position = 100
-                    elif current_macd < current_signal and prev_macd >= prev_signal and self.position > 0:
-                        context.place_order(self.symbol, 100, 'SELL')
-                        self.position = 0
+            self.macd.update(close_price)
+            current_macd, current_signal = self.macd.macd, self.macd.signal
+            if self.macd.count >= self.macd_slow + self.macd_signal:
+                prev_macd, prev_signal = self.prev_macd, self.prev_signal
+                if current_macd > current_signal and prev_macd <= prev_signal and self.position <= 0:
+                    context.place_order(self.symbol, 100, 'BUY')
+                    self.position = 100
+                elif current_macd < current_signal and prev_macd >= prev_signal and self.position > 0:
+                    context.place_order(self.symbol, 100, 'SELL')
+                    self.position = 0
+            self.prev_macd, self.prev_signal = current_macd, current_signal
 
 
 def create_custom_strategy(code: str, params: Dict[str, Any] = None) -> Strategy:
@@ -221,12 +223,21 @@ def create_custom_strategy(code: str, params: Dict[str, Any] = None) -> Strategy
     # Add quantlib imports that strategies commonly use
     try:
         from quantlib.indicators import sma, ema, rsi, macd, bollinger_bands
+        from quantlib.indicators import streaming
         namespace.update({
             'sma': sma,
             'ema': ema,
             'rsi': rsi,
             'macd': macd,
             'bollinger_bands': bollinger_bands,
+            # Incremental O(1)-per-bar indicators
+            'SMA': streaming.SMA,
+            'EMA': streaming.EMA,
+            'RSI': streaming.RSI,
+            'MACD': streaming.MACD,
+            'BollingerBands': streaming.BollingerBands,
+            'ATR': streaming.ATR,
+            'Stochastic': streaming.Stochastic,
         })
     except ImportError:
         pass
@@ -297,13 +308,18 @@ def create_strategy(strategy_config: Dict[str, Any]) -> Strategy:
         raise ValueError(f"Unknown strategy type: {strategy_type}")
 
 
-def dict_list_to_dataframe(data: list) -> pd.DataFrame:
-    """Convert list of dictionaries to DataFrame"""
-    df = pd.DataFrame(data)
-    if 'Date' in df.columns:
-        df['Date'] = pd.to_datetime(df['Date'])
-        df.set_index('Date', inplace=True)
-    return df
+def create_strategy_with_params(
+    base_strategy: Dict[str, Any],
+    params: Dict[str, Any]
+) -> Strategy:
+    """Create a strategy from a base configuration and parameters.
+
+    Module-level so that functools.partial(create_strategy_with_params, base)
+    can be pickled to worker processes as a strategy factory.
+    """
+    strategy_config = base_strategy.copy()
+    strategy_config['params'] = params
+    return create_strategy(strategy_config)
 
 
 def serialize_dataframe(df: pd.DataFrame) -> list:
@@ -326,7 +342,8 @@ def run_single_backtest(
     data_df: pd.DataFrame,
     strategy_config: Dict[str, Any],
     config: Dict[str, Any],
-    symbol: str
+    symbol: str,
+    metrics: Optional[List[str]] = None
 ) -> Dict[str, Any]:
     """
     Run a single backtest with given parameters and return metrics.
@@ -336,6 +353,8 @@ def run_single_backtest(
         strategy_config: Strategy configuration dict (type and params)
         config: Backtest configuration dict
         symbol: Trading symbol
+        metrics: Risk metrics to compute (default: all). Optimization passes
+            just its objective so each run only pays for what it ranks on.
         
     Returns:
         Dictionary with metrics and result_id
@@ -349,12 +368,13 @@ def run_single_backtest(
     slippage = config.get('slippage', 0.0)
     commission_type = config.get('commission_type', 'fixed')
     
-    # Create and run backtest engine
+    # Create and run backtest engine (metrics only need the equity curve)
     engine = BacktestEngine(
         initial_capital=initial_capital,
         commission=commission,
         slippage=slippage,
-        commission_type=commission_type
+        commission_type=commission_type,
+        recording=config.get('recording', 'equity_only')
     )
     
     # Store symbol in engine for context
@@ -365,19 +385,15 @@ def run_single_backtest(
     # Extract data for metrics calculation
     returns = results.get('returns', pd.Series())
     equity_curve = results.get('equity_curve', pd.Series())
-    trades_df = results.get('trades', pd.DataFrame())
     
     # Calculate comprehensive metrics using RiskCalculator
+    requested_metrics = metrics
     metrics = {}
     if len(returns) > 0:
         try:
-            # Prepare trades DataFrame with PnL if available
-            trades_for_metrics = None
-            if not trades_df.empty:
-                if 'pnl' not in trades_df.columns and 'price' in trades_df.columns:
-                    trades_for_metrics = trades_df.copy()
-                elif 'pnl' in trades_df.columns:
-                    trades_for_metrics = trades_df.copy()
+            # Trade statistics are computed on closed round trips, which carry the PnL
+            ledger = results.get('round_trips')
+            trades_for_metrics = ledger if ledger is not None and not ledger.empty else None
             
             # Create risk calculator
             calculator = RiskCalculator(
@@ -388,9 +404,14 @@ def run_single_backtest(
                 periods=252,  # Daily data
             )
             
-            # Get all metrics (flat structure for API)
-            all_metrics = calculator.get_flat_metrics()
-            metrics.update(all_metrics)
+            if requested_metrics is None:
+                # Get all metrics (flat structure for API)
+                metrics.update(calculator.get_flat_metrics())
+            else:
+                # Only the requested ones (basic result metrics are added below)
+                metrics.update(calculator.compute(
+                    [name for name in requested_metrics if RiskCalculator.has_metric(name)]
+                ))
         except Exception as e:
             print(f"Warning: Error calculating comprehensive metrics: {e}")
             # Fall back to basic metrics
@@ -417,12 +438,106 @@ def run_single_backtest(
     }
 
 
+def run_optimization_task(
+    data_handle,
+    strategy_config: Dict[str, Any],
+    config: Dict[str, Any],
+    symbol: str,
+    objective: str
+) -> Dict[str, Any]:
+    """
+    Run one optimization backtest inside a pool worker.
+    
+    The OHLCV frame is attached from shared memory (once per worker) and only
+    the parameters, metrics and objective value are sent back. Only the
+    objective (plus the basic result metrics) is computed.
+    
+    Args:
+        data_handle: SharedFrameHandle of the OHLCV data
+        strategy_config: Strategy configuration with the parameters to test
+        config: Backtest configuration dict
+        symbol: Trading symbol
+        objective: Objective metric name
+        
+    Returns:
+        Dictionary with parameters, metrics and objective_value
+    """
+    data_df = attach_frame(data_handle)
+    result = run_single_backtest(
+        data_df=data_df,
+        strategy_config=strategy_config,
+        config=config,
+        symbol=symbol,
+        metrics=[objective]
+    )
+    
+    metrics = result['metrics']
+    objective_value = metrics.get(objective, float('-inf'))
+    
+    return {
+        'parameters': strategy_config['params'].copy(),
+        'metrics': metrics,
+        'objective_value': float(objective_value) if objective_value is not None else float('-inf'),
+    }
+
+
+# Progress of running optimizations, keyed by optimization_id
+optimization_progress: Dict[str, Dict[str, Any]] = {}
+_progress_lock = threading.Lock()
+
+
+def _start_progress(optimization_id: str, total: Optional[int]):
+    """Register a running optimization"""
+    with _progress_lock:
+        # Forget the oldest finished runs so the registry stays small
+        finished = [k for k, v in optimization_progress.items() if v['status'] == 'finished']
+        for key in finished[:max(0, len(finished) - 100)]:
+            del optimization_progress[key]
+        
+        optimization_progress[optimization_id] = {
+            'optimization_id': optimization_id,
+            'status': 'running',
+            'completed': 0,
+            'failed': 0,
+            'total': total,
+            'best_parameters': None,
+            'best_objective_value': None,
+        }
+
+
+def _record_progress(optimization_id: str, result: Optional[Dict[str, Any]]):
+    """Record one finished (or failed, if result is None) backtest"""
+    with _progress_lock:
+        progress = optimization_progress.get(optimization_id)
+        if progress is None:
+            return
+        if result is None:
+            progress['failed'] += 1
+            return
+        progress['completed'] += 1
+        best = progress['best_objective_value']
+        if best is None or result['objective_value'] > best:
+            progress['best_objective_value'] = result['objective_value']
+            progress['best_parameters'] = result['parameters']
+
+
+def _finish_progress(optimization_id: str):
+    """Mark an optimization as finished"""
+    with _progress_lock:
+        progress = optimization_progress.get(optimization_id)
+        if progress is not None:
+            progress['status'] = 'finished'
+
+
 @router.post("/run", response_model=BacktestResponse)
 async def run_backtest(request: BacktestRequest):
     """Run backtest with strategy and configuration"""
     try:
-        # Convert data from list of dicts to DataFrame
-        data_df = dict_list_to_dataframe(request.data)
+        # Inline data, or bars loaded server-side from the data reference
+        try:
+            data_df = resolve_request_data(request.data, request.data_ref)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         if data_df.empty:
             raise HTTPException(status_code=400, detail="Data is empty")
@@ -453,21 +568,14 @@ async def run_backtest(request: BacktestRequest):
         # Extract data for metrics calculation
         returns = results.get('returns', pd.Series())
         equity_curve = results.get('equity_curve', pd.Series())
-        trades_df = results.get('trades', pd.DataFrame())
         
         # Calculate comprehensive metrics using RiskCalculator
         metrics = {}
         if len(returns) > 0:
             try:
-                # Prepare trades DataFrame with PnL if available
-                trades_for_metrics = None
-                if not trades_df.empty:
-                    # Try to calculate PnL from trades if not present
-                    if 'pnl' not in trades_df.columns and 'price' in trades_df.columns:
-                        # Simple PnL calculation (can be enhanced)
-                        trades_for_metrics = trades_df.copy()
-                    elif 'pnl' in trades_df.columns:
-                        trades_for_metrics = trades_df.copy()
+                # Trade statistics are computed on closed round trips, which carry the PnL
+                ledger = results.get('round_trips')
+                trades_for_metrics = ledger if ledger is not None and not ledger.empty else None
                 
                 # Create risk calculator
                 calculator = RiskCalculator(
@@ -514,8 +622,8 @@ async def run_backtest(request: BacktestRequest):
                 start_date = data_df.index[0]
                 end_date = data_df.index[-1]
                 
-                # Fetch benchmark data
-                store = DataStore()
+                # Fetch benchmark data (repeat backtests reuse the cached frame)
+                store = CachedDataStore(DataStore())
                 
                 # Create fetcher using registry (use default source for benchmark)
                 try:
@@ -1011,10 +1119,18 @@ async def optimize_parameters(request: OptimizationRequest):
     """Optimize strategy parameters using grid search or scipy.optimize
     
     Supports grid search for discrete parameters and scipy.optimize.minimize for continuous optimization.
+    Backtests run in a process pool, so the event loop stays responsive; poll
+    /optimize/{optimization_id}/progress with a client-supplied optimization_id
+    to follow a running search.
     """
+    optimization_id = request.optimization_id or str(uuid.uuid4())
+    pool = None
     try:
-        # Convert data from list of dicts to DataFrame
-        data_df = dict_list_to_dataframe(request.data)
+        # Inline data, or bars loaded server-side from the data reference
+        try:
+            data_df = resolve_request_data(request.data, request.data_ref)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         if data_df.empty:
             raise HTTPException(status_code=400, detail="Data is empty")
@@ -1028,7 +1144,6 @@ async def optimize_parameters(request: OptimizationRequest):
         if not param_names:
             raise HTTPException(status_code=400, detail="No parameters specified for optimization")
         
-        optimization_id = str(uuid.uuid4())
         all_results = []
         
         if request.optimization_type == 'grid':
@@ -1061,55 +1176,71 @@ async def optimize_parameters(request: OptimizationRequest):
                            f"Reduce parameter ranges or increase max_combinations."
                 )
             
-            # Run backtests for each combination
-            for param_combo in param_combinations:
-                # Create params dict for this combination
-                test_params = base_params.copy()
-                for i, param_name in enumerate(param_names):
-                    test_params[param_name] = param_combo[i]
-                
-                # Update strategy config with test parameters
-                test_strategy_config = base_strategy.copy()
-                test_strategy_config['params'] = test_params
-                
-                try:
-                    # Run backtest
-                    result = run_single_backtest(
-                        data_df=data_df,
-                        strategy_config=test_strategy_config,
-                        config=request.config,
-                        symbol=request.symbol
-                    )
-                    
-                    # Get objective value
-                    metrics = result['metrics']
-                    objective_value = metrics.get(request.objective, float('-inf'))
-                    
-                    # Generate result ID
-                    result_id = str(uuid.uuid4())
-                    
-                    # Store result (optional - could skip to save space for large optimizations)
-                    # For now, we'll just store in memory/database if enabled
+            # Run backtests for each combination in the process pool; the
+            # OHLCV frame is published once in shared memory
+            pool = get_optimization_pool()
+            loop = asyncio.get_running_loop()
+            _start_progress(optimization_id, total=len(param_combinations))
+            
+            with SharedFrame(data_df) as shared_data:
+                futures = {}
+                for index, param_combo in enumerate(param_combinations):
+                    # Create params dict for this combination
+                    test_params = base_params.copy()
+                    for i, param_name in enumerate(param_names):
+                        test_params[param_name] = param_combo[i]
                     
-                    all_results.append({
-                        'parameters': test_params.copy(),
-                        'metrics': metrics,
-                        'result_id': result_id,
-                        'objective_value': float(objective_value) if objective_value is not None else float('-inf'),
-                    })
+                    # Update strategy config with test parameters
+                    test_strategy_config = base_strategy.copy()
+                    test_strategy_config['params'] = test_params
                     
-                except Exception as e:
-                    print(f"Warning: Error running backtest with params {test_params}: {e}")
-                    # Continue with next combination
-                    continue
+                    future = loop.run_in_executor(
+                        pool,
+                        run_optimization_task,
+                        shared_data.handle,
+                        test_strategy_config,
+                        request.config,
+                        request.symbol,
+                        request.objective,
+                    )
+                    futures[future] = (index, test_params)
+                
+                results_by_index = {}
+                try:
+                    pending = set(futures)
+                    while pending:
+                        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                        for future in done:
+                            index, test_params = futures[future]
+                            try:
+                                result = future.result()
+                            except BrokenProcessPool:
+                                raise
+                            except Exception as e:
+                                print(f"Warning: Error running backtest with params {test_params}: {e}")
+                                _record_progress(optimization_id, None)
+                                continue
+                            
+                            result['result_id'] = str(uuid.uuid4())
+                            results_by_index[index] = result
+                            _record_progress(optimization_id, result)
+                finally:
+                    # Client went away or something failed: drop queued work
+                    for future in futures:
+                        future.cancel()
+            
+            # Keep grid order so ties resolve the same way as a serial run
+            all_results = [results_by_index[i] for i in sorted(results_by_index)]
         
         elif request.optimization_type == 'minimize':
-            # Continuous optimization using scipy.optimize
-            # This is more complex and requires converting params to a vector
-            # For now, we'll implement a simplified version
+            # Continuous optimization using scipy.optimize. scipy drives the
+            # search from a worker thread; every objective evaluation (and all
+            # finite-difference points of a gradient at once) runs in the pool.
+            pool = get_optimization_pool()
+            _start_progress(optimization_id, total=None)
+            evaluations: Dict[tuple, Dict[str, Any]] = {}
             
-            # Define objective function
-            def objective_function(param_vector):
+            def vector_to_params(param_vector) -> Dict[str, Any]:
                 # Map vector back to param dict
                 test_params = base_params.copy()
                 for i, param_name in enumerate(param_names):
@@ -1118,27 +1249,43 @@ async def optimize_parameters(request: OptimizationRequest):
                         test_params[param_name] = int(param_vector[i])
                     else:
                         test_params[param_name] = float(param_vector[i])
-                
-                # Update strategy config
-                test_strategy_config = base_strategy.copy()
-                test_strategy_config['params'] = test_params
-                
-                try:
-                    result = run_single_backtest(
-                        data_df=data_df,
-                        strategy_config=test_strategy_config,
-                        config=request.config,
-                        symbol=request.symbol
+                return test_params
+            
+            def evaluate(param_sets: List[Dict[str, Any]], shared_handle) -> List[float]:
+                """Evaluate parameter sets in parallel, reusing earlier evaluations"""
+                keys = [tuple(sorted(params.items())) for params in param_sets]
+                submitted = {}
+                for key, test_params in zip(keys, param_sets):
+                    if key in evaluations or key in submitted:
+                        continue
+                    test_strategy_config = base_strategy.copy()
+                    test_strategy_config['params'] = test_params
+                    submitted[key] = pool.submit(
+                        run_optimization_task,
+                        shared_handle,
+                        test_strategy_config,
+                        request.config,
+                        request.symbol,
+                        request.objective,
                     )
-                    
-                    metrics = result['metrics']
-                    objective_value = metrics.get(request.objective, float('-inf'))
-                    
-                    # Negate for minimization (scipy minimizes, so negate to maximize)
-                    return -float(objective_value) if objective_value is not None else float('inf')
-                except Exception as e:
-                    print(f"Warning: Error in optimization: {e}")
-                    return float('inf')
+                for key, future in submitted.items():
+                    try:
+                        result = future.result()
+                        evaluations[key] = result
+                        _record_progress(optimization_id, result)
+                    except BrokenProcessPool:
+                        raise
+                    except Exception as e:
+                        print(f"Warning: Error in optimization: {e}")
+                        evaluations[key] = None
+                        _record_progress(optimization_id, None)
+                
+                # Negate for minimization (scipy minimizes, so negate to maximize)
+                values = []
+                for key in keys:
+                    result = evaluations[key]
+                    values.append(-result['objective_value'] if result is not None else float('inf'))
+                return values
             
             # Set up bounds
             bounds = []
@@ -1148,46 +1295,47 @@ async def optimize_parameters(request: OptimizationRequest):
                 bounds.append((param_range.min, param_range.max))
                 initial_guess.append((param_range.min + param_range.max) / 2.0)
             
-            # Run optimization
-            opt_result = minimize(
-                objective_function,
-                x0=initial_guess,
-                method='L-BFGS-B',  # Bounded optimization
-                bounds=bounds,
-                options={'maxiter': 50}  # Limit iterations
-            )
-            
-            # Extract best parameters
-            best_params = base_params.copy()
-            for i, param_name in enumerate(param_names):
-                param_range = request.parameter_ranges[param_name]
-                if param_range.type == 'int':
-                    best_params[param_name] = int(opt_result.x[i])
-                else:
-                    best_params[param_name] = float(opt_result.x[i])
-            
-            # Run final backtest with best parameters
-            best_strategy_config = base_strategy.copy()
-            best_strategy_config['params'] = best_params
-            
-            result = run_single_backtest(
-                data_df=data_df,
-                strategy_config=best_strategy_config,
-                config=request.config,
-                symbol=request.symbol
-            )
-            
-            metrics = result['metrics']
-            objective_value = metrics.get(request.objective, float('-inf'))
+            def run_minimize(shared_handle):
+                eps = 1e-8  # L-BFGS-B's default finite-difference step
+                
+                def objective_and_gradient(param_vector):
+                    # Forward differences, stepping backwards at an upper bound
+                    steps = [
+                        -eps if param_vector[i] + eps > bounds[i][1] else eps
+                        for i in range(len(param_vector))
+                    ]
+                    points = [np.array(param_vector, dtype=float)]
+                    for i, step in enumerate(steps):
+                        point = points[0].copy()
+                        point[i] += step
+                        points.append(point)
+                    
+                    values = evaluate([vector_to_params(p) for p in points], shared_handle)
+                    gradient = np.array([
+                        (values[i + 1] - values[0]) / steps[i] for i in range(len(steps))
+                    ])
+                    return values[0], gradient
+                
+                return minimize(
+                    objective_and_gradient,
+                    x0=initial_guess,
+                    jac=True,
+                    method='L-BFGS-B',  # Bounded optimization
+                    bounds=bounds,
+                    options={'maxiter': 50}  # Limit iterations
+                )
             
-            result_id = str(uuid.uuid4())
+            with SharedFrame(data_df) as shared_data:
+                opt_result = await asyncio.to_thread(run_minimize, shared_data.handle)
+                
+                # Extract best parameters and evaluate them (usually already cached)
+                best_params = vector_to_params(opt_result.x)
+                await asyncio.to_thread(evaluate, [best_params], shared_data.handle)
             
-            all_results.append({
-                'parameters': best_params,
-                'metrics': metrics,
-                'result_id': result_id,
-                'objective_value': float(objective_value) if objective_value is not None else float('-inf'),
-            })
+            result = evaluations.get(tuple(sorted(best_params.items())))
+            if result is not None:
+                result['result_id'] = str(uuid.uuid4())
+                all_results.append(result)
         else:
             raise HTTPException(
                 status_code=400,
@@ -1200,6 +1348,17 @@ async def optimize_parameters(request: OptimizationRequest):
         # Find best result based on objective
         best_result_data = max(all_results, key=lambda x: x['objective_value'])
         
+        # Runs only computed the objective; report full metrics for the winner
+        try:
+            best_strategy_config = base_strategy.copy()
+            best_strategy_config['params'] = {**base_params, **best_result_data['parameters']}
+            full_result = await asyncio.to_thread(
+                run_single_backtest, data_df, best_strategy_config, request.config, request.symbol
+            )
+            best_result_data['metrics'] = full_result['metrics']
+        except Exception as e:
+            print(f"Warning: Error calculating full metrics for best result: {e}")
+        
         # Sort all results by objective (descending)
         all_results_sorted = sorted(all_results, key=lambda x: x['objective_value'], reverse=True)
         
@@ -1247,12 +1406,27 @@ async def optimize_parameters(request: OptimizationRequest):
         
     except HTTPException:
         raise
+    except BrokenProcessPool:
+        discard_optimization_pool(pool)
+        raise HTTPException(status_code=503, detail="Optimization workers crashed; please retry")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid optimization request: {str(e)}")
     except Exception as e:
         import traceback
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"Error running optimization: {str(e)}")
+    finally:
+        _finish_progress(optimization_id)
+
+
+@router.get("/optimize/{optimization_id}/progress")
+async def get_optimization_progress(optimization_id: str):
+    """Get progress and best result so far of an optimization"""
+    with _progress_lock:
+        progress = optimization_progress.get(optimization_id)
+        if progress is None:
+            raise HTTPException(status_code=404, detail=f"Optimization {optimization_id} not found")
+        return dict(progress)
 
 
 @router.post("/walkforward", response_model=WalkForwardResponse)
@@ -1263,22 +1437,22 @@ async def walkforward_analysis(request: WalkForwardRequest):
     optimizes parameters on training data, then tests on out-of-sample data.
     This helps detect overfitting by comparing in-sample vs out-of-sample performance.
     """
+    pool = None
     try:
         from quantlib.backtesting.walkforward import WalkForwardAnalyzer
         
-        # Convert data from list of dicts to DataFrame
-        data_df = dict_list_to_dataframe(request.data)
+        # Inline data, or bars loaded server-side from the data reference
+        try:
+            data_df = resolve_request_data(request.data, request.data_ref)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         if data_df.empty:
             raise HTTPException(status_code=400, detail="Data is empty")
         
-        # Create strategy factory function
+        # Create strategy factory function (picklable for the worker pool)
         base_strategy = request.strategy.copy()
-        
-        def strategy_factory(params: Dict[str, Any]) -> Strategy:
-            strategy_config = base_strategy.copy()
-            strategy_config['params'] = params
-            return create_strategy(strategy_config)
+        strategy_factory = partial(create_strategy_with_params, base_strategy)
         
         # Convert parameter ranges format
         param_ranges = {}
@@ -1306,8 +1480,10 @@ async def walkforward_analysis(request: WalkForwardRequest):
             anchor=request.anchor
         )
         
-        # Run walk-forward analysis
-        wf_results = analyzer.run_analysis(
+        # Run walk-forward analysis on the shared worker pool, off the event loop
+        pool = get_optimization_pool()
+        wf_results = await asyncio.to_thread(
+            analyzer.run_analysis,
             strategy_factory=strategy_factory,
             data=data_df,
             symbol=request.symbol,
@@ -1318,6 +1494,8 @@ async def walkforward_analysis(request: WalkForwardRequest):
             slippage=slippage,
             commission_type=commission_type,
             risk_free_rate=risk_free_rate,
+            executor=pool,
+            n_workers=optimization_pool_workers(),
         )
         
         # Convert to response format
@@ -1364,6 +1542,9 @@ async def walkforward_analysis(request: WalkForwardRequest):
         
     except HTTPException:
         raise
+    except BrokenProcessPool:
+        discard_optimization_pool(pool)
+        raise HTTPException(status_code=503, detail="Walk-forward workers crashed; please retry")
     except ValueError as e:
         raise HTTPException(status_code=400, detail=f"Invalid walk-forward request: {str(e)}")
     except Exception as e:
@@ -5,7 +5,7 @@ Data fetching endpoints
 import sys
 import json
 from pathlib import Path
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from datetime import datetime, timedelta
 from typing import Optional
 import pandas as pd
@@ -18,6 +18,8 @@ if str(project_root) not in sys.path:
 from quantlib.data import DataStore
 from quantlib.data.fetcher_registry import get_registry
 from quantlib.utils.datetime import normalize_date_range
+from quantlib.utils.frame_cache import CachedDataStore, get_frame_cache
+from api.utils.columnar import ARROW_MEDIA_TYPE, check_format, dataframe_to_arrow, dataframe_to_columnar
 from api.models.schemas import (
     DataFetchRequest,
     DataFetchResponse,
@@ -198,9 +200,10 @@ async def fetch_data(request: DataFetchRequest):
         start_date = request.start_date
         end_date = request.end_date
 
-        # Validate date range before proceeding
+        # Validate date range and response format before proceeding
         try:
             normalize_date_range(start_date, end_date)
+            response_format = check_format(request.format)
         except ValueError as e:
             raise HTTPException(status_code=400, detail=str(e))
 
@@ -208,7 +211,7 @@ async def fetch_data(request: DataFetchRequest):
         data_source = request.data_source or 'yahoo'
         
         # Create DataStore for the specific data source
-        store = DataStore(data_source=data_source)
+        store = CachedDataStore(DataStore(data_source=data_source))
         
         # Create fetcher using registry
         try:
@@ -274,8 +277,14 @@ async def fetch_data(request: DataFetchRequest):
         except Exception:
             pass
 
+        if response_format == "arrow":
+            return Response(content=dataframe_to_arrow(data), media_type=ARROW_MEDIA_TYPE)
+
         # Convert DataFrame to JSON-serializable format
-        data_dict = dataframe_to_dict_list(data)
+        if response_format == "columnar":
+            data_dict = dataframe_to_columnar(data)
+        else:
+            data_dict = dataframe_to_dict_list(data)
 
         return DataFetchResponse(
             symbol=symbol,
@@ -321,7 +330,7 @@ async def get_data_preview(symbol: str, data_source: Optional[str] = None):
     """
     try:
         data_source = data_source or 'yahoo'
-        store = DataStore(data_source=data_source)
+        store = CachedDataStore(DataStore(data_source=data_source))
         # Get metadata to find date range
         metadata = store.get_metadata(symbol.upper())
         if not metadata or not metadata.get("start_date"):
@@ -349,4 +358,18 @@ async def get_data_preview(symbol: str, data_source: Optional[str] = None):
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error fetching preview: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error fetching preview: {str(e)}")
+
+
+@router.get("/cache/stats")
+async def get_frame_cache_stats():
+    """Get statistics of the in-process frame cache (entries, bytes, hits, misses)"""
+    return get_frame_cache().stats()
+
+
+@router.post("/cache/clear")
+async def clear_frame_cache():
+    """Clear the in-process frame cache (e.g. after writing to the database from a script)"""
+    cache = get_frame_cache()
+    cache.clear()
+    return cache.stats()
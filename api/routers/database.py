@@ -17,6 +17,7 @@ if str(project_root) not in sys.path:
 from quantlib.data import DataStore
 from quantlib.data.database import verify_connection, create_database_engine, get_database_url
 from quantlib.data.fetcher_registry import get_registry
+from quantlib.utils.frame_cache import CachedDataStore
 from sqlalchemy import text
 from api.models.schemas import DatabaseStatusResponse, DatabaseStatisticsResponse, DatabaseBatchUpdateResponse
 
@@ -170,7 +171,7 @@ async def update_all_tickers():
         
         # Initialize store and fetcher
         # Use Yahoo Finance database for bulk updates (default source)
-        store = DataStore(data_source='yahoo')
+        store = CachedDataStore(DataStore(data_source='yahoo'))
         registry = get_registry()
         fetcher = registry.create(source='yahoo')  # Use yfinance
         
@@ -17,10 +17,8 @@ if str(project_root) not in sys.path:
 
 from quantlib.live.paper_trading import PaperTradingEngine
 from quantlib.data import DataStore
+from quantlib.utils.frame_cache import CachedDataStore
 from api.routers.backtest import create_strategy
-from quantlib.risk import RiskCalculator
-from quantlib.risk.metrics import sharpe_ratio, sortino_ratio, calmar_ratio
-from quantlib.risk.drawdown import max_drawdown, max_drawdown_pct
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -42,7 +40,7 @@ def fetch_historical_data(symbols: List[str], days: int = 90) -> Dict[str, pd.Da
     Returns:
         Dictionary mapping symbol to DataFrame with OHLCV data
     """
-    store = DataStore()
+    store = CachedDataStore(DataStore())
     historical_data = {}
     
     end_date = datetime.now().date()
@@ -352,9 +350,8 @@ async def get_session_metrics(session_id: str):
         raise HTTPException(status_code=400, detail="Session is not running")
     
     engine = paper_trading_engines[session_id]
-    equity_df = engine.get_equity_curve()
     
-    if equity_df.empty or len(equity_df) < 2:
+    if engine.risk_tracker.num_returns == 0:
         return {
             'session_id': session_id,
             'metrics': {},
@@ -362,49 +359,9 @@ async def get_session_metrics(session_id: str):
         }
     
     try:
-        # Calculate returns from equity curve
-        if 'equity' in equity_df.columns:
-            equity_series = equity_df['equity']
-        elif len(equity_df.columns) > 0:
-            equity_series = equity_df.iloc[:, 0]
-        else:
-            return {
-                'session_id': session_id,
-                'metrics': {},
-                'message': 'No equity data available'
-            }
-        returns = equity_series.pct_change().dropna()
-        
-        if len(returns) == 0:
-            return {
-                'session_id': session_id,
-                'metrics': {},
-                'message': 'Insufficient data for metrics calculation'
-            }
-        
-        # Calculate metrics using RiskCalculator
-        metrics = {}
-        try:
-            calculator = RiskCalculator(
-                returns=returns,
-                equity_curve=equity_series,
-                risk_free_rate=0.0,
-                periods=252,  # Daily data
-            )
-            metrics = calculator.get_flat_metrics()
-        except Exception as e:
-            logger.warning(f"Error calculating comprehensive metrics: {e}")
-            # Fall back to basic metrics
-            if len(returns) > 0:
-                metrics['sharpe_ratio'] = float(sharpe_ratio(returns))
-                metrics['sortino_ratio'] = float(sortino_ratio(returns))
-                if len(equity_series) > 0:
-                    max_dd = max_drawdown(equity_series)
-                    max_dd_pct = max_drawdown_pct(equity_series)
-                    metrics['max_drawdown'] = float(max_dd)
-                    metrics['max_drawdown_pct'] = float(max_dd_pct)
-                    if max_dd_pct != 0:
-                        metrics['calmar_ratio'] = float(calmar_ratio(returns, abs(max_dd_pct / 100)))
+        # The engine updates its risk tracker on every bar; metrics without a
+        # streaming form are computed over the tracker's window only
+        metrics = engine.risk_tracker.get_flat_metrics()
         
         # Add basic metrics
         initial_capital = paper_trading_sessions[session_id]['initial_capital']
@@ -26,7 +26,7 @@ from api.models.schemas import (
     WorkflowStatus,
     WorkflowResultSummary,
 )
-from api.routers.backtest import dict_list_to_dataframe
+from api.utils.data_loader import resolve_request_data
 from quantlib.workflows.workflow_orchestrator import WorkflowOrchestrator
 
 router = APIRouter()
@@ -59,8 +59,11 @@ async def create_workflow(
 ):
     """Create and start a new optimization workflow"""
     try:
-        # Convert data from list of dicts to DataFrame
-        data_df = dict_list_to_dataframe(request.data)
+        # Inline data, or bars loaded server-side from the data reference
+        try:
+            data_df = resolve_request_data(request.data, request.data_ref)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         if data_df.empty:
             raise HTTPException(status_code=400, detail="Data is empty")
@@ -0,0 +1,130 @@
+"""
+Columnar encoding of time series responses
+
+The default JSON responses are row oriented: one dict per point, repeating
+every key and an ISO timestamp string. For long series (years of minute
+bars) the columnar format sends the timestamps once, as epoch
+milliseconds, next to one plain array per column. Arrays are built
+straight from the NumPy buffers with tolist(), not point by point.
+
+Formats:
+    records  - current row-oriented JSON (default)
+    columnar - {'timestamps': [...], 'columns': {name: [...]}}
+    arrow    - Arrow IPC stream (requires pyarrow)
+"""
+
+from typing import Any, Dict, List
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+RESPONSE_FORMATS = ('records', 'columnar', 'arrow')
+ARROW_MEDIA_TYPE = 'application/vnd.apache.arrow.stream'
+
+
+def check_format(response_format: str) -> str:
+    """
+    Validate a requested response format.
+
+    Args:
+        response_format: One of RESPONSE_FORMATS
+
+    Returns:
+        The format
+
+    Raises:
+        ValueError: If the format is unknown or needs a missing dependency
+    """
+    if response_format not in RESPONSE_FORMATS:
+        raise ValueError(
+            f"Unknown format '{response_format}'. Available: {', '.join(RESPONSE_FORMATS)}"
+        )
+    if response_format == 'arrow' and not ARROW_AVAILABLE:
+        raise ValueError("The arrow format requires pyarrow (pip install pyarrow)")
+    return response_format
+
+
+def encode_timestamps(index: pd.Index) -> List[Any]:
+    """
+    Encode an index as epoch milliseconds.
+
+    Timezone-aware indexes are converted to UTC; naive ones are taken as
+    UTC. Indexes without dates are returned as their labels.
+
+    Args:
+        index: Index of the series or frame
+
+    Returns:
+        List of integers (or labels)
+    """
+    if isinstance(index, pd.DatetimeIndex):
+        # .values is UTC for tz-aware indexes (as_unit needs pandas >= 2.0)
+        milliseconds = index.values.astype('datetime64[ms]').astype(np.int64)
+        if index.hasnans:
+            encoded = milliseconds.astype(object)
+            encoded[index.isna()] = None
+            return encoded.tolist()
+        return milliseconds.tolist()
+    return index.tolist()
+
+
+def encode_values(values) -> List[Any]:
+    """
+    Encode an array as a JSON-ready list (NaN becomes None).
+
+    Args:
+        values: Array-like of numbers, datetimes or objects
+
+    Returns:
+        List of Python values
+    """
+    values = np.asarray(values)
+    if values.dtype.kind == 'M':
+        return encode_timestamps(pd.DatetimeIndex(values))
+    if values.dtype.kind == 'f':
+        missing = np.isnan(values)
+        if missing.any():
+            encoded = values.astype(object)
+            encoded[missing] = None
+            return encoded.tolist()
+    return values.tolist()
+
+
+def dataframe_to_columnar(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Encode a DataFrame as parallel timestamp and column arrays.
+
+    Args:
+        df: Time-indexed DataFrame
+
+    Returns:
+        {'timestamps': [...], 'columns': {column: [...]}}
+    """
+    return {
+        'timestamps': encode_timestamps(df.index),
+        'columns': {str(column): encode_values(df[column].to_numpy()) for column in df.columns},
+    }
+
+
+def dataframe_to_arrow(df: pd.DataFrame) -> bytes:
+    """
+    Encode a DataFrame as an Arrow IPC stream.
+
+    The index is written as a 'timestamp' column.
+
+    Args:
+        df: Time-indexed DataFrame
+
+    Returns:
+        IPC stream bytes
+    """
+    table = pa.Table.from_pandas(df.rename_axis('timestamp').reset_index(), preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
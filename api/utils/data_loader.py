@@ -0,0 +1,93 @@
+"""
+Server-side resolution of OHLCV data references
+
+Backtest, optimization, walk-forward, workflow and indicator requests can
+name their data instead of uploading it:
+
+    "data_ref": {"symbol": "SPY", "start": "2015-01-01", "end": "2024-12-31",
+                 "interval": "1d", "data_source": "yahoo"}
+
+The bars are loaded from the DataStore of the data source through the
+shared frame cache, so repeated requests on the same data skip both the
+upload and the JSON parsing, and requests for a sub-range of an already
+loaded range skip the database.
+"""
+
+from typing import Any, Dict, List, Optional
+import pandas as pd
+
+from quantlib.data import DataStore
+from quantlib.utils.frame_cache import CachedDataStore
+
+
+def dict_list_to_dataframe(data: list) -> pd.DataFrame:
+    """Convert list of dictionaries to DataFrame"""
+    df = pd.DataFrame(data)
+    if 'Date' in df.columns:
+        df['Date'] = pd.to_datetime(df['Date'])
+        df.set_index('Date', inplace=True)
+    return df
+
+
+def load_reference(
+    symbol: str,
+    start: str,
+    end: str,
+    interval: str = '1d',
+    data_source: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Load the bars a data reference names.
+
+    Args:
+        symbol: Symbol
+        start: Start date (YYYY-MM-DD)
+        end: End date (YYYY-MM-DD)
+        interval: Bar interval (default '1d')
+        data_source: Data source (default 'yahoo')
+
+    Returns:
+        OHLCV DataFrame indexed by date (a copy; callers may modify it)
+
+    Raises:
+        ValueError: If the store has no data for the reference
+    """
+    source, symbol, interval = data_source or 'yahoo', symbol.upper(), interval or '1d'
+    data = CachedDataStore(DataStore(data_source=source)).load(symbol, start=start, end=end, interval=interval)
+    if data is None or data.empty:
+        raise ValueError(f"No data found for {symbol} ({source}, {interval}) between {start} and {end}")
+    return data
+
+
+def resolve_request_data(
+    data: Optional[List[Dict[str, Any]]],
+    data_ref: Optional[Any] = None
+) -> pd.DataFrame:
+    """
+    Get the DataFrame of a request from its inline data or its data reference.
+
+    Args:
+        data: Inline bars (list of dicts with a 'Date' key)
+        data_ref: DataReference model or dict with symbol, start, end and
+            optional interval and data_source (takes precedence over data)
+
+    Returns:
+        OHLCV DataFrame (empty if neither is given)
+
+    Raises:
+        ValueError: If the reference cannot be resolved
+    """
+    if data_ref is not None:
+        if not isinstance(data_ref, dict):
+            data_ref = data_ref.model_dump()
+        missing = [field for field in ('symbol', 'start', 'end') if not data_ref.get(field)]
+        if missing:
+            raise ValueError(f"data_ref requires: {', '.join(missing)}")
+        return load_reference(
+            data_ref['symbol'],
+            data_ref['start'],
+            data_ref['end'],
+            interval=data_ref.get('interval') or '1d',
+            data_source=data_ref.get('data_source'),
+        )
+    return dict_list_to_dataframe(data or [])
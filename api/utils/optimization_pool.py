@@ -0,0 +1,67 @@
+"""
+Persistent process pool for parameter optimization
+"""
+
+import os
+import threading
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+# Set up logger
+logger = logging.getLogger(__name__)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def get_optimization_pool() -> ProcessPoolExecutor:
+    """
+    Get the shared optimization process pool, creating it on first use.
+
+    The pool lives for the lifetime of the API process so worker start-up
+    (interpreter, pandas, quantlib imports) is paid once rather than per
+    optimization. The size defaults to the CPU count and can be set with
+    the QUANTLIB_OPTIMIZE_WORKERS environment variable.
+    """
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None:
+            _pool_workers = int(os.environ.get('QUANTLIB_OPTIMIZE_WORKERS', 0)) or os.cpu_count() or 1
+            _pool = ProcessPoolExecutor(max_workers=_pool_workers)
+            logger.info(f"[Optimize] Started process pool with {_pool_workers} workers")
+        return _pool
+
+
+def optimization_pool_workers() -> int:
+    """Number of workers of the shared pool (starting it if needed)"""
+    get_optimization_pool()
+    return _pool_workers
+
+
+def discard_optimization_pool(pool: Optional[ProcessPoolExecutor]):
+    """
+    Drop a pool whose workers died so the next request starts a fresh one.
+
+    Call this when work on the pool raised BrokenProcessPool. Pools other
+    than the current one (already replaced by another request) are left alone.
+
+    Args:
+        pool: The pool the failed work ran on
+    """
+    global _pool
+    with _pool_lock:
+        if pool is not None and pool is _pool:
+            logger.warning("[Optimize] Process pool is broken, recreating it on next use")
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def shutdown_optimization_pool():
+    """Shut down the shared optimization pool (called on API shutdown)"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
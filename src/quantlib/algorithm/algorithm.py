@@ -91,7 +91,7 @@ class AlgorithmFramework:
                     symbol = 'SYMBOL'
             
             # Create DataFrame-like structure for this symbol
-            bar_data = {symbol: pd.DataFrame([data], index=[context.current_time])}
+            bar_data = {symbol: pd.DataFrame([dict(data)], index=[context.current_time])}
             data = bar_data
         
         # Step 1: Universe Selection
@@ -4,10 +4,13 @@ from quantlib.backtesting.event import (
     Event, MarketEvent, SignalEvent, OrderEvent, FillEvent,
     OrderStatus, TimeInForce
 )
+from quantlib.backtesting.event_queue import EventQueue
 from quantlib.backtesting.broker import SimulatedBroker
 from quantlib.backtesting.engine import BacktestEngine
+from quantlib.backtesting.ledger import round_trips
+from quantlib.backtesting.vectorized import positions_from_signals
 from quantlib.backtesting.walkforward import WalkForwardAnalyzer
-from quantlib.backtesting.order_manager import OrderManager
+from quantlib.backtesting.order_manager import OrderBook, OrderManager
 from quantlib.backtesting.scheduler import (
     Scheduler,
     ScheduledEvent,
@@ -27,9 +30,13 @@ __all__ = [
     "FillEvent",
     "OrderStatus",
     "TimeInForce",
+    "EventQueue",
     "SimulatedBroker",
     "BacktestEngine",
+    "round_trips",
+    "positions_from_signals",
     "WalkForwardAnalyzer",
+    "OrderBook",
     "OrderManager",
     "Scheduler",
     "ScheduledEvent",
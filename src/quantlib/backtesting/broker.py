@@ -2,6 +2,7 @@
 
 from typing import Dict, Literal, Optional, Tuple
 from datetime import datetime
+import numpy as np
 import pandas as pd
 from quantlib.backtesting.event import FillEvent, OrderEvent
 
@@ -66,6 +67,42 @@ class SimulatedBroker:
         
         return execution_price, commission
     
+    def calculate_execution_batch(
+        self,
+        quantities: np.ndarray,
+        prices: np.ndarray,
+        is_buy: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized counterpart of calculate_execution for many fills at once.
+        
+        Applies exactly the same slippage and commission rules element-wise.
+        
+        Args:
+            quantities: Order quantities (positive)
+            prices: Reference market prices
+            is_buy: Boolean array, True for BUY and False for SELL
+            
+        Returns:
+            Tuple of (execution_prices, commissions) arrays
+        """
+        quantities = np.asarray(quantities)
+        prices = np.asarray(prices, dtype=float)
+        is_buy = np.asarray(is_buy, dtype=bool)
+        
+        execution_prices = np.where(
+            is_buy,
+            prices * (1 + self.slippage),
+            prices * (1 - self.slippage)
+        )
+        
+        if self.commission_type == 'fixed':
+            commissions = np.full(len(prices), float(self.commission))
+        else:  # percentage
+            commissions = (quantities * execution_prices) * (self.commission / 100.0)
+        
+        return execution_prices, commissions
+    
     def execute_order(
         self,
         order: OrderEvent,
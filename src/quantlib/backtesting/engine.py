@@ -1,15 +1,19 @@
 """Backtesting engine"""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 from datetime import datetime
 import pandas as pd
 import numpy as np
-from queue import PriorityQueue
 
 from quantlib.backtesting.event import Event, MarketEvent, SignalEvent, OrderEvent, FillEvent, OrderStatus
 from quantlib.backtesting.broker import SimulatedBroker
+from quantlib.backtesting.event_queue import EventQueue
+from quantlib.backtesting.feed import BarFeed, MultiBarFeed, is_panel
+from quantlib.backtesting.ledger import round_trips
 from quantlib.backtesting.order_manager import OrderManager
+from quantlib.backtesting.recorder import EquityRecorder, RECORDING_LEVELS
 from quantlib.backtesting.scheduler import Scheduler
+from quantlib.backtesting.vectorized import positions_from_signals, simulate_target_positions
 from quantlib.portfolio import Portfolio
 
 # Import AlgorithmFramework for type checking (optional dependency)
@@ -21,6 +25,29 @@ except ImportError:
     AlgorithmFramework = None
 
 
+class BacktestContext:
+    """Context object passed to strategies and scheduled callbacks"""
+    
+    def __init__(self, engine):
+        self.engine = engine
+        self.portfolio = engine.portfolio  # Use Portfolio instead of broker
+        self.current_time = engine.current_time
+        self.symbol = getattr(engine, '_symbol', None)
+        # Add current_prices for framework support
+        self.current_prices = getattr(engine, '_current_prices', {})
+    
+    def place_order(self, symbol: str, quantity: int, direction: str):
+        """Place an order"""
+        order = OrderEvent(
+            timestamp=self.current_time,
+            symbol=symbol,
+            order_type='MARKET',
+            quantity=quantity,
+            direction=direction
+        )
+        self.engine._add_event(order)
+
+
 class BacktestEngine:
     """Event-driven backtesting engine"""
     
@@ -29,7 +56,9 @@ class BacktestEngine:
         initial_capital: float = 100000.0,
         commission: float = 1.0,
         slippage: float = 0.0,
-        commission_type: str = 'fixed'
+        commission_type: str = 'fixed',
+        recording: str = 'full',
+        portfolio_class: type = Portfolio
     ):
         """
         Initialize backtesting engine.
@@ -39,37 +68,55 @@ class BacktestEngine:
             commission: Commission per trade (dollars or percentage)
             slippage: Slippage as fraction
             commission_type: 'fixed' for $ per trade, 'percentage' for % of value
+            recording: History kept per bar: 'full' (equity, cash, positions),
+                'equity_only' (equity and cash, enough for returns-based
+                metrics) or 'none' (first/last bar only, for final equity)
+            portfolio_class: Portfolio implementation to track state with
+                (e.g. CompactPortfolio for wide universes)
         """
+        if recording not in RECORDING_LEVELS:
+            raise ValueError(
+                f"Invalid recording level '{recording}'. Must be one of {RECORDING_LEVELS}"
+            )
+        
         self.initial_capital = initial_capital
+        self.recording = recording
+        self.portfolio_class = portfolio_class
         self.broker = SimulatedBroker(
             commission=commission,
             slippage=slippage,
             commission_type=commission_type
         )
-        self.portfolio = Portfolio(initial_cash=initial_capital)
-        self.events = PriorityQueue()
+        self.portfolio = self.portfolio_class(initial_cash=initial_capital)
+        self.events = EventQueue()
+        self._handlers = {
+            SignalEvent: self._on_signal,
+            OrderEvent: self._on_order,
+            FillEvent: self._on_fill,
+        }
         self.order_manager = OrderManager()
         self.scheduler = Scheduler()
         self.data = None
+        self._current_bar = None
         self.strategy = None
         self.current_time = None
-        self.equity_curve = []
+        self.recorder = EquityRecorder(recording)
         self.trades = []
         self.positions_history = []
     
+    @property
+    def equity_curve(self) -> List[Dict]:
+        """Recorded bars as dicts of timestamp, cash, equity and positions (read-only)"""
+        return self.recorder.to_records()
+    
     def _add_event(self, event: Event):
-        """Add event to queue (priority by timestamp)"""
-        # Use a counter to break ties when timestamps are equal
-        # This prevents comparison errors between different event types
-        if not hasattr(self, '_event_counter'):
-            self._event_counter = 0
-        self._event_counter += 1
-        self.events.put((event.timestamp, self._event_counter, event))
+        """Add event to queue (ordered by timestamp, then insertion)"""
+        self.events.put(event)
     
     def run(
         self,
         strategy,
-        data: pd.DataFrame,
+        data: Union[pd.DataFrame, Dict[str, pd.DataFrame]],
         start: Optional[str] = None,
         end: Optional[str] = None,
         symbol: Optional[str] = None
@@ -77,40 +124,64 @@ class BacktestEngine:
         """
         Run backtest.
         
+        Passing a dict of symbol -> DataFrame (or a long/panel frame with a
+        (symbol, timestamp) MultiIndex or a 'symbol' column) runs a
+        multi-asset backtest on the merged timestamp index. In that mode
+        strategies receive a dict of symbol -> bar for the symbols that have
+        a bar at the current timestamp (framework strategies get symbol ->
+        one-row DataFrame), and every held position is marked at its latest
+        close.
+        
         Args:
             strategy: Strategy object with on_data method
-            data: OHLCV DataFrame
+            data: OHLCV DataFrame, or multi-asset data (see above)
             start: Start date (optional, uses data start if None)
             end: End date (optional, uses data end if None)
-            symbol: Trading symbol (optional, extracted from trades if not provided)
+            symbol: Trading symbol (optional, extracted from trades if not provided;
+                ignored for multi-asset data)
             
         Returns:
             Dictionary with backtest results
         """
         self.strategy = strategy
-        self.data = data.copy()
-        
-        # Filter data by date range
-        if start:
-            self.data = self.data[self.data.index >= pd.Timestamp(start)]
-        if end:
-            self.data = self.data[self.data.index <= pd.Timestamp(end)]
+        multi_asset = is_panel(data)
         
-        if self.data.empty:
-            raise ValueError("No data available for the specified date range")
+        if multi_asset:
+            feed = MultiBarFeed(data, start=start, end=end)
+            if feed.empty:
+                raise ValueError("No data available for the specified date range")
+            self.data = feed.frames
+            symbol = None
+        else:
+            self.data = data.copy()
+            
+            # Filter data by date range
+            if start:
+                self.data = self.data[self.data.index >= pd.Timestamp(start)]
+            if end:
+                self.data = self.data[self.data.index <= pd.Timestamp(end)]
+            
+            if self.data.empty:
+                raise ValueError("No data available for the specified date range")
+            
+            # Pre-extract OHLCV columns once; strategies get a reusable dict-like bar
+            feed = BarFeed(self.data)
         
         # Store symbol for equity calculation
         self._symbol = symbol
         
         # Reset state
-        self.portfolio = Portfolio(initial_cash=self.initial_capital)
+        self.portfolio = self.portfolio_class(initial_cash=self.initial_capital)
         self.order_manager.clear()
         self.scheduler.clear()
-        self.equity_curve = []
+        capacity = max(map(len, feed.feeds.values())) if multi_asset else len(feed)
+        self.recorder = EquityRecorder(self.recording, capacity=capacity)
         self.trades = []
         self.positions_history = []
-        self._event_counter = 0  # Reset event counter for tiebreaking
+        self.events.clear()
         self._all_symbols = set()  # Track all symbols encountered
+        self._current_prices = {}
+        self._current_bar = None
         
         # Check if strategy is AlgorithmFramework
         is_framework = (FRAMEWORK_AVAILABLE and 
@@ -122,29 +193,59 @@ class BacktestEngine:
             context = self._create_context()
             strategy.initialize(context)
         
+        self._feed = feed
+        
+        # Events scheduled in initialize fire at bars known up front
+        if self.scheduler.events:
+            if multi_asset:
+                frames = list(feed.frames.values())
+                index = frames[0].index.append([df.index for df in frames[1:]]).unique().sort_values()
+            else:
+                index = feed.index
+            if isinstance(index, pd.DatetimeIndex):
+                self.scheduler.compile(index)
+        
+        if multi_asset:
+            self._run_multi_asset(strategy, feed, is_framework)
+        else:
+            self._run_single_asset(strategy, feed, is_framework)
+        
+        # Portfolio history shares the recorder's position snapshots
+        if self.recording == 'full':
+            self.portfolio.history = self.recorder.to_records()
+        
+        # Calculate results
+        return self._calculate_results()
+    
+    def _run_single_asset(self, strategy, feed: BarFeed, is_framework: bool):
+        """Event loop over a single symbol's bars"""
+        highs, lows, closes = feed.high, feed.low, feed.close
+        
         # Process data bar by bar
-        for timestamp, bar in self.data.iterrows():
+        for timestamp, bar in feed:
             self.current_time = timestamp
+            self._current_bar = bar
+            pos = bar._pos
+            close_price = closes[pos]
             
             # Create market event
             market_event = MarketEvent(timestamp)
             self._add_event(market_event)
             
             # Check pending orders for execution (before processing other events)
-            self._check_pending_orders(bar)
+            self._check_pending_orders(highs[pos], lows[pos], close_price)
             
             # Process events for this timestamp
             self._process_events()
             
             # Update current_prices for context
-            close_price = bar['Close']
             if self._symbol:
                 self._current_prices = {self._symbol: close_price}
             else:
                 # Try to infer from portfolio positions
-                positions = self.portfolio.get_positions()
+                positions = self.portfolio.positions
                 if positions:
-                    first_symbol = list(positions.keys())[0]
+                    first_symbol = next(iter(positions))
                     self._current_prices = {first_symbol: close_price}
                 else:
                     self._current_prices = {'SYMBOL': close_price}
@@ -168,60 +269,191 @@ class BacktestEngine:
                     }
                 strategy.on_data(context, framework_data)
             elif hasattr(strategy, 'on_data'):
-                # Traditional Strategy expects single bar dict
-                strategy.on_data(context, bar.to_dict())
+                # Traditional Strategy expects a single bar (dict-like)
+                strategy.on_data(context, bar)
+            
+            self._record_equity(timestamp)
+    
+    def _run_multi_asset(self, strategy, feed: MultiBarFeed, is_framework: bool):
+        """Event loop over the merged timestamps of many symbols"""
+        symbol_feeds = feed.feeds
+        frames = feed.frames
+        pending_orders = self.order_manager.pending_orders
+        
+        for timestamp, bars in feed:
+            self.current_time = timestamp
+            
+            market_event = MarketEvent(timestamp)
+            self._add_event(market_event)
             
-            # Update equity curve
-            # Use current_prices that was set for context
+            # Check pending orders of every symbol that traded this timestamp
+            if pending_orders:
+                for symbol, bar in bars.items():
+                    if pending_orders.get(symbol):
+                        symbol_feed = symbol_feeds[symbol]
+                        pos = bar._pos
+                        self._check_pending_orders(
+                            symbol_feed.high[pos], symbol_feed.low[pos],
+                            symbol_feed.close[pos], symbol=symbol
+                        )
+            
+            # Market orders fill at each symbol's previous close
+            self._process_events()
+            
+            # Symbols without a bar keep their last close for marking
             current_prices = self._current_prices
+            for symbol, bar in bars.items():
+                current_prices[symbol] = symbol_feeds[symbol].close[bar._pos]
             
-            equity = self.portfolio.get_total_equity(current_prices)
+            context = self._create_context()
+            self.scheduler.check_and_execute(context)
             
-            # Update portfolio history
-            self.portfolio.update_equity(timestamp, current_prices)
+            if is_framework:
+                framework_data = {
+                    symbol: frames[symbol].iloc[bar._pos:bar._pos + 1]
+                    for symbol, bar in bars.items()
+                }
+                strategy.on_data(context, framework_data)
+            elif hasattr(strategy, 'on_data'):
+                strategy.on_data(context, bars)
             
-            self.equity_curve.append({
+            self._record_equity(timestamp)
+    
+    def _record_equity(self, timestamp):
+        """Mark the portfolio to market and record the bar"""
+        portfolio = self.portfolio
+        self.recorder.record(
+            timestamp,
+            portfolio.get_total_equity(self._current_prices),
+            portfolio.cash,
+            portfolio.positions
+        )
+    
+    def run_vectorized(
+        self,
+        signals,
+        data: pd.DataFrame,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        symbol: Optional[str] = None,
+        exits=None,
+        size: float = 100
+    ) -> Dict:
+        """
+        Run a vectorized backtest from precomputed signals.
+        
+        Much faster than run() for parameter sweeps because no strategy
+        object, context or event queue is involved. Fills follow the same
+        timing as the event-driven engine (decided on bar t, filled on bar
+        t+1 at the close of bar t) and use the broker's commission and
+        slippage rules. Orders are not checked against available cash.
+        
+        Args:
+            signals: Target positions (shares) per bar as a Series aligned to
+                data or an array of len(data). NaN means "keep previous target".
+                If exits is given, signals are treated as boolean entries.
+            data: OHLCV DataFrame
+            start: Start date (optional, uses data start if None)
+            end: End date (optional, uses data end if None)
+            symbol: Trading symbol (default: 'SYMBOL')
+            exits: Optional boolean exit signals (Series or array)
+            size: Position size used with entry/exit signals
+            
+        Returns:
+            Dictionary with backtest results (same keys as run())
+        """
+        signals = self._align_signals(signals, data)
+        if exits is not None:
+            exits = self._align_signals(exits, data)
+        
+        mask = np.ones(len(data), dtype=bool)
+        if start:
+            mask &= data.index >= pd.Timestamp(start)
+        if end:
+            mask &= data.index <= pd.Timestamp(end)
+        
+        data = data[mask]
+        if data.empty:
+            raise ValueError("No data available for the specified date range")
+        
+        if exits is not None:
+            targets = positions_from_signals(signals[mask], exits[mask], size)
+        else:
+            targets = signals[mask].astype(float)
+        
+        self.data = data
+        self._symbol = symbol
+        symbol = symbol if symbol else 'SYMBOL'
+        
+        sim = simulate_target_positions(
+            targets, data['Close'].values, self.broker, self.initial_capital
+        )
+        
+        # Reset state and replay the (few) fills into the portfolio
+        self.portfolio = self.portfolio_class(initial_cash=self.initial_capital)
+        self.order_manager.clear()
+        self.recorder = EquityRecorder(self.recording, capacity=len(data))
+        self.trades = []
+        self.positions_history = []
+        
+        symbol_upper = symbol.upper()
+        timestamps = data.index[sim['fill_index']]
+        for timestamp, quantity, is_buy, price, commission in zip(
+            timestamps, sim['quantity'], sim['is_buy'], sim['price'], sim['commission']
+        ):
+            quantity = int(quantity)
+            price = float(price)
+            commission = float(commission)
+            direction = 'BUY' if is_buy else 'SELL'
+            
+            self.portfolio.add_position(symbol_upper, quantity if is_buy else -quantity)
+            self.portfolio.record_transaction(
+                symbol_upper, quantity, price, direction, timestamp, commission
+            )
+            self.trades.append({
                 'timestamp': timestamp,
-                'equity': equity,
-                'cash': self.portfolio.get_cash(),
-                'positions': self.portfolio.get_positions()
+                'symbol': symbol,
+                'quantity': quantity,
+                'direction': direction,
+                'price': price,
+                'commission': commission
             })
+        self.portfolio.cash = float(sim['cash'][-1])
+        self.current_time = data.index[-1]
+        
+        # One bulk append, so get_results() and equity_curve match run()
+        positions = None
+        if self.recording == 'full':
+            positions = [{symbol_upper: int(q)} if q else {} for q in sim['holdings']]
+        self.recorder.extend(data.index, sim['equity'], sim['cash'], positions)
+        if self.recording == 'full':
+            self.portfolio.history = self.recorder.to_records()
         
-        # Calculate results
         return self._calculate_results()
     
+    @staticmethod
+    def _align_signals(signals, data: pd.DataFrame) -> np.ndarray:
+        """Align a signal Series/array to the data index"""
+        if isinstance(signals, pd.Series):
+            if signals.dtype == bool:
+                return signals.reindex(data.index, fill_value=False).values
+            return signals.reindex(data.index).values
+        
+        signals = np.asarray(signals)
+        if len(signals) != len(data):
+            raise ValueError(
+                f"signals length ({len(signals)}) must match data length ({len(data)})"
+            )
+        return signals
+    
     def _create_context(self):
         """Create context object for strategy"""
-        engine = self
-        
-        class Context:
-            def __init__(self, engine):
-                self.engine = engine
-                self.portfolio = engine.portfolio  # Use Portfolio instead of broker
-                self.current_time = engine.current_time
-                self.symbol = getattr(engine, '_symbol', None)
-                # Add current_prices for framework support
-                self.current_prices = getattr(engine, '_current_prices', {})
-            
-            def place_order(self, symbol: str, quantity: int, direction: str):
-                """Place an order"""
-                order = OrderEvent(
-                    timestamp=self.current_time,
-                    symbol=symbol,
-                    order_type='MARKET',
-                    quantity=quantity,
-                    direction=direction
-                )
-                self.engine._add_event(order)
-        
-        return Context(self)
+        return BacktestContext(self)
     
-    def _check_pending_orders(self, bar: pd.Series):
+    def _check_pending_orders(self, high: float, low: float, close: float, symbol: Optional[str] = None):
         """Check pending orders for execution conditions"""
-        symbol = self._symbol if self._symbol else 'SYMBOL'
-        high = bar.get('High', bar.get('Close', 0))
-        low = bar.get('Low', bar.get('Close', 0))
-        close = bar.get('Close', 0)
+        if symbol is None:
+            symbol = self._symbol if self._symbol else 'SYMBOL'
         
         fills = self.order_manager.check_orders(symbol, high, low, close, self.current_time)
         
@@ -253,138 +485,140 @@ class BacktestEngine:
     
     def _process_events(self):
         """Process all events in queue for current timestamp"""
-        while not self.events.empty():
-            timestamp, counter, event = self.events.get()
-            
-            # Only process events up to current time
-            if timestamp > self.current_time:
-                self.events.put((timestamp, counter, event))
+        handlers = self._handlers
+        # Only process events up to current time
+        for event in self.events.due(self.current_time):
+            try:
+                handler = handlers[type(event)]
+            except KeyError:
+                handler = self._resolve_handler(type(event))
+            if handler is not None:
+                handler(event)
+    
+    def _resolve_handler(self, event_class: type):
+        """Find (and cache) the handler for an event class via its base classes"""
+        handler = None
+        for cls in event_class.__mro__:
+            if cls in self._handlers:
+                handler = self._handlers[cls]
                 break
+        self._handlers[event_class] = handler
+        return handler
+    
+    def _on_signal(self, event: SignalEvent):
+        """Convert a signal to a market order"""
+        if event.signal_type == 'BUY':
+            order = OrderEvent(
+                timestamp=event.timestamp,
+                symbol=event.symbol,
+                order_type='MARKET',
+                quantity=int(100 * event.strength),  # Scale by strength
+                direction='BUY'
+            )
+            self._add_event(order)
+        elif event.signal_type == 'SELL':
+            order = OrderEvent(
+                timestamp=event.timestamp,
+                symbol=event.symbol,
+                order_type='MARKET',
+                quantity=int(100 * event.strength),
+                direction='SELL'
+            )
+            self._add_event(order)
+    
+    def _on_order(self, event: OrderEvent):
+        """Fill market orders at the current price; queue other orders as pending"""
+        if event.order_type == 'MARKET':
+            # Market orders execute immediately
+            symbol_upper = event.symbol.upper()
+            if hasattr(self, '_current_prices') and symbol_upper in self._current_prices:
+                current_price = self._current_prices[symbol_upper]
+            elif self._current_bar is not None and 'Close' in self._current_bar:
+                current_price = self._current_bar['Close']
+            else:
+                return  # Skip if no price available
             
-            if isinstance(event, SignalEvent):
-                # Convert signal to order
-                if event.signal_type == 'BUY':
-                    order = OrderEvent(
-                        timestamp=event.timestamp,
-                        symbol=event.symbol,
-                        order_type='MARKET',
-                        quantity=int(100 * event.strength),  # Scale by strength
-                        direction='BUY'
-                    )
-                    self._add_event(order)
-                elif event.signal_type == 'SELL':
-                    order = OrderEvent(
-                        timestamp=event.timestamp,
-                        symbol=event.symbol,
-                        order_type='MARKET',
-                        quantity=int(100 * event.strength),
-                        direction='SELL'
-                    )
-                    self._add_event(order)
+            # Calculate execution price and commission
+            execution_price, commission = self.broker.calculate_execution(
+                event, current_price, self.current_time
+            )
             
-            elif isinstance(event, OrderEvent):
-                # Handle order placement
-                if event.order_type == 'MARKET':
-                    # Market orders execute immediately
-                    symbol_upper = event.symbol.upper()
-                    if hasattr(self, '_current_prices') and symbol_upper in self._current_prices:
-                        current_price = self._current_prices[symbol_upper]
-                    elif self.current_time in self.data.index:
-                        bar = self.data.loc[self.current_time]
-                        current_price = bar['Close']
-                    else:
-                        continue  # Skip if no price available
-                    
-                    # Calculate execution price and commission
-                    execution_price, commission = self.broker.calculate_execution(
-                        event, current_price, self.current_time
-                    )
-                    
-                    # Check if we have enough cash/positions (validation)
-                    quantity = event.quantity
-                    
-                    if event.direction == 'BUY':
-                        total_cost = quantity * execution_price + commission
-                        if self.portfolio.get_cash() < total_cost:
-                            # Insufficient funds - reject order
-                            event.status = OrderStatus.REJECTED
-                            continue
-                    else:  # SELL
-                        current_position = self.portfolio.get_position(symbol_upper)
-                        if current_position < quantity:
-                            # Insufficient position - reject order
-                            event.status = OrderStatus.REJECTED
-                            continue
-                    
-                    # Create fill event
-                    fill = FillEvent(
-                        timestamp=self.current_time,
-                        symbol=event.symbol,
-                        quantity=quantity,
-                        direction=event.direction,
-                        price=execution_price,
-                        commission=commission
-                    )
-                    self._add_event(fill)
-                else:
-                    # Non-market orders go to order manager as pending orders
-                    self.order_manager.add_order(event)
+            # Check if we have enough cash/positions (validation)
+            quantity = event.quantity
+            
+            if event.direction == 'BUY':
+                total_cost = quantity * execution_price + commission
+                if self.portfolio.get_cash() < total_cost:
+                    # Insufficient funds - reject order
+                    event.status = OrderStatus.REJECTED
+                    return
+            else:  # SELL
+                current_position = self.portfolio.get_position(symbol_upper)
+                if current_position < quantity:
+                    # Insufficient position - reject order
+                    event.status = OrderStatus.REJECTED
+                    return
             
-            elif isinstance(event, FillEvent):
-                # Record trade in Portfolio and trades list
-                symbol_upper = event.symbol.upper()
-                self._all_symbols.add(symbol_upper)
-                
-                # Update portfolio
-                if event.direction == 'BUY':
-                    cost = event.quantity * event.price + event.commission
-                    self.portfolio.update_cash(-cost)
-                    self.portfolio.add_position(symbol_upper, event.quantity)
-                else:  # SELL
-                    proceeds = event.quantity * event.price - event.commission
-                    self.portfolio.update_cash(proceeds)
-                    self.portfolio.add_position(symbol_upper, -event.quantity)
-                
-                # Record transaction in portfolio
-                self.portfolio.record_transaction(
-                    symbol_upper,
-                    event.quantity,
-                    event.price,
-                    event.direction,
-                    event.timestamp,
-                    event.commission
-                )
-                
-                # Record trade for results
-                self.trades.append({
-                    'timestamp': event.timestamp,
-                    'symbol': event.symbol,
-                    'quantity': event.quantity,
-                    'direction': event.direction,
-                    'price': event.price,
-                    'commission': event.commission
-                })
+            # Create fill event
+            fill = FillEvent(
+                timestamp=self.current_time,
+                symbol=event.symbol,
+                quantity=quantity,
+                direction=event.direction,
+                price=execution_price,
+                commission=commission
+            )
+            self._add_event(fill)
+        else:
+            # Non-market orders go to order manager as pending orders
+            self.order_manager.add_order(event)
     
-    def _calculate_results(self) -> Dict:
-        """Calculate backtest results"""
-        if not self.equity_curve:
-            return {}
-        
-        equity_df = pd.DataFrame(self.equity_curve)
-        equity_df.set_index('timestamp', inplace=True)
+    def _on_fill(self, event: FillEvent):
+        """Record a fill in the portfolio and the trades list"""
+        symbol_upper = event.symbol.upper()
+        self._all_symbols.add(symbol_upper)
         
-        # Calculate returns
-        # Ensure equity column exists
-        if 'equity' not in equity_df.columns:
-            raise ValueError("Equity curve data is missing 'equity' column")
+        # Update portfolio
+        if event.direction == 'BUY':
+            cost = event.quantity * event.price + event.commission
+            self.portfolio.update_cash(-cost)
+            self.portfolio.add_position(symbol_upper, event.quantity)
+        else:  # SELL
+            proceeds = event.quantity * event.price - event.commission
+            self.portfolio.update_cash(proceeds)
+            self.portfolio.add_position(symbol_upper, -event.quantity)
         
-        equity_series = equity_df['equity']
+        # Record transaction in portfolio
+        self.portfolio.record_transaction(
+            symbol_upper,
+            event.quantity,
+            event.price,
+            event.direction,
+            event.timestamp,
+            event.commission
+        )
         
-        # Ensure it's a Series (should always be, but defensive check)
-        if not isinstance(equity_series, pd.Series):
-            # This should never happen, but handle edge case
-            equity_series = pd.Series([float(equity_series)], index=equity_df.index)
+        # Record trade for results
+        self.trades.append({
+            'timestamp': event.timestamp,
+            'symbol': event.symbol,
+            'quantity': event.quantity,
+            'direction': event.direction,
+            'price': event.price,
+            'commission': event.commission
+        })
+    
+    def _calculate_results(self) -> Dict:
+        """Calculate backtest results"""
+        if len(self.recorder) == 0:
+            return {}
         
+        return self._build_results(
+            self.recorder.equity_series(), self.recorder.positions_history()
+        )
+    
+    def _build_results(self, equity_series: pd.Series, positions_history: pd.DataFrame) -> Dict:
+        """Assemble the results dictionary from an equity curve and the recorded trades"""
         if len(equity_series) == 0:
             return {}
         
@@ -403,14 +637,16 @@ class BacktestEngine:
         
         # Calculate total commission from transactions
         total_commission = sum(t.get('commission', 0) for t in self.trades)
+        trades = pd.DataFrame(self.trades) if self.trades else pd.DataFrame()
         
         results = {
             'equity_curve': equity_series,
             'returns': returns,
             'cumulative_returns': cumulative_returns,
             'total_return': total_return,
-            'trades': pd.DataFrame(self.trades) if self.trades else pd.DataFrame(),
-            'positions_history': equity_df[['cash', 'positions']] if all(col in equity_df.columns for col in ['cash', 'positions']) else pd.DataFrame(),
+            'trades': trades,
+            'round_trips': round_trips(trades, bars=self.data),
+            'positions_history': positions_history,
             'initial_capital': self.initial_capital,
             'final_equity': final_equity,
             'total_commission': total_commission,
@@ -0,0 +1,67 @@
+"""
+Event queue for the backtest loop
+
+The engine used a queue.PriorityQueue keyed by (timestamp, counter): a
+lock per put/get and a heap push/pop per event, although a backtest runs
+on one thread and generates its events in timestamp order. EventQueue is
+a plain deque kept in that same order: an event is appended when it is
+not earlier than the tail (the usual case, O(1)) and otherwise inserted
+after every queued event not later than it, so events come out by
+timestamp and, within a timestamp, in the order they were added.
+"""
+
+from collections import deque
+from datetime import datetime
+from typing import Iterator
+
+from quantlib.backtesting.event import Event
+
+
+class EventQueue:
+    """Single-threaded FIFO of events ordered by timestamp"""
+
+    def __init__(self):
+        self._events = deque()
+
+    def put(self, event: Event):
+        """
+        Add an event.
+
+        Args:
+            event: Event to queue (ordered by its timestamp)
+        """
+        events = self._events
+        if events and event.timestamp < events[-1].timestamp:
+            i = len(events) - 1
+            while i and event.timestamp < events[i - 1].timestamp:
+                i -= 1
+            events.insert(i, event)
+        else:
+            events.append(event)
+
+    def due(self, current_time: datetime) -> Iterator[Event]:
+        """
+        Remove and yield queued events up to current_time, in order.
+
+        Events put while iterating are yielded too when they are due.
+
+        Args:
+            current_time: Current backtest time
+
+        Yields:
+            Events whose timestamp is not after current_time
+        """
+        events = self._events
+        while events and not events[0].timestamp > current_time:
+            yield events.popleft()
+
+    def empty(self) -> bool:
+        """Whether no events are queued"""
+        return not self._events
+
+    def clear(self):
+        """Drop all queued events"""
+        self._events.clear()
+
+    def __len__(self) -> int:
+        return len(self._events)
@@ -0,0 +1,232 @@
+"""Array-backed bar feed for the event-driven engine"""
+
+from collections.abc import Mapping
+from itertools import repeat
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+import heapq
+import numpy as np
+import pandas as pd
+
+
+class Bar(Mapping):
+    """
+    Lightweight view of one row of a BarFeed.
+
+    Behaves like the read-only dict strategies used to receive
+    (`bar['Close']`, `bar.get('Volume')`, `'High' in bar`, ...). The engine
+    reuses a single Bar for every row, so strategies that need to keep a bar
+    around should store `bar.to_dict()` rather than the bar itself.
+    """
+
+    __slots__ = ('_columns', '_names', '_pos', 'timestamp')
+
+    def __init__(self, columns: Dict[str, np.ndarray], names: Tuple[str, ...]):
+        self._columns = columns
+        self._names = names
+        self._pos = 0
+        self.timestamp = None
+
+    def __getitem__(self, key: str) -> Any:
+        return self._columns[key][self._pos]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        column = self._columns.get(key)
+        if column is None:
+            return default
+        return column[self._pos]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._columns
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a standalone dict copy of the current row"""
+        pos = self._pos
+        row = {}
+        for name in self._names:
+            value = self._columns[name][pos]
+            row[name] = value.item() if isinstance(value, np.generic) else value
+        return row
+
+    def __repr__(self) -> str:
+        return f"Bar({self.timestamp}, {self.to_dict()})"
+
+
+class BarFeed:
+    """
+    Column-oriented storage of an OHLCV DataFrame.
+
+    Extracts every column into a contiguous NumPy array once so the event
+    loop can walk bars by integer position instead of boxing each row into
+    a pandas Series.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        """
+        Initialize bar feed.
+
+        Args:
+            data: OHLCV DataFrame with datetime index
+        """
+        self.index = data.index
+        self.timestamps = list(data.index)
+        self.names = tuple(data.columns)
+
+        # One common dtype for all columns, like DataFrame.iterrows()
+        values = data.to_numpy()
+        self.columns = {
+            name: np.ascontiguousarray(values[:, i])
+            for i, name in enumerate(self.names)
+        }
+
+        zeros = np.zeros(len(data))
+        self.close = self.columns.get('Close', zeros)
+        self.high = self.columns.get('High', self.close)
+        self.low = self.columns.get('Low', self.close)
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __iter__(self) -> Iterator[Tuple[pd.Timestamp, Bar]]:
+        """Yield (timestamp, bar) pairs, reusing a single Bar object"""
+        bar = Bar(self.columns, self.names)
+        for pos, timestamp in enumerate(self.timestamps):
+            bar._pos = pos
+            bar.timestamp = timestamp
+            yield timestamp, bar
+
+
+def split_panel(data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
+    """
+    Split a long/panel OHLCV frame into a dict of symbol -> DataFrame.
+    
+    Accepts either a two-level MultiIndex of (symbol, timestamp) or
+    (timestamp, symbol), or a frame with a 'symbol'/'Symbol' column and a
+    datetime index.
+    
+    Args:
+        data: Long-format OHLCV DataFrame
+        
+    Returns:
+        Dictionary of symbol -> OHLCV DataFrame with datetime index
+    """
+    if isinstance(data.index, pd.MultiIndex):
+        if data.index.nlevels != 2:
+            raise ValueError("Panel data must have a (symbol, timestamp) MultiIndex")
+        first = data.index.get_level_values(0)
+        symbol_level = 1 if isinstance(first, pd.DatetimeIndex) else 0
+        return {
+            symbol: frame.droplevel(symbol_level)
+            for symbol, frame in data.groupby(level=symbol_level, sort=False)
+        }
+    
+    for column in ('symbol', 'Symbol'):
+        if column in data.columns:
+            return {
+                symbol: frame.drop(columns=column)
+                for symbol, frame in data.groupby(column, sort=False)
+            }
+    
+    raise ValueError("Panel data needs a (symbol, timestamp) MultiIndex or a 'symbol' column")
+
+
+def is_panel(data: Any) -> bool:
+    """Check whether data is a multi-asset input (dict or long/panel frame)"""
+    if isinstance(data, dict):
+        return True
+    if isinstance(data, pd.DataFrame):
+        return (isinstance(data.index, pd.MultiIndex)
+                or 'symbol' in data.columns or 'Symbol' in data.columns)
+    return False
+
+
+class MultiBarFeed:
+    """
+    Timestamp-synchronized feed over many symbols.
+    
+    Each symbol keeps its own BarFeed; the per-symbol timestamp streams are
+    combined with a k-way heap merge, so iteration costs O(rows * log(symbols))
+    and no frame is ever reindexed onto the union calendar. Symbols without a
+    bar at a given timestamp are simply absent from that step.
+    """
+    
+    def __init__(
+        self,
+        data: Union[Dict[str, pd.DataFrame], pd.DataFrame],
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ):
+        """
+        Initialize multi-symbol feed.
+        
+        Args:
+            data: Dict of symbol -> OHLCV DataFrame, or a long/panel frame
+                (see split_panel)
+            start: Start date (optional)
+            end: End date (optional)
+        """
+        if isinstance(data, pd.DataFrame):
+            data = split_panel(data)
+        
+        self.frames: Dict[str, pd.DataFrame] = {}
+        for symbol, df in data.items():
+            if not df.index.is_monotonic_increasing:
+                df = df.sort_index()
+            if start:
+                df = df[df.index >= pd.Timestamp(start)]
+            if end:
+                df = df[df.index <= pd.Timestamp(end)]
+            if not df.empty:
+                self.frames[str(symbol).upper()] = df
+        
+        self.symbols = list(self.frames)
+        self.feeds = {symbol: BarFeed(df) for symbol, df in self.frames.items()}
+        
+        # Integer keys make heap comparisons much cheaper than Timestamps; index
+        # units can differ (pandas >= 2), so every index is cast to UTC ns first
+        indexes = [df.index for df in self.frames.values()]
+        if indexes and all(isinstance(index, pd.DatetimeIndex) for index in indexes):
+            self._keys = [
+                index.values.astype('datetime64[ns]').view('i8').tolist()
+                for index in indexes
+            ]
+        else:
+            self._keys = [list(index) for index in indexes]
+    
+    @property
+    def empty(self) -> bool:
+        """True if no symbol has data"""
+        return not self.frames
+    
+    def __iter__(self) -> Iterator[Tuple[pd.Timestamp, Dict[str, Bar]]]:
+        """Yield (timestamp, {symbol: bar}) for every timestamp in the merged index"""
+        symbols = self.symbols
+        feeds = [self.feeds[symbol] for symbol in symbols]
+        bars = [Bar(feed.columns, feed.names) for feed in feeds]
+        streams = [
+            zip(keys, repeat(i), range(len(keys)))
+            for i, keys in enumerate(self._keys)
+        ]
+        
+        current_key = None
+        timestamp = None
+        active: Dict[str, Bar] = {}
+        for key, i, pos in heapq.merge(*streams):
+            if key != current_key:
+                if active:
+                    yield timestamp, active
+                    active = {}
+                current_key = key
+                timestamp = feeds[i].timestamps[pos]
+            bar = bars[i]
+            bar._pos = pos
+            bar.timestamp = timestamp
+            active[symbols[i]] = bar
+        
+        if active:
+            yield timestamp, active
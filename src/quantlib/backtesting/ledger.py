@@ -0,0 +1,262 @@
+"""
+Round-trip trade ledger built from a fills table
+
+BacktestEngine records fills (one row per execution), but trade
+statistics such as win rate and profit factor are defined on closed
+trades. round_trips() matches each symbol's closing units against its
+opening units first-in first-out and returns one row per matched lot,
+with entry/exit times and prices, gross and net P&L and, when bars are
+given, the maximum adverse and favorable excursions while the lot was
+open.
+
+The matching runs on arrays: within a symbol, the units opened and closed
+on each side (long and short) form two cumulative ranges, and FIFO pairs
+are the pieces of their intersection, found by merging the sorted range
+ends. There is no loop over fills.
+"""
+
+from typing import Dict, Optional, Union
+import numpy as np
+import pandas as pd
+
+LEDGER_COLUMNS = [
+    'symbol', 'side', 'quantity', 'entry_time', 'exit_time', 'holding_period',
+    'entry_price', 'exit_price', 'gross_pnl', 'commission', 'pnl', 'return', 'mae', 'mfe',
+]
+
+
+def _empty_ledger() -> pd.DataFrame:
+    return pd.DataFrame({column: pd.Series(dtype=object if column in ('symbol', 'side') else float)
+                         for column in LEDGER_COLUMNS})
+
+
+def _factorize_upper(values: pd.Series):
+    """Integer codes of upper-cased labels, factorizing the distinct labels only"""
+    codes, uniques = pd.factorize(values, sort=False)
+    upper_codes, names = pd.factorize(pd.Index(uniques).astype(str).str.upper(), sort=False)
+    return upper_codes[codes], np.asarray(names)
+
+
+def _match_side(group_end: np.ndarray, before: np.ndarray, after: np.ndarray):
+    """
+    FIFO-match the units one side (long or short) opens and closes.
+
+    Args:
+        group_end: Index of the last fill of each symbol (fills sorted by symbol)
+        before: Side position before each fill (>= 0)
+        after: Side position after each fill (>= 0)
+
+    Returns:
+        Tuple of (open fill index, close fill index, quantity) per matched lot
+    """
+    open_qty = np.maximum(after - before, 0.0)
+    close_qty = np.maximum(before - after, 0.0)
+    cum_open = np.cumsum(open_qty)
+
+    # Units still open at the end of a symbol never close; shifting the later
+    # symbols' close ranges by them keeps every symbol's ranges aligned
+    remainder = after[group_end]
+    shift = np.repeat(np.cumsum(remainder) - remainder, np.diff(np.concatenate(([-1], group_end))))
+    cum_close = np.cumsum(close_qty) + shift
+
+    # Merge the sorted range ends (a stable sort of two sorted runs is a
+    # linear merge); on ties the open end comes first
+    opens = np.flatnonzero(open_qty > 0)
+    closes = np.flatnonzero(close_qty > 0)
+    ends = np.concatenate((cum_open[opens], cum_close[closes]))
+    is_open = np.concatenate((np.ones(len(opens), dtype=bool), np.zeros(len(closes), dtype=bool)))
+    merged = np.argsort(ends, kind='stable')
+    ends, is_open = ends[merged], is_open[merged]
+    m = len(ends)
+    if m == 0:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, np.empty(0)
+
+    # The lot pieces end at the distinct range ends; each lies in the first
+    # open range and the first close range ending at or after it
+    positions = np.arange(m)
+    next_open = np.minimum.accumulate(np.where(is_open, positions, m)[::-1])[::-1]
+    next_close = np.minimum.accumulate(np.where(is_open, m, positions)[::-1])[::-1]
+    first = np.ones(m, dtype=bool)
+    first[1:] = ends[1:] != ends[:-1]
+    bounds = ends[first]
+    quantity = np.diff(bounds, prepend=0.0)
+    open_rank = np.cumsum(is_open) - 1
+    close_rank = np.cumsum(~is_open) - 1
+    open_index = opens[open_rank[next_open[first]]]
+
+    # Pieces past a symbol's last close belong to lots that are still open
+    close_position = next_close[first]
+    valid = close_position < m
+    close_index = closes[close_rank[np.minimum(close_position, m - 1)]] if len(closes) else np.zeros(len(bounds), dtype=np.int64)
+    valid &= (cum_close[close_index] - close_qty[close_index]) < bounds
+    valid &= quantity > 0
+    return open_index[valid], close_index[valid], quantity[valid]
+
+
+def _range_extremes(high: np.ndarray, low: np.ndarray, left: np.ndarray, right: np.ndarray):
+    """
+    Maximum high and minimum low over inclusive bar ranges [left, right].
+
+    Builds the sparse-table levels one at a time (O(bars) memory) and
+    answers each query at the level of its length.
+    """
+    max_high = np.full(len(left), np.nan)
+    min_low = np.full(len(left), np.nan)
+    valid = right >= left
+    if not valid.any():
+        return max_high, min_low
+    length = right - left + 1
+    level = np.zeros(len(left), dtype=np.int64)
+    level[valid] = np.floor(np.log2(length[valid])).astype(np.int64)
+
+    level_high, level_low = high.copy(), low.copy()
+    for k in range(int(level[valid].max()) + 1):
+        if k:
+            width = 1 << (k - 1)
+            level_high = np.fmax(level_high[:-width], level_high[width:])
+            level_low = np.fmin(level_low[:-width], level_low[width:])
+        queries = np.flatnonzero(valid & (level == k))
+        if len(queries):
+            start, end = left[queries], right[queries] - (1 << k) + 1
+            max_high[queries] = np.fmax(level_high[start], level_high[end])
+            min_low[queries] = np.fmin(level_low[start], level_low[end])
+    return max_high, min_low
+
+
+def _bars_for(bars: Union[pd.DataFrame, Dict[str, pd.DataFrame]], symbol: str) -> Optional[pd.DataFrame]:
+    if isinstance(bars, pd.DataFrame):
+        return bars
+    for key, frame in bars.items():
+        if str(key).upper() == symbol:
+            return frame
+    return None
+
+
+def round_trips(
+    fills: pd.DataFrame,
+    bars: Optional[Union[pd.DataFrame, Dict[str, pd.DataFrame]]] = None
+) -> pd.DataFrame:
+    """
+    Match fills into closed round trips (FIFO).
+
+    A fill that reverses a position closes the old side and opens the new
+    one. Commissions are allocated to lots pro rata by quantity. Lots that
+    are still open at the end are not included.
+
+    Args:
+        fills: DataFrame with timestamp, symbol, quantity (positive),
+            direction ('BUY'/'SELL'), price and optionally commission, in
+            execution order
+        bars: OHLC bars used for MAE/MFE: one DataFrame for every symbol,
+            or a dict of symbol -> DataFrame (optional)
+
+    Returns:
+        DataFrame with one row per closed lot: symbol, side ('LONG'/'SHORT'),
+        quantity, entry_time, exit_time, holding_period, entry_price,
+        exit_price, gross_pnl, commission, pnl (net of commission), return
+        (pnl over entry value), mae and mfe (worst and best open P&L over
+        the bars from entry to exit; NaN without bars)
+    """
+    if fills is None or len(fills) == 0:
+        return _empty_ledger()
+    missing = [column for column in ('timestamp', 'symbol', 'quantity', 'direction', 'price')
+               if column not in fills.columns]
+    if missing:
+        raise ValueError(f"fills are missing columns: {', '.join(missing)}")
+
+    symbol_codes, symbol_names = _factorize_upper(fills['symbol'])
+    direction_codes, directions = _factorize_upper(fills['direction'])
+    is_buy = (directions == 'BUY')[direction_codes]
+
+    # Small integer codes let the stable sort use radix sort
+    sort_codes = symbol_codes.astype(np.uint16) if len(symbol_names) < 1 << 16 else symbol_codes
+    order = np.argsort(sort_codes, kind='stable')
+    symbol_codes = symbol_codes[order]
+    quantity = np.abs(fills['quantity'].to_numpy(dtype=float))[order]
+    price = fills['price'].to_numpy(dtype=float)[order]
+    commission = (fills['commission'].to_numpy(dtype=float)[order]
+                  if 'commission' in fills.columns else np.zeros(len(order)))
+    signed = np.where(is_buy[order], quantity, -quantity)
+
+    # Position of each fill's symbol after the fill
+    group_end = np.flatnonzero(np.diff(symbol_codes, append=-1) != 0)
+    cum = np.cumsum(signed)
+    group_sizes = np.diff(np.concatenate(([-1], group_end)))
+    offset = np.repeat(np.concatenate(([0.0], cum[group_end[:-1]])), group_sizes)
+    position_after = cum - offset
+    position_before = position_after - signed
+
+    pieces = [
+        _match_side(group_end, np.maximum(sign * position_before, 0.0), np.maximum(sign * position_after, 0.0))
+        for sign in (1.0, -1.0)
+    ]
+    n_long = len(pieces[0][2])
+    open_index = np.concatenate([piece[0] for piece in pieces])
+    close_index = np.concatenate([piece[1] for piece in pieces])
+    lot_quantity = np.concatenate([piece[2] for piece in pieces])
+    if len(lot_quantity) == 0:
+        return _empty_ledger()
+    is_short = np.arange(len(lot_quantity)) >= n_long
+
+    # Ledger in the order the lots closed; a fill closes lots of one side
+    # only, and those are already in FIFO order, so a stable sort suffices
+    lot_order = np.argsort(order[close_index], kind='stable')
+    open_index, close_index, lot_quantity = open_index[lot_order], close_index[lot_order], lot_quantity[lot_order]
+    is_short = is_short[lot_order]
+    sign = np.where(is_short, -1.0, 1.0)
+    side = np.array(['LONG', 'SHORT'], dtype=object)[is_short.view(np.int8)]
+
+    timestamps = pd.Index(fills['timestamp'])
+    entry_time = timestamps[order[open_index]]
+    exit_time = timestamps[order[close_index]]
+    entry_price = price[open_index]
+    exit_price = price[close_index]
+    gross_pnl = sign * (exit_price - entry_price) * lot_quantity
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lot_commission = (
+            np.nan_to_num(commission[open_index] * lot_quantity / quantity[open_index])
+            + np.nan_to_num(commission[close_index] * lot_quantity / quantity[close_index])
+        )
+        pnl = gross_pnl - lot_commission
+        trade_return = pnl / (entry_price * lot_quantity)
+    lot_symbols = symbol_codes[open_index]
+
+    mae = np.full(len(lot_quantity), np.nan)
+    mfe = np.full(len(lot_quantity), np.nan)
+    if bars is not None:
+        for code in np.unique(lot_symbols):
+            frame = _bars_for(bars, symbol_names[code])
+            if frame is None or frame.empty:
+                continue
+            close = frame['Close'].to_numpy(dtype=float) if 'Close' in frame.columns else None
+            high = frame['High'].to_numpy(dtype=float) if 'High' in frame.columns else close
+            low = frame['Low'].to_numpy(dtype=float) if 'Low' in frame.columns else close
+            if high is None or low is None:
+                continue
+            lots = np.flatnonzero(lot_symbols == code)
+            left = frame.index.searchsorted(entry_time[lots], side='left')
+            right = frame.index.searchsorted(exit_time[lots], side='right') - 1
+            max_high, min_low = _range_extremes(high, low, np.asarray(left), np.asarray(right))
+            long_lot = sign[lots] > 0
+            best = np.where(long_lot, max_high, min_low)
+            worst = np.where(long_lot, min_low, max_high)
+            mfe[lots] = sign[lots] * (best - entry_price[lots]) * lot_quantity[lots]
+            mae[lots] = sign[lots] * (worst - entry_price[lots]) * lot_quantity[lots]
+
+    return pd.DataFrame({
+        'symbol': symbol_names[lot_symbols],
+        'side': side,
+        'quantity': lot_quantity,
+        'entry_time': entry_time,
+        'exit_time': exit_time,
+        'holding_period': exit_time - entry_time,
+        'entry_price': entry_price,
+        'exit_price': exit_price,
+        'gross_pnl': gross_pnl,
+        'commission': lot_commission,
+        'pnl': pnl,
+        'return': trade_return,
+        'mae': mae,
+        'mfe': mfe,
+    })
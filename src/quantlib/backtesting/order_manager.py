@@ -1,37 +1,221 @@
 """Order manager for tracking and executing pending orders"""
 
-from typing import Dict, List, Optional, Tuple
-from datetime import datetime
+import heapq
+from typing import Dict, Iterator, List, Optional, Tuple
+from datetime import date, datetime
 import pandas as pd
 
 from quantlib.backtesting.event import OrderEvent, FillEvent, OrderStatus
 
 
+def _trigger(order: OrderEvent) -> Tuple[Optional[str], Optional[float]]:
+    """
+    Side of the bar that can fill an order, and the price it must reach.
+
+    Returns:
+        ('high', price) if the order can only fill once the bar's high
+        reaches price, ('low', price) if once the low reaches price, or
+        (None, None) if the order must be checked on every bar
+    """
+    if order.order_type == 'LIMIT':
+        price = order.limit_price
+        side = {'BUY': 'low', 'SELL': 'high'}.get(order.direction)
+    elif order.order_type in ('STOP', 'STOP_LIMIT'):
+        price = order.stop_price
+        side = {'BUY': 'high', 'SELL': 'low'}.get(order.direction)
+    else:
+        # Market and trailing stop orders depend on the close of every bar
+        return None, None
+    if side is None or price is None or price != price:
+        return None, None
+    return side, float(price)
+
+
+class OrderBook:
+    """
+    Pending orders of one symbol, indexed by trigger price.
+
+    Limit and stop orders sit in two heaps: a min-heap of orders that fill
+    when the bar's high reaches their price (sell limits, buy stops) and a
+    max-heap of orders that fill when the low reaches it (buy limits, sell
+    stops). A bar only pops the orders whose trigger lies within its
+    [low, high] range; market and trailing stop orders are checked every
+    bar. Removed orders are dropped from the heaps lazily.
+
+    Iterating the book yields its orders in the order they were added.
+    """
+
+    def __init__(self):
+        """Initialize order book"""
+        self._orders: Dict[int, List] = {}  # id(order) -> [seq, order, in_heap]
+        self._high_heap: List[Tuple[float, int, OrderEvent]] = []
+        self._low_heap: List[Tuple[float, int, OrderEvent]] = []
+        self._every_bar: Dict[int, OrderEvent] = {}  # seq -> order
+        self._day_orders: Dict[date, Dict[int, OrderEvent]] = {}  # order date -> {seq: order}
+        self._seq = 0
+        self._stale = 0
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __iter__(self) -> Iterator[OrderEvent]:
+        return (entry[1] for entry in list(self._orders.values()))
+
+    def __contains__(self, order: OrderEvent) -> bool:
+        return id(order) in self._orders
+
+    def add(self, order: OrderEvent):
+        """Add an order to the book"""
+        seq = self._seq
+        self._seq += 1
+        entry = [seq, order, False]
+        self._orders[id(order)] = entry
+        if order.time_in_force.value == 'DAY':
+            self._day_orders.setdefault(order.timestamp.date(), {})[seq] = order
+        self._push(entry)
+
+    def _push(self, entry: List):
+        seq, order = entry[0], entry[1]
+        side, price = _trigger(order)
+        if side == 'high':
+            heapq.heappush(self._high_heap, (price, seq, order))
+            entry[2] = True
+        elif side == 'low':
+            heapq.heappush(self._low_heap, (-price, seq, order))
+            entry[2] = True
+        else:
+            self._every_bar[seq] = order
+
+    def remove(self, order: OrderEvent) -> bool:
+        """
+        Remove an order from the book.
+
+        Returns:
+            True if the order was in the book
+        """
+        entry = self._orders.pop(id(order), None)
+        if entry is None:
+            return False
+        seq = entry[0]
+        self._every_bar.pop(seq, None)
+        if order.time_in_force.value == 'DAY':
+            day = self._day_orders.get(order.timestamp.date())
+            if day is not None:
+                day.pop(seq, None)
+                if not day:
+                    del self._day_orders[order.timestamp.date()]
+        if entry[2]:
+            self._stale += 1
+            if self._stale > 64 and self._stale > len(self._orders):
+                self._compact()
+        return True
+
+    def _compact(self):
+        """Rebuild the heaps without removed orders"""
+        self._high_heap = [item for item in self._high_heap if self._is_live(item)]
+        self._low_heap = [item for item in self._low_heap if self._is_live(item)]
+        heapq.heapify(self._high_heap)
+        heapq.heapify(self._low_heap)
+        self._stale = 0
+
+    def _is_live(self, item: Tuple[float, int, OrderEvent]) -> bool:
+        entry = self._orders.get(id(item[2]))
+        return entry is not None and entry[0] == item[1]
+
+    def expired(self, current_date: date) -> List[OrderEvent]:
+        """DAY orders placed on another date than current_date"""
+        return [
+            order
+            for order_date, orders in self._day_orders.items() if order_date != current_date
+            for order in orders.values()
+        ]
+
+    def candidates(self, high: float, low: float) -> List[OrderEvent]:
+        """
+        Pop the orders that may fill on a bar.
+
+        Limit and stop orders whose trigger price lies within [low, high]
+        leave the heaps; orders that do not fill must be handed back with
+        restore().
+
+        Args:
+            high: High price of the bar
+            low: Low price of the bar
+
+        Returns:
+            Orders to check, in the order they were added
+        """
+        popped = []
+        high_heap, low_heap = self._high_heap, self._low_heap
+        while high_heap and high_heap[0][0] <= high:
+            popped.append(heapq.heappop(high_heap))
+        while low_heap and -low_heap[0][0] >= low:
+            popped.append(heapq.heappop(low_heap))
+
+        candidates = []
+        for item in popped:
+            if self._is_live(item):
+                self._orders[id(item[2])][2] = False
+                candidates.append((item[1], item[2]))
+            else:
+                self._stale -= 1
+        candidates.extend(self._every_bar.items())
+        candidates.sort(key=lambda candidate: candidate[0])
+        return [order for _, order in candidates]
+
+    def restore(self, order: OrderEvent):
+        """Put a popped order that did not fill back in its heap"""
+        entry = self._orders.get(id(order))
+        if entry is not None and not entry[2] and entry[0] not in self._every_bar:
+            self._push(entry)
+
+
 class OrderManager:
-    """Manages pending orders and checks for execution conditions"""
+    """
+    Manages pending orders and checks for execution conditions.
+
+    Pending orders are kept in a price-indexed OrderBook per symbol, so a
+    bar only checks the orders it can fill, and in an order ID index, so
+    cancelling does not scan every symbol.
+    """
     
     def __init__(self):
         """Initialize order manager"""
-        self.pending_orders: Dict[str, List[OrderEvent]] = {}  # symbol -> list of orders
+        self.pending_orders: Dict[str, OrderBook] = {}  # symbol -> order book
         self.order_history: List[OrderEvent] = []
+        self._orders_by_id: Dict[str, List[OrderEvent]] = {}
     
     def add_order(self, order: OrderEvent):
-        """Add an order to the pending orders list"""
+        """Add an order to the pending orders"""
         symbol = order.symbol.upper()
         if symbol not in self.pending_orders:
-            self.pending_orders[symbol] = []
-        self.pending_orders[symbol].append(order)
+            self.pending_orders[symbol] = OrderBook()
+        self.pending_orders[symbol].add(order)
+        self._orders_by_id.setdefault(order.order_id, []).append(order)
         self.order_history.append(order)
     
+    def _remove(self, book: OrderBook, order: OrderEvent):
+        """Remove an order from its book and the ID index"""
+        if book.remove(order):
+            orders = self._orders_by_id.get(order.order_id)
+            if orders is not None:
+                orders.remove(order)
+                if not orders:
+                    del self._orders_by_id[order.order_id]
+    
     def cancel_order(self, order_id: str) -> bool:
         """Cancel a pending order by ID"""
-        for symbol, orders in self.pending_orders.items():
-            for order in orders:
-                if order.order_id == order_id and order.status == OrderStatus.PENDING:
-                    order.status = OrderStatus.CANCELLED
-                    orders.remove(order)
-                    return True
-        return False
+        orders = [order for order in self._orders_by_id.get(order_id, ()) if order.status == OrderStatus.PENDING]
+        if not orders:
+            return False
+        if len(orders) > 1:
+            # Same ID in several books: cancel the first in symbol order
+            symbols = list(self.pending_orders)
+            orders.sort(key=lambda order: symbols.index(order.symbol.upper()))
+        order = orders[0]
+        order.status = OrderStatus.CANCELLED
+        self._remove(self.pending_orders[order.symbol.upper()], order)
+        return True
     
     def check_orders(
         self,
@@ -44,6 +228,9 @@ class OrderManager:
         """
         Check pending orders for execution conditions.
         
+        Only orders whose trigger price lies within [low, high], plus
+        market and trailing stop orders, are checked.
+        
         Args:
             symbol: Trading symbol
             high: High price of current bar
@@ -54,37 +241,31 @@ class OrderManager:
         Returns:
             List of FillEvent objects for orders that should be executed
         """
-        symbol_upper = symbol.upper()
-        if symbol_upper not in self.pending_orders:
+        book = self.pending_orders.get(symbol.upper())
+        if not book:
             return []
         
-        fills = []
-        orders_to_remove = []
+        # DAY orders expire once a bar of another day arrives
+        for order in book.expired(current_time.date()):
+            if order.status == OrderStatus.PENDING:
+                order.status = OrderStatus.CANCELLED
+            self._remove(book, order)
         
-        for order in self.pending_orders[symbol_upper]:
+        fills = []
+        for order in book.candidates(high, low):
             if order.status != OrderStatus.PENDING:
-                orders_to_remove.append(order)
+                self._remove(book, order)
                 continue
             
-            # Check time-in-force expiration (DAY orders expire at end of day)
-            if order.time_in_force.value == 'DAY':
-                # Simple check: if order timestamp is not same day as current_time, cancel
-                if order.timestamp.date() != current_time.date():
-                    order.status = OrderStatus.CANCELLED
-                    orders_to_remove.append(order)
-                    continue
-            
             fill_event = self._check_order_execution(order, high, low, close, current_time)
             if fill_event:
                 fills.append(fill_event)
+                order.filled_quantity += fill_event.quantity
                 if order.filled_quantity >= order.quantity:
                     order.status = OrderStatus.FILLED
-                    orders_to_remove.append(order)
-        
-        # Remove filled/cancelled orders
-        for order in orders_to_remove:
-            if order in self.pending_orders[symbol_upper]:
-                self.pending_orders[symbol_upper].remove(order)
+                    self._remove(book, order)
+                    continue
+            book.restore(order)
         
         return fills
     
@@ -241,3 +422,4 @@ class OrderManager:
         """Clear all pending orders"""
         self.pending_orders.clear()
         self.order_history.clear()
+        self._orders_by_id.clear()
@@ -0,0 +1,193 @@
+"""Columnar equity and position recording for the backtesting engine"""
+
+from typing import Dict, List, Optional
+import numpy as np
+import pandas as pd
+
+
+RECORDING_LEVELS = ('full', 'equity_only', 'none')
+
+
+class EquityRecorder:
+    """
+    Preallocated, column-oriented store for per-bar portfolio state.
+
+    Timestamps, equity and cash go into NumPy arrays that grow by doubling.
+    Positions are kept as a sparse change-log: a snapshot is stored only on
+    bars where holdings differ from the previous snapshot, so memory grows
+    with the number of position changes instead of bars x positions.
+
+    Recording levels:
+        full: equity, cash and the positions change-log
+        equity_only: equity and cash (enough for returns-based metrics)
+        none: only the first and last bar (final equity / total return)
+    """
+
+    def __init__(self, level: str = 'full', capacity: int = 1024):
+        """
+        Initialize recorder.
+
+        Args:
+            level: Recording level ('full', 'equity_only' or 'none')
+            capacity: Initial number of bars to preallocate
+        """
+        if level not in RECORDING_LEVELS:
+            raise ValueError(
+                f"Invalid recording level '{level}'. Must be one of {RECORDING_LEVELS}"
+            )
+
+        self.level = level
+        if level == 'none':
+            capacity = 2
+        capacity = max(int(capacity), 2)
+
+        self._timestamps = np.empty(capacity, dtype=object)
+        self._equity = np.empty(capacity, dtype=np.float64)
+        self._cash = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+
+        # Positions change-log: bar index -> positions snapshot
+        self._change_index: List[int] = []
+        self._change_positions: List[Dict[str, int]] = []
+        self._last_positions: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _grow(self):
+        """Double the capacity of the column arrays"""
+        capacity = len(self._equity) * 2
+        for name in ('_timestamps', '_equity', '_cash'):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    def record(
+        self,
+        timestamp: pd.Timestamp,
+        equity: float,
+        cash: float,
+        positions: Optional[Dict[str, int]] = None
+    ):
+        """
+        Record the portfolio state for one bar.
+
+        Args:
+            timestamp: Bar timestamp
+            equity: Total equity
+            cash: Cash balance
+            positions: Current positions (only read at the 'full' level; a
+                copy is stored when they differ from the last snapshot)
+        """
+        i = self._size
+        if self.level == 'none' and i == 2:
+            # Keep the first bar and overwrite the last one
+            i = 1
+        else:
+            if i == len(self._equity):
+                self._grow()
+            self._size = i + 1
+
+        self._timestamps[i] = timestamp
+        self._equity[i] = equity
+        self._cash[i] = cash
+
+        if self.level == 'full' and positions is not None:
+            if positions != self._last_positions:
+                snapshot = positions.copy()
+                self._change_index.append(i)
+                self._change_positions.append(snapshot)
+                self._last_positions = snapshot
+
+    def extend(
+        self,
+        timestamps,
+        equity,
+        cash,
+        positions: Optional[List[Dict[str, int]]] = None
+    ):
+        """
+        Record the portfolio state for many bars at once.
+
+        Args:
+            timestamps: Bar timestamps
+            equity: Total equity per bar
+            cash: Cash balance per bar
+            positions: Positions per bar (only read at the 'full' level)
+        """
+        n = len(equity)
+        if self.level == 'none':
+            for i in sorted({0, n - 1}) if n else []:
+                self.record(timestamps[i], equity[i], cash[i])
+            return
+
+        start = self._size
+        while start + n > len(self._equity):
+            self._grow()
+        self._size = start + n
+
+        self._timestamps[start:start + n] = list(timestamps)
+        self._equity[start:start + n] = equity
+        self._cash[start:start + n] = cash
+
+        if self.level == 'full' and positions is not None:
+            for i, snapshot in enumerate(positions, start):
+                if snapshot != self._last_positions:
+                    snapshot = snapshot.copy()
+                    self._change_index.append(i)
+                    self._change_positions.append(snapshot)
+                    self._last_positions = snapshot
+
+    @property
+    def index(self) -> pd.Index:
+        """Recorded timestamps as an index named 'timestamp'"""
+        return pd.Index(list(self._timestamps[:self._size]), name='timestamp')
+
+    @property
+    def equity(self) -> np.ndarray:
+        """Recorded equity values"""
+        return self._equity[:self._size]
+
+    @property
+    def cash(self) -> np.ndarray:
+        """Recorded cash balances"""
+        return self._cash[:self._size]
+
+    def equity_series(self) -> pd.Series:
+        """Equity curve as a Series indexed by timestamp"""
+        return pd.Series(self.equity.copy(), index=self.index, name='equity')
+
+    def positions_at(self, i: int) -> Dict[str, int]:
+        """Positions held at recorded bar i (requires the 'full' level)"""
+        k = int(np.searchsorted(self._change_index, i, side='right')) - 1
+        return self._change_positions[k] if k >= 0 else {}
+
+    def positions_history(self) -> pd.DataFrame:
+        """
+        Per-bar cash and positions, expanded from the change-log.
+
+        Bars without a position change share the previous snapshot dict.
+        Returns an empty DataFrame unless the level is 'full'.
+        """
+        if self.level != 'full' or self._size == 0:
+            return pd.DataFrame()
+
+        snapshots = [{}] + self._change_positions
+        k = np.searchsorted(self._change_index, np.arange(self._size), side='right')
+        return pd.DataFrame({
+            'cash': self.cash.copy(),
+            'positions': [snapshots[j] for j in k],
+        }, index=self.index)
+
+    def to_records(self) -> List[Dict]:
+        """Recorded bars as a list of dicts (Portfolio.history layout)"""
+        history = self.positions_history()
+        positions = history['positions'].tolist() if not history.empty else [{}] * self._size
+        return [
+            {'timestamp': timestamp, 'cash': cash, 'equity': equity, 'positions': snapshot}
+            for timestamp, cash, equity, snapshot in zip(
+                self._timestamps[:self._size], self.cash.tolist(),
+                self.equity.tolist(), positions
+            )
+        ]
@@ -1,10 +1,25 @@
 """Scheduled events system for time-based function execution"""
 
+import bisect
+import heapq
 from typing import Callable, Dict, List, Optional, Set
 from datetime import datetime, time
 from enum import Enum
+import numpy as np
 import pandas as pd
 
+# Minute-based rules and the interval their minute must divide
+_MINUTE_INTERVALS = {
+    'every_minute': 1,
+    'every_5_minutes': 5,
+    'every_15_minutes': 15,
+    'every_30_minutes': 30,
+    'every_hour': 60,
+}
+
+# How far ahead next_fire_time searches for a matching day
+_MAX_SEARCH_DAYS = 400
+
 
 class TimeRule(Enum):
     """Time rules for scheduling"""
@@ -98,6 +113,92 @@ class ScheduledEvent:
         
         return False
     
+    def _time_of_day(self) -> Optional[time]:
+        """Time the rule fires at, or None if it fires all day on matching days"""
+        if self.time_rule == TimeRule.EVERY_DAY:
+            return self.time_of_day or time(9, 30)
+        if self.time_rule == TimeRule.MARKET_OPEN:
+            return time(9, 30)
+        if self.time_rule == TimeRule.MARKET_CLOSE:
+            return time(16, 0)
+        if self.time_rule == TimeRule.EVERY_WEEK and self.day_of_week is None:
+            return None
+        if self.time_rule == TimeRule.EVERY_MONTH and self.day_of_month is None:
+            return None
+        return self.time_of_day
+    
+    def _matches_day(self, day: pd.Timestamp) -> bool:
+        """Whether the rule can fire on the given day"""
+        if self.time_rule == TimeRule.EVERY_WEEK:
+            return day.weekday() == (self.day_of_week if self.day_of_week is not None else 0)
+        if self.time_rule == TimeRule.EVERY_MONTH:
+            return day.day == (self.day_of_month if self.day_of_month is not None else 1)
+        return True
+    
+    def fire_mask(self, index: pd.DatetimeIndex) -> np.ndarray:
+        """
+        Vectorized should_execute over a whole index.
+        
+        Args:
+            index: Bar timestamps
+            
+        Returns:
+            Boolean array, True where the event fires
+        """
+        rule = self.time_rule.value
+        if rule in _MINUTE_INTERVALS:
+            return np.asarray(index.minute % _MINUTE_INTERVALS[rule] == 0)
+        if self.time_rule not in (
+            TimeRule.EVERY_DAY, TimeRule.EVERY_WEEK, TimeRule.EVERY_MONTH,
+            TimeRule.MARKET_OPEN, TimeRule.MARKET_CLOSE
+        ):
+            return np.zeros(len(index), dtype=bool)
+        
+        mask = np.ones(len(index), dtype=bool)
+        if self.time_rule == TimeRule.EVERY_WEEK:
+            mask &= np.asarray(index.weekday == (self.day_of_week if self.day_of_week is not None else 0))
+        elif self.time_rule == TimeRule.EVERY_MONTH:
+            mask &= np.asarray(index.day == (self.day_of_month if self.day_of_month is not None else 1))
+        time_of_day = self._time_of_day()
+        if time_of_day is not None:
+            mask &= np.asarray((index.hour == time_of_day.hour) & (index.minute == time_of_day.minute))
+        return mask
+    
+    def next_fire_time(self, after: datetime) -> Optional[pd.Timestamp]:
+        """
+        Start of the first minute at or after a time in which the event fires.
+        
+        Rules compare hours and minutes only, so the event is due for any
+        time within the returned minute.
+        
+        Args:
+            after: Time to search from
+            
+        Returns:
+            Timestamp of the minute, or None if the rule never fires
+        """
+        minute = pd.Timestamp(after).replace(second=0, microsecond=0, nanosecond=0)
+        rule = self.time_rule.value
+        if rule in _MINUTE_INTERVALS:
+            return minute + pd.Timedelta(minutes=-minute.minute % _MINUTE_INTERVALS[rule])
+        if self.time_rule not in (
+            TimeRule.EVERY_DAY, TimeRule.EVERY_WEEK, TimeRule.EVERY_MONTH,
+            TimeRule.MARKET_OPEN, TimeRule.MARKET_CLOSE
+        ):
+            return None
+        
+        time_of_day = self._time_of_day()
+        day = minute.normalize()
+        for _ in range(_MAX_SEARCH_DAYS):
+            if self._matches_day(day):
+                if time_of_day is None:
+                    return max(day, minute)
+                candidate = day.replace(hour=time_of_day.hour, minute=time_of_day.minute)
+                if candidate >= minute:
+                    return candidate
+            day = (day + pd.Timedelta(hours=36)).normalize()
+        return None
+    
     def execute(self, context: any) -> None:
         """Execute the scheduled callback"""
         try:
@@ -109,11 +210,33 @@ class ScheduledEvent:
 
 
 class Scheduler:
-    """Manages scheduled events for algorithms"""
+    """
+    Manages scheduled events for algorithms.
+    
+    A backtest knows its timestamps up front, so compile() turns every rule
+    into the sorted list of bar timestamps it fires at; checking a bar is
+    then a comparison against the next firing time. Without a compiled
+    index (live trading), events wait in a heap keyed by their next fire
+    time and only the due ones are evaluated on each tick.
+    """
     
     def __init__(self):
         """Initialize scheduler"""
         self.events: List[ScheduledEvent] = []
+        self._reset()
+    
+    def _reset(self):
+        # Compiled schedule: firing timestamps, the events due at each, and a cursor
+        self._index: Optional[pd.DatetimeIndex] = None
+        self._firing: Dict[int, List[ScheduledEvent]] = {}
+        self._fire_times: List[pd.Timestamp] = []
+        self._fire_events: List[List[ScheduledEvent]] = []
+        self._cursor = 0
+        self._last_time = None
+        # Live schedule: heap of (next fire time, event number, event)
+        self._heap: List[tuple] = []
+        # Number of events already compiled or queued
+        self._known = 0
     
     def schedule(
         self,
@@ -140,6 +263,68 @@ class Scheduler:
         self.events.append(event)
         return event
     
+    def compile(self, index: pd.DatetimeIndex) -> None:
+        """
+        Precompute the bars every event fires at.
+        
+        Events scheduled later are added to the compiled schedule when the
+        next bar is checked. Only timestamps in the index can fire.
+        
+        Args:
+            index: Timestamps of the bars that will be checked, in order
+        """
+        self._reset()
+        self._index = pd.DatetimeIndex(index)
+        self._sync_compiled()
+    
+    def _sync_compiled(self):
+        """Add events scheduled since the last sync to the compiled schedule"""
+        for event in self.events[self._known:]:
+            for pos in np.flatnonzero(event.fire_mask(self._index)).tolist():
+                self._firing.setdefault(pos, []).append(event)
+        self._known = len(self.events)
+        positions = sorted(self._firing)
+        self._fire_times = list(self._index[positions])
+        self._fire_events = [self._firing[pos] for pos in positions]
+        self._cursor = 0 if self._last_time is None else bisect.bisect_left(self._fire_times, self._last_time)
+    
+    def _due_compiled(self, current_time) -> List[ScheduledEvent]:
+        if self._known != len(self.events):
+            self._sync_compiled()
+        self._last_time = current_time
+        fire_times = self._fire_times
+        cursor = self._cursor
+        while cursor < len(fire_times) and fire_times[cursor] < current_time:
+            cursor += 1
+        self._cursor = cursor
+        if cursor < len(fire_times) and fire_times[cursor] == current_time:
+            return self._fire_events[cursor]
+        return []
+    
+    def _due_live(self, current_time) -> List[ScheduledEvent]:
+        current_time = pd.Timestamp(current_time)
+        heap = self._heap
+        for number in range(self._known, len(self.events)):
+            next_time = self.events[number].next_fire_time(current_time)
+            if next_time is not None:
+                heapq.heappush(heap, (next_time, number, self.events[number]))
+        self._known = len(self.events)
+        
+        popped = []
+        while heap and heap[0][0] <= current_time:
+            popped.append(heapq.heappop(heap))
+        popped.sort(key=lambda item: item[1])
+        
+        due = []
+        for _, number, event in popped:
+            if event.should_execute(current_time):
+                due.append(event)
+            # The event stays due for the rest of a matching minute
+            next_time = event.next_fire_time(current_time)
+            if next_time is not None:
+                heapq.heappush(heap, (next_time, number, event))
+        return due
+    
     def check_and_execute(self, context: any) -> None:
         """
         Check all scheduled events and execute those that should run.
@@ -147,21 +332,25 @@ class Scheduler:
         Args:
             context: Algorithm context object
         """
-        if not hasattr(context, 'current_time'):
+        if not hasattr(context, 'current_time') or not self.events:
             return
         
         current_time = context.current_time
+        if self._index is not None:
+            due = self._due_compiled(current_time)
+        else:
+            due = self._due_live(current_time)
         
-        for event in self.events:
-            if event.should_execute(current_time):
-                # Check if we've already executed this event for this timestamp
-                # (prevent multiple executions in the same bar)
-                if event.last_executed is None or event.last_executed < current_time:
-                    event.execute(context)
+        for event in due:
+            # Check if we've already executed this event for this timestamp
+            # (prevent multiple executions in the same bar)
+            if event.last_executed is None or event.last_executed < current_time:
+                event.execute(context)
     
     def clear(self):
         """Clear all scheduled events"""
         self.events.clear()
+        self._reset()
 
 
 # Convenience functions for common scheduling patterns
@@ -0,0 +1,134 @@
+"""
+Vectorized (signal-based) backtesting
+
+Simulates a single-symbol strategy from precomputed target positions using
+NumPy array math instead of the event loop. Fill semantics mirror
+BacktestEngine.run: a target decided on bar t is filled on bar t+1 at the
+close of bar t (adjusted for slippage), and commissions follow the
+SimulatedBroker rules.
+"""
+
+from typing import Dict, Union
+import numpy as np
+import pandas as pd
+
+from quantlib.backtesting.broker import SimulatedBroker
+
+
+ArrayLike = Union[pd.Series, np.ndarray, list]
+
+
+def _forward_fill(values: np.ndarray, fill_value: float = 0.0) -> np.ndarray:
+    """Forward-fill NaNs in a 1-D float array; leading NaNs become fill_value"""
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        return values.copy()
+
+    valid = ~np.isnan(values)
+    idx = np.where(valid, np.arange(len(values)), 0)
+    np.maximum.accumulate(idx, out=idx)
+
+    filled = values[idx]
+    filled[np.isnan(filled)] = fill_value
+    return filled
+
+
+def positions_from_signals(
+    entries: ArrayLike,
+    exits: ArrayLike,
+    size: float = 100
+) -> np.ndarray:
+    """
+    Convert entry/exit boolean arrays into a target position array.
+
+    The position becomes `size` on an entry bar and 0 on an exit bar, and is
+    held in between. If both are set on the same bar the entry wins.
+
+    Args:
+        entries: Boolean array, True where the strategy wants to be long
+        exits: Boolean array, True where the strategy wants to be flat
+        size: Position size (shares) held while long
+
+    Returns:
+        Target position array (float)
+    """
+    entries = np.asarray(entries, dtype=bool)
+    exits = np.asarray(exits, dtype=bool)
+
+    if entries.shape != exits.shape:
+        raise ValueError("entries and exits must have the same length")
+
+    state = np.full(len(entries), np.nan)
+    state[exits] = 0.0
+    state[entries] = float(size)
+
+    return _forward_fill(state)
+
+
+def simulate_target_positions(
+    targets: ArrayLike,
+    close: ArrayLike,
+    broker: SimulatedBroker,
+    initial_capital: float
+) -> Dict[str, np.ndarray]:
+    """
+    Simulate cash, holdings and equity for a target position array.
+
+    NaN targets mean "keep the previous target". Orders are not checked
+    against available cash, so targets are assumed to be affordable.
+
+    Args:
+        targets: Desired position after each bar's decision
+        close: Close prices, same length as targets
+        broker: SimulatedBroker providing commission and slippage rules
+        initial_capital: Starting cash
+
+    Returns:
+        Dictionary of arrays: holdings, cash, equity, fill_index, quantity,
+        is_buy, price, commission
+    """
+    close = np.asarray(close, dtype=float)
+    targets = _forward_fill(targets)
+
+    if len(targets) != len(close):
+        raise ValueError("targets and close must have the same length")
+
+    n = len(close)
+
+    # Holdings during bar t are the target decided on bar t-1
+    holdings = np.zeros(n)
+    if n > 1:
+        holdings[1:] = targets[:-1]
+
+    trade_sizes = np.diff(holdings, prepend=0.0)
+    fill_index = np.flatnonzero(trade_sizes)
+    quantity = np.abs(trade_sizes[fill_index])
+    is_buy = trade_sizes[fill_index] > 0
+
+    # Fills are priced at the close of the bar the decision was made on
+    execution_prices, commissions = broker.calculate_execution_batch(
+        quantity, close[fill_index - 1], is_buy
+    )
+
+    # Sequential cumulative sum keeps the same rounding as the event loop
+    cash_flows = np.zeros(n)
+    if n > 0:
+        cash_flows[0] = initial_capital
+    cash_flows[fill_index] += np.where(
+        is_buy,
+        -(quantity * execution_prices + commissions),
+        quantity * execution_prices - commissions
+    )
+    cash = np.cumsum(cash_flows)
+    equity = cash + holdings * close
+
+    return {
+        'holdings': holdings,
+        'cash': cash,
+        'equity': equity,
+        'fill_index': fill_index,
+        'quantity': quantity.astype(np.int64),
+        'is_buy': is_buy,
+        'price': execution_prices,
+        'commission': commissions,
+    }
@@ -5,7 +5,11 @@ Walk-forward analysis splits data into training and testing periods, optimizes
 parameters on training data, then tests on out-of-sample data to detect overfitting.
 """
 
-from typing import Dict, Any, List, Optional, Callable
+import logging
+import os
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Callable, Tuple
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -14,6 +18,19 @@ from quantlib.backtesting import BacktestEngine
 from quantlib.strategies import Strategy
 from quantlib.risk import RiskCalculator
 
+logger = logging.getLogger(__name__)
+
+def _run_job(job: tuple) -> List[Optional[Dict[str, Any]]]:
+    """Executor entry point: backtest one parameter set on its spans"""
+    analyzer, strategy_factory, data, parameters, spans, anchored, backtest_kwargs, full_result = job
+    if not isinstance(data, pd.DataFrame):
+        # Shared-memory handle published by run_analysis
+        from quantlib.workflows.shared_data import attach_frame
+        data = attach_frame(data)
+    return analyzer._backtest_spans(
+        strategy_factory, data, parameters, spans, anchored, full_result, **backtest_kwargs
+    )
+
 
 class WalkForwardAnalyzer:
     """Walk-forward analysis for strategy optimization"""
@@ -51,10 +68,21 @@ class WalkForwardAnalyzer:
         slippage: float = 0.0,
         commission_type: str = 'fixed',
         risk_free_rate: float = 0.0,
+        n_jobs: int = 1,
+        executor: Optional[Executor] = None,
+        n_workers: Optional[int] = None,
     ) -> Dict[str, Any]:
         """
         Run walk-forward analysis.
         
+        Every (parameter set, training window) backtest is an independent job,
+        so with n_jobs or an executor both the windows and the grid inside
+        each window run in parallel. Training metrics of the selected
+        parameters are reused from the optimization pass. With anchor=True
+        each parameter set is backtested once over the longest training
+        window and the shorter (expanding) windows are read off its equity
+        curve.
+        
         Args:
             strategy_factory: Function that takes parameters dict and returns Strategy instance
             data: OHLCV DataFrame with datetime index
@@ -66,6 +94,12 @@ class WalkForwardAnalyzer:
             slippage: Slippage as fraction
             commission_type: 'fixed' or 'percentage'
             risk_free_rate: Risk-free rate for metrics
+            n_jobs: Number of worker processes (1 = serial, -1 = all CPUs). The
+                strategy_factory must be picklable (a module-level function)
+            executor: Existing concurrent.futures executor to use instead of
+                creating a pool (it is not shut down)
+            n_workers: Number of workers of `executor`, used to size job
+                chunks (default: the CPU count)
         
         Returns:
             Dictionary with walk-forward results
@@ -80,71 +114,107 @@ class WalkForwardAnalyzer:
                 f"train_size ({self.train_size}) + test_size ({self.test_size})"
             )
         
-        results = []
-        current_start = 0
+        windows = self._generate_windows(total_periods)
+        if not windows:
+            raise ValueError("No valid walk-forward windows could be created")
         
-        # Generate walk-forward windows
-        windows = []
-        while current_start + self.train_size + self.test_size <= total_periods:
-            train_end = current_start + self.train_size
-            test_end = train_end + self.test_size
+        combinations = self._parameter_combinations(parameter_ranges)
+        backtest_kwargs = {
+            'symbol': symbol,
+            'initial_capital': initial_capital,
+            'commission': commission,
+            'slippage': slippage,
+            'commission_type': commission_type,
+            'risk_free_rate': risk_free_rate,
+        }
+        
+        own_executor = None
+        if executor is None and n_jobs != 1:
+            n_workers = (os.cpu_count() or 1) if n_jobs < 0 else n_jobs
+            executor = own_executor = self._create_executor(n_workers, strategy_factory)
+        elif executor is not None and n_workers is None:
+            n_workers = os.cpu_count() or 1
+        
+        shared = None
+        data_ref = data
+        if isinstance(executor, ProcessPoolExecutor):
+            # Publish the data once; jobs carry a small handle instead of a frame
+            from quantlib.workflows.shared_data import SharedFrame
+            try:
+                shared = SharedFrame(data)
+                data_ref = shared.handle
+            except ValueError:
+                pass
+        
+        try:
+            # Optimize on the training windows. Every (parameters, window) pair is
+            # an independent job; in anchored mode the training windows are
+            # prefixes of the same series, so one run per parameter set covers
+            # all of them.
+            train_spans = [(w['train_start'], w['train_end']) for w in windows]
+            if self.anchor:
+                train_jobs = [
+                    (self, strategy_factory, data_ref, params, train_spans, True, backtest_kwargs, False)
+                    for params in combinations
+                ]
+            else:
+                train_jobs = [
+                    (self, strategy_factory, data_ref, params, [span], False, backtest_kwargs, False)
+                    for params in combinations for span in train_spans
+                ]
+            train_output = self._map(executor, train_jobs, n_workers)
             
-            windows.append({
-                'train_start': current_start,
-                'train_end': train_end,
-                'test_start': train_end,
-                'test_end': test_end,
-            })
+            # train_metrics[w][c]: metrics of combination c on window w (None on error)
+            if self.anchor:
+                train_metrics = [[out[w] for out in train_output] for w in range(len(windows))]
+            else:
+                train_metrics = [
+                    [train_output[c * len(windows) + w][0] for c in range(len(combinations))]
+                    for w in range(len(windows))
+                ]
             
-            current_start += self.step_size
-        
-        if not windows:
-            raise ValueError("No valid walk-forward windows could be created")
+            best = [
+                self._select_best(combinations, window_metrics, optimization_objective, parameter_ranges)
+                for window_metrics in train_metrics
+            ]
+            
+            # Test each window's best parameters out of sample
+            test_jobs = [
+                (self, strategy_factory, data_ref, best_params, [(w['test_start'], w['test_end'])],
+                 False, backtest_kwargs, True)
+                for w, (best_params, _) in zip(windows, best)
+            ]
+            test_output = self._map(executor, test_jobs, n_workers)
+        finally:
+            if shared is not None:
+                shared.unlink()
+            if own_executor is not None:
+                own_executor.shutdown()
         
-        # Run optimization and testing for each window
-        for i, window in enumerate(windows):
+        results = []
+        for i, (window, (best_params, best_train_metrics), test_out) in enumerate(
+            zip(windows, best, test_output)
+        ):
             train_data = data.iloc[window['train_start']:window['train_end']]
             test_data = data.iloc[window['test_start']:window['test_end']]
+            test_result = test_out[0]
+            if test_result is None:
+                # The out-of-sample run failed; repeat it here to raise its error
+                test_result = self._run_backtest(
+                    strategy_factory=strategy_factory,
+                    data=test_data,
+                    parameters=best_params,
+                    **backtest_kwargs,
+                )
             
-            # Optimize parameters on training data
-            best_params = self._optimize_parameters(
-                strategy_factory=strategy_factory,
-                data=train_data,
-                symbol=symbol,
-                parameter_ranges=parameter_ranges,
-                objective=optimization_objective,
-                initial_capital=initial_capital,
-                commission=commission,
-                slippage=slippage,
-                commission_type=commission_type,
-                risk_free_rate=risk_free_rate,
-            )
-            
-            # Test optimized parameters on test data
-            test_result = self._run_backtest(
-                strategy_factory=strategy_factory,
-                data=test_data,
-                symbol=symbol,
-                parameters=best_params,
-                initial_capital=initial_capital,
-                commission=commission,
-                slippage=slippage,
-                commission_type=commission_type,
-                risk_free_rate=risk_free_rate,
-            )
-            
-            # Also run on training data for comparison
-            train_result = self._run_backtest(
-                strategy_factory=strategy_factory,
-                data=train_data,
-                symbol=symbol,
-                parameters=best_params,
-                initial_capital=initial_capital,
-                commission=commission,
-                slippage=slippage,
-                commission_type=commission_type,
-                risk_free_rate=risk_free_rate,
-            )
+            if best_train_metrics is None:
+                # No combination succeeded; report the fallback parameters' training run
+                best_train_metrics = self._run_backtest(
+                    strategy_factory=strategy_factory,
+                    data=train_data,
+                    parameters=best_params,
+                    **backtest_kwargs,
+                )['metrics']
             
             results.append({
                 'window': i + 1,
@@ -153,7 +223,7 @@ class WalkForwardAnalyzer:
                 'test_start_date': test_data.index[0],
                 'test_end_date': test_data.index[-1],
                 'optimized_parameters': best_params,
-                'train_metrics': train_result['metrics'],
+                'train_metrics': best_train_metrics,
                 'test_metrics': test_result['metrics'],
                 'test_equity_curve': test_result['equity_curve'],
                 'test_returns': test_result['returns'],
@@ -172,20 +242,27 @@ class WalkForwardAnalyzer:
             'total_windows': len(results),
         }
     
-    def _optimize_parameters(
-        self,
-        strategy_factory: Callable[[Dict[str, Any]], Strategy],
-        data: pd.DataFrame,
-        symbol: str,
-        parameter_ranges: Dict[str, Dict[str, Any]],
-        objective: str,
-        initial_capital: float,
-        commission: float,
-        slippage: float,
-        commission_type: str,
-        risk_free_rate: float,
-    ) -> Dict[str, Any]:
-        """Optimize parameters using grid search"""
+    def _generate_windows(self, total_periods: int) -> List[Dict[str, int]]:
+        """Generate train/test index ranges (training starts at 0 when anchored)"""
+        windows = []
+        current_start = 0
+        while current_start + self.train_size + self.test_size <= total_periods:
+            train_end = current_start + self.train_size
+            test_end = train_end + self.test_size
+            
+            windows.append({
+                'train_start': 0 if self.anchor else current_start,
+                'train_end': train_end,
+                'test_start': train_end,
+                'test_end': test_end,
+            })
+            
+            current_start += self.step_size
+        
+        return windows
+    
+    def _parameter_combinations(self, parameter_ranges: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build the parameter grid (sampled down to 100 combinations)"""
         from itertools import product
         
         # Generate parameter combinations
@@ -215,40 +292,108 @@ class WalkForwardAnalyzer:
             indices = np.linspace(0, len(combinations) - 1, max_combinations, dtype=int)
             combinations = [combinations[i] for i in indices]
         
-        # Test each combination
+        return [{param_names[i]: combo[i] for i in range(len(param_names))} for combo in combinations]
+    
+    def _select_best(
+        self,
+        combinations: List[Dict[str, Any]],
+        metrics: List[Optional[Dict[str, Any]]],
+        objective: str,
+        parameter_ranges: Dict[str, Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Pick the combination with the highest objective; returns (parameters, train metrics)"""
         best_params = None
+        best_metrics = None
         best_objective = float('-inf')
         
-        for combo in combinations:
-            params = {param_names[i]: combo[i] for i in range(len(param_names))}
-            
-            try:
-                result = self._run_backtest(
-                    strategy_factory=strategy_factory,
-                    data=data,
-                    symbol=symbol,
-                    parameters=params,
-                    initial_capital=initial_capital,
-                    commission=commission,
-                    slippage=slippage,
-                    commission_type=commission_type,
-                    risk_free_rate=risk_free_rate,
-                )
-                
-                objective_value = result['metrics'].get(objective, float('-inf'))
-                if objective_value > best_objective:
-                    best_objective = objective_value
-                    best_params = params
-            except Exception as e:
-                print(f"Warning: Error testing parameters {params}: {e}")
+        for params, combo_metrics in zip(combinations, metrics):
+            if combo_metrics is None:
                 continue
+            objective_value = combo_metrics.get(objective, float('-inf'))
+            if objective_value > best_objective:
+                best_objective = objective_value
+                best_params = params
+                best_metrics = combo_metrics
         
         if best_params is None:
             # Fallback to defaults
-            best_params = {name: param_ranges[name].get('default', param_ranges[name]['min'])
-                          for name, param_ranges in parameter_ranges.items()}
+            best_params = {name: param_range.get('default', param_range['min'])
+                           for name, param_range in parameter_ranges.items()}
+        
+        return best_params, best_metrics
+    
+    def _create_executor(self, n_workers: int, strategy_factory: Callable) -> Optional[ProcessPoolExecutor]:
+        """Create a process pool of n_workers workers (None if the factory cannot be pickled)"""
+        try:
+            pickle.dumps(strategy_factory)
+        except Exception:
+            logger.warning("strategy_factory cannot be pickled (use a module-level function); "
+                           "running walk-forward analysis serially")
+            return None
+        
+        return ProcessPoolExecutor(max_workers=n_workers)
+    
+    def _map(self, executor: Optional[Executor], jobs: List[tuple], n_workers: Optional[int]) -> List[Any]:
+        """Run jobs serially or on an executor with n_workers workers, preserving order"""
+        if executor is None:
+            return [_run_job(job) for job in jobs]
+        
+        chunksize = max(1, len(jobs) // (n_workers * 4))
+        return list(executor.map(_run_job, jobs, chunksize=chunksize))
+    
+    def _backtest_spans(
+        self,
+        strategy_factory: Callable[[Dict[str, Any]], Strategy],
+        data: pd.DataFrame,
+        parameters: Dict[str, Any],
+        spans: List[Tuple[int, int]],
+        anchored: bool,
+        full_result: bool,
+        **backtest_kwargs,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Backtest one parameter set on several index spans.
+        
+        Anchored spans share their start, so a single run over the longest
+        span is sliced for the shorter ones: the engine is causal, so the
+        equity curve of a prefix run equals the prefix of the longer run.
         
-        return best_params
+        Returns:
+            Per span, the result dict (full_result) or its metrics, or None
+            if the backtest failed
+        """
+        try:
+            if anchored and len(spans) > 1:
+                start = spans[0][0]
+                result = self._run_backtest(
+                    strategy_factory=strategy_factory,
+                    data=data.iloc[start:max(end for _, end in spans)],
+                    parameters=parameters,
+                    **backtest_kwargs,
+                )
+                equity_curve = result['equity_curve']
+                output = []
+                for span_start, span_end in spans:
+                    prefix = equity_curve.iloc[:span_end - span_start]
+                    metrics = self._calculate_metrics(
+                        prefix.pct_change().dropna(), prefix, backtest_kwargs['risk_free_rate']
+                    )
+                    output.append(metrics)
+                return output
+            
+            output = []
+            for span_start, span_end in spans:
+                result = self._run_backtest(
+                    strategy_factory=strategy_factory,
+                    data=data.iloc[span_start:span_end],
+                    parameters=parameters,
+                    **backtest_kwargs,
+                )
+                output.append(result if full_result else result['metrics'])
+            return output
+        except Exception as e:
+            print(f"Warning: Error testing parameters {parameters}: {e}")
+            return [None] * len(spans)
     
     def _run_backtest(
         self,
@@ -269,16 +414,29 @@ class WalkForwardAnalyzer:
             initial_capital=initial_capital,
             commission=commission,
             slippage=slippage,
-            commission_type=commission_type
+            commission_type=commission_type,
+            recording='equity_only'  # Only returns/equity are needed for metrics
         )
         engine._symbol = symbol
         
         backtest_results = engine.run(strategy, data, symbol=symbol)
         
-        # Calculate metrics
         returns = backtest_results.get('returns', pd.Series())
         equity_curve = backtest_results.get('equity_curve', pd.Series())
         
+        return {
+            'metrics': self._calculate_metrics(returns, equity_curve, risk_free_rate),
+            'equity_curve': equity_curve,
+            'returns': returns,
+        }
+    
+    def _calculate_metrics(
+        self,
+        returns: pd.Series,
+        equity_curve: pd.Series,
+        risk_free_rate: float,
+    ) -> Dict[str, Any]:
+        """Calculate flat risk metrics for a returns series"""
         metrics = {}
         if len(returns) > 0:
             try:
@@ -292,11 +450,7 @@ class WalkForwardAnalyzer:
             except Exception as e:
                 print(f"Warning: Error calculating metrics: {e}")
         
-        return {
-            'metrics': metrics,
-            'equity_curve': equity_curve,
-            'returns': returns,
-        }
+        return metrics
     
     def _calculate_summary(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Calculate summary statistics across all windows"""
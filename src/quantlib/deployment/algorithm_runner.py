@@ -122,6 +122,9 @@ class AlgorithmRunner:
             trades = self.engine.get_trades()
             metrics['num_trades'] = len(trades) if not trades.empty else 0
         
+        if hasattr(self.engine, 'get_risk_metrics'):
+            metrics.update(self.engine.get_risk_metrics())
+        
         return metrics
     
     def get_logs(self, log_type: str = 'performance') -> List[Dict]:
@@ -4,6 +4,10 @@ from quantlib.indicators.trend import sma, ema, macd, adx, ichimoku
 from quantlib.indicators.momentum import rsi, stochastic, williams_r, cci, roc
 from quantlib.indicators.volatility import bollinger_bands, atr, keltner_channels, donchian_channels
 from quantlib.indicators.volume import obv, volume_sma, volume_profile, vwap
+from quantlib.indicators.pipeline import IndicatorSet
+from quantlib.indicators.batch import (
+    batch_sma, batch_ema, batch_rsi, batch_roc, batch_bollinger_bands, batch_atr
+)
 
 __all__ = [
     # Trend indicators
@@ -28,4 +32,12 @@ __all__ = [
     "volume_sma",
     "volume_profile",
     "vwap",
+    # Batched computation
+    "IndicatorSet",
+    "batch_sma",
+    "batch_ema",
+    "batch_rsi",
+    "batch_roc",
+    "batch_bollinger_bands",
+    "batch_atr",
 ]
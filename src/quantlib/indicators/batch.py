@@ -0,0 +1,369 @@
+"""
+Batch indicators over many symbols and many parameter values.
+
+Universe screening and parameter sweeps call the same indicator thousands
+of times on individual Series. The functions here take a (T x N) price
+matrix (a DataFrame with one column per symbol, or a 2-D array) and a
+single window or a sequence of windows, and compute everything in one
+vectorized pass:
+
+- Rolling means come from one cumulative sum per column; every window is
+  a difference of two rows of it
+- Rolling standard deviations reduce strided window views in row blocks
+- EMAs run as a first-order linear filter down every column at once
+
+Results match the single-series functions in quantlib.indicators to
+floating-point rounding.
+
+Output shape:
+    - One window: same shape and type as the input
+    - Several windows: DataFrame input gives a DataFrame with (window,
+      symbol) MultiIndex columns, Series input a DataFrame with one column
+      per window, array input an array of shape (n_windows, T[, N])
+"""
+
+from typing import Dict, Iterable, Union
+import pandas as pd
+import numpy as np
+from scipy.signal import lfilter
+
+from quantlib.indicators.volatility import _true_range
+
+PriceInput = Union[pd.Series, pd.DataFrame, np.ndarray]
+Windows = Union[int, Iterable[int]]
+
+# Elements per strided block in rolling standard deviations (~32 MB of float64)
+STD_BLOCK_ELEMENTS = 1 << 22
+
+
+def _as_matrix(prices: PriceInput):
+    """Convert the input to a float (T, N) array plus what is needed to rebuild it"""
+    values = np.asarray(prices, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+    elif values.ndim != 2:
+        raise ValueError("Prices must be 1-D or 2-D")
+    return values, prices
+
+
+def _as_windows(windows: Windows):
+    """Validate windows; returns (array of windows, whether a single window was given)"""
+    single = np.ndim(windows) == 0
+    windows = np.atleast_1d(np.asarray(windows))
+    if len(windows) == 0:
+        raise ValueError("At least one window is required")
+    if not np.issubdtype(windows.dtype, np.integer) or (windows <= 0).any():
+        raise ValueError("Window must be positive")
+    return windows.astype(np.int64), single
+
+
+def _wrap(result: np.ndarray, windows: np.ndarray, single: bool, template: PriceInput):
+    """Shape a (W, T, N) result like the input (see module docstring)"""
+    if isinstance(template, pd.Series):
+        if single:
+            return pd.Series(result[0, :, 0], index=template.index, name=template.name)
+        return pd.DataFrame(result[:, :, 0].T, index=template.index,
+                            columns=pd.Index(windows, name='window'))
+
+    if isinstance(template, pd.DataFrame):
+        if single:
+            return pd.DataFrame(result[0], index=template.index, columns=template.columns)
+        columns = pd.MultiIndex.from_product(
+            [windows, template.columns], names=['window', template.columns.name]
+        )
+        stacked = result.transpose(1, 0, 2).reshape(result.shape[1], -1)
+        return pd.DataFrame(stacked, index=template.index, columns=columns)
+
+    if np.ndim(template) == 1:
+        result = result[:, :, 0]
+    return result[0] if single else result
+
+
+def _window_counts(flags: np.ndarray) -> np.ndarray:
+    """Cumulative count of flags with a leading zero row, for windowed counts"""
+    counts = np.zeros((flags.shape[0] + 1, flags.shape[1]), dtype=np.int32)
+    counts[1:] = np.cumsum(flags, axis=0, dtype=np.int32)
+    return counts
+
+
+def _rolling_means(values: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """
+    Trailing means for every window, shape (W, T, N).
+
+    Windows containing NaN give NaN, like rolling(window).mean(). Columns
+    are centred before the cumulative sum to limit rounding, and windows
+    of identical values return that value exactly (so flat prices give a
+    flat mean and all-zero gains give exactly zero, as pandas does).
+    """
+    n_rows, n_cols = values.shape
+    missing = np.isnan(values)
+    has_missing = missing.any()
+    filled = np.where(missing, 0.0, values) if has_missing else values
+
+    valid = np.maximum(n_rows - missing.sum(axis=0), 1)
+    offset = filled.sum(axis=0) / valid
+    sums = np.zeros((n_rows + 1, n_cols))
+    np.cumsum(filled - offset, axis=0, out=sums[1:])
+    if has_missing:
+        nan_counts = _window_counts(missing)
+
+    # Windows without a change from one value to the next are flat
+    repeated = values[1:] == values[:-1]
+    if repeated.any():
+        change_counts = _window_counts(~repeated)
+
+    result = np.full((len(windows), n_rows, n_cols), np.nan)
+    for i, window in enumerate(windows):
+        if window > n_rows:
+            continue
+        means = (sums[window:] - sums[:-window]) / window
+        means += offset
+        if repeated.any():
+            # change_counts[k] counts changes into rows 1..k
+            flat = change_counts[window - 1:] == change_counts[:n_rows - window + 1]
+            np.copyto(means, values[window - 1:], where=flat)
+        if has_missing:
+            means[(nan_counts[window:] - nan_counts[:-window]) > 0] = np.nan
+        result[i, window - 1:] = means
+    return result
+
+
+def _rolling_stds(values: np.ndarray, windows: np.ndarray) -> np.ndarray:
+    """
+    Trailing sample standard deviations (ddof=1) for every window, shape (W, T, N).
+
+    Each window is reduced with a two-pass mean/deviation over a strided
+    view, processed in row blocks to bound the temporaries.
+    """
+    n_rows, n_cols = values.shape
+    result = np.full((len(windows), n_rows, n_cols), np.nan)
+    for i, window in enumerate(windows):
+        if window > n_rows or window < 2:
+            continue
+        views = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+        block_rows = max(1, STD_BLOCK_ELEMENTS // (n_cols * window))
+        for start in range(0, len(views), block_rows):
+            block = views[start:start + block_rows]
+            deviations = block - block.mean(axis=-1, keepdims=True)
+            std = np.sqrt((deviations * deviations).sum(axis=-1) / (window - 1))
+            # Flat windows are exactly zero, as in pandas
+            std[(block == block[..., :1]).all(axis=-1)] = 0.0
+            result[i, start + window - 1:start + window - 1 + len(block)] = std
+    return result
+
+
+def _ewm_recursion(values: np.ndarray, alphas: np.ndarray) -> np.ndarray:
+    """
+    ewm(alpha, adjust=False).mean() for every alpha, shape (W, T, N).
+
+    Follows pandas' recursion step by step (series start at their first
+    valid value, NaN rows carry the last average and decay its weight),
+    with all symbols and alphas advanced together one row at a time.
+    """
+    n_rows, n_cols = values.shape
+    alpha = alphas[:, None]
+    decay = 1.0 - alpha
+
+    result = np.empty((len(alphas), n_rows, n_cols))
+    if n_rows == 0:
+        return result
+    weighted = np.broadcast_to(values[0], (len(alphas), n_cols)).copy()
+    old_weight = np.ones_like(weighted)
+    result[:, 0] = weighted
+
+    for t in range(1, n_rows):
+        current = values[t]
+        observed = ~np.isnan(current)
+        started = ~np.isnan(weighted)
+
+        old_weight = np.where(started, old_weight * decay, old_weight)
+        update = started & observed & (weighted != current)
+        combined = (old_weight * weighted + alpha * current) / (old_weight + alpha)
+        weighted = np.where(update, combined, weighted)
+        old_weight = np.where(started & observed, 1.0, old_weight)
+        weighted = np.where(~started & observed, current, weighted)
+        result[:, t] = weighted
+    return result
+
+
+def _ewm_means(values: np.ndarray, alphas: np.ndarray) -> np.ndarray:
+    """
+    ewm(alpha, adjust=False).mean() for every alpha, shape (W, T, N).
+
+    Columns without gaps after their first valid value are filtered with
+    scipy.signal.lfilter (y = alpha * x + (1 - alpha) * y_prev along the
+    whole column in C); columns with gaps use the row-by-row recursion.
+    """
+    n_rows, n_cols = values.shape
+    result = np.empty((len(alphas), n_rows, n_cols))
+    if n_rows == 0:
+        return result
+
+    missing = np.isnan(values)
+    if missing.any():
+        first = np.argmax(~missing, axis=0)
+        before_start = np.arange(n_rows)[:, None] < first
+        gaps = (missing & ~before_start).any(axis=0)
+        clean = np.flatnonzero(~gaps)
+    else:
+        first = np.zeros(n_cols, dtype=np.int64)
+        before_start = None
+        gaps = np.zeros(n_cols, dtype=bool)
+        clean = slice(None)
+
+    columns = values[:, clean]
+    if columns.shape[1]:
+        start_values = columns[first[clean], np.arange(columns.shape[1])]
+        if before_start is not None:
+            # Leading NaN rows are filled with the first value and blanked afterwards
+            columns = np.where(before_start[:, clean], start_values, columns)
+        for i, alpha in enumerate(alphas):
+            initial = ((1.0 - alpha) * start_values)[None, :]
+            filtered, _ = lfilter([alpha], [1.0, alpha - 1.0], columns, axis=0, zi=initial)
+            if before_start is not None:
+                filtered[before_start[:, clean]] = np.nan
+            result[i][:, clean] = filtered
+
+    if gaps.any():
+        result[:, :, gaps] = _ewm_recursion(values[:, gaps], alphas)
+    return result
+
+
+def batch_sma(prices: PriceInput, windows: Windows) -> PriceInput:
+    """
+    Simple Moving Average of many series and/or windows.
+
+    Args:
+        prices: Price Series, (T x N) DataFrame or array
+        windows: Window size or sequence of window sizes
+
+    Returns:
+        SMA values, shaped as described in the module docstring
+    """
+    values, template = _as_matrix(prices)
+    windows, single = _as_windows(windows)
+    return _wrap(_rolling_means(values, windows), windows, single, template)
+
+
+def batch_ema(prices: PriceInput, windows: Windows) -> PriceInput:
+    """
+    Exponential Moving Average of many series and/or windows.
+
+    Args:
+        prices: Price Series, (T x N) DataFrame or array
+        windows: Window size or sequence of window sizes
+
+    Returns:
+        EMA values (alpha = 2 / (window + 1), as ema), shaped as described
+        in the module docstring
+    """
+    values, template = _as_matrix(prices)
+    windows, single = _as_windows(windows)
+    alphas = 2.0 / (windows + 1.0)
+    return _wrap(_ewm_means(values, alphas), windows, single, template)
+
+
+def batch_rsi(prices: PriceInput, windows: Windows = 14) -> PriceInput:
+    """
+    Relative Strength Index of many series and/or windows.
+
+    Args:
+        prices: Price Series, (T x N) DataFrame or array
+        windows: Window size or sequence of window sizes
+
+    Returns:
+        RSI values (0-100), shaped as described in the module docstring
+    """
+    values, template = _as_matrix(prices)
+    windows, single = _as_windows(windows)
+
+    delta = np.full_like(values, np.nan)
+    delta[1:] = values[1:] - values[:-1]
+    # As rsi: NaN changes (first row, gaps) count as zero gain and loss
+    gain = _rolling_means(np.where(delta > 0, delta, 0.0), windows)
+    loss = _rolling_means(np.where(delta < 0, -delta, 0.0), windows)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = gain / loss
+        result = 100 - (100 / (1 + rs))
+    return _wrap(result, windows, single, template)
+
+
+def batch_roc(prices: PriceInput, windows: Windows = 10) -> PriceInput:
+    """
+    Rate of Change of many series and/or windows.
+
+    Args:
+        prices: Price Series, (T x N) DataFrame or array
+        windows: Window size or sequence of window sizes
+
+    Returns:
+        ROC values (percentage change), shaped as described in the module docstring
+    """
+    values, template = _as_matrix(prices)
+    windows, single = _as_windows(windows)
+
+    result = np.full((len(windows),) + values.shape, np.nan)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i, window in enumerate(windows):
+            if window < len(values):
+                result[i, window:] = (values[window:] / values[:-window] - 1) * 100
+    return _wrap(result, windows, single, template)
+
+
+def batch_bollinger_bands(
+    prices: PriceInput,
+    windows: Windows = 20,
+    num_std: float = 2.0
+) -> Dict[str, PriceInput]:
+    """
+    Bollinger Bands of many series and/or windows.
+
+    Args:
+        prices: Price Series, (T x N) DataFrame or array
+        windows: Window size or sequence of window sizes
+        num_std: Number of standard deviations
+
+    Returns:
+        Dictionary with keys upper, middle, lower; each value is shaped as
+        described in the module docstring
+    """
+    values, template = _as_matrix(prices)
+    windows, single = _as_windows(windows)
+
+    middle = _rolling_means(values, windows)
+    std = _rolling_stds(values, windows)
+    return {
+        'upper': _wrap(middle + (std * num_std), windows, single, template),
+        'middle': _wrap(middle, windows, single, template),
+        'lower': _wrap(middle - (std * num_std), windows, single, template),
+    }
+
+
+def batch_atr(
+    high: PriceInput,
+    low: PriceInput,
+    close: PriceInput,
+    windows: Windows = 14
+) -> PriceInput:
+    """
+    Average True Range of many series and/or windows.
+
+    Args:
+        high: High prices (same shape as close)
+        low: Low prices (same shape as close)
+        close: Close prices, Series, (T x N) DataFrame or array
+        windows: Window size or sequence of window sizes
+
+    Returns:
+        ATR values, shaped like close as described in the module docstring
+    """
+    close_values, template = _as_matrix(close)
+    high_values, _ = _as_matrix(high)
+    low_values, _ = _as_matrix(low)
+    if not (high_values.shape == low_values.shape == close_values.shape):
+        raise ValueError("high, low and close must have the same shape")
+    windows, single = _as_windows(windows)
+
+    true_range = _true_range(high_values, low_values, close_values)
+    return _wrap(_rolling_means(true_range, windows), windows, single, template)
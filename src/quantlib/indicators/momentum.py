@@ -81,6 +81,33 @@ def williams_r(high: pd.Series, low: pd.Series, close: pd.Series, window: int =
     return wr
 
 
+# Windows processed per block by _rolling_mean_abs_deviation (bounds memory)
+MAD_BLOCK_SIZE = 65536
+
+
+def _rolling_mean_abs_deviation(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Mean absolute deviation from the mean over each trailing window.
+    
+    Windows are strided views of the input (no copy); they are reduced in
+    blocks so the temporaries stay small for long series. Windows containing
+    NaN give NaN, like a rolling apply.
+    """
+    if window <= 0:
+        raise ValueError("Window must be positive")
+    
+    result = np.full(len(values), np.nan)
+    if len(values) < window:
+        return result
+    
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+    for start in range(0, len(windows), MAD_BLOCK_SIZE):
+        block = windows[start:start + MAD_BLOCK_SIZE]
+        deviations = np.abs(block - block.mean(axis=1, keepdims=True))
+        result[start + window - 1:start + window - 1 + len(block)] = deviations.mean(axis=1)
+    return result
+
+
 def cci(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 20) -> pd.Series:
     """
     Commodity Channel Index.
@@ -96,7 +123,7 @@ def cci(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 20) ->
     """
     tp = (high + low + close) / 3  # Typical Price
     sma_tp = tp.rolling(window=window).mean()
-    mad = tp.rolling(window=window).apply(lambda x: np.mean(np.abs(x - x.mean())))
+    mad = pd.Series(_rolling_mean_abs_deviation(tp.to_numpy(dtype=np.float64), window), index=tp.index)
     
     cci = (tp - sma_tp) / (0.015 * mad)
     
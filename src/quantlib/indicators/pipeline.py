@@ -0,0 +1,423 @@
+"""
+Indicator computation graph.
+
+Many indicators are built from the same intermediate series: Bollinger
+Bands and SMA share a rolling mean, ATR, ADX and Keltner Channels share the
+true range and its rolling mean, MACD and EMA share exponential averages.
+IndicatorSet lets callers request several indicators at once; each
+indicator declares the intermediate nodes it needs, the planner merges
+identical nodes, and every node is evaluated once over the whole frame.
+
+Example:
+    >>> indicators = IndicatorSet()
+    >>> indicators.add('bollinger_bands', window=20).add('atr').add('keltner_channels')
+    >>> results = indicators.compute(ohlcv)   # {'bollinger_bands': DataFrame, 'atr': Series, ...}
+"""
+
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Union
+import pandas as pd
+import numpy as np
+
+from quantlib.indicators.trend import ichimoku
+from quantlib.indicators.momentum import rsi, roc, _rolling_mean_abs_deviation
+from quantlib.indicators.volatility import _true_range
+from quantlib.indicators.volume import obv, volume_profile, vwap
+
+IndicatorResult = Union[pd.Series, pd.DataFrame]
+
+# Node key: (operation, *arguments); arguments that are tuples are input node keys
+NodeKey = Tuple
+
+
+def _rolling_mean(series: pd.Series, window: int) -> pd.Series:
+    return series.rolling(window=window).mean()
+
+
+def _rolling_std(series: pd.Series, window: int) -> pd.Series:
+    return series.rolling(window=window).std()
+
+
+def _rolling_max(series: pd.Series, window: int) -> pd.Series:
+    return series.rolling(window=window).max()
+
+
+def _rolling_min(series: pd.Series, window: int) -> pd.Series:
+    return series.rolling(window=window).min()
+
+
+def _ewm_mean(series: pd.Series, alpha: float) -> pd.Series:
+    return series.ewm(alpha=alpha, adjust=False).mean()
+
+
+def _ewm_span(series: pd.Series, span: int) -> pd.Series:
+    return series.ewm(span=span, adjust=False).mean()
+
+
+def _typical_price(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
+    return (high + low + close) / 3
+
+
+def _true_range_series(high: pd.Series, low: pd.Series, close: pd.Series) -> pd.Series:
+    return pd.Series(_true_range(high, low, close), index=close.index)
+
+
+def _mean_abs_deviation(series: pd.Series, window: int) -> pd.Series:
+    values = _rolling_mean_abs_deviation(series.to_numpy(dtype=np.float64), window)
+    return pd.Series(values, index=series.index)
+
+
+def _directional_movement(high: pd.Series, low: pd.Series) -> pd.DataFrame:
+    up_move = high - high.shift(1)
+    down_move = low.shift(1) - low
+    return pd.DataFrame({
+        'plus': np.where((up_move > down_move) & (up_move > 0), up_move, 0),
+        'minus': np.where((down_move > up_move) & (down_move > 0), down_move, 0),
+    }, index=high.index)
+
+
+# Operation name -> function(*inputs, *arguments)
+OPERATIONS: Dict[str, Callable] = {
+    'rolling_mean': _rolling_mean,
+    'rolling_std': _rolling_std,
+    'rolling_max': _rolling_max,
+    'rolling_min': _rolling_min,
+    'ewm_mean': _ewm_mean,
+    'ewm_span': _ewm_span,
+    'typical_price': _typical_price,
+    'true_range': _true_range_series,
+    'mean_abs_deviation': _mean_abs_deviation,
+    'directional_movement': _directional_movement,
+    'column_of': lambda frame, column: frame[column],
+    'difference': lambda a, b: a - b,
+    'rsi': rsi,
+    'roc': roc,
+    'obv': obv,
+    'vwap': vwap,
+    'ichimoku': ichimoku,
+    'volume_profile': volume_profile,
+}
+
+
+class Planner:
+    """
+    Collects the nodes requested by indicators, merging identical ones.
+
+    Node methods return keys; indicators combine the computed values of
+    those keys in their assemble function.
+    """
+
+    def __init__(self):
+        # Insertion order is a valid execution order: inputs are added first
+        self.nodes: Dict[NodeKey, None] = {}
+        self.columns: Dict[str, None] = {}
+
+    def node(self, operation: str, *arguments) -> NodeKey:
+        """Add (or reuse) a node; tuple arguments must be existing node keys"""
+        if operation not in OPERATIONS:
+            raise ValueError(f"Unknown indicator operation: {operation}")
+        key = (operation,) + arguments
+        self.nodes.setdefault(key, None)
+        return key
+
+    def column(self, name: str) -> NodeKey:
+        """Input column of the data frame"""
+        self.columns.setdefault(name, None)
+        return ('column', name)
+
+    def ema(self, source: NodeKey, window: int) -> NodeKey:
+        """EMA with alpha = 2 / (window + 1), as trend.ema and ewm(span=window)"""
+        if window <= 0:
+            raise ValueError("Window must be positive")
+        return self.node('ewm_mean', source, 2.0 / (window + 1.0))
+
+    def rolling(self, statistic: str, source: NodeKey, window: int) -> NodeKey:
+        """Rolling mean, std, max or min"""
+        if window <= 0:
+            raise ValueError("Window must be positive")
+        return self.node(f'rolling_{statistic}', source, window)
+
+    def true_range(self) -> NodeKey:
+        return self.node('true_range', self.column('High'), self.column('Low'), self.column('Close'))
+
+
+class IndicatorSpec(NamedTuple):
+    """Registered indicator: builds its nodes and assembles the output"""
+    name: str
+    build: Callable[..., Callable[[Dict[NodeKey, Any]], IndicatorResult]]
+    defaults: Dict[str, Any]
+
+
+# Indicator type -> IndicatorSpec
+INDICATORS: Dict[str, IndicatorSpec] = {}
+
+
+def register_indicator(name: str, **defaults):
+    """
+    Register an indicator with IndicatorSet.
+
+    The decorated function receives a Planner and the indicator parameters,
+    declares its nodes and returns a function that builds the result from
+    the computed node values.
+
+    Args:
+        name: Indicator type used in IndicatorSet.add
+        **defaults: Default parameter values
+
+    Returns:
+        Decorator
+    """
+    def decorator(build):
+        INDICATORS[name] = IndicatorSpec(name, build, defaults)
+        return build
+    return decorator
+
+
+@register_indicator('sma', window=20)
+def _sma(p: Planner, window):
+    mean = p.rolling('mean', p.column('Close'), window)
+    return lambda v: v[mean]
+
+
+@register_indicator('ema', window=20)
+def _ema(p: Planner, window):
+    average = p.ema(p.column('Close'), window)
+    return lambda v: v[average]
+
+
+@register_indicator('rsi', window=14)
+def _rsi(p: Planner, window):
+    if window <= 0:
+        raise ValueError("Window must be positive")
+    node = p.node('rsi', p.column('Close'), window)
+    return lambda v: v[node]
+
+
+@register_indicator('roc', window=10)
+def _roc(p: Planner, window):
+    node = p.node('roc', p.column('Close'), window)
+    return lambda v: v[node]
+
+
+@register_indicator('bollinger_bands', window=20, num_std=2.0)
+def _bollinger_bands(p: Planner, window, num_std):
+    close = p.column('Close')
+    middle = p.rolling('mean', close, window)
+    std = p.rolling('std', close, window)
+    return lambda v: pd.DataFrame({
+        'upper': v[middle] + (v[std] * num_std),
+        'middle': v[middle],
+        'lower': v[middle] - (v[std] * num_std),
+    })
+
+
+@register_indicator('macd', fast=12, slow=26, signal=9)
+def _macd(p: Planner, fast, slow, signal):
+    close = p.column('Close')
+    ema_fast, ema_slow = p.ema(close, fast), p.ema(close, slow)
+    macd_line = p.node('difference', ema_fast, ema_slow)
+    signal_line = p.ema(macd_line, signal)
+    return lambda v: pd.DataFrame({
+        'macd': v[macd_line],
+        'signal': v[signal_line],
+        'histogram': v[macd_line] - v[signal_line],
+    })
+
+
+@register_indicator('stochastic', k_window=14, d_window=3)
+def _stochastic(p: Planner, k_window, d_window):
+    lowest_low = p.rolling('min', p.column('Low'), k_window)
+    highest_high = p.rolling('max', p.column('High'), k_window)
+    close = p.column('Close')
+
+    def assemble(v):
+        k_percent = 100 * ((v[close] - v[lowest_low]) / (v[highest_high] - v[lowest_low]))
+        return pd.DataFrame({
+            'k_percent': k_percent,
+            'd_percent': k_percent.rolling(window=d_window).mean(),
+        })
+    return assemble
+
+
+@register_indicator('williams_r', window=14)
+def _williams_r(p: Planner, window):
+    highest_high = p.rolling('max', p.column('High'), window)
+    lowest_low = p.rolling('min', p.column('Low'), window)
+    close = p.column('Close')
+    return lambda v: -100 * ((v[highest_high] - v[close]) / (v[highest_high] - v[lowest_low]))
+
+
+@register_indicator('cci', window=20)
+def _cci(p: Planner, window):
+    tp = p.node('typical_price', p.column('High'), p.column('Low'), p.column('Close'))
+    sma_tp = p.rolling('mean', tp, window)
+    mad = p.node('mean_abs_deviation', tp, window)
+    return lambda v: (v[tp] - v[sma_tp]) / (0.015 * v[mad])
+
+
+@register_indicator('atr', window=14)
+def _atr(p: Planner, window):
+    atr = p.rolling('mean', p.true_range(), window)
+    return lambda v: v[atr]
+
+
+@register_indicator('adx', window=14)
+def _adx(p: Planner, window):
+    atr = p.rolling('mean', p.true_range(), window)
+    dm = p.node('directional_movement', p.column('High'), p.column('Low'))
+    plus_dm = p.rolling('mean', p.node('column_of', dm, 'plus'), window)
+    minus_dm = p.rolling('mean', p.node('column_of', dm, 'minus'), window)
+
+    def assemble(v):
+        plus_di = 100 * (v[plus_dm] / v[atr])
+        minus_di = 100 * (v[minus_dm] / v[atr])
+        dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+        return dx.rolling(window=window).mean()
+    return assemble
+
+
+@register_indicator('keltner_channels', window=20, atr_mult=2.0)
+def _keltner_channels(p: Planner, window, atr_mult):
+    # keltner_channels uses ewm(span=window), whose alpha can differ from ema's in the last bit
+    middle = p.node('ewm_span', p.column('Close'), window)
+    atr = p.rolling('mean', p.true_range(), window)
+    return lambda v: pd.DataFrame({
+        'upper': v[middle] + (v[atr] * atr_mult),
+        'middle': v[middle],
+        'lower': v[middle] - (v[atr] * atr_mult),
+    })
+
+
+@register_indicator('donchian_channels', window=20)
+def _donchian_channels(p: Planner, window):
+    upper = p.rolling('max', p.column('High'), window)
+    lower = p.rolling('min', p.column('Low'), window)
+    return lambda v: pd.DataFrame({
+        'upper': v[upper],
+        'middle': (v[upper] + v[lower]) / 2,
+        'lower': v[lower],
+    })
+
+
+@register_indicator('ichimoku')
+def _ichimoku(p: Planner):
+    node = p.node('ichimoku', p.column('High'), p.column('Low'), p.column('Close'))
+    return lambda v: v[node]
+
+
+@register_indicator('obv')
+def _obv(p: Planner):
+    node = p.node('obv', p.column('Close'), p.column('Volume'))
+    return lambda v: v[node]
+
+
+@register_indicator('volume_sma', window=20)
+def _volume_sma(p: Planner, window):
+    mean = p.rolling('mean', p.column('Volume'), window)
+    return lambda v: v[mean]
+
+
+@register_indicator('vwap')
+def _vwap(p: Planner):
+    node = p.node('vwap', p.column('High'), p.column('Low'), p.column('Close'), p.column('Volume'))
+    return lambda v: v[node]
+
+
+@register_indicator('volume_profile', bins=20)
+def _volume_profile(p: Planner, bins):
+    node = p.node('volume_profile', p.column('Close'), p.column('Volume'), bins)
+    return lambda v: v[node]
+
+
+class IndicatorSet:
+    """
+    A batch of indicators computed together over one OHLCV frame.
+
+    Shared intermediates (typical price, true range, rolling statistics of
+    the same series and window, EMAs of the same span) are computed once.
+    Results equal the standalone functions in quantlib.indicators.
+    """
+
+    def __init__(self):
+        self._requests: List[Tuple[str, str, Dict[str, Any]]] = []
+
+    @staticmethod
+    def available() -> List[str]:
+        """Indicator types accepted by add()"""
+        return list(INDICATORS)
+
+    def add(self, indicator_type: str, name: Optional[str] = None, **params) -> 'IndicatorSet':
+        """
+        Request an indicator.
+
+        Args:
+            indicator_type: Indicator type (see available())
+            name: Key of the result (default: indicator_type)
+            **params: Indicator parameters (defaults as the standalone function)
+
+        Returns:
+            self, for chaining
+        """
+        if indicator_type not in INDICATORS:
+            raise ValueError(
+                f"Unknown indicator '{indicator_type}'. Available: {', '.join(INDICATORS)}"
+            )
+        spec = INDICATORS[indicator_type]
+        unknown = set(params) - set(spec.defaults)
+        if unknown:
+            raise ValueError(f"Unknown parameters for {indicator_type}: {', '.join(sorted(unknown))}")
+        self._requests.append((name or indicator_type, indicator_type, {**spec.defaults, **params}))
+        return self
+
+    def __len__(self) -> int:
+        return len(self._requests)
+
+    def _plan(self):
+        """Build the merged graph; returns (planner, assemblers, columns per result)"""
+        planner = Planner()
+        assemblers, columns = {}, {}
+        for name, indicator_type, params in self._requests:
+            before = planner.columns.copy()
+            planner.columns = {}
+            assemblers[name] = INDICATORS[indicator_type].build(planner, **params)
+            columns[name] = (indicator_type, list(planner.columns))
+            planner.columns = {**before, **planner.columns}
+        return planner, assemblers, columns
+
+    def plan(self) -> List[NodeKey]:
+        """
+        Unique intermediate nodes in execution order.
+
+        Returns:
+            List of node keys (operation, *arguments)
+        """
+        planner, _, _ = self._plan()
+        return list(planner.nodes)
+
+    def required_columns(self) -> List[str]:
+        """Data columns the requested indicators read"""
+        planner, _, _ = self._plan()
+        return list(planner.columns)
+
+    def compute(self, data: pd.DataFrame) -> Dict[str, IndicatorResult]:
+        """
+        Compute every requested indicator.
+
+        Args:
+            data: DataFrame with the required OHLCV columns
+
+        Returns:
+            Dictionary of result name -> Series or DataFrame
+        """
+        planner, assemblers, columns = self._plan()
+        for indicator_type, required in columns.values():
+            if any(column not in data.columns for column in required):
+                raise ValueError(f"{indicator_type} requires columns: {', '.join(required)}")
+
+        values: Dict[NodeKey, Any] = {('column', column): data[column] for column in planner.columns}
+        for key in planner.nodes:
+            operation, arguments = key[0], key[1:]
+            resolved = [values[arg] if isinstance(arg, tuple) else arg for arg in arguments]
+            values[key] = OPERATIONS[operation](*resolved)
+
+        return {name: assemble(values) for name, assemble in assemblers.items()}
+
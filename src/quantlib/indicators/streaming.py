@@ -0,0 +1,509 @@
+"""
+Streaming (incremental) indicators
+
+Stateful counterparts of the batch indicators in quantlib.indicators. Each
+indicator consumes one observation per update() call in O(1) time and keeps
+only a fixed-size ring buffer of history, which makes them suitable for
+event-driven backtests and live/paper trading.
+
+Values follow the batch functions: they are NaN until enough observations
+have been seen, and then match sma(), ema(), rsi(), macd(),
+bollinger_bands(), atr() and stochastic() on the same series.
+
+Example:
+    >>> fast, slow = SMA(20), SMA(50)
+    >>> for price in prices:
+    ...     fast.update(price)
+    ...     slow.update(price)
+    ...     if slow.ready and fast.value > slow.value:
+    ...         ...
+"""
+
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Dict, List, Optional
+import math
+
+
+NAN = float('nan')
+
+
+class RingBuffer:
+    """Fixed-size circular buffer of floats"""
+
+    __slots__ = ('size', '_data', '_head', '_count')
+
+    def __init__(self, size: int):
+        """
+        Initialize ring buffer.
+
+        Args:
+            size: Capacity of the buffer
+        """
+        if size <= 0:
+            raise ValueError("Window must be positive")
+        self.size = size
+        self._data = [NAN] * size
+        self._head = 0
+        self._count = 0
+
+    def append(self, value: float) -> float:
+        """
+        Append a value, overwriting the oldest one when full.
+
+        Returns:
+            The evicted value, or NaN if the buffer was not yet full
+        """
+        head = self._head
+        evicted = self._data[head] if self._count == self.size else NAN
+        self._data[head] = value
+        self._head = head + 1 if head + 1 < self.size else 0
+        if self._count < self.size:
+            self._count += 1
+        return evicted
+
+    @property
+    def full(self) -> bool:
+        """True once size values have been appended"""
+        return self._count == self.size
+
+    def values(self) -> List[float]:
+        """Buffered values, oldest first"""
+        if self._count < self.size:
+            return self._data[:self._count]
+        return self._data[self._head:] + self._data[:self._head]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def clear(self):
+        """Remove all values"""
+        self._data = [NAN] * self.size
+        self._head = 0
+        self._count = 0
+
+
+class RollingWindow(RingBuffer):
+    """
+    Ring buffer with a running sum and running variance.
+
+    Like pandas rolling windows, the mean and std are NaN while the window
+    is not full or contains a NaN. The variance uses the same Welford
+    add/remove updates as pandas, and all running statistics are
+    recomputed from the buffer each time it wraps around, so floating-point
+    drift stays bounded at an amortized O(1) cost.
+    """
+
+    __slots__ = ('_sum', '_nobs', '_mean', '_ssqdm', '_nan_count', '_nonzero')
+
+    def __init__(self, size: int):
+        super().__init__(size)
+        self._reset_stats()
+
+    def _reset_stats(self):
+        self._sum = 0.0
+        self._nobs = 0
+        self._mean = 0.0
+        self._ssqdm = 0.0
+        self._nan_count = 0
+        self._nonzero = 0
+
+    def append(self, value: float) -> float:
+        was_full = self._count == self.size
+        evicted = RingBuffer.append(self, value)
+
+        if was_full:
+            if evicted != evicted:
+                self._nan_count -= 1
+            else:
+                self._sum -= evicted
+                if evicted != 0.0:
+                    self._nonzero -= 1
+                self._nobs -= 1
+                if self._nobs:
+                    delta = evicted - self._mean
+                    self._mean -= delta / self._nobs
+                    self._ssqdm -= ((self._nobs + 1) * delta * delta) / self._nobs
+                else:
+                    self._mean = 0.0
+                    self._ssqdm = 0.0
+
+        if value != value:
+            self._nan_count += 1
+        else:
+            self._sum += value
+            if value != 0.0:
+                self._nonzero += 1
+            self._nobs += 1
+            delta = value - self._mean
+            self._mean += delta / self._nobs
+            self._ssqdm += ((self._nobs - 1) * delta * delta) / self._nobs
+
+        if self._head == 0:
+            self._resync()
+        return evicted
+
+    def _resync(self):
+        """Recompute the running statistics exactly from the buffer"""
+        finite = [v for v in self._data[:self._count] if v == v]
+        self._nobs = len(finite)
+        self._nan_count = self._count - self._nobs
+        self._nonzero = sum(1 for v in finite if v != 0.0)
+        self._sum = math.fsum(finite)
+        self._mean = self._sum / self._nobs if self._nobs else 0.0
+        self._ssqdm = math.fsum((v - self._mean) ** 2 for v in finite)
+
+    @property
+    def sum(self) -> float:
+        """Sum of the window (NaN if not full or containing NaN)"""
+        if self._count < self.size or self._nan_count:
+            return NAN
+        return self._sum if self._nonzero else 0.0
+
+    @property
+    def mean(self) -> float:
+        """Mean of the window (NaN if not full or containing NaN)"""
+        if self._count < self.size or self._nan_count:
+            return NAN
+        return self._sum / self.size if self._nonzero else 0.0
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1) of the window"""
+        n = self.size
+        if self._count < n or self._nan_count or n < 2:
+            return NAN
+        variance = self._ssqdm / (n - 1)
+        return math.sqrt(variance) if variance > 0.0 else 0.0
+
+    def clear(self):
+        RingBuffer.clear(self)
+        self._reset_stats()
+
+
+class StreamingIndicator(ABC):
+    """Base class for incremental indicators"""
+
+    def __init__(self):
+        self.count = 0
+        self._value = NAN
+
+    @property
+    def value(self):
+        """Current indicator value (NaN until ready)"""
+        return self._value
+
+    @property
+    def ready(self) -> bool:
+        """True once the indicator has produced a non-NaN value"""
+        return self._value == self._value
+
+    @abstractmethod
+    def update(self, value: float):
+        """Consume one observation and return the new indicator value"""
+
+    def reset(self):
+        """Forget all observations"""
+        self.count = 0
+        self._value = NAN
+
+
+class SMA(StreamingIndicator):
+    """Simple Moving Average (streaming counterpart of sma())"""
+
+    def __init__(self, window: int):
+        """
+        Initialize SMA.
+
+        Args:
+            window: Window size
+        """
+        super().__init__()
+        self.window = window
+        self._buffer = RollingWindow(window)
+
+    def update(self, value: float) -> float:
+        self.count += 1
+        self._buffer.append(float(value))
+        self._value = self._buffer.mean
+        return self._value
+
+    def reset(self):
+        super().reset()
+        self._buffer.clear()
+
+
+class EMA(StreamingIndicator):
+    """Exponential Moving Average (streaming counterpart of ema())"""
+
+    def __init__(self, window: int, alpha: Optional[float] = None):
+        """
+        Initialize EMA.
+
+        Args:
+            window: Window size
+            alpha: Smoothing factor (if None, calculated from window)
+        """
+        if window <= 0:
+            raise ValueError("Window must be positive")
+        super().__init__()
+        self.window = window
+        self.alpha = alpha if alpha is not None else 2.0 / (window + 1.0)
+        self._old_weight = 1.0 - self.alpha
+
+    def update(self, value: float) -> float:
+        self.count += 1
+        value = float(value)
+        if value != value:
+            return self._value
+
+        if self._value != self._value:
+            self._value = value
+        else:
+            # Same update as pandas ewm(adjust=False)
+            self._value = ((self._old_weight * self._value) + (self.alpha * value)) / (
+                self._old_weight + self.alpha
+            )
+        return self._value
+
+
+class RSI(StreamingIndicator):
+    """Relative Strength Index (streaming counterpart of rsi())"""
+
+    def __init__(self, window: int = 14):
+        """
+        Initialize RSI.
+
+        Args:
+            window: Window size
+        """
+        super().__init__()
+        self.window = window
+        self._gains = RollingWindow(window)
+        self._losses = RollingWindow(window)
+        self._prev = NAN
+
+    def update(self, value: float) -> float:
+        self.count += 1
+        value = float(value)
+        delta = value - self._prev
+        self._prev = value
+
+        # The first delta is NaN and, as in rsi(), counts as no gain/loss
+        self._gains.append(delta if delta > 0 else 0.0)
+        self._losses.append(-delta if delta < 0 else 0.0)
+
+        gain = self._gains.mean
+        loss = self._losses.mean
+        if gain != gain or loss != loss:
+            self._value = NAN
+        elif loss == 0.0:
+            self._value = 100.0 if gain > 0.0 else NAN
+        else:
+            self._value = 100 - (100 / (1 + gain / loss))
+        return self._value
+
+    def reset(self):
+        super().reset()
+        self._gains.clear()
+        self._losses.clear()
+        self._prev = NAN
+
+
+class MACD(StreamingIndicator):
+    """Moving Average Convergence Divergence (streaming counterpart of macd())"""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9):
+        """
+        Initialize MACD.
+
+        Args:
+            fast: Fast EMA period
+            slow: Slow EMA period
+            signal: Signal line EMA period
+        """
+        super().__init__()
+        self._fast = EMA(fast)
+        self._slow = EMA(slow)
+        self._signal = EMA(signal)
+        self.macd = NAN
+        self.signal = NAN
+        self.histogram = NAN
+
+    def update(self, value: float) -> Dict[str, float]:
+        self.count += 1
+        self.macd = self._fast.update(value) - self._slow.update(value)
+        self.signal = self._signal.update(self.macd)
+        self.histogram = self.macd - self.signal
+        return self.value
+
+    def reset(self):
+        super().reset()
+        self._fast.reset()
+        self._slow.reset()
+        self._signal.reset()
+        self.macd = NAN
+        self.signal = NAN
+        self.histogram = NAN
+
+    @property
+    def value(self) -> Dict[str, float]:
+        """Current values with the same keys as macd() columns"""
+        return {'macd': self.macd, 'signal': self.signal, 'histogram': self.histogram}
+
+    @property
+    def ready(self) -> bool:
+        return self.signal == self.signal
+
+
+class BollingerBands(StreamingIndicator):
+    """Bollinger Bands (streaming counterpart of bollinger_bands())"""
+
+    def __init__(self, window: int = 20, num_std: float = 2.0):
+        """
+        Initialize Bollinger Bands.
+
+        Args:
+            window: Window size
+            num_std: Number of standard deviations
+        """
+        super().__init__()
+        self.window = window
+        self.num_std = num_std
+        self._buffer = RollingWindow(window)
+        self.upper = NAN
+        self.middle = NAN
+        self.lower = NAN
+
+    def update(self, value: float) -> Dict[str, float]:
+        self.count += 1
+        self._buffer.append(float(value))
+        self.middle = self._buffer.mean
+        std = self._buffer.std
+        self.upper = self.middle + (std * self.num_std)
+        self.lower = self.middle - (std * self.num_std)
+        return self.value
+
+    def reset(self):
+        super().reset()
+        self._buffer.clear()
+        self.upper = NAN
+        self.middle = NAN
+        self.lower = NAN
+
+    @property
+    def value(self) -> Dict[str, float]:
+        """Current values with the same keys as bollinger_bands() columns"""
+        return {'upper': self.upper, 'middle': self.middle, 'lower': self.lower}
+
+    @property
+    def ready(self) -> bool:
+        return self.upper == self.upper
+
+
+class ATR(StreamingIndicator):
+    """Average True Range (streaming counterpart of atr())"""
+
+    def __init__(self, window: int = 14):
+        """
+        Initialize ATR.
+
+        Args:
+            window: Window size
+        """
+        super().__init__()
+        self.window = window
+        self._buffer = RollingWindow(window)
+        self._prev_close = NAN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        self.count += 1
+        true_range = high - low
+        prev_close = self._prev_close
+        if prev_close == prev_close:
+            true_range = max(true_range, abs(high - prev_close), abs(low - prev_close))
+        self._prev_close = close
+
+        self._buffer.append(float(true_range))
+        self._value = self._buffer.mean
+        return self._value
+
+    def reset(self):
+        super().reset()
+        self._buffer.clear()
+        self._prev_close = NAN
+
+
+class Stochastic(StreamingIndicator):
+    """Stochastic Oscillator (streaming counterpart of stochastic())"""
+
+    def __init__(self, k_window: int = 14, d_window: int = 3):
+        """
+        Initialize Stochastic Oscillator.
+
+        Args:
+            k_window: %K window size
+            d_window: %D window size (smoothing)
+        """
+        if k_window <= 0:
+            raise ValueError("Window must be positive")
+        super().__init__()
+        self.k_window = k_window
+        self.d_window = d_window
+        # Monotonic deques of (index, value) give O(1) amortized rolling min/max
+        self._lows = deque()
+        self._highs = deque()
+        self._d = RollingWindow(d_window)
+        self.k_percent = NAN
+        self.d_percent = NAN
+
+    def update(self, high: float, low: float, close: float) -> Dict[str, float]:
+        i = self.count
+        self.count += 1
+
+        lows, highs = self._lows, self._highs
+        while lows and lows[-1][1] >= low:
+            lows.pop()
+        lows.append((i, low))
+        while highs and highs[-1][1] <= high:
+            highs.pop()
+        highs.append((i, high))
+
+        oldest = i - self.k_window
+        if lows[0][0] <= oldest:
+            lows.popleft()
+        if highs[0][0] <= oldest:
+            highs.popleft()
+
+        if self.count < self.k_window:
+            k = NAN
+        else:
+            lowest_low = lows[0][1]
+            price_range = highs[0][1] - lowest_low
+            numerator = close - lowest_low
+            if price_range == 0:
+                k = NAN if numerator == 0 else math.copysign(math.inf, numerator)
+            else:
+                k = 100 * (numerator / price_range)
+
+        self.k_percent = k
+        self._d.append(k)
+        self.d_percent = self._d.mean
+        return self.value
+
+    def reset(self):
+        super().reset()
+        self._lows.clear()
+        self._highs.clear()
+        self._d.clear()
+        self.k_percent = NAN
+        self.d_percent = NAN
+
+    @property
+    def value(self) -> Dict[str, float]:
+        """Current values with the same keys as stochastic() columns"""
+        return {'k_percent': self.k_percent, 'd_percent': self.d_percent}
+
+    @property
+    def ready(self) -> bool:
+        return self.d_percent == self.d_percent
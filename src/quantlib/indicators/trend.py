@@ -4,6 +4,8 @@ from typing import Optional
 import pandas as pd
 import numpy as np
 
+from quantlib.indicators.volatility import _true_range
+
 
 def sma(series: pd.Series, window: int) -> pd.Series:
     """
@@ -87,10 +89,7 @@ def adx(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14) ->
         ADX series
     """
     # Calculate True Range
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    tr = pd.Series(_true_range(high, low, close), index=high.index)
     
     # Calculate Directional Movement
     up_move = high - high.shift(1)
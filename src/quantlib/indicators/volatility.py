@@ -33,6 +33,22 @@ def bollinger_bands(
     })
 
 
+def _true_range(high: pd.Series, low: pd.Series, close: pd.Series) -> np.ndarray:
+    """
+    True range as an array: max of high-low and the gaps from the previous close.
+    
+    np.fmax skips NaN like a row-wise DataFrame max, so the first bar
+    (no previous close) is just high - low. 2-D inputs are treated as one
+    column per symbol.
+    """
+    high = np.asarray(high, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    prev_close = np.empty_like(high)
+    prev_close[:1] = np.nan
+    prev_close[1:] = np.asarray(close, dtype=np.float64)[:-1]
+    return np.fmax.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+
+
 def atr(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14) -> pd.Series:
     """
     Average True Range.
@@ -46,11 +62,7 @@ def atr(high: pd.Series, low: pd.Series, close: pd.Series, window: int = 14) ->
     Returns:
         ATR series
     """
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
-    
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    tr = pd.Series(_true_range(high, low, close), index=close.index)
     atr = tr.rolling(window=window).mean()
     
     return atr
@@ -41,6 +41,8 @@ def volume_profile(
     """
     Volume Profile (Volume at Price).
     
+    Bars with a missing price or volume are skipped.
+    
     Args:
         price: Price series
         volume: Volume series
@@ -49,26 +51,23 @@ def volume_profile(
     Returns:
         DataFrame with price bins and volume
     """
+    price_values = np.asarray(price, dtype=np.float64)
+    volume_values = np.asarray(volume, dtype=np.float64)
+    valid = ~(np.isnan(price_values) | np.isnan(volume_values))
+    price_values, volume_values = price_values[valid], volume_values[valid]
+    
     price_min = price.min()
     price_max = price.max()
     bin_edges = np.linspace(price_min, price_max, bins + 1)
     bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
     
-    volume_by_price = pd.Series(index=bin_centers, dtype=float)
-    
-    for i in range(len(price)):
-        price_val = price.iloc[i]
-        vol_val = volume.iloc[i]
-        
-        # Find which bin this price belongs to
-        bin_idx = np.digitize(price_val, bin_edges) - 1
-        bin_idx = max(0, min(bin_idx, len(bin_centers) - 1))
-        
-        volume_by_price.iloc[bin_idx] += vol_val
+    # Bin index of every price (the maximum falls into the last bin)
+    bin_idx = np.clip(np.digitize(price_values, bin_edges) - 1, 0, bins - 1)
+    volume_by_price = np.bincount(bin_idx, weights=volume_values, minlength=bins)
     
     return pd.DataFrame({
         'price': bin_centers,
-        'volume': volume_by_price.values
+        'volume': volume_by_price
     })
 
 
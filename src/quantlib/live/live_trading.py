@@ -6,6 +6,7 @@ import pandas as pd
 from quantlib.brokers.base import Broker
 from quantlib.live.data_stream import DataStream
 from quantlib.portfolio import Portfolio
+from quantlib.risk.streaming import StreamingRiskTracker
 
 
 class LiveTradingEngine:
@@ -16,7 +17,8 @@ class LiveTradingEngine:
         broker: Broker,
         data_stream: Optional[DataStream] = None,
         max_position_size: Optional[float] = None,
-        max_daily_loss: Optional[float] = None
+        max_daily_loss: Optional[float] = None,
+        risk_window: Optional[int] = 252
     ):
         """
         Initialize live trading engine.
@@ -26,6 +28,7 @@ class LiveTradingEngine:
             data_stream: Real-time data stream (optional)
             max_position_size: Maximum position size (risk limit)
             max_daily_loss: Maximum daily loss before stopping (risk limit)
+            risk_window: Returns window for the rolling risk metrics (None = all)
         """
         self.broker = broker
         self.data_stream = data_stream
@@ -37,6 +40,9 @@ class LiveTradingEngine:
         self.equity_history: List[Dict] = []
         self.initial_equity: Optional[float] = None
         self.daily_start_equity: Optional[float] = None
+        
+        # Risk metrics updated with every equity point
+        self.risk_tracker = StreamingRiskTracker(window=risk_window)
     
     async def start(self, strategy, symbols: List[str]) -> None:
         """Start live trading"""
@@ -47,6 +53,7 @@ class LiveTradingEngine:
         # Get initial equity
         self.initial_equity = await self.broker.get_equity()
         self.daily_start_equity = self.initial_equity
+        self.risk_tracker.update(self.initial_equity)
         
         self.running = True
         
@@ -70,6 +77,7 @@ class LiveTradingEngine:
                     'timestamp': context.current_time,
                     'equity': equity,
                 })
+                self.risk_tracker.update(equity, context.current_time)
                 
                 # Check risk limits
                 if self._check_risk_limits():
@@ -160,6 +168,10 @@ class LiveTradingEngine:
         """Get current equity from broker"""
         return await self.broker.get_equity()
     
+    def get_risk_metrics(self) -> Dict:
+        """Get the current risk metrics (constant time, see StreamingRiskTracker)"""
+        return self.risk_tracker.get_metrics()
+    
     def get_trades(self) -> pd.DataFrame:
         """Get trade history"""
         if self.trades:
@@ -7,6 +7,7 @@ from quantlib.backtesting.engine import BacktestEngine
 from quantlib.backtesting.event import OrderEvent, FillEvent
 from quantlib.live.data_stream import DataStream, SimulatedDataStream
 from quantlib.portfolio import Portfolio
+from quantlib.risk.streaming import StreamingRiskTracker
 
 
 class PaperTradingEngine:
@@ -17,7 +18,8 @@ class PaperTradingEngine:
         initial_capital: float = 100000.0,
         commission: float = 1.0,
         slippage: float = 0.0,
-        data_stream: Optional[DataStream] = None
+        data_stream: Optional[DataStream] = None,
+        risk_window: Optional[int] = 252
     ):
         """
         Initialize paper trading engine.
@@ -27,6 +29,7 @@ class PaperTradingEngine:
             commission: Commission per trade
             slippage: Slippage as fraction
             data_stream: Data stream instance (creates SimulatedDataStream if None)
+            risk_window: Returns window for the rolling risk metrics (None = all)
         """
         self.initial_capital = initial_capital
         self.portfolio = Portfolio(initial_cash=initial_capital)
@@ -37,6 +40,10 @@ class PaperTradingEngine:
         self.trades: List[Dict] = []
         self.equity_history: List[Dict] = []
         self.positions: Dict[str, int] = {}
+        
+        # Risk metrics updated with every equity point
+        self.risk_tracker = StreamingRiskTracker(window=risk_window)
+        self.risk_tracker.update(initial_capital)
     
     async def start(
         self,
@@ -94,6 +101,7 @@ class PaperTradingEngine:
                 'cash': self.portfolio.get_cash(),
                 'positions': self.portfolio.get_positions().copy()
             })
+            self.risk_tracker.update(equity, data['timestamp'])
         
         # Subscribe to all symbols
         for symbol in symbols:
@@ -195,6 +203,10 @@ class PaperTradingEngine:
             return self.equity_history[-1]['equity']
         return self.initial_capital
     
+    def get_risk_metrics(self) -> Dict:
+        """Get the current risk metrics (constant time, see StreamingRiskTracker)"""
+        return self.risk_tracker.get_metrics()
+    
     def get_trades(self) -> pd.DataFrame:
         """Get trade history as DataFrame"""
         if self.trades:
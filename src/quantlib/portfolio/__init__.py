@@ -1,6 +1,7 @@
 """Portfolio management module"""
 
 from quantlib.portfolio.manager import Portfolio
+from quantlib.portfolio.compact import CompactPortfolio
 from quantlib.portfolio.sizing import (
     fixed_dollar,
     fixed_percent,
@@ -37,6 +38,7 @@ from quantlib.portfolio.reporting import (
 
 __all__ = [
     "Portfolio",
+    "CompactPortfolio",
     "fixed_dollar",
     "fixed_percent",
     "kelly_criterion",
@@ -0,0 +1,377 @@
+"""
+Array-backed portfolio state
+
+Portfolio keeps quantities, cost basis, total cost and realized P&L in
+dicts keyed by upper-cased symbol, and get_total_equity walks the price
+dict on every bar. CompactPortfolio interns each symbol to an integer slot
+once and keeps those four fields in NumPy arrays indexed by slot, so
+marking to market is one gather and dot product. It subclasses Portfolio
+and exposes the same attributes as dict-like views, so the engine, the
+Rebalancer, constraints, analytics and reporting use it unchanged.
+"""
+
+from collections.abc import MutableMapping
+from typing import Dict, List, Optional, Union
+from datetime import datetime
+import numpy as np
+
+from quantlib.portfolio.manager import Portfolio
+
+
+def _scalar(value: float) -> Union[int, float]:
+    """Quantity as a Python number (int when integral, as Portfolio stores them)"""
+    value = float(value)
+    return int(value) if value.is_integer() else value
+
+
+class _SlotView(MutableMapping):
+    """
+    Dict-like view of one per-slot array, keyed by upper-cased symbol.
+
+    A slot is present when its flag is set; for positions (no flag array)
+    when its quantity is non-zero, like the keys Portfolio deletes at zero.
+    """
+
+    def __init__(self, portfolio: 'CompactPortfolio', values: str, present: Optional[str] = None):
+        self._portfolio = portfolio
+        self._values = values
+        self._present = present
+
+    def _mask(self) -> np.ndarray:
+        n = len(self._portfolio._names)
+        if self._present is None:
+            return getattr(self._portfolio, self._values)[:n] != 0
+        return getattr(self._portfolio, self._present)[:n]
+
+    def _slot(self, symbol) -> int:
+        slot = self._portfolio._slots.get(symbol)
+        if slot is None or not self._mask()[slot]:
+            raise KeyError(symbol)
+        return slot
+
+    def __getitem__(self, symbol):
+        value = getattr(self._portfolio, self._values)[self._slot(symbol)]
+        return _scalar(value) if self._present is None else float(value)
+
+    def __setitem__(self, symbol, value):
+        slot = self._portfolio._slot(symbol)
+        getattr(self._portfolio, self._values)[slot] = value
+        if self._present is not None:
+            getattr(self._portfolio, self._present)[slot] = True
+
+    def __delitem__(self, symbol):
+        slot = self._slot(symbol)
+        getattr(self._portfolio, self._values)[slot] = 0.0
+        if self._present is not None:
+            getattr(self._portfolio, self._present)[slot] = False
+
+    def __contains__(self, symbol) -> bool:
+        slot = self._portfolio._slots.get(symbol)
+        return slot is not None and bool(self._mask()[slot])
+
+    def __iter__(self):
+        names = self._portfolio._names
+        return iter([names[slot] for slot in np.flatnonzero(self._mask())])
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self._mask()))
+
+    def copy(self) -> Dict:
+        """Snapshot as a plain dict"""
+        return dict(self.items())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (dict, MutableMapping)):
+            return self.copy() == dict(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+
+class CompactPortfolio(Portfolio):
+    """Portfolio with symbols interned to integer slots and NumPy state arrays"""
+
+    def __init__(self, initial_cash: float = 100000.0, capacity: int = 64):
+        """
+        Initialize portfolio.
+
+        Args:
+            initial_cash: Starting cash balance
+            capacity: Initial number of symbol slots (grows as needed)
+        """
+        super().__init__(initial_cash)
+
+        # Replace the per-symbol dicts with slot arrays behind dict-like views
+        self._names: List[str] = []  # slot -> upper-cased symbol
+        self._slots: Dict[str, int] = {}  # upper-cased symbol -> slot
+        self._aliases: Dict[str, int] = {}  # symbol as passed in -> slot
+        self._quantity = np.zeros(capacity)
+        self._cost_basis = np.zeros(capacity)
+        self._total_cost = np.zeros(capacity)
+        self._realized = np.zeros(capacity)
+        self._has_cost = np.zeros(capacity, dtype=bool)
+        self._has_realized = np.zeros(capacity, dtype=bool)
+        self._price_keys: tuple = ()
+        self._price_slots = np.empty(0, dtype=np.int64)
+
+        self.positions = _SlotView(self, '_quantity')
+        self.cost_basis = _SlotView(self, '_cost_basis', '_has_cost')
+        self.total_cost = _SlotView(self, '_total_cost', '_has_cost')
+        self.realized_pnl = _SlotView(self, '_realized', '_has_realized')
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols in slot order (the order of price vectors)"""
+        return list(self._names)
+
+    def _grow(self):
+        capacity = 2 * len(self._quantity)
+        for name in ('_quantity', '_cost_basis', '_total_cost', '_realized', '_has_cost', '_has_realized'):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _find(self, symbol: str) -> Optional[int]:
+        """Slot of a symbol, or None if it has never been seen"""
+        slot = self._aliases.get(symbol)
+        if slot is None:
+            slot = self._slots.get(symbol.upper())
+            if slot is not None:
+                self._aliases[symbol] = slot
+        return slot
+
+    def _slot(self, symbol: str) -> int:
+        """Slot of a symbol, interning it on first use"""
+        slot = self._find(symbol)
+        if slot is None:
+            slot = len(self._names)
+            if slot == len(self._quantity):
+                self._grow()
+            upper = symbol.upper()
+            self._names.append(upper)
+            self._slots[upper] = slot
+            self._aliases[symbol] = slot
+        return slot
+
+    def price_vector(self, current_prices: Dict[str, float]) -> np.ndarray:
+        """
+        Slot-aligned price vector (0 for symbols without a price).
+
+        Args:
+            current_prices: Dictionary of symbol -> current price
+
+        Returns:
+            Array of prices in the order of `symbols`
+        """
+        slots = [self._slot(symbol) for symbol in current_prices]
+        prices = np.zeros(len(self._names))
+        prices[slots] = list(current_prices.values())
+        return prices
+
+    def add_position(self, symbol: str, quantity: int):
+        """
+        Add to position.
+
+        Args:
+            symbol: Stock symbol
+            quantity: Quantity to add (can be negative to reduce)
+        """
+        slot = self._slot(symbol)
+        self._quantity[slot] += quantity
+
+    def remove_position(self, symbol: str):
+        """
+        Remove position completely.
+
+        Args:
+            symbol: Stock symbol
+        """
+        slot = self._find(symbol)
+        if slot is not None:
+            self._quantity[slot] = 0.0
+
+    def update_position(self, symbol: str, quantity: int):
+        """
+        Set position to specific quantity.
+
+        Args:
+            symbol: Stock symbol
+            quantity: New quantity
+        """
+        slot = self._slot(symbol)
+        self._quantity[slot] = quantity
+
+    def get_position(self, symbol: str) -> int:
+        """
+        Get current position for symbol.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Position quantity
+        """
+        slot = self._find(symbol)
+        return 0 if slot is None else _scalar(self._quantity[slot])
+
+    def get_positions(self) -> Dict[str, int]:
+        """Get all current positions"""
+        return self.positions.copy()
+
+    def get_total_equity(self, current_prices: Union[Dict[str, float], np.ndarray]) -> float:
+        """
+        Calculate total equity (cash + positions value).
+
+        Args:
+            current_prices: Dictionary of symbol -> current price, or a
+                price vector aligned with `symbols`
+
+        Returns:
+            Total equity
+        """
+        if isinstance(current_prices, np.ndarray):
+            return self.cash + float(self._quantity[:len(current_prices)] @ current_prices)
+
+        # The slots of a price dict are cached while its keys stay the same
+        keys = tuple(current_prices)
+        if keys != self._price_keys:
+            self._price_slots = np.array([self._slot(symbol) for symbol in keys], dtype=np.int64)
+            self._price_keys = keys
+        prices = np.fromiter(current_prices.values(), dtype=float, count=len(keys))
+        return self.cash + float(self._quantity[self._price_slots] @ prices)
+
+    def record_transaction(
+        self,
+        symbol: str,
+        quantity: int,
+        price: float,
+        direction: str,
+        timestamp: datetime,
+        commission: float = 0.0
+    ):
+        """
+        Record a transaction (buy or sell) and update cost basis.
+
+        Args:
+            symbol: Stock symbol
+            quantity: Number of shares
+            price: Execution price per share
+            direction: 'BUY' or 'SELL'
+            timestamp: Transaction timestamp
+            commission: Commission paid
+        """
+        slot = self._slot(symbol)
+        symbol = self._names[slot]
+        direction = direction.upper()
+
+        self.transactions.append({
+            'timestamp': timestamp,
+            'symbol': symbol,
+            'quantity': quantity,
+            'price': price,
+            'direction': direction,
+            'commission': commission,
+            'total_value': quantity * price
+        })
+
+        # Update cost basis (weighted average method)
+        if direction == 'BUY':
+            if not self._has_cost[slot]:
+                self._has_cost[slot] = True
+                self._total_cost[slot] = 0.0
+                self._cost_basis[slot] = 0.0
+                self.position_metadata[symbol] = {
+                    'entry_date': timestamp,
+                    'last_trade_date': timestamp,
+                    'num_trades': 0
+                }
+
+            self._total_cost[slot] += quantity * price + commission
+            new_total_quantity = self._quantity[slot] + quantity
+            if new_total_quantity > 0:
+                self._cost_basis[slot] = self._total_cost[slot] / new_total_quantity
+
+            self.position_metadata[symbol]['last_trade_date'] = timestamp
+            self.position_metadata[symbol]['num_trades'] += 1
+
+        elif direction == 'SELL':
+            if not self._has_cost[slot]:
+                return
+
+            if self._quantity[slot] > 0:
+                avg_cost = self._cost_basis[slot]
+                self._realized[slot] += (price - avg_cost) * quantity - commission
+                self._has_realized[slot] = True
+                self._total_cost[slot] = max(0.0, self._total_cost[slot] - avg_cost * quantity)
+
+                if symbol in self.position_metadata:
+                    self.position_metadata[symbol]['last_trade_date'] = timestamp
+                    self.position_metadata[symbol]['num_trades'] += 1
+
+    def get_cost_basis(self, symbol: str) -> float:
+        """
+        Get average cost basis for a position.
+
+        Args:
+            symbol: Stock symbol
+
+        Returns:
+            Average cost basis per share, or 0.0 if no position
+        """
+        slot = self._find(symbol)
+        return float(self._cost_basis[slot]) if slot is not None and self._has_cost[slot] else 0.0
+
+    def get_unrealized_pnl(self, current_prices: Dict[str, float]) -> Dict[str, float]:
+        """
+        Calculate unrealized P&L for all open positions.
+
+        Args:
+            current_prices: Dictionary of symbol -> current price
+
+        Returns:
+            Dictionary of symbol -> unrealized P&L
+        """
+        unrealized = {}
+        for slot in np.flatnonzero(self._quantity[:len(self._names)] > 0):
+            symbol = self._names[slot]
+            if symbol in current_prices:
+                unrealized[symbol] = float((current_prices[symbol] - self._cost_basis[slot]) * self._quantity[slot])
+        return unrealized
+
+    def get_realized_pnl(self, symbol: Optional[str] = None) -> float:
+        """
+        Get realized P&L for a symbol or all symbols.
+
+        Args:
+            symbol: Stock symbol (optional, if None returns total)
+
+        Returns:
+            Realized P&L for symbol or total realized P&L
+        """
+        if symbol is None:
+            return float(self._realized[:len(self._names)].sum())
+        slot = self._find(symbol)
+        return 0.0 if slot is None else float(self._realized[slot])
+
+    def get_weights(self, current_prices: Dict[str, float]) -> Dict[str, float]:
+        """
+        Get current portfolio weights.
+
+        Args:
+            current_prices: Dictionary of symbol -> current price
+
+        Returns:
+            Dictionary of symbol -> weight (0.0 to 1.0)
+        """
+        total_value = self.get_total_equity(current_prices)
+        if total_value == 0:
+            return {}
+
+        weights = {}
+        for slot in np.flatnonzero(self._quantity[:len(self._names)] > 0):
+            symbol = self._names[slot]
+            if symbol in current_prices:
+                weights[symbol] = float(self._quantity[slot] * current_prices[symbol] / total_value)
+        return weights
@@ -11,6 +11,7 @@ import matplotlib.pyplot as plt
 from datetime import datetime
 
 from quantlib.data import DataStore
+from quantlib.utils.frame_cache import CachedDataStore
 from quantlib.backtesting import BacktestEngine
 from quantlib.risk import RiskCalculator
 from quantlib.strategies import Strategy
@@ -41,7 +42,7 @@ def load_symbol(
         >>> data = load_symbol('AAPL', '2020-01-01', '2023-01-01')
         >>> data.head()
     """
-    store = DataStore()
+    store = CachedDataStore(DataStore())
     
     # Try to load from database first
     try:
@@ -102,6 +103,7 @@ def run_backtest(
         - metrics: Performance metrics dict
         - equity_curve: Equity curve Series
         - trades: Trades DataFrame
+        - round_trips: Closed round trips with PnL
         - returns: Returns Series
         
     Example:
@@ -126,6 +128,7 @@ def run_backtest(
     returns = backtest_results.get('returns', pd.Series())
     equity_curve = backtest_results.get('equity_curve', pd.Series())
     trades_df = backtest_results.get('trades', pd.DataFrame())
+    ledger = backtest_results.get('round_trips', pd.DataFrame())
     
     # Calculate comprehensive metrics
     metrics = {}
@@ -134,7 +137,7 @@ def run_backtest(
             calculator = RiskCalculator(
                 returns=returns,
                 equity_curve=equity_curve if len(equity_curve) > 0 else None,
-                trades=trades_df if not trades_df.empty else None,
+                trades=ledger if not ledger.empty else None,
                 risk_free_rate=risk_free_rate,
                 periods=252,  # Daily data
             )
@@ -147,6 +150,7 @@ def run_backtest(
         'metrics': metrics,
         'equity_curve': equity_curve,
         'trades': trades_df,
+        'round_trips': ledger,
         'returns': returns,
     }
 
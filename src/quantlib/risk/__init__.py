@@ -25,6 +25,7 @@ from quantlib.risk.drawdown import (
     underwater_curve,
     average_drawdown_duration,
     drawdown_recovery_time,
+    drawdown_table,
     ulcer_index,
 )
 from quantlib.risk.var import (
@@ -37,7 +38,10 @@ from quantlib.risk.monte_carlo import (
     monte_carlo_simulation,
     monte_carlo_metrics,
 )
-from quantlib.risk.calculator import RiskCalculator
+from quantlib.risk.return_stats import ReturnStats
+from quantlib.risk.calculator import RiskCalculator, register_metric
+from quantlib.risk.batch import BatchRiskCalculator
+from quantlib.risk.streaming import StreamingRiskTracker
 
 __all__ = [
     # Performance metrics
@@ -64,14 +68,20 @@ __all__ = [
     "underwater_curve",
     "average_drawdown_duration",
     "drawdown_recovery_time",
+    "drawdown_table",
     "ulcer_index",
     # VaR
     "historical_var",
     "parametric_var",
     "monte_carlo_var",
     "cvar",
+    # Shared statistics
+    "ReturnStats",
     # Calculator
     "RiskCalculator",
+    "BatchRiskCalculator",
+    "register_metric",
+    "StreamingRiskTracker",
     # Monte Carlo
     "monte_carlo_simulation",
     "monte_carlo_metrics",
@@ -0,0 +1,300 @@
+"""
+Batched risk metrics over many return series.
+
+Parameter sweeps produce hundreds of equity curves of the same length.
+BatchRiskCalculator takes them as the columns of a (T x N) matrix and
+computes the metrics of RiskCalculator.get_flat_metrics column-wise with
+NumPy reductions, instead of building one calculator per run.
+"""
+
+import pandas as pd
+import numpy as np
+from scipy import stats
+from typing import Optional, Dict, Union, Sequence
+
+ArrayLike = Union[np.ndarray, pd.DataFrame]
+
+
+def _as_matrix(values: ArrayLike, name: str) -> np.ndarray:
+    """Convert input to a 2-D float array with one run per column"""
+    matrix = np.asarray(values, dtype=np.float64)
+    if matrix.ndim == 1:
+        matrix = matrix[:, None]
+    if matrix.ndim != 2:
+        raise ValueError(f"{name} must be a 1-D or 2-D array (periods x runs)")
+    if np.isnan(matrix).any():
+        raise ValueError(f"{name} must not contain NaN (runs must share one calendar)")
+    return matrix
+
+
+class BatchRiskCalculator:
+    """
+    Risk and performance metrics for N runs at once.
+
+    Every column of the returns matrix is one run. Metrics match
+    RiskCalculator.get_flat_metrics for each column (same names and
+    definitions); trade and benchmark metrics are not included.
+    """
+
+    def __init__(
+        self,
+        returns: ArrayLike,
+        equity_curves: Optional[ArrayLike] = None,
+        risk_free_rate: float = 0.0,
+        periods: int = 252,
+        var_confidence_level: float = 0.95,
+        var_simulations: int = 10000,
+        var_random_seed: Optional[int] = None,
+        columns: Optional[Sequence] = None,
+    ):
+        """
+        Initialize BatchRiskCalculator.
+
+        Args:
+            returns: Returns matrix (periods x runs) or DataFrame with one column per run
+            equity_curves: Equity matrix (periods x runs, optional, for drawdown metrics)
+            risk_free_rate: Annual risk-free rate (default 0.0)
+            periods: Number of periods per year (default 252 for daily)
+            var_confidence_level: Confidence level for VaR calculations (default 0.95)
+            var_simulations: Number of simulations for Monte Carlo VaR (default 10000)
+            var_random_seed: Random seed for Monte Carlo VaR (default None)
+            columns: Run labels (default: DataFrame columns or 0..N-1)
+        """
+        if columns is None and isinstance(returns, pd.DataFrame):
+            columns = returns.columns
+
+        self.returns = _as_matrix(returns, 'returns')
+        if self.returns.shape[0] == 0:
+            raise ValueError("returns series cannot be empty")
+
+        self.equity_curves = None
+        if equity_curves is not None:
+            self.equity_curves = _as_matrix(equity_curves, 'equity_curves')
+            if self.equity_curves.shape[1] != self.returns.shape[1]:
+                raise ValueError("returns and equity_curves must have the same number of runs")
+
+        if var_confidence_level <= 0 or var_confidence_level >= 1:
+            raise ValueError("confidence_level must be between 0 and 1")
+        if var_simulations <= 0:
+            raise ValueError("simulations must be positive")
+
+        self.risk_free_rate = risk_free_rate
+        self.periods = periods
+        self.var_confidence_level = var_confidence_level
+        self.var_simulations = var_simulations
+        self.var_random_seed = var_random_seed
+        self.columns = pd.Index(columns if columns is not None else range(self.returns.shape[1]))
+
+        # Shared column statistics
+        self._mean = self.returns.mean(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self._std = self.returns.std(axis=0, ddof=1)
+        self._drawdown_cache = None
+        self._percentile_cache = None
+
+    @classmethod
+    def from_equity(cls, equity_curves: ArrayLike, **kwargs) -> 'BatchRiskCalculator':
+        """
+        Build a calculator from equity curves, deriving period returns.
+
+        Args:
+            equity_curves: Equity matrix (periods x runs) or DataFrame
+            **kwargs: Other BatchRiskCalculator arguments
+
+        Returns:
+            BatchRiskCalculator
+        """
+        if isinstance(equity_curves, pd.DataFrame):
+            kwargs.setdefault('columns', equity_curves.columns)
+        equity = _as_matrix(equity_curves, 'equity_curves')
+        returns = equity[1:] / equity[:-1] - 1
+        return cls(returns, equity_curves=equity, **kwargs)
+
+    def calculate_all(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Calculate all metrics, organized by category.
+
+        Returns:
+            Dictionary of categories, each mapping metric names to arrays (one value per run)
+        """
+        results = {'performance': self.calculate_performance_metrics()}
+        if self.equity_curves is not None:
+            results['drawdown'] = self.calculate_drawdown_metrics()
+        results['var'] = self.calculate_var_metrics()
+        results['distribution'] = self.calculate_distribution_metrics()
+        return results
+
+    def calculate_performance_metrics(self) -> Dict[str, np.ndarray]:
+        """
+        Calculate performance ratio metrics.
+
+        Returns:
+            Dictionary with performance metrics (one value per run)
+        """
+        r = self.returns
+        periods = self.periods
+        std = self._std
+        excess_mean = self._mean - self.risk_free_rate / periods
+        metrics = {}
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            metrics['sharpe_ratio'] = np.where(std == 0, 0.0, np.sqrt(periods) * excess_mean / std)
+
+            # Downside deviation: sample std of the negative returns only
+            downside = r < 0
+            n_down = downside.sum(axis=0)
+            down_mean = np.where(downside, r, 0.0).sum(axis=0) / n_down
+            down_var = np.where(downside, (r - down_mean) ** 2, 0.0).sum(axis=0) / (n_down - 1)
+            down_std = np.sqrt(down_var)
+            metrics['sortino_ratio'] = np.where(
+                (n_down == 0) | (down_std == 0), 0.0, np.sqrt(periods) * excess_mean / down_std
+            )
+
+            if self.equity_curves is not None:
+                max_dd_pct = self._max_drawdown_pct()
+                metrics['calmar_ratio'] = np.where(
+                    max_dd_pct != 0, self._mean * 252 / np.abs(max_dd_pct / 100), 0.0
+                )
+
+            metrics['annualized_volatility'] = std * np.sqrt(periods)
+
+            excess = r - self.risk_free_rate / periods
+            gains = np.where(excess > 0, excess, 0.0).sum(axis=0)
+            losses = np.abs(np.where(excess < 0, excess, 0.0).sum(axis=0))
+            metrics['omega_ratio'] = np.where(
+                losses == 0, np.where(gains > 0, np.inf, 0.0), gains / losses
+            )
+
+            percentiles = self._percentiles()
+            upper, lower = percentiles[95.0], percentiles[5.0]
+            metrics['tail_ratio'] = np.where(
+                np.abs(lower) < 1e-10,
+                np.where(upper == 0, 0.0, np.where(upper > 0, np.inf, -np.inf)),
+                np.abs(upper / lower)
+            )
+
+        return metrics
+
+    def _drawdowns(self):
+        """Running peak and drawdown matrices of the equity curves (computed once)"""
+        if self._drawdown_cache is None:
+            equity = self.equity_curves
+            running_max = np.maximum.accumulate(equity, axis=0)
+            self._drawdown_cache = (running_max, equity - running_max)
+        return self._drawdown_cache
+
+    def _percentiles(self) -> Dict[float, np.ndarray]:
+        """Column percentiles used by tail ratio and historical VaR (one partition pass)"""
+        if self._percentile_cache is None:
+            q = [95.0, 5.0, (1 - self.var_confidence_level) * 100]
+            values = np.percentile(self.returns, q, axis=0)
+            self._percentile_cache = dict(zip(q, values))
+        return self._percentile_cache
+
+    def _max_drawdown_pct(self) -> np.ndarray:
+        """Maximum drawdown as a percentage of the final peak, per run"""
+        running_max, drawdown = self._drawdowns()
+        peak = running_max[-1]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(peak == 0, 0.0, drawdown.min(axis=0) / peak * 100)
+
+    def calculate_drawdown_metrics(self) -> Dict[str, np.ndarray]:
+        """
+        Calculate drawdown-related metrics.
+
+        Returns:
+            Dictionary with drawdown metrics (one value per run)
+        """
+        if self.equity_curves is None or self.equity_curves.shape[0] == 0:
+            return {}
+
+        running_max, drawdown = self._drawdowns()
+        metrics = {
+            'max_drawdown': drawdown.min(axis=0),
+            'max_drawdown_pct': self._max_drawdown_pct(),
+        }
+
+        # Average episode length = bars in drawdown / number of episodes
+        is_drawdown = drawdown < 0
+        n_episodes = is_drawdown[0].astype(np.int64) + (is_drawdown[1:] & ~is_drawdown[:-1]).sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            metrics['average_drawdown_duration'] = np.where(
+                n_episodes == 0, 0.0, is_drawdown.sum(axis=0) / n_episodes
+            )
+            underwater = np.where(running_max != 0, drawdown / running_max * 100, 0.0)
+        metrics['ulcer_index'] = np.sqrt((underwater ** 2).mean(axis=0))
+
+        return metrics
+
+    def calculate_var_metrics(self) -> Dict[str, np.ndarray]:
+        """
+        Calculate Value at Risk metrics.
+
+        Monte Carlo VaR uses one set of standard-normal draws for every run:
+        the percentile of mean + std * Z is mean + std * percentile(Z), so
+        the draws are made once instead of per run. With var_random_seed the
+        values equal monte_carlo_var with the same seed.
+
+        Returns:
+            Dictionary with VaR metrics (one value per run)
+        """
+        r = self.returns
+        percentile = (1 - self.var_confidence_level) * 100
+        mean, std = self._mean, self._std
+        metrics = {}
+
+        historical = self._percentiles()[percentile]
+        metrics['historical_var'] = historical
+
+        z_score = stats.norm.ppf(1 - self.var_confidence_level)
+        metrics['parametric_var'] = np.where(std == 0, mean, mean + z_score * std)
+
+        if self.var_random_seed is not None:
+            draws = np.random.RandomState(self.var_random_seed).standard_normal(self.var_simulations)
+        else:
+            draws = np.random.default_rng().standard_normal(self.var_simulations)
+        metrics['monte_carlo_var'] = np.where(
+            std == 0, mean, mean + std * np.percentile(draws, percentile)
+        )
+
+        tail = r <= historical
+        n_tail = tail.sum(axis=0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            metrics['cvar'] = np.where(
+                n_tail == 0, historical, np.where(tail, r, 0.0).sum(axis=0) / n_tail
+            )
+
+        return metrics
+
+    def calculate_distribution_metrics(self) -> Dict[str, np.ndarray]:
+        """
+        Calculate return distribution statistics.
+
+        Returns:
+            Dictionary with distribution metrics (one value per run)
+        """
+        r = self.returns
+        n_runs = r.shape[1]
+        return {
+            'skewness': stats.skew(r, axis=0) if len(r) >= 3 else np.zeros(n_runs),
+            'kurtosis': stats.kurtosis(r, axis=0, fisher=True) if len(r) >= 4 else np.zeros(n_runs),
+            'mean_return': self._mean,
+            'std_return': self._std,
+        }
+
+    def get_flat_metrics(self) -> pd.DataFrame:
+        """
+        Get all metrics as a flat table.
+
+        Column names match the keys of RiskCalculator.get_flat_metrics.
+
+        Returns:
+            DataFrame with one row per run and one column per metric
+        """
+        flat = {}
+        for category, metrics in self.calculate_all().items():
+            for key, values in metrics.items():
+                # Performance metrics don't get a prefix for backward compatibility
+                name = key if category == 'performance' else f"{category}_{key}"
+                flat[name] = values
+        return pd.DataFrame(flat, index=self.columns)
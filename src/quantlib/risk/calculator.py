@@ -6,7 +6,7 @@ Provides a comprehensive interface for calculating all risk and performance metr
 
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Iterable, List, NamedTuple, Tuple
 
 from quantlib.risk.metrics import (
     sharpe_ratio,
@@ -41,6 +41,50 @@ from quantlib.risk.var import (
     monte_carlo_var,
     cvar,
 )
+from quantlib.risk.batch import BatchRiskCalculator
+from quantlib.risk.return_stats import ReturnStats
+
+
+class MetricSpec(NamedTuple):
+    """Registered metric: how to compute it and what inputs it needs"""
+    name: str
+    category: str
+    func: Callable[['RiskCalculator'], Any]
+    requires: Tuple[str, ...]
+    default: Any
+
+
+# Flat metric name (as in get_flat_metrics) -> MetricSpec, in output order
+METRIC_REGISTRY: Dict[str, MetricSpec] = {}
+
+
+def register_metric(
+    name: str,
+    category: str,
+    requires: Tuple[str, ...] = (),
+    default: Any = 0.0
+):
+    """
+    Register a metric function with RiskCalculator.
+    
+    Args:
+        name: Metric name within its category
+        category: Category ('performance', 'drawdown', 'var', 'trades',
+            'benchmark' or 'distribution'); non-performance metrics are
+            flattened as '<category>_<name>'
+        requires: Optional inputs the metric needs ('equity_curve',
+            'drawdown_data', 'trades', 'benchmark'); it is skipped when any
+            is missing
+        default: Value reported when the function raises (None omits the metric)
+    
+    Returns:
+        Decorator registering a function(calculator) -> value
+    """
+    def decorator(func):
+        flat_name = name if category == 'performance' else f"{category}_{name}"
+        METRIC_REGISTRY[flat_name] = MetricSpec(name, category, func, tuple(requires), default)
+        return func
+    return decorator
 
 
 class RiskCalculator:
@@ -102,6 +146,29 @@ class RiskCalculator:
         else:
             self.returns_aligned = None
             self.benchmark_returns_aligned = None
+        
+        # Memoized intermediates and metric values
+        self._memo: Dict[str, Any] = {}
+    
+    @classmethod
+    def from_matrix(
+        cls,
+        returns,
+        equity_curves=None,
+        **kwargs
+    ) -> BatchRiskCalculator:
+        """
+        Create a batched calculator for many runs at once.
+        
+        Args:
+            returns: Returns matrix (periods x runs) or DataFrame with one column per run
+            equity_curves: Equity matrix (periods x runs, optional)
+            **kwargs: risk_free_rate, periods and VaR settings as for RiskCalculator
+        
+        Returns:
+            BatchRiskCalculator whose get_flat_metrics() has one row per run
+        """
+        return BatchRiskCalculator(returns, equity_curves, **kwargs)
     
     def calculate_all(self) -> Dict[str, Any]:
         """
@@ -135,71 +202,118 @@ class RiskCalculator:
         
         return results
     
-    def calculate_performance_metrics(self) -> Dict[str, float]:
-        """
-        Calculate performance ratio metrics.
-        
-        Returns:
-            Dictionary with performance metrics
-        """
-        metrics = {}
-        
-        try:
-            metrics['sharpe_ratio'] = sharpe_ratio(
-                self.returns,
-                self.risk_free_rate,
-                self.periods
-            )
-        except Exception:
-            metrics['sharpe_ratio'] = 0.0
-        
-        try:
-            metrics['sortino_ratio'] = sortino_ratio(
-                self.returns,
-                self.risk_free_rate,
-                self.periods
-            )
-        except Exception:
-            metrics['sortino_ratio'] = 0.0
+    @staticmethod
+    def available_metrics() -> List[str]:
+        """Names accepted by compute(), in get_flat_metrics order"""
+        return list(METRIC_REGISTRY)
+    
+    @staticmethod
+    def has_metric(name: str) -> bool:
+        """Check whether compute() knows a metric name (flat name or unique short name)"""
+        return RiskCalculator._resolve_metric(name) is not None
+    
+    @staticmethod
+    def _resolve_metric(name: str) -> Optional[str]:
+        """Map a flat or unprefixed metric name to its registry key"""
+        if name in METRIC_REGISTRY:
+            return name
+        matches = [flat for flat, spec in METRIC_REGISTRY.items() if spec.name == name]
+        return matches[0] if len(matches) == 1 else None
+    
+    def _cached(self, key: str, func: Callable[[], Any]) -> Any:
+        """Compute a shared intermediate once per calculator"""
+        if key not in self._memo:
+            self._memo[key] = func()
+        return self._memo[key]
+    
+    @property
+    def return_stats(self) -> ReturnStats:
+        """Moments, downside deviation and percentiles of the returns, computed once"""
+        return self._cached('return_stats', lambda: ReturnStats(self.returns))
+    
+    def _pnl_column(self) -> Optional[str]:
+        """Name of the trades' PnL column, if any"""
+        def find():
+            for col in ['pnl', 'PnL', 'profit_loss', 'profit', 'return']:
+                if col in self.trades.columns:
+                    return col
+            return None
+        return self._cached('pnl_column', find)
+    
+    def _has_input(self, requirement: str) -> bool:
+        """Check whether an optional input needed by a metric is present"""
+        if requirement == 'equity_curve':
+            return self.equity_curve is not None
+        if requirement == 'drawdown_data':
+            return self.equity_curve is not None and len(self.equity_curve) > 0
+        if requirement == 'trades':
+            return self.trades is not None and not self.trades.empty and self._pnl_column() is not None
+        if requirement == 'benchmark':
+            return self.returns_aligned is not None
+        raise ValueError(f"Unknown metric requirement: {requirement}")
+    
+    def _evaluate(self, flat_name: str) -> Any:
+        """Evaluate a registered metric (memoized); None if unavailable or omitted"""
+        spec = METRIC_REGISTRY[flat_name]
+        if not all(self._has_input(requirement) for requirement in spec.requires):
+            return None
         
-        # Calmar ratio requires max drawdown
-        if self.equity_curve is not None:
+        def run():
             try:
-                max_dd_pct = max_drawdown_pct(self.equity_curve)
-                if max_dd_pct != 0:
-                    metrics['calmar_ratio'] = calmar_ratio(
-                        self.returns,
-                        abs(max_dd_pct / 100)
-                    )
-                else:
-                    metrics['calmar_ratio'] = 0.0
+                return spec.func(self)
             except Exception:
-                metrics['calmar_ratio'] = 0.0
-        
-        try:
-            metrics['annualized_volatility'] = annualized_volatility(
-                self.returns,
-                self.periods
-            )
-        except Exception:
-            metrics['annualized_volatility'] = 0.0
+                return spec.default
+        return self._cached(f"metric:{flat_name}", run)
+    
+    def compute(self, metrics: Iterable[str]) -> Dict[str, Any]:
+        """
+        Compute only the requested metrics.
         
-        try:
-            metrics['omega_ratio'] = omega_ratio(
-                self.returns,
-                self.risk_free_rate,
-                self.periods
-            )
-        except Exception:
-            metrics['omega_ratio'] = 0.0
+        Metrics are evaluated lazily: only the requested ones and the
+        intermediates they depend on are computed, and everything is
+        memoized on the calculator. Names are the keys of
+        get_flat_metrics() (e.g. 'sharpe_ratio', 'drawdown_max_drawdown_pct')
+        or, when unambiguous, the unprefixed name ('max_drawdown_pct').
         
-        try:
-            metrics['tail_ratio'] = tail_ratio(self.returns)
-        except Exception:
-            metrics['tail_ratio'] = 0.0
+        Args:
+            metrics: Metric names to compute
         
+        Returns:
+            Dictionary keyed by the requested names; metrics whose inputs
+            are missing (e.g. drawdown metrics without an equity curve) are
+            left out
+        """
+        results = {}
+        for name in metrics:
+            flat_name = self._resolve_metric(name)
+            if flat_name is None:
+                raise ValueError(
+                    f"Unknown metric '{name}'. Available: {', '.join(METRIC_REGISTRY)}"
+                )
+            value = self._evaluate(flat_name)
+            if value is not None:
+                results[name] = value
+        return results
+    
+    def _calculate_category(self, category: str) -> Dict[str, Any]:
+        """Evaluate every registered metric of a category"""
+        metrics = {}
+        for flat_name, spec in METRIC_REGISTRY.items():
+            if spec.category == category:
+                value = self._evaluate(flat_name)
+                if value is not None:
+                    metrics[spec.name] = value
         return metrics
     
+    def calculate_performance_metrics(self) -> Dict[str, float]:
+        """
+        Calculate performance ratio metrics.
+        
+        Returns:
+            Dictionary with performance metrics
+        """
+        return self._calculate_category('performance')
+    
     def calculate_drawdown_metrics(self) -> Dict[str, Any]:
         """
         Calculate drawdown-related metrics.
@@ -207,31 +321,7 @@ class RiskCalculator:
         Returns:
             Dictionary with drawdown metrics
         """
-        if self.equity_curve is None or len(self.equity_curve) == 0:
-            return {}
-        
-        metrics = {}
-        
-        try:
-            metrics['max_drawdown'] = float(max_drawdown(self.equity_curve))
-            metrics['max_drawdown_pct'] = float(max_drawdown_pct(self.equity_curve))
-        except Exception:
-            metrics['max_drawdown'] = 0.0
-            metrics['max_drawdown_pct'] = 0.0
-        
-        try:
-            metrics['average_drawdown_duration'] = float(
-                average_drawdown_duration(self.equity_curve)
-            )
-        except Exception:
-            metrics['average_drawdown_duration'] = 0.0
-        
-        try:
-            metrics['ulcer_index'] = float(ulcer_index(self.equity_curve))
-        except Exception:
-            metrics['ulcer_index'] = 0.0
-        
-        return metrics
+        return self._calculate_category('drawdown')
     
     def calculate_var_metrics(self) -> Dict[str, float]:
         """
@@ -240,40 +330,7 @@ class RiskCalculator:
         Returns:
             Dictionary with VaR metrics
         """
-        metrics = {}
-        
-        try:
-            metrics['historical_var'] = float(
-                historical_var(self.returns, self.var_confidence_level)
-            )
-        except Exception:
-            metrics['historical_var'] = 0.0
-        
-        try:
-            metrics['parametric_var'] = float(
-                parametric_var(self.returns, self.var_confidence_level)
-            )
-        except Exception:
-            metrics['parametric_var'] = 0.0
-        
-        try:
-            metrics['monte_carlo_var'] = float(
-                monte_carlo_var(
-                    self.returns,
-                    self.var_confidence_level,
-                    self.var_simulations,
-                    self.var_random_seed
-                )
-            )
-        except Exception:
-            metrics['monte_carlo_var'] = 0.0
-        
-        try:
-            metrics['cvar'] = float(cvar(self.returns, self.var_confidence_level))
-        except Exception:
-            metrics['cvar'] = 0.0
-        
-        return metrics
+        return self._calculate_category('var')
     
     def calculate_trade_metrics(self) -> Dict[str, Any]:
         """
@@ -284,44 +341,7 @@ class RiskCalculator:
         Returns:
             Dictionary with trade metrics
         """
-        if self.trades is None or self.trades.empty:
-            return {}
-        
-        metrics = {}
-        
-        # Try to find PnL column
-        pnl_column = None
-        for col in ['pnl', 'PnL', 'profit_loss', 'profit', 'return']:
-            if col in self.trades.columns:
-                pnl_column = col
-                break
-        
-        if pnl_column is None:
-            return metrics
-        
-        try:
-            metrics['win_rate'] = float(win_rate(self.trades, pnl_column))
-        except Exception:
-            metrics['win_rate'] = 0.0
-        
-        try:
-            metrics['profit_factor'] = float(profit_factor(self.trades, pnl_column))
-        except Exception:
-            metrics['profit_factor'] = 0.0
-        
-        try:
-            win_loss_stats = average_win_loss(self.trades, pnl_column)
-            metrics.update(win_loss_stats)
-        except Exception:
-            pass
-        
-        try:
-            metrics['num_trades'] = len(self.trades)
-            metrics['total_trades'] = len(self.trades)
-        except Exception:
-            pass
-        
-        return metrics
+        return self._calculate_category('trades')
     
     def calculate_benchmark_metrics(self) -> Dict[str, float]:
         """
@@ -330,46 +350,7 @@ class RiskCalculator:
         Returns:
             Dictionary with benchmark comparison metrics
         """
-        if self.returns_aligned is None:
-            return {}
-        
-        metrics = {}
-        
-        try:
-            metrics['beta'] = float(beta(
-                self.returns_aligned,
-                self.benchmark_returns_aligned
-            ))
-        except Exception:
-            metrics['beta'] = 0.0
-        
-        try:
-            metrics['alpha'] = float(alpha(
-                self.returns_aligned,
-                self.benchmark_returns_aligned,
-                self.risk_free_rate
-            ))
-        except Exception:
-            metrics['alpha'] = 0.0
-        
-        try:
-            metrics['jensen_alpha'] = float(jensen_alpha(
-                self.returns_aligned,
-                self.benchmark_returns_aligned,
-                self.risk_free_rate
-            ))
-        except Exception:
-            metrics['jensen_alpha'] = 0.0
-        
-        try:
-            metrics['information_ratio'] = float(information_ratio(
-                self.returns_aligned,
-                self.benchmark_returns_aligned
-            ))
-        except Exception:
-            metrics['information_ratio'] = 0.0
-        
-        return metrics
+        return self._calculate_category('benchmark')
     
     def calculate_distribution_metrics(self) -> Dict[str, float]:
         """
@@ -378,26 +359,7 @@ class RiskCalculator:
         Returns:
             Dictionary with distribution metrics
         """
-        metrics = {}
-        
-        try:
-            metrics['skewness'] = float(skewness(self.returns))
-        except Exception:
-            metrics['skewness'] = 0.0
-        
-        try:
-            metrics['kurtosis'] = float(kurtosis(self.returns))
-        except Exception:
-            metrics['kurtosis'] = 0.0
-        
-        try:
-            metrics['mean_return'] = float(self.returns.mean())
-            metrics['std_return'] = float(self.returns.std())
-        except Exception:
-            metrics['mean_return'] = 0.0
-            metrics['std_return'] = 0.0
-        
-        return metrics
+        return self._calculate_category('distribution')
     
     def get_flat_metrics(self) -> Dict[str, float]:
         """
@@ -419,3 +381,179 @@ class RiskCalculator:
                         flat[f"{category}_{key}"] = value
         
         return flat
+
+
+# Performance metrics
+
+@register_metric('sharpe_ratio', 'performance')
+def _sharpe_ratio(calc: RiskCalculator):
+    return sharpe_ratio(calc.returns, calc.risk_free_rate, calc.periods, calc.return_stats)
+
+
+@register_metric('sortino_ratio', 'performance')
+def _sortino_ratio(calc: RiskCalculator):
+    return sortino_ratio(calc.returns, calc.risk_free_rate, calc.periods, calc.return_stats)
+
+
+def _max_drawdown_pct(calc: RiskCalculator) -> float:
+    """Max drawdown percentage, shared by calmar_ratio and the drawdown metrics"""
+    return calc._cached('max_drawdown_pct', lambda: max_drawdown_pct(calc.equity_curve))
+
+
+@register_metric('calmar_ratio', 'performance', requires=('equity_curve',))
+def _calmar_ratio(calc: RiskCalculator):
+    # Calmar ratio requires max drawdown
+    max_dd_pct = _max_drawdown_pct(calc)
+    if max_dd_pct != 0:
+        return calmar_ratio(calc.returns, abs(max_dd_pct / 100), calc.return_stats)
+    return 0.0
+
+
+@register_metric('annualized_volatility', 'performance')
+def _annualized_volatility(calc: RiskCalculator):
+    return annualized_volatility(calc.returns, calc.periods, calc.return_stats)
+
+
+@register_metric('omega_ratio', 'performance')
+def _omega_ratio(calc: RiskCalculator):
+    return omega_ratio(calc.returns, calc.risk_free_rate, calc.periods, calc.return_stats)
+
+
+@register_metric('tail_ratio', 'performance')
+def _tail_ratio(calc: RiskCalculator):
+    return tail_ratio(calc.returns, return_stats=calc.return_stats)
+
+
+# Drawdown metrics
+
+@register_metric('max_drawdown', 'drawdown', requires=('drawdown_data',))
+def _max_drawdown(calc: RiskCalculator):
+    return float(max_drawdown(calc.equity_curve))
+
+
+@register_metric('max_drawdown_pct', 'drawdown', requires=('drawdown_data',))
+def _drawdown_max_drawdown_pct(calc: RiskCalculator):
+    return float(_max_drawdown_pct(calc))
+
+
+@register_metric('average_drawdown_duration', 'drawdown', requires=('drawdown_data',))
+def _average_drawdown_duration(calc: RiskCalculator):
+    return float(average_drawdown_duration(calc.equity_curve))
+
+
+@register_metric('ulcer_index', 'drawdown', requires=('drawdown_data',))
+def _ulcer_index(calc: RiskCalculator):
+    return float(ulcer_index(calc.equity_curve))
+
+
+# VaR metrics
+
+@register_metric('historical_var', 'var')
+def _historical_var(calc: RiskCalculator):
+    return float(historical_var(calc.returns, calc.var_confidence_level, calc.return_stats))
+
+
+@register_metric('parametric_var', 'var')
+def _parametric_var(calc: RiskCalculator):
+    return float(parametric_var(calc.returns, calc.var_confidence_level, calc.return_stats))
+
+
+@register_metric('monte_carlo_var', 'var')
+def _monte_carlo_var(calc: RiskCalculator):
+    return float(monte_carlo_var(
+        calc.returns,
+        calc.var_confidence_level,
+        calc.var_simulations,
+        calc.var_random_seed,
+        calc.return_stats
+    ))
+
+
+@register_metric('cvar', 'var')
+def _cvar(calc: RiskCalculator):
+    return float(cvar(calc.returns, calc.var_confidence_level, calc.return_stats))
+
+
+# Trade statistics
+
+@register_metric('win_rate', 'trades', requires=('trades',))
+def _win_rate(calc: RiskCalculator):
+    return float(win_rate(calc.trades, calc._pnl_column()))
+
+
+@register_metric('profit_factor', 'trades', requires=('trades',))
+def _profit_factor(calc: RiskCalculator):
+    return float(profit_factor(calc.trades, calc._pnl_column()))
+
+
+def _win_loss_stats(calc: RiskCalculator) -> Dict[str, float]:
+    return calc._cached('win_loss', lambda: average_win_loss(calc.trades, calc._pnl_column()))
+
+
+@register_metric('avg_win', 'trades', requires=('trades',), default=None)
+def _avg_win(calc: RiskCalculator):
+    return _win_loss_stats(calc)['avg_win']
+
+
+@register_metric('avg_loss', 'trades', requires=('trades',), default=None)
+def _avg_loss(calc: RiskCalculator):
+    return _win_loss_stats(calc)['avg_loss']
+
+
+@register_metric('win_loss_ratio', 'trades', requires=('trades',), default=None)
+def _win_loss_ratio(calc: RiskCalculator):
+    return _win_loss_stats(calc)['win_loss_ratio']
+
+
+@register_metric('num_trades', 'trades', requires=('trades',), default=None)
+def _num_trades(calc: RiskCalculator):
+    return len(calc.trades)
+
+
+@register_metric('total_trades', 'trades', requires=('trades',), default=None)
+def _total_trades(calc: RiskCalculator):
+    return len(calc.trades)
+
+
+# Benchmark comparison
+
+@register_metric('beta', 'benchmark', requires=('benchmark',))
+def _beta(calc: RiskCalculator):
+    return float(beta(calc.returns_aligned, calc.benchmark_returns_aligned))
+
+
+@register_metric('alpha', 'benchmark', requires=('benchmark',))
+def _alpha(calc: RiskCalculator):
+    return float(alpha(calc.returns_aligned, calc.benchmark_returns_aligned, calc.risk_free_rate))
+
+
+@register_metric('jensen_alpha', 'benchmark', requires=('benchmark',))
+def _jensen_alpha(calc: RiskCalculator):
+    return float(jensen_alpha(calc.returns_aligned, calc.benchmark_returns_aligned, calc.risk_free_rate))
+
+
+@register_metric('information_ratio', 'benchmark', requires=('benchmark',))
+def _information_ratio(calc: RiskCalculator):
+    return float(information_ratio(calc.returns_aligned, calc.benchmark_returns_aligned))
+
+
+# Distribution statistics
+
+@register_metric('skewness', 'distribution')
+def _skewness(calc: RiskCalculator):
+    return float(skewness(calc.returns, calc.return_stats))
+
+
+@register_metric('kurtosis', 'distribution')
+def _kurtosis(calc: RiskCalculator):
+    return float(kurtosis(calc.returns, calc.return_stats))
+
+
+@register_metric('mean_return', 'distribution')
+def _mean_return(calc: RiskCalculator):
+    return float(calc.return_stats.mean)
+
+
+@register_metric('std_return', 'distribution')
+def _std_return(calc: RiskCalculator):
+    return float(calc.return_stats.std)
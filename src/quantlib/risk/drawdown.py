@@ -55,6 +55,40 @@ def max_drawdown_pct(equity_curve: pd.Series) -> float:
     return (max_dd / peak) * 100
 
 
+def _drawdown_values(equity_curve: pd.Series):
+    """Equity, running peak and drawdown as float arrays (NaN-skipping peak)"""
+    values = np.asarray(equity_curve, dtype=np.float64)
+    running_max = np.fmax.accumulate(values) if len(values) else values
+    return values, running_max, values - running_max
+
+
+def _drawdown_runs(drawdown: np.ndarray):
+    """
+    Locate drawdown episodes (runs of consecutive negative drawdown).
+
+    Returns:
+        Tuple of (start positions, end positions), ends inclusive
+    """
+    is_drawdown = np.concatenate(([False], drawdown < 0, [False]))
+    edges = np.diff(is_drawdown.astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return starts, ends
+
+
+def _next_recovery(drawdown: np.ndarray) -> np.ndarray:
+    """
+    Position of the next bar at or after each bar that sits at its running peak.
+
+    A bar in drawdown recovers at the first later bar back at the running
+    peak, since every bar in between is below the same peak. Bars with no
+    later recovery get len(drawdown).
+    """
+    n = len(drawdown)
+    at_peak = np.where(drawdown == 0, np.arange(n), n)
+    return np.minimum.accumulate(at_peak[::-1])[::-1]
+
+
 def drawdown_duration(equity_curve: pd.Series) -> pd.Series:
     """
     Calculate duration of drawdown periods.
@@ -65,20 +99,68 @@ def drawdown_duration(equity_curve: pd.Series) -> pd.Series:
     Returns:
         Series with duration (in periods) for each point in drawdown
     """
-    drawdown = calculate_drawdown(equity_curve)
+    _, _, drawdown = _drawdown_values(equity_curve)
     is_drawdown = drawdown < 0
     
-    duration = pd.Series(0, index=equity_curve.index)
-    current_duration = 0
+    # Count bars since the last bar that was not in drawdown
+    positions = np.arange(len(drawdown))
+    last_reset = np.maximum.accumulate(np.where(is_drawdown, -1, positions)) if len(drawdown) else positions
+    duration = np.where(is_drawdown, positions - last_reset, 0)
     
-    for i in range(len(is_drawdown)):
-        if is_drawdown.iloc[i]:
-            current_duration += 1
-            duration.iloc[i] = current_duration
-        else:
-            current_duration = 0
+    return pd.Series(duration.astype(np.int64), index=equity_curve.index)
+
+
+def drawdown_table(equity_curve: pd.Series) -> pd.DataFrame:
+    """
+    List every drawdown episode.
     
-    return duration
+    An episode is a run of consecutive periods below the running peak.
+    
+    Args:
+        equity_curve: Equity/portfolio value over time
+        
+    Returns:
+        DataFrame with one row per episode and columns:
+        - start: First period below the peak
+        - trough: Period of the deepest drawdown
+        - recovery: First period back at the peak (None/NaT if not recovered)
+        - peak: Peak value the episode is measured from
+        - depth: Drawdown at the trough (negative value)
+        - depth_pct: Depth as a percentage of the peak (negative value)
+        - duration: Number of periods below the peak
+    """
+    columns = ['start', 'trough', 'recovery', 'peak', 'depth', 'depth_pct', 'duration']
+    _, running_max, drawdown = _drawdown_values(equity_curve)
+    starts, ends = _drawdown_runs(drawdown)
+    if len(starts) == 0:
+        return pd.DataFrame(columns=columns)
+    
+    # Deepest point of each run: first position equal to the run minimum
+    lengths = ends - starts + 1
+    positions = np.flatnonzero(drawdown < 0)
+    episode = np.repeat(np.arange(len(starts)), lengths)
+    depths = np.minimum.reduceat(drawdown[positions], np.cumsum(lengths) - lengths)
+    is_trough = drawdown[positions] == depths[episode]
+    _, first = np.unique(episode[is_trough], return_index=True)
+    troughs = positions[is_trough][first]
+    
+    n = len(drawdown)
+    recovery = np.append(_next_recovery(drawdown), n)[ends + 1]
+    
+    index = equity_curve.index
+    peaks = running_max[starts]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        depth_pct = np.where(peaks != 0, depths / peaks * 100, 0.0)
+    
+    return pd.DataFrame({
+        'start': index[starts],
+        'trough': index[troughs],
+        'recovery': [index[r] if r < n else None for r in recovery],
+        'peak': peaks,
+        'depth': depths,
+        'depth_pct': depth_pct,
+        'duration': lengths.astype(np.int64),
+    }, columns=columns)
 
 
 def underwater_curve(equity_curve: pd.Series) -> pd.Series:
@@ -115,35 +197,14 @@ def average_drawdown_duration(equity_curve: pd.Series) -> float:
     if len(equity_curve) == 0:
         return 0.0
     
-    duration_series = drawdown_duration(equity_curve)
-    drawdown_periods = duration_series[duration_series > 0]
-    
-    if len(drawdown_periods) == 0:
-        return 0.0
+    _, _, drawdown = _drawdown_values(equity_curve)
+    starts, ends = _drawdown_runs(drawdown)
     
-    # Get maximum duration for each drawdown period
-    # Each drawdown period starts at 1 and increments
-    # We need to find the peaks (max duration of each drawdown)
-    max_durations = []
-    current_max = 0
-    
-    for i in range(len(duration_series)):
-        if duration_series.iloc[i] > 0:
-            if duration_series.iloc[i] > current_max:
-                current_max = duration_series.iloc[i]
-        else:
-            if current_max > 0:
-                max_durations.append(current_max)
-                current_max = 0
-    
-    # Add the last drawdown if we ended in a drawdown
-    if current_max > 0:
-        max_durations.append(current_max)
-    
-    if len(max_durations) == 0:
+    if len(starts) == 0:
         return 0.0
     
-    return np.mean(max_durations)
+    # Each drawdown period lasts from its first to its last bar below the peak
+    return np.mean(ends - starts + 1)
 
 
 def drawdown_recovery_time(equity_curve: pd.Series) -> pd.Series:
@@ -159,26 +220,14 @@ def drawdown_recovery_time(equity_curve: pd.Series) -> pd.Series:
     if len(equity_curve) == 0:
         return pd.Series(dtype=float)
     
-    drawdown = calculate_drawdown(equity_curve)
-    running_max = equity_curve.expanding().max()
-    recovery_time = pd.Series(0, index=equity_curve.index)
-    
-    # For each point in drawdown, find when it recovers
-    for i in range(len(equity_curve)):
-        if drawdown.iloc[i] < 0:
-            # Find when equity recovers to the peak value at this point
-            peak_value = running_max.iloc[i]
-            future_equity = equity_curve.iloc[i:]
-            
-            recovery_idx = (future_equity >= peak_value).idxmax() if len(future_equity) > 0 else None
-            
-            if recovery_idx is not None and equity_curve.index.get_loc(recovery_idx) >= i:
-                recovery_time.iloc[i] = equity_curve.index.get_loc(recovery_idx) - i
-            else:
-                # Not recovered within the data range
-                recovery_time.iloc[i] = len(equity_curve) - i
-    
-    return recovery_time
+    _, _, drawdown = _drawdown_values(equity_curve)
+    n = len(drawdown)
+    
+    # For each point in drawdown, the next bar back at the peak
+    recovery = _next_recovery(drawdown)
+    recovery_time = np.where((drawdown < 0) & (recovery < n), recovery - np.arange(n), 0)
+    
+    return pd.Series(recovery_time.astype(np.int64), index=equity_curve.index)
 
 
 def ulcer_index(equity_curve: pd.Series) -> float:
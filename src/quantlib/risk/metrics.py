@@ -3,12 +3,16 @@
 import pandas as pd
 import numpy as np
 from scipy import stats
+from typing import Optional
+
+from quantlib.risk.return_stats import ReturnStats
 
 
 def sharpe_ratio(
     returns: pd.Series,
     risk_free_rate: float = 0.0,
-    periods: int = 252
+    periods: int = 252,
+    return_stats: Optional[ReturnStats] = None
 ) -> float:
     """
     Calculate annualized Sharpe ratio.
@@ -17,10 +21,16 @@ def sharpe_ratio(
         returns: Returns series
         risk_free_rate: Annual risk-free rate
         periods: Number of periods per year (252 for daily)
+        return_stats: Precomputed ReturnStats of returns (optional fast path)
         
     Returns:
         Sharpe ratio
     """
+    if return_stats is not None:
+        if return_stats.n == 0 or return_stats.std == 0:
+            return 0.0
+        return np.sqrt(periods) * (return_stats.mean - risk_free_rate / periods) / return_stats.std
+    
     if len(returns) == 0 or returns.std() == 0:
         return 0.0
     
@@ -31,7 +41,8 @@ def sharpe_ratio(
 def sortino_ratio(
     returns: pd.Series,
     risk_free_rate: float = 0.0,
-    periods: int = 252
+    periods: int = 252,
+    return_stats: Optional[ReturnStats] = None
 ) -> float:
     """
     Calculate annualized Sortino ratio (uses downside deviation).
@@ -40,10 +51,16 @@ def sortino_ratio(
         returns: Returns series
         risk_free_rate: Annual risk-free rate
         periods: Number of periods per year
+        return_stats: Precomputed ReturnStats of returns (optional fast path)
         
     Returns:
         Sortino ratio
     """
+    if return_stats is not None:
+        if return_stats.n == 0 or len(return_stats.downside) == 0 or return_stats.downside_std == 0:
+            return 0.0
+        return np.sqrt(periods) * (return_stats.mean - risk_free_rate / periods) / return_stats.downside_std
+    
     if len(returns) == 0:
         return 0.0
     
@@ -57,17 +74,27 @@ def sortino_ratio(
     return np.sqrt(periods) * excess_returns.mean() / downside_std
 
 
-def calmar_ratio(returns: pd.Series, max_drawdown: float) -> float:
+def calmar_ratio(
+    returns: pd.Series,
+    max_drawdown: float,
+    return_stats: Optional[ReturnStats] = None
+) -> float:
     """
     Calculate Calmar ratio (annualized return / max drawdown).
     
     Args:
         returns: Returns series
         max_drawdown: Maximum drawdown (positive number)
+        return_stats: Precomputed ReturnStats of returns (optional fast path)
         
     Returns:
         Calmar ratio
     """
+    if return_stats is not None:
+        if max_drawdown == 0 or return_stats.n == 0:
+            return 0.0
+        return return_stats.mean * 252 / max_drawdown
+    
     if max_drawdown == 0 or len(returns) == 0:
         return 0.0
     
@@ -168,7 +195,8 @@ def jensen_alpha(
 
 def annualized_volatility(
     returns: pd.Series,
-    periods: int = 252
+    periods: int = 252,
+    return_stats: Optional[ReturnStats] = None
 ) -> float:
     """
     Calculate annualized volatility (standard deviation).
@@ -176,10 +204,14 @@ def annualized_volatility(
     Args:
         returns: Returns series
         periods: Number of periods per year (252 for daily)
+        return_stats: Precomputed ReturnStats of returns (optional fast path)
         
     Returns:
         Annualized volatility
     """
+    if return_stats is not None:
+        return return_stats.std * np.sqrt(periods) if return_stats.n else 0.0
+    
     if len(returns) == 0:
         return 0.0
     
@@ -189,7 +221,8 @@ def annualized_volatility(
 def omega_ratio(
     returns: pd.Series,
     threshold: float = 0.0,
-    periods: int = 252
+    periods: int = 252,
+    return_stats: Optional[ReturnStats] = None
 ) -> float:
     """
     Calculate Omega ratio (probability-weighted ratio of gains vs losses).
@@ -201,18 +234,22 @@ def omega_ratio(
         returns: Returns series
         threshold: Threshold return level (default 0.0)
         periods: Number of periods per year (for annualizing threshold)
+        return_stats: Precomputed ReturnStats of returns (optional fast path)
         
     Returns:
         Omega ratio
     """
-    if len(returns) == 0:
-        return 0.0
-    
     threshold_daily = threshold / periods
-    excess_returns = returns - threshold_daily
-    
-    gains = excess_returns[excess_returns > 0].sum()
-    losses = abs(excess_returns[excess_returns < 0].sum())
+    if return_stats is not None:
+        if return_stats.n == 0:
+            return 0.0
+        gains, losses = return_stats.gains_losses(threshold_daily)
+    else:
+        if len(returns) == 0:
+            return 0.0
+        excess_returns = returns - threshold_daily
+        gains = excess_returns[excess_returns > 0].sum()
+        losses = abs(excess_returns[excess_returns < 0].sum())
     
     if losses == 0:
         return np.inf if gains > 0 else 0.0
@@ -223,7 +260,8 @@ def omega_ratio(
 def tail_ratio(
     returns: pd.Series,
     upper_percentile: float = 95.0,
-    lower_percentile: float = 5.0
+    lower_percentile: float = 5.0,
+    return_stats: Optional[ReturnStats] = None
 ) -> float:
     """
     Calculate tail ratio (ratio of upper percentile to lower percentile returns).
@@ -235,15 +273,21 @@ def tail_ratio(
         returns: Returns series
         upper_percentile: Upper percentile (default 95th)
         lower_percentile: Lower percentile (default 5th)
+        return_stats: Precomputed ReturnStats of returns (optional fast path)
         
     Returns:
         Tail ratio
     """
-    if len(returns) == 0:
-        return 0.0
-    
-    upper = np.percentile(returns, upper_percentile)
-    lower = np.percentile(returns, lower_percentile)
+    if return_stats is not None:
+        if return_stats.n == 0:
+            return 0.0
+        upper = return_stats.percentile(upper_percentile)
+        lower = return_stats.percentile(lower_percentile)
+    else:
+        if len(returns) == 0:
+            return 0.0
+        upper = np.percentile(returns, upper_percentile)
+        lower = np.percentile(returns, lower_percentile)
     
     if abs(lower) < 1e-10:
         return 0.0 if upper == 0 else np.inf if upper > 0 else -np.inf
@@ -251,7 +295,7 @@ def tail_ratio(
     return abs(upper / lower)
 
 
-def skewness(returns: pd.Series) -> float:
+def skewness(returns: pd.Series, return_stats: Optional[ReturnStats] = None) -> float:
     """
     Calculate skewness of returns distribution.
     
@@ -260,17 +304,21 @@ def skewness(returns: pd.Series) -> float:
     
     Args:
         returns: Returns series
+        return_stats: Precomputed ReturnStats of returns (optional fast path)
         
     Returns:
         Skewness
     """
+    if return_stats is not None:
+        return return_stats.skewness if return_stats.n >= 3 else 0.0
+    
     if len(returns) < 3:
         return 0.0
     
     return stats.skew(returns)
 
 
-def kurtosis(returns: pd.Series) -> float:
+def kurtosis(returns: pd.Series, return_stats: Optional[ReturnStats] = None) -> float:
     """
     Calculate excess kurtosis of returns distribution.
     
@@ -279,10 +327,14 @@ def kurtosis(returns: pd.Series) -> float:
     
     Args:
         returns: Returns series
+        return_stats: Precomputed ReturnStats of returns (optional fast path)
         
     Returns:
         Excess kurtosis
     """
+    if return_stats is not None:
+        return return_stats.kurtosis if return_stats.n >= 4 else 0.0
+    
     if len(returns) < 4:
         return 0.0
     
@@ -3,71 +3,210 @@ Monte Carlo simulation for risk analysis
 
 Monte Carlo simulation generates multiple scenarios by sampling from historical returns
 to estimate the distribution of potential outcomes.
+
+Simulations are generated in batches: bootstrap indices for a whole chunk of
+paths are drawn at once from a local np.random.Generator and compounded with
+a single cumprod along the time axis. Chunks keep memory bounded, get their
+own child seeds from a SeedSequence (so results for a given seed do not
+depend on n_jobs), and can be spread over worker processes.
 """
 
-from typing import Dict, Any, Optional
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 from scipy import stats
 
 
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Target number of simulated values (paths x periods) per chunk (~32 MB of float64)
+CHUNK_ELEMENTS = 4_000_000
+
+
+def bootstrap_indices(
+    rng: np.random.Generator,
+    n_obs: int,
+    n_paths: int,
+    n_periods: int,
+    block_size: int = 1
+) -> np.ndarray:
+    """
+    Draw bootstrap sample indices for a batch of paths.
+
+    With block_size > 1 a circular block bootstrap is used: each path is built
+    from blocks of consecutive observations starting at random positions
+    (wrapping around the end), which preserves short-range autocorrelation.
+
+    Args:
+        rng: Random generator
+        n_obs: Number of historical observations
+        n_paths: Number of paths
+        n_periods: Number of periods per path
+        block_size: Length of each bootstrap block (1 = i.i.d. bootstrap)
+
+    Returns:
+        Integer array of shape (n_paths, n_periods)
+    """
+    if block_size <= 1:
+        return rng.integers(0, n_obs, size=(n_paths, n_periods))
+
+    n_blocks = -(-n_periods // block_size)
+    starts = rng.integers(0, n_obs, size=(n_paths, n_blocks, 1))
+    indices = (starts + np.arange(block_size)) % n_obs
+    return indices.reshape(n_paths, n_blocks * block_size)[:, :n_periods]
+
+
+def _simulate_paths(
+    returns_array: np.ndarray,
+    n_paths: int,
+    n_periods: int,
+    initial_value: float,
+    block_size: int,
+    seed: np.random.SeedSequence
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Simulate one chunk; returns (sampled returns, value paths)"""
+    rng = np.random.default_rng(seed)
+    sampled = returns_array[bootstrap_indices(rng, len(returns_array), n_paths, n_periods, block_size)]
+    paths = 1.0 + sampled
+    np.cumprod(paths, axis=1, out=paths)
+    paths *= initial_value
+    return sampled, paths
+
+
+def _simulation_chunk(args: tuple) -> Dict[str, np.ndarray]:
+    """Worker for monte_carlo_simulation: final values, band samples and optional paths"""
+    returns_array, n_paths, n_periods, initial_value, block_size, seed, band_columns, return_paths = args
+    _, paths = _simulate_paths(returns_array, n_paths, n_periods, initial_value, block_size, seed)
+    result = {
+        'final_values': paths[:, -1].copy(),
+        'band_values': paths[:, band_columns],
+    }
+    if return_paths:
+        result['paths'] = paths.astype(np.float32)
+    return result
+
+
+def _metrics_chunk(args: tuple) -> Dict[str, np.ndarray]:
+    """Worker for monte_carlo_metrics: per-path final equity, drawdown and Sharpe"""
+    returns_array, n_paths, n_periods, initial_value, block_size, seed = args
+    sampled, paths = _simulate_paths(returns_array, n_paths, n_periods, initial_value, block_size, seed)
+
+    peak = np.maximum.accumulate(paths, axis=1)
+    max_drawdowns = ((paths - peak) / peak).min(axis=1)
+
+    mean = sampled.mean(axis=1)
+    std = sampled.std(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = np.where(std > 0, mean / std * np.sqrt(252), 0.0)
+
+    final_equities = paths[:, -1].copy()
+    return {
+        'final_equity': final_equities,
+        'total_return': final_equities / initial_value - 1,
+        'max_drawdown': max_drawdowns,
+        'sharpe_ratio': sharpe,
+    }
+
+
+def _run_chunks(
+    worker,
+    common: tuple,
+    n_simulations: int,
+    n_periods: int,
+    random_seed: Optional[int],
+    chunk_size: Optional[int],
+    n_jobs: int,
+    extra: tuple = ()
+) -> List[Dict[str, np.ndarray]]:
+    """Split simulations into seeded chunks and run them serially or in a process pool"""
+    if chunk_size is None:
+        chunk_size = max(1, CHUNK_ELEMENTS // max(n_periods, 1))
+    sizes = [min(chunk_size, n_simulations - start) for start in range(0, n_simulations, chunk_size)]
+    seeds = np.random.SeedSequence(random_seed).spawn(len(sizes))
+    tasks = [common[:1] + (size,) + common[1:] + (seed,) + extra for size, seed in zip(sizes, seeds)]
+
+    if n_jobs == 1 or len(tasks) == 1:
+        return [worker(task) for task in tasks]
+
+    n_workers = (os.cpu_count() or 1) if n_jobs < 0 else n_jobs
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(tasks))) as executor:
+        return list(executor.map(worker, tasks))
+
+
+def _validate(n_simulations: int, block_size: int):
+    """Validate common simulation arguments"""
+    if n_simulations < 1:
+        raise ValueError("n_simulations must be at least 1")
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1")
+
+
 def monte_carlo_simulation(
     returns: pd.Series,
     n_simulations: int = 1000,
     n_periods: Optional[int] = None,
     initial_value: float = 1.0,
-    random_seed: Optional[int] = None
+    random_seed: Optional[int] = None,
+    block_size: int = 1,
+    return_paths: bool = False,
+    max_band_points: int = 252,
+    chunk_size: Optional[int] = None,
+    n_jobs: int = 1
 ) -> Dict[str, Any]:
     """
     Run Monte Carlo simulation on returns.
-    
+
     Args:
         returns: Historical returns series
         n_simulations: Number of simulations to run (default: 1000)
         n_periods: Number of periods to simulate (default: length of returns)
         initial_value: Starting value (default: 1.0)
         random_seed: Random seed for reproducibility
-        
+        block_size: Block length for a circular block bootstrap (default: 1, i.i.d.)
+        return_paths: Also return every simulated path as a float32 array
+        max_band_points: Maximum number of periods at which percentile bands
+            are computed (evenly spaced, always including the last period)
+        chunk_size: Paths simulated per batch (default: sized to ~32 MB)
+        n_jobs: Worker processes for the chunks (1 = serial, -1 = all CPUs)
+
     Returns:
         Dictionary with simulation results including:
-        - simulations: Array of simulated paths (n_simulations x n_periods)
+        - bands: Percentile bands over time ('periods' plus 'p5' ... 'p95' arrays)
         - final_values: Array of final values for each simulation
         - percentiles: Dictionary with percentile values (5th, 25th, 50th, 75th, 95th)
         - statistics: Dictionary with mean, std, min, max
+        - simulations: float32 array of paths (n_simulations x n_periods), only
+          when return_paths is True
     """
     if len(returns) == 0:
         raise ValueError("Returns series cannot be empty")
-    
-    if random_seed is not None:
-        np.random.seed(random_seed)
-    
+    _validate(n_simulations, block_size)
+
     n_periods = n_periods if n_periods is not None else len(returns)
-    
-    # Bootstrap sampling from historical returns
-    returns_array = returns.values
-    
-    # Generate simulations
-    simulations = []
-    for _ in range(n_simulations):
-        # Sample returns with replacement
-        sampled_returns = np.random.choice(returns_array, size=n_periods, replace=True)
-        
-        # Calculate cumulative returns
-        cumulative = (1 + sampled_returns).cumprod() * initial_value
-        simulations.append(cumulative)
-    
-    simulations = np.array(simulations)
-    final_values = simulations[:, -1]
-    
+    returns_array = np.asarray(returns, dtype=np.float64)
+
+    band_columns = np.unique(
+        np.linspace(0, n_periods - 1, min(n_periods, max(max_band_points, 1))).round().astype(int)
+    )
+    band_columns[-1] = n_periods - 1
+
+    chunks = _run_chunks(
+        _simulation_chunk,
+        (returns_array, n_periods, initial_value, block_size),
+        n_simulations, n_periods, random_seed, chunk_size, n_jobs,
+        extra=(band_columns, return_paths)
+    )
+
+    final_values = np.concatenate([chunk['final_values'] for chunk in chunks])
+    band_values = np.concatenate([chunk['band_values'] for chunk in chunks])
+    band_percentiles = np.percentile(band_values, PERCENTILES, axis=0)
+
     # Calculate percentiles
-    percentiles = {
-        'p5': float(np.percentile(final_values, 5)),
-        'p25': float(np.percentile(final_values, 25)),
-        'p50': float(np.percentile(final_values, 50)),
-        'p75': float(np.percentile(final_values, 75)),
-        'p95': float(np.percentile(final_values, 95)),
-    }
-    
+    final_percentiles = np.percentile(final_values, PERCENTILES)
+    percentiles = {f'p{p}': float(v) for p, v in zip(PERCENTILES, final_percentiles)}
+
     # Calculate statistics
     statistics = {
         'mean': float(np.mean(final_values)),
@@ -76,34 +215,47 @@ def monte_carlo_simulation(
         'max': float(np.max(final_values)),
         'median': float(np.median(final_values)),
     }
-    
-    return {
-        'simulations': simulations.tolist(),  # Convert to list for JSON serialization
-        'final_values': final_values.tolist(),
+
+    result = {
+        'bands': {
+            'periods': band_columns,
+            **{f'p{p}': band for p, band in zip(PERCENTILES, band_percentiles)},
+        },
+        'final_values': final_values,
         'percentiles': percentiles,
         'statistics': statistics,
         'n_simulations': n_simulations,
         'n_periods': n_periods,
         'initial_value': initial_value,
+        'block_size': block_size,
     }
+    if return_paths:
+        result['simulations'] = np.concatenate([chunk['paths'] for chunk in chunks])
+    return result
 
 
 def monte_carlo_metrics(
     equity_curve: pd.Series,
     n_simulations: int = 1000,
-    random_seed: Optional[int] = None
+    random_seed: Optional[int] = None,
+    block_size: int = 1,
+    chunk_size: Optional[int] = None,
+    n_jobs: int = 1
 ) -> Dict[str, Any]:
     """
     Run Monte Carlo simulation on equity curve and calculate metrics.
-    
+
     This function simulates multiple scenarios of the strategy's performance
     to estimate confidence intervals for various metrics.
-    
+
     Args:
         equity_curve: Equity curve series
         n_simulations: Number of simulations (default: 1000)
         random_seed: Random seed for reproducibility
-        
+        block_size: Block length for a circular block bootstrap (default: 1, i.i.d.)
+        chunk_size: Paths simulated per batch (default: sized to ~32 MB)
+        n_jobs: Worker processes for the chunks (1 = serial, -1 = all CPUs)
+
     Returns:
         Dictionary with Monte Carlo results for:
         - final_equity: Distribution of final equity values
@@ -113,67 +265,37 @@ def monte_carlo_metrics(
     """
     if len(equity_curve) == 0:
         raise ValueError("Equity curve cannot be empty")
-    
+    _validate(n_simulations, block_size)
+
     # Calculate returns from equity curve
     returns = equity_curve.pct_change().dropna()
-    
+
     if len(returns) == 0:
         raise ValueError("Cannot calculate returns from equity curve")
-    
-    initial_value = equity_curve.iloc[0]
-    
-    if random_seed is not None:
-        np.random.seed(random_seed)
-    
-    # Run simulations
-    final_equities = []
-    total_returns = []
-    max_drawdowns = []
-    sharpe_ratios = []
-    
-    returns_array = returns.values
-    
-    for _ in range(n_simulations):
-        # Sample returns
-        sampled_returns = np.random.choice(returns_array, size=len(returns), replace=True)
-        
-        # Calculate equity curve
-        equity_sim = (1 + sampled_returns).cumprod() * initial_value
-        
-        # Calculate metrics
-        final_equity = equity_sim.iloc[-1]
-        total_return = (final_equity / initial_value) - 1
-        
-        # Calculate drawdown
-        peak = equity_sim.expanding().max()
-        drawdown = (equity_sim - peak) / peak
-        max_drawdown = float(drawdown.min())
-        
-        # Calculate Sharpe ratio
-        sharpe = float(np.mean(sampled_returns) / np.std(sampled_returns) * np.sqrt(252)) if np.std(sampled_returns) > 0 else 0.0
-        
-        final_equities.append(float(final_equity))
-        total_returns.append(float(total_return))
-        max_drawdowns.append(max_drawdown)
-        sharpe_ratios.append(sharpe)
-    
+
+    initial_value = float(equity_curve.iloc[0])
+    returns_array = returns.to_numpy(dtype=np.float64)
+
+    chunks = _run_chunks(
+        _metrics_chunk,
+        (returns_array, len(returns_array), initial_value, block_size),
+        n_simulations, len(returns_array), random_seed, chunk_size, n_jobs
+    )
+
     # Calculate percentiles for each metric
     def calculate_percentiles(values):
         return {
-            'p5': float(np.percentile(values, 5)),
-            'p25': float(np.percentile(values, 25)),
-            'p50': float(np.percentile(values, 50)),
-            'p75': float(np.percentile(values, 75)),
-            'p95': float(np.percentile(values, 95)),
+            **{f'p{p}': float(v) for p, v in zip(PERCENTILES, np.percentile(values, PERCENTILES))},
             'mean': float(np.mean(values)),
             'std': float(np.std(values)),
         }
-    
-    return {
-        'final_equity': calculate_percentiles(final_equities),
-        'total_return': calculate_percentiles(total_returns),
-        'max_drawdown': calculate_percentiles(max_drawdowns),
-        'sharpe_ratio': calculate_percentiles(sharpe_ratios),
-        'n_simulations': n_simulations,
-        'initial_value': float(initial_value),
+
+    results = {
+        name: calculate_percentiles(np.concatenate([chunk[name] for chunk in chunks]))
+        for name in ('final_equity', 'total_return', 'max_drawdown', 'sharpe_ratio')
     }
+    results.update({
+        'n_simulations': n_simulations,
+        'initial_value': initial_value,
+    })
+    return results
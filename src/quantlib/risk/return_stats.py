@@ -0,0 +1,157 @@
+"""
+Shared return statistics for the risk metrics.
+
+Most metrics in quantlib.risk.metrics and quantlib.risk.var reduce the same
+returns series to the same few quantities: mean, standard deviation, higher
+moments, downside deviation and percentiles. ReturnStats computes each of
+them once, on first use, so a calculator evaluating many metrics does not
+rescan (or re-sort) the series for every one of them. Metric functions take
+it through their optional return_stats argument.
+"""
+
+from functools import cached_property
+from typing import Union
+import pandas as pd
+import numpy as np
+
+
+def _sorted_percentile(sorted_values, q: float) -> float:
+    """Percentile of an ascending sequence, interpolated exactly as np.percentile"""
+    n = len(sorted_values)
+    position = q / 100 * (n - 1)
+    lower = int(np.floor(position))
+    upper = min(lower + 1, n - 1)
+    weight = position - lower
+    a, b = sorted_values[lower], sorted_values[upper]
+    # Same interpolation as NumPy's _lerp (exact at both ends)
+    if weight >= 0.5:
+        return float(b - (b - a) * (1 - weight))
+    return float(a + (b - a) * weight)
+
+
+class ReturnStats:
+    """
+    Lazily computed, cached statistics of a returns series.
+
+    NaN values are dropped, matching the pandas reductions the metric
+    functions use. Moments come from a single array of deviations from the
+    mean (a vectorized two-pass scheme, as stable as Welford's update), and
+    percentiles are read off one sorted copy of the returns.
+    """
+
+    def __init__(self, returns: Union[pd.Series, np.ndarray]):
+        """
+        Initialize ReturnStats.
+
+        Args:
+            returns: Returns series or array
+        """
+        values = np.asarray(returns, dtype=np.float64).ravel()
+        self.values = values[~np.isnan(values)]
+        self.n = len(self.values)
+
+    @cached_property
+    def mean(self) -> float:
+        """Mean return"""
+        return float(self.values.mean()) if self.n else np.nan
+
+    @cached_property
+    def _deviations(self) -> np.ndarray:
+        return self.values - self.mean
+
+    @cached_property
+    def _squared_deviations(self) -> np.ndarray:
+        return self._deviations * self._deviations
+
+    @cached_property
+    def _m2(self) -> float:
+        """Second central moment (biased)"""
+        return float(self._squared_deviations.mean()) if self.n else np.nan
+
+    @cached_property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1, NaN for fewer than 2 returns)"""
+        if self.n < 2:
+            return np.nan
+        return float(np.sqrt(self._squared_deviations.sum() / (self.n - 1)))
+
+    @cached_property
+    def skewness(self) -> float:
+        """Biased sample skewness (as scipy.stats.skew)"""
+        if self.n == 0 or self._m2 <= (np.finfo(np.float64).eps * self.mean) ** 2:
+            return np.nan
+        m3 = float((self._squared_deviations * self._deviations).mean())
+        return m3 / self._m2 ** 1.5
+
+    @cached_property
+    def kurtosis(self) -> float:
+        """Biased excess kurtosis (as scipy.stats.kurtosis with fisher=True)"""
+        if self.n == 0 or self._m2 <= (np.finfo(np.float64).eps * self.mean) ** 2:
+            return np.nan
+        m4 = float((self._squared_deviations * self._squared_deviations).mean())
+        return m4 / self._m2 ** 2 - 3.0
+
+    @cached_property
+    def downside(self) -> np.ndarray:
+        """Negative returns"""
+        return self.values[self.values < 0]
+
+    @cached_property
+    def downside_std(self) -> float:
+        """Sample standard deviation of the negative returns (NaN for fewer than 2)"""
+        downside = self.downside
+        if len(downside) < 2:
+            return np.nan
+        return float(downside.std(ddof=1))
+
+    @cached_property
+    def sorted(self) -> np.ndarray:
+        """Returns sorted in ascending order"""
+        return np.sort(self.values)
+
+    def percentile(self, q: float) -> float:
+        """
+        Percentile of the returns, with linear interpolation.
+
+        Matches np.percentile's default method, reading from the cached
+        sorted array instead of partitioning the data again.
+
+        Args:
+            q: Percentile in [0, 100]
+
+        Returns:
+            Percentile value
+        """
+        if self.n == 0:
+            return np.nan
+        return _sorted_percentile(self.sorted, q)
+
+    def tail_mean(self, threshold: float) -> float:
+        """
+        Mean of the returns at or below a threshold.
+
+        Args:
+            threshold: Upper bound of the tail (inclusive)
+
+        Returns:
+            Tail mean (NaN if no return is in the tail)
+        """
+        count = int(np.searchsorted(self.sorted, threshold, side='right'))
+        if count == 0:
+            return np.nan
+        return float(self.sorted[:count].mean())
+
+    def gains_losses(self, threshold: float = 0.0):
+        """
+        Sums of the returns' excess over a threshold, split by sign.
+
+        Args:
+            threshold: Per-period threshold return
+
+        Returns:
+            Tuple of (sum of positive excess, absolute sum of negative excess)
+        """
+        excess = self.values - threshold
+        gains = float(excess[excess > 0].sum())
+        losses = abs(float(excess[excess < 0].sum()))
+        return gains, losses
@@ -0,0 +1,262 @@
+"""
+Streaming risk metrics for live and paper trading.
+
+Live sessions receive one equity point per bar and are polled for metrics
+far more often than their history changes. StreamingRiskTracker updates
+its state with every new point so reads never rescan the history:
+
+- Rolling mean and variance of returns over a ring buffer, using Welford's
+  update for the incoming return and its inverse for the one leaving the
+  window (O(1) per point), recomputed exactly from the window each time
+  it turns over so rounding drift stays bounded in long sessions
+- A sorted copy of the window for the historical VaR percentile, updated
+  by binary search (O(log n) search plus a memmove)
+- Running peak, maximum drawdown and drawdown durations over the whole
+  session (O(1) per point)
+
+Metrics without a streaming form (Sortino, Calmar, tail ratios, parametric
+and Monte Carlo VaR, higher moments, ulcer index) are computed on demand
+by get_flat_metrics with a RiskCalculator over the window only.
+"""
+
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Any, Dict, Optional
+import math
+import numpy as np
+import pandas as pd
+
+from quantlib.risk.return_stats import _sorted_percentile
+
+
+class StreamingRiskTracker:
+    """
+    Incrementally updated risk metrics of an equity stream.
+
+    Return-based metrics (Sharpe ratio, volatility, historical VaR) cover
+    the last `window` returns; drawdown metrics cover the whole stream and
+    use the same definitions as quantlib.risk.drawdown. Metric names match
+    the keys of RiskCalculator.get_flat_metrics.
+    """
+
+    def __init__(
+        self,
+        window: Optional[int] = 252,
+        periods: int = 252,
+        risk_free_rate: float = 0.0,
+        var_confidence_level: float = 0.95
+    ):
+        """
+        Initialize StreamingRiskTracker.
+
+        Args:
+            window: Number of most recent returns used for the rolling
+                metrics (None = all returns)
+            periods: Number of periods per year (default 252 for daily)
+            risk_free_rate: Annual risk-free rate (default 0.0)
+            var_confidence_level: Confidence level for historical VaR (default 0.95)
+        """
+        if window is not None and window < 2:
+            raise ValueError("window must be at least 2")
+        if var_confidence_level <= 0 or var_confidence_level >= 1:
+            raise ValueError("confidence_level must be between 0 and 1")
+
+        self.window = window
+        self.periods = periods
+        self.risk_free_rate = risk_free_rate
+        self.var_confidence_level = var_confidence_level
+
+        # Rolling returns: ring buffer, Welford state and sorted window
+        self._returns = deque(maxlen=window)
+        self._sorted = []
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._evictions = 0
+
+        # Equity points behind the windowed returns, for get_flat_metrics
+        self._equity = deque(maxlen=None if window is None else window + 1)
+        self._timestamps = deque(maxlen=None if window is None else window + 1)
+
+        # Drawdown state over the whole stream
+        self.num_points = 0
+        self.last_equity: Optional[float] = None
+        self.last_timestamp = None
+        self._peak = -np.inf
+        self._max_drawdown = 0.0
+        self._current_duration = 0
+        self._max_duration = 0
+        self._drawdown_bars = 0
+        self._drawdown_episodes = 0
+
+    def update(self, equity: float, timestamp=None) -> None:
+        """
+        Add a new equity point.
+
+        Args:
+            equity: Portfolio equity
+            timestamp: Time of the point (optional, kept for reporting)
+        """
+        equity = float(equity)
+        if not np.isfinite(equity):
+            return
+
+        if self.last_equity is not None and self.last_equity != 0:
+            self._add_return(equity / self.last_equity - 1)
+
+        self._update_drawdown(equity)
+        self._equity.append(equity)
+        self._timestamps.append(timestamp)
+        self.last_equity = equity
+        self.last_timestamp = timestamp
+        self.num_points += 1
+
+    def _add_return(self, value: float) -> None:
+        """Push a return into the window, dropping the oldest when full"""
+        if self.window is not None and len(self._returns) == self.window:
+            old = self._returns[0]
+            count = len(self._returns) - 1
+            if count == 0:
+                self._mean = self._m2 = 0.0
+            else:
+                delta = old - self._mean
+                self._mean -= delta / count
+                self._m2 -= delta * (old - self._mean)
+            del self._sorted[bisect_left(self._sorted, old)]
+            self._evictions += 1
+
+        self._returns.append(value)
+        delta = value - self._mean
+        self._mean += delta / len(self._returns)
+        self._m2 += delta * (value - self._mean)
+        insort(self._sorted, value)
+
+        # Once the whole window has turned over, drop the accumulated
+        # rounding of the inverse updates (amortized O(1))
+        if self._evictions == self.window:
+            self._resync()
+
+    def _resync(self) -> None:
+        """Recompute the running mean and sum of squares exactly from the window"""
+        n = len(self._returns)
+        self._mean = math.fsum(self._returns) / n if n else 0.0
+        self._m2 = math.fsum((value - self._mean) ** 2 for value in self._returns)
+        self._evictions = 0
+
+    def _update_drawdown(self, equity: float) -> None:
+        """Advance peak, maximum drawdown and drawdown durations"""
+        self._peak = max(self._peak, equity)
+        drawdown = equity - self._peak
+        if drawdown < 0:
+            if self._current_duration == 0:
+                self._drawdown_episodes += 1
+            self._current_duration += 1
+            self._drawdown_bars += 1
+            self._max_duration = max(self._max_duration, self._current_duration)
+            self._max_drawdown = min(self._max_drawdown, drawdown)
+        else:
+            self._current_duration = 0
+
+    @property
+    def num_returns(self) -> int:
+        """Number of returns in the rolling window"""
+        return len(self._returns)
+
+    @property
+    def volatility(self) -> float:
+        """Per-period sample standard deviation of the windowed returns"""
+        n = len(self._returns)
+        if n < 2:
+            return 0.0
+        # Rounding can leave a tiny negative sum of squares for a flat window
+        return float(np.sqrt(max(self._m2, 0.0) / (n - 1)))
+
+    @property
+    def sharpe_ratio(self) -> float:
+        """Annualized Sharpe ratio of the windowed returns"""
+        std = self.volatility
+        if std == 0:
+            return 0.0
+        return float(np.sqrt(self.periods) * (self._mean - self.risk_free_rate / self.periods) / std)
+
+    @property
+    def historical_var(self) -> float:
+        """Historical VaR of the windowed returns (as quantlib.risk.var.historical_var)"""
+        if not self._sorted:
+            return 0.0
+        return _sorted_percentile(self._sorted, (1 - self.var_confidence_level) * 100)
+
+    @property
+    def max_drawdown(self) -> float:
+        """Maximum drawdown so far (negative value)"""
+        return float(self._max_drawdown)
+
+    @property
+    def max_drawdown_pct(self) -> float:
+        """Maximum drawdown as a percentage of the peak (as max_drawdown_pct)"""
+        if self.num_points == 0 or self._peak == 0:
+            return 0.0
+        return float(self._max_drawdown / self._peak * 100)
+
+    @property
+    def current_drawdown(self) -> float:
+        """Distance of the latest equity below the peak (negative or zero)"""
+        if self.last_equity is None:
+            return 0.0
+        return float(self.last_equity - self._peak)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get the current metrics (constant time).
+
+        Returns:
+            Flat dictionary of metrics, named like RiskCalculator.get_flat_metrics
+        """
+        average_duration = (
+            self._drawdown_bars / self._drawdown_episodes if self._drawdown_episodes else 0.0
+        )
+        return {
+            'sharpe_ratio': self.sharpe_ratio,
+            'annualized_volatility': self.volatility * float(np.sqrt(self.periods)),
+            'drawdown_max_drawdown': self.max_drawdown,
+            'drawdown_max_drawdown_pct': self.max_drawdown_pct,
+            'drawdown_average_drawdown_duration': float(average_duration),
+            'drawdown_max_drawdown_duration': self._max_duration,
+            'drawdown_current_drawdown': self.current_drawdown,
+            'drawdown_current_drawdown_duration': self._current_duration,
+            'var_historical_var': self.historical_var,
+            'distribution_mean_return': float(self._mean) if self._returns else 0.0,
+            'distribution_std_return': self.volatility,
+            'num_observations': self.num_points,
+            'rolling_window': self.window,
+        }
+
+    def get_flat_metrics(self) -> Dict[str, Any]:
+        """
+        Get the full RiskCalculator.get_flat_metrics key set.
+
+        The streaming metrics are taken from get_metrics; the remaining ones
+        are computed by a RiskCalculator over the windowed returns and the
+        equity points behind them, so the cost is bounded by the window
+        rather than the session length.
+
+        Returns:
+            Flat dictionary of metrics
+        """
+        from quantlib.risk.calculator import RiskCalculator
+
+        metrics = {}
+        if len(self._returns) > 0:
+            index = None
+            if all(timestamp is not None for timestamp in self._timestamps):
+                index = pd.Index(list(self._timestamps))
+            equity = pd.Series(list(self._equity), index=index, dtype=float)
+            returns = pd.Series(list(self._returns), index=equity.index[-len(self._returns):], dtype=float)
+            metrics = RiskCalculator(
+                returns=returns,
+                equity_curve=equity,
+                risk_free_rate=self.risk_free_rate,
+                periods=self.periods,
+                var_confidence_level=self.var_confidence_level,
+            ).get_flat_metrics()
+        metrics.update(self.get_metrics())
+        return metrics
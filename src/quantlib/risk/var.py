@@ -5,10 +5,13 @@ import numpy as np
 from scipy import stats
 from typing import Optional
 
+from quantlib.risk.return_stats import ReturnStats
+
 
 def historical_var(
     returns: pd.Series,
-    confidence_level: float = 0.95
+    confidence_level: float = 0.95,
+    return_stats: Optional[ReturnStats] = None
 ) -> float:
     """
     Calculate Historical Value at Risk.
@@ -16,24 +19,28 @@ def historical_var(
     Args:
         returns: Returns series
         confidence_level: Confidence level (e.g., 0.95 for 95%)
+        return_stats: Precomputed ReturnStats of returns (optional fast path)
         
     Returns:
         VaR (negative value, represents loss)
     """
-    if len(returns) == 0:
+    if (return_stats.n if return_stats is not None else len(returns)) == 0:
         return 0.0
     
     if confidence_level <= 0 or confidence_level >= 1:
         raise ValueError("confidence_level must be between 0 and 1")
     
     percentile = (1 - confidence_level) * 100
+    if return_stats is not None:
+        return return_stats.percentile(percentile)
     var = np.percentile(returns, percentile)
     return var
 
 
 def parametric_var(
     returns: pd.Series,
-    confidence_level: float = 0.95
+    confidence_level: float = 0.95,
+    return_stats: Optional[ReturnStats] = None
 ) -> float:
     """
     Calculate Parametric VaR (assumes normal distribution).
@@ -41,18 +48,21 @@ def parametric_var(
     Args:
         returns: Returns series
         confidence_level: Confidence level (e.g., 0.95 for 95%)
+        return_stats: Precomputed ReturnStats of returns (optional fast path)
         
     Returns:
         VaR (negative value)
     """
-    if len(returns) == 0:
+    if (return_stats.n if return_stats is not None else len(returns)) == 0:
         return 0.0
     
     if confidence_level <= 0 or confidence_level >= 1:
         raise ValueError("confidence_level must be between 0 and 1")
     
-    mean_return = returns.mean()
-    std_return = returns.std()
+    if return_stats is not None:
+        mean_return, std_return = return_stats.mean, return_stats.std
+    else:
+        mean_return, std_return = returns.mean(), returns.std()
     
     if std_return == 0:
         return mean_return
@@ -68,7 +78,8 @@ def monte_carlo_var(
     returns: pd.Series,
     confidence_level: float = 0.95,
     simulations: int = 10000,
-    random_seed: Optional[int] = None
+    random_seed: Optional[int] = None,
+    return_stats: Optional[ReturnStats] = None
 ) -> float:
     """
     Calculate VaR using Monte Carlo simulation.
@@ -78,11 +89,12 @@ def monte_carlo_var(
         confidence_level: Confidence level (e.g., 0.95 for 95%)
         simulations: Number of simulations
         random_seed: Optional random seed for reproducibility (None for random)
+        return_stats: Precomputed ReturnStats of returns (optional fast path)
         
     Returns:
         VaR (negative value)
     """
-    if len(returns) == 0:
+    if (return_stats.n if return_stats is not None else len(returns)) == 0:
         return 0.0
     
     if confidence_level <= 0 or confidence_level >= 1:
@@ -91,8 +103,10 @@ def monte_carlo_var(
     if simulations <= 0:
         raise ValueError("simulations must be positive")
     
-    mean_return = returns.mean()
-    std_return = returns.std()
+    if return_stats is not None:
+        mean_return, std_return = return_stats.mean, return_stats.std
+    else:
+        mean_return, std_return = returns.mean(), returns.std()
     
     if std_return == 0:
         return mean_return
@@ -110,7 +124,8 @@ def monte_carlo_var(
 
 def cvar(
     returns: pd.Series,
-    confidence_level: float = 0.95
+    confidence_level: float = 0.95,
+    return_stats: Optional[ReturnStats] = None
 ) -> float:
     """
     Calculate Conditional VaR (Expected Shortfall).
@@ -118,17 +133,22 @@ def cvar(
     Args:
         returns: Returns series
         confidence_level: Confidence level (e.g., 0.95 for 95%)
+        return_stats: Precomputed ReturnStats of returns (optional fast path)
         
     Returns:
         CVaR (negative value)
     """
-    if len(returns) == 0:
+    if (return_stats.n if return_stats is not None else len(returns)) == 0:
         return 0.0
     
     if confidence_level <= 0 or confidence_level >= 1:
         raise ValueError("confidence_level must be between 0 and 1")
     
-    var = historical_var(returns, confidence_level)
+    var = historical_var(returns, confidence_level, return_stats)
+    
+    if return_stats is not None:
+        tail_mean = return_stats.tail_mean(var)
+        return var if np.isnan(tail_mean) else tail_mean
     
     # Average of returns worse than VaR
     tail_returns = returns[returns <= var]
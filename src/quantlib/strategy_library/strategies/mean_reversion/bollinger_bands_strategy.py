@@ -2,6 +2,10 @@
 
 from quantlib.strategies import Strategy
 from quantlib.indicators import bollinger_bands
+from quantlib.indicators.streaming import BollingerBands
+from quantlib.backtesting.vectorized import positions_from_signals
+import numpy as np
+import pandas as pd
 
 
 class BollingerBandsStrategy(Strategy):
@@ -11,7 +15,7 @@ class BollingerBandsStrategy(Strategy):
         self.bb_window = params.get('bb_window', 20)
         self.bb_std = params.get('bb_std', 2.0)
         self.position = 0
-        self.prices = []
+        self.bb = BollingerBands(self.bb_window, self.bb_std)
     
     def initialize(self, context):
         if hasattr(context, 'symbol'):
@@ -22,18 +26,20 @@ class BollingerBandsStrategy(Strategy):
     def on_data(self, context, data):
         close_price = data.get('Close', 0)
         if close_price:
-            self.prices.append(close_price)
-            if len(self.prices) >= self.bb_window:
-                import pandas as pd
-                prices_series = pd.Series(self.prices)
-                bb = bollinger_bands(prices_series, self.bb_window, self.bb_std)
-                if len(bb['lower'].dropna()) > 0 and len(bb['upper'].dropna()) > 0:
-                    current_price = close_price
-                    lower_band = bb['lower'].dropna().iloc[-1]
-                    upper_band = bb['upper'].dropna().iloc[-1]
-                    if current_price < lower_band and self.position <= 0:
-                        context.place_order(self.symbol, 100, 'BUY')
-                        self.position = 100
-                    elif current_price > upper_band and self.position > 0:
-                        context.place_order(self.symbol, 100, 'SELL')
-                        self.position = 0
+            self.bb.update(close_price)
+            if self.bb.ready:
+                if close_price < self.bb.lower and self.position <= 0:
+                    context.place_order(self.symbol, 100, 'BUY')
+                    self.position = 100
+                elif close_price > self.bb.upper and self.position > 0:
+                    context.place_order(self.symbol, 100, 'SELL')
+                    self.position = 0
+
+    def target_positions(self, data):
+        """Vectorized target positions for BacktestEngine.run_vectorized"""
+        close = data['Close']
+        bb = bollinger_bands(close, self.bb_window, self.bb_std).ffill()
+        warmup = np.arange(len(close)) < self.bb_window - 1
+        entries = (close < bb['lower']).values & ~warmup
+        exits = (close > bb['upper']).values & ~warmup
+        return pd.Series(positions_from_signals(entries, exits, 100), index=data.index)
@@ -2,6 +2,10 @@
 
 from quantlib.strategies import Strategy
 from quantlib.indicators import macd
+from quantlib.indicators.streaming import MACD
+from quantlib.backtesting.vectorized import positions_from_signals
+import numpy as np
+import pandas as pd
 
 
 class MACDStrategy(Strategy):
@@ -12,7 +16,9 @@ class MACDStrategy(Strategy):
         self.macd_slow = params.get('macd_slow', 26)
         self.macd_signal = params.get('macd_signal', 9)
         self.position = 0
-        self.prices = []
+        self.macd = MACD(self.macd_fast, self.macd_slow, self.macd_signal)
+        self.prev_macd = None
+        self.prev_signal = None
     
     def initialize(self, context):
         if hasattr(context, 'symbol'):
@@ -23,19 +29,23 @@ class MACDStrategy(Strategy):
     def on_data(self, context, data):
         close_price = data.get('Close', 0)
         if close_price:
-            self.prices.append(close_price)
-            if len(self.prices) >= self.macd_slow + self.macd_signal:
-                import pandas as pd
-                prices_series = pd.Series(self.prices)
-                macd_result = macd(prices_series, self.macd_fast, self.macd_slow, self.macd_signal)
-                if len(macd_result['macd'].dropna()) > 0 and len(macd_result['signal'].dropna()) > 0:
-                    current_macd = macd_result['macd'].dropna().iloc[-1]
-                    current_signal = macd_result['signal'].dropna().iloc[-1]
-                    prev_macd = macd_result['macd'].dropna().iloc[-2] if len(macd_result['macd'].dropna()) > 1 else current_macd
-                    prev_signal = macd_result['signal'].dropna().iloc[-2] if len(macd_result['signal'].dropna()) > 1 else current_signal
-                    if current_macd > current_signal and prev_macd <= prev_signal and self.position <= 0:
-                        context.place_order(self.symbol, 100, 'BUY')
-                        self.position = 100
-                    elif current_macd < current_signal and prev_macd >= prev_signal and self.position > 0:
-                        context.place_order(self.symbol, 100, 'SELL')
-                        self.position = 0
+            self.macd.update(close_price)
+            current_macd, current_signal = self.macd.macd, self.macd.signal
+            if self.macd.count >= self.macd_slow + self.macd_signal:
+                prev_macd, prev_signal = self.prev_macd, self.prev_signal
+                if current_macd > current_signal and prev_macd <= prev_signal and self.position <= 0:
+                    context.place_order(self.symbol, 100, 'BUY')
+                    self.position = 100
+                elif current_macd < current_signal and prev_macd >= prev_signal and self.position > 0:
+                    context.place_order(self.symbol, 100, 'SELL')
+                    self.position = 0
+            self.prev_macd, self.prev_signal = current_macd, current_signal
+
+    def target_positions(self, data):
+        """Vectorized target positions for BacktestEngine.run_vectorized"""
+        macd_result = macd(data['Close'], self.macd_fast, self.macd_slow, self.macd_signal)
+        line, signal = macd_result['macd'], macd_result['signal']
+        warmup = np.arange(len(line)) < self.macd_slow + self.macd_signal - 1
+        entries = ((line > signal) & (line.shift(1) <= signal.shift(1))).values & ~warmup
+        exits = ((line < signal) & (line.shift(1) >= signal.shift(1))).values & ~warmup
+        return pd.Series(positions_from_signals(entries, exits, 100), index=data.index)
@@ -2,6 +2,10 @@
 
 from quantlib.strategies import Strategy
 from quantlib.indicators import sma
+from quantlib.indicators.streaming import SMA
+from quantlib.backtesting.vectorized import positions_from_signals
+import numpy as np
+import pandas as pd
 
 
 class MovingAverageCrossover(Strategy):
@@ -11,7 +15,8 @@ class MovingAverageCrossover(Strategy):
         self.short_window = params.get('short_window', 20)
         self.long_window = params.get('long_window', 50)
         self.position = 0
-        self.prices = []
+        self.short_ma = SMA(self.short_window)
+        self.long_ma = SMA(self.long_window)
     
     def initialize(self, context):
         if hasattr(context, 'symbol'):
@@ -22,16 +27,22 @@ class MovingAverageCrossover(Strategy):
     def on_data(self, context, data):
         close_price = data.get('Close', 0)
         if close_price:
-            self.prices.append(close_price)
-            if len(self.prices) >= self.long_window:
-                import pandas as pd
-                prices_series = pd.Series(self.prices)
-                short_ma = sma(prices_series, self.short_window)
-                long_ma = sma(prices_series, self.long_window)
-                if len(short_ma.dropna()) > 0 and len(long_ma.dropna()) > 0:
-                    if short_ma.dropna().iloc[-1] > long_ma.dropna().iloc[-1] and self.position <= 0:
-                        context.place_order(self.symbol, 100, 'BUY')
-                        self.position = 100
-                    elif short_ma.dropna().iloc[-1] < long_ma.dropna().iloc[-1] and self.position > 0:
-                        context.place_order(self.symbol, 100, 'SELL')
-                        self.position = 0
+            short_ma = self.short_ma.update(close_price)
+            long_ma = self.long_ma.update(close_price)
+            if self.short_ma.ready and self.long_ma.ready:
+                if short_ma > long_ma and self.position <= 0:
+                    context.place_order(self.symbol, 100, 'BUY')
+                    self.position = 100
+                elif short_ma < long_ma and self.position > 0:
+                    context.place_order(self.symbol, 100, 'SELL')
+                    self.position = 0
+
+    def target_positions(self, data):
+        """Vectorized target positions for BacktestEngine.run_vectorized"""
+        close = data['Close']
+        short_ma = sma(close, self.short_window).ffill()
+        long_ma = sma(close, self.long_window).ffill()
+        warmup = np.arange(len(close)) < self.long_window - 1
+        entries = (short_ma > long_ma).values & ~warmup
+        exits = (short_ma < long_ma).values & ~warmup
+        return pd.Series(positions_from_signals(entries, exits, 100), index=data.index)
@@ -2,6 +2,10 @@
 
 from quantlib.strategies import Strategy
 from quantlib.indicators import rsi
+from quantlib.indicators.streaming import RSI
+from quantlib.backtesting.vectorized import positions_from_signals
+import numpy as np
+import pandas as pd
 
 
 class RSIStrategy(Strategy):
@@ -12,7 +16,8 @@ class RSIStrategy(Strategy):
         self.rsi_oversold = params.get('rsi_oversold', 30)
         self.rsi_overbought = params.get('rsi_overbought', 70)
         self.position = 0
-        self.prices = []
+        self.rsi = RSI(self.rsi_window)
+        self.current_rsi = None
     
     def initialize(self, context):
         if hasattr(context, 'symbol'):
@@ -23,16 +28,22 @@ class RSIStrategy(Strategy):
     def on_data(self, context, data):
         close_price = data.get('Close', 0)
         if close_price:
-            self.prices.append(close_price)
-            if len(self.prices) >= self.rsi_window + 1:
-                import pandas as pd
-                prices_series = pd.Series(self.prices)
-                rsi_val = rsi(prices_series, self.rsi_window)
-                if len(rsi_val.dropna()) > 0:
-                    current_rsi = rsi_val.dropna().iloc[-1]
-                    if current_rsi < self.rsi_oversold and self.position <= 0:
-                        context.place_order(self.symbol, 100, 'BUY')
-                        self.position = 100
-                    elif current_rsi > self.rsi_overbought and self.position > 0:
-                        context.place_order(self.symbol, 100, 'SELL')
-                        self.position = 0
+            rsi_val = self.rsi.update(close_price)
+            if not np.isnan(rsi_val):
+                # Flat windows give NaN; keep acting on the last valid reading
+                self.current_rsi = rsi_val
+            if self.rsi.count >= self.rsi_window + 1 and self.current_rsi is not None:
+                if self.current_rsi < self.rsi_oversold and self.position <= 0:
+                    context.place_order(self.symbol, 100, 'BUY')
+                    self.position = 100
+                elif self.current_rsi > self.rsi_overbought and self.position > 0:
+                    context.place_order(self.symbol, 100, 'SELL')
+                    self.position = 0
+
+    def target_positions(self, data):
+        """Vectorized target positions for BacktestEngine.run_vectorized"""
+        rsi_val = rsi(data['Close'], self.rsi_window).ffill()
+        warmup = np.arange(len(rsi_val)) < self.rsi_window
+        entries = (rsi_val < self.rsi_oversold).values & ~warmup
+        exits = (rsi_val > self.rsi_overbought).values & ~warmup
+        return pd.Series(positions_from_signals(entries, exits, 100), index=data.index)
@@ -0,0 +1,333 @@
+"""
+In-process cache of OHLCV frames loaded from a DataStore
+
+Backtests, paper trading, research helpers and the UI load the same
+symbols over and over (a benchmark for every backtest, the same universe
+for every session). FrameCache keeps the widest range loaded per
+(source, symbol, interval) in memory and serves any range inside it by
+slicing, so repeated loads do not go back to the database.
+
+The cache is bounded by memory: least recently used entries are evicted
+once the total size of the cached frames exceeds max_bytes. Wrap a store
+in CachedDataStore to route its loads through the cache and invalidate
+entries whenever it saves.
+
+Example:
+    >>> store = CachedDataStore(DataStore(data_source='yahoo'))
+    >>> spy = store.load('SPY', start='2015-01-01', end='2024-12-31')   # database
+    >>> spy = store.load('SPY', start='2020-01-01', end='2024-12-31')   # cache
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+import pandas as pd
+
+# Default memory bound of the shared cache (QUANTLIB_FRAME_CACHE_MB overrides it)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+class CacheEntry(NamedTuple):
+    """Cached frame and the range it was loaded for (None = unbounded)"""
+    start: Optional[pd.Timestamp]
+    end: Optional[pd.Timestamp]
+    frame: pd.DataFrame
+    nbytes: int
+
+
+def _timestamp(value) -> Optional[pd.Timestamp]:
+    return None if value is None else pd.Timestamp(value)
+
+
+def _date_arg(value: Optional[pd.Timestamp]) -> Optional[str]:
+    """Timestamp as the date string DataStore.load expects"""
+    if value is None:
+        return None
+    return str(value.date()) if value == value.normalize() else str(value)
+
+
+def _covers(entry: CacheEntry, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]) -> bool:
+    """Whether the entry's range contains [start, end]"""
+    if entry.start is not None and (start is None or start < entry.start):
+        return False
+    if entry.end is not None and (end is None or end > entry.end):
+        return False
+    return True
+
+
+def _slice(frame: pd.DataFrame, start: Optional[pd.Timestamp], end: Optional[pd.Timestamp]) -> pd.DataFrame:
+    """Rows of frame between start and end (inclusive), as a copy"""
+    index = frame.index
+    if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+        start = start.tz_localize(index.tz) if start is not None and start.tz is None else start
+        end = end.tz_localize(index.tz) if end is not None and end.tz is None else end
+    lower = 0 if start is None else index.searchsorted(start, side='left')
+    if end is None:
+        upper = len(index)
+    elif end == end.normalize():
+        # A date-only end includes the whole day, as string slicing with .loc does
+        upper = index.searchsorted(end + pd.Timedelta(days=1), side='left')
+    else:
+        upper = index.searchsorted(end, side='right')
+    return frame.iloc[lower:upper].copy()
+
+
+class FrameCache:
+    """
+    Memory-bounded LRU cache of frames keyed by (source, symbol, interval).
+
+    Each key holds the widest range loaded so far; requests inside it are
+    served by slicing a copy. Statistics (hits, misses, evictions, bytes)
+    are available from stats().
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        """
+        Initialize FrameCache.
+
+        Args:
+            max_bytes: Upper bound on the total size of the cached frames
+        """
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[tuple, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(source: Optional[str], symbol: str, interval: Optional[str]) -> tuple:
+        return (source or 'default', symbol.upper(), interval or '1d')
+
+    def get(
+        self,
+        source: Optional[str],
+        symbol: str,
+        interval: Optional[str] = '1d',
+        start=None,
+        end=None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Get a cached range.
+
+        Args:
+            source: Data source
+            symbol: Symbol
+            interval: Bar interval
+            start: Start of the range (None = from the first bar)
+            end: End of the range, inclusive (None = to the last bar)
+
+        Returns:
+            Copy of the rows in the range, or None on a miss
+        """
+        key = self.make_key(source, symbol, interval)
+        start, end = _timestamp(start), _timestamp(end)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not _covers(entry, start, end):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _slice(entry.frame, start, end)
+
+    def cached_range(self, source: Optional[str], symbol: str, interval: Optional[str] = '1d'):
+        """
+        Range held for a key.
+
+        Returns:
+            Tuple of (start, end) timestamps (None = unbounded), or None if
+            the key is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(self.make_key(source, symbol, interval))
+        return None if entry is None else (entry.start, entry.end)
+
+    def put(
+        self,
+        source: Optional[str],
+        symbol: str,
+        interval: Optional[str],
+        start,
+        end,
+        frame: pd.DataFrame
+    ) -> None:
+        """
+        Store a loaded range, replacing the key's previous range.
+
+        Frames larger than max_bytes are not cached.
+
+        Args:
+            source: Data source
+            symbol: Symbol
+            interval: Bar interval
+            start: Start the frame was loaded for (None = unbounded)
+            end: End the frame was loaded for (None = unbounded)
+            frame: Loaded frame (the cache keeps its own copy)
+        """
+        key = self.make_key(source, symbol, interval)
+        nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+        with self._lock:
+            self._remove(key)
+            if nbytes > self.max_bytes:
+                return
+            self._entries[key] = CacheEntry(_timestamp(start), _timestamp(end), frame.copy(), nbytes)
+            self.nbytes += nbytes
+            while self.nbytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.nbytes -= evicted.nbytes
+                self.evictions += 1
+
+    def _remove(self, key: tuple) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry.nbytes
+
+    def invalidate(
+        self,
+        source: Optional[str] = None,
+        symbol: Optional[str] = None,
+        interval: Optional[str] = None
+    ) -> int:
+        """
+        Drop cached entries; None matches any source, symbol or interval.
+
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            keys = [
+                key for key in self._entries
+                if (source is None or key[0] == (source or 'default'))
+                and (symbol is None or key[1] == symbol.upper())
+                and (interval is None or key[2] == interval)
+            ]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all entries and reset the statistics"""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache statistics.
+
+        Returns:
+            Dictionary with entries, bytes, max_bytes, hits, misses,
+            hit_rate and evictions
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self.nbytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+            }
+
+
+_shared_cache: Optional[FrameCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_frame_cache() -> FrameCache:
+    """
+    Get the process-wide frame cache, creating it on first use.
+
+    Its size can be set in megabytes with the QUANTLIB_FRAME_CACHE_MB
+    environment variable.
+    """
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            megabytes = os.environ.get('QUANTLIB_FRAME_CACHE_MB')
+            max_bytes = int(float(megabytes) * 1024 * 1024) if megabytes else DEFAULT_MAX_BYTES
+            _shared_cache = FrameCache(max_bytes)
+        return _shared_cache
+
+
+class CachedDataStore:
+    """
+    DataStore wrapper that serves load() from a FrameCache.
+
+    A miss loads the union of the requested range and the range already
+    cached for the key, so the cached range only grows. save() invalidates
+    the symbol's entries. Every other attribute is passed through to the
+    wrapped store.
+    """
+
+    def __init__(self, store, cache: Optional[FrameCache] = None):
+        """
+        Initialize CachedDataStore.
+
+        Args:
+            store: DataStore (or any object with load/save)
+            cache: FrameCache to use (default: the shared cache)
+        """
+        self.store = store
+        self.cache = cache if cache is not None else get_frame_cache()
+        self.source = getattr(store, 'data_source', None) or getattr(store, 'database_url', None)
+
+    def load(self, symbol: str, start=None, end=None, interval: str = '1d', **kwargs) -> pd.DataFrame:
+        """
+        Load bars, from the cache when the range is covered.
+
+        Args:
+            symbol: Symbol
+            start: Start date (None = all history)
+            end: End date, inclusive (None = latest)
+            interval: Bar interval (default '1d')
+            **kwargs: Passed to the store's load (bypasses the cache)
+
+        Returns:
+            OHLCV DataFrame (a copy; callers may modify it)
+        """
+        if kwargs:
+            return self.store.load(symbol, start=start, end=end, interval=interval, **kwargs)
+
+        cached = self.cache.get(self.source, symbol, interval, start, end)
+        if cached is not None:
+            return cached
+
+        load_start, load_end = _timestamp(start), _timestamp(end)
+        held = self.cache.cached_range(self.source, symbol, interval)
+        if held is not None:
+            held_start, held_end = held
+            load_start = None if held_start is None or load_start is None else min(load_start, held_start)
+            load_end = None if held_end is None or load_end is None else max(load_end, held_end)
+
+        data = self.store.load(
+            symbol, start=_date_arg(load_start), end=_date_arg(load_end), interval=interval
+        )
+        if data is None or data.empty:
+            return data
+        self.cache.put(self.source, symbol, interval, load_start, load_end, data)
+        return _slice(data, _timestamp(start), _timestamp(end))
+
+    def save(self, symbol: str, data: pd.DataFrame, *args, **kwargs):
+        """
+        Save through the wrapped store, invalidating the symbol's cached frames.
+
+        Entries of every source are dropped, since stores created with and
+        without an explicit data_source may share a database.
+        """
+        self.cache.invalidate(symbol=symbol)
+        try:
+            return self.store.save(symbol, data, *args, **kwargs)
+        finally:
+            self.cache.invalidate(symbol=symbol)
+
+    def __getattr__(self, name):
+        return getattr(self.store, name)
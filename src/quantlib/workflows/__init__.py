@@ -4,10 +4,11 @@ Agent workflow system for intelligent backtest optimization
 
 from quantlib.workflows.workflow_orchestrator import WorkflowOrchestrator
 from quantlib.workflows.optimization_agent import OptimizationAgent
-from quantlib.workflows.parallel_executor import ParallelExecutor
+from quantlib.workflows.parallel_executor import ParallelExecutor, get_shared_data
 
 __all__ = [
     'WorkflowOrchestrator',
     'OptimizationAgent',
     'ParallelExecutor',
+    'get_shared_data',
 ]
@@ -5,26 +5,131 @@ Parallel execution framework for backtests
 import multiprocessing
 from typing import List, Dict, Any, Callable, Optional
 from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 import logging
+import pandas as pd
+
+from quantlib.workflows.shared_data import SharedFrame, SharedFrameHandle, attach_frame
 
 logger = logging.getLogger(__name__)
 
 
+# Frames attached by the pool initializer in each worker process: name -> DataFrame
+_worker_data: Dict[str, pd.DataFrame] = {}
+
+
+def _init_worker(handles: Dict[str, SharedFrameHandle]):
+    """Pool initializer: attach every registered frame zero-copy"""
+    _worker_data.clear()
+    for name, handle in handles.items():
+        _worker_data[name] = attach_frame(handle, copy=False)
+
+
+def get_shared_data(name: str) -> pd.DataFrame:
+    """
+    Get a frame registered with ParallelExecutor.register_data.
+
+    Call this from a task function running in the executor's workers. The
+    returned frame is backed by shared memory and must be treated as
+    read-only (pandas copies on write, so in-place edits stay local).
+
+    Args:
+        name: Name the frame was registered under
+
+    Returns:
+        Shared DataFrame
+    """
+    try:
+        return _worker_data[name]
+    except KeyError:
+        raise KeyError(
+            f"No shared data named '{name}' in this process. "
+            f"Register it with ParallelExecutor.register_data before executing tasks."
+        ) from None
+
+
 class ParallelExecutor:
-    """Execute backtests in parallel using multiprocessing"""
-    
+    """
+    Execute backtests in parallel using multiprocessing.
+
+    The worker pool is created on first use and kept alive across batches.
+    Large read-only frames (OHLCV data) can be registered once with
+    register_data(); they are placed in shared memory and attached by each
+    worker when it starts, so tasks only carry their parameters. Call
+    shutdown() (or use the executor as a context manager) when done.
+    """
+
     def __init__(self, n_workers: Optional[int] = None):
         """
         Initialize parallel executor.
-        
+
         Args:
             n_workers: Number of worker processes (default: CPU count)
         """
         if n_workers is None:
             n_workers = multiprocessing.cpu_count()
         self.n_workers = min(n_workers, multiprocessing.cpu_count())
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._shared: Dict[str, SharedFrame] = {}
         logger.info(f"Initialized ParallelExecutor with {self.n_workers} workers")
-    
+
+    def register_data(self, name: str, df: pd.DataFrame) -> SharedFrameHandle:
+        """
+        Publish a read-only frame to the workers through shared memory.
+
+        Workers read it with get_shared_data(name). Registering while the
+        pool is running restarts the pool so new workers attach the frame.
+
+        Args:
+            name: Name tasks use to look the frame up
+            df: DataFrame with a datetime or numeric index
+
+        Returns:
+            Handle of the shared frame
+        """
+        self.unregister_data(name)
+        self._shared[name] = SharedFrame(df)
+        self._stop_pool()
+        return self._shared[name].handle
+
+    def unregister_data(self, name: str):
+        """Release a registered frame (no-op if not registered)"""
+        shared = self._shared.pop(name, None)
+        if shared is not None:
+            # Workers map the block zero-copy, so stop them before unlinking
+            self._stop_pool()
+            shared.unlink()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the persistent pool, starting it on first use"""
+        if self._executor is None:
+            handles = {name: shared.handle for name, shared in self._shared.items()}
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                initializer=_init_worker,
+                initargs=(handles,)
+            )
+        return self._executor
+
+    def _stop_pool(self):
+        """Shut down the worker pool, if running"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def shutdown(self):
+        """Stop the worker pool and release all registered data"""
+        self._stop_pool()
+        for name in list(self._shared):
+            self.unregister_data(name)
+
+    def __enter__(self) -> 'ParallelExecutor':
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
     def execute_batch(
         self,
         tasks: List[Dict[str, Any]],
@@ -33,44 +138,56 @@ class ParallelExecutor:
     ) -> List[Dict[str, Any]]:
         """
         Execute a batch of tasks in parallel.
-        
+
+        task_function must be picklable (a module-level function); it should
+        read registered data with get_shared_data() rather than receive it in
+        the task dict.
+
         Args:
             tasks: List of task dictionaries (each contains parameters for a backtest)
             task_function: Function that executes a single task and returns result
             progress_callback: Optional callback function(completed, total) for progress updates
-        
+
         Returns:
             List of results corresponding to tasks (in same order)
         """
         if not tasks:
             return []
-        
+
         results = [None] * len(tasks)
         completed_count = 0
-        
-        with ProcessPoolExecutor(max_workers=self.n_workers) as executor:
-            # Submit all tasks
-            future_to_index = {
-                executor.submit(task_function, task): i
-                for i, task in enumerate(tasks)
-            }
-            
-            # Collect results as they complete
-            for future in as_completed(future_to_index):
-                index = future_to_index[future]
-                try:
-                    result = future.result()
-                    results[index] = result
-                    completed_count += 1
-                    
-                    if progress_callback:
-                        progress_callback(completed_count, len(tasks))
-                        
-                except Exception as e:
-                    logger.error(f"Error executing task {index}: {e}")
-                    results[index] = {
-                        'error': str(e),
-                        'parameters': tasks[index].get('parameters', {})
-                    }
-        
+        broken = False
+
+        executor = self._get_executor()
+
+        # Submit all tasks
+        future_to_index = {
+            executor.submit(task_function, task): i
+            for i, task in enumerate(tasks)
+        }
+
+        # Collect results as they complete
+        for future in as_completed(future_to_index):
+            index = future_to_index[future]
+            try:
+                result = future.result()
+                results[index] = result
+                completed_count += 1
+
+                if progress_callback:
+                    progress_callback(completed_count, len(tasks))
+
+            except Exception as e:
+                broken = broken or isinstance(e, BrokenProcessPool)
+                logger.error(f"Error executing task {index}: {e}")
+                results[index] = {
+                    'error': str(e),
+                    'parameters': tasks[index].get('parameters', {})
+                }
+
+        if broken:
+            # A worker died; the pool cannot run more tasks, so start a fresh one next batch
+            logger.warning("Process pool is broken, restarting it on the next batch")
+            self._stop_pool()
+
         return results
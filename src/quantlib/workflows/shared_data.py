@@ -0,0 +1,196 @@
+"""
+Shared-memory DataFrames for process pools
+
+Publishing a frame once in shared memory lets worker processes attach to
+the same OHLCV data instead of receiving a pickled copy with every task.
+Only a small, picklable SharedFrameHandle travels with each task.
+"""
+
+from dataclasses import dataclass, field
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class SharedFrameHandle:
+    """Picklable description of a DataFrame stored in shared memory"""
+    name: str
+    nrows: int
+    index_dtype: str
+    index_name: Optional[str]
+    columns: Tuple[Tuple[Any, str, int], ...]  # (column, dtype, byte offset)
+    extra: Optional[pd.DataFrame] = field(default=None, compare=False)  # non-numeric columns
+    column_order: Tuple[Any, ...] = ()
+
+
+class SharedFrame:
+    """
+    DataFrame published in a shared-memory block.
+
+    Numeric columns (and a datetime or numeric index) are packed
+    column-by-column into one block; any other columns are small enough to
+    ride along in the handle. The creating process owns the block and must
+    call unlink() (or use the object as a context manager) when done.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Publish a DataFrame.
+
+        Args:
+            df: DataFrame to share
+        """
+        index = df.index
+        if isinstance(index, pd.DatetimeIndex) or pd.api.types.is_numeric_dtype(index.dtype):
+            index_values = np.ascontiguousarray(index.values)
+        else:
+            raise ValueError("SharedFrame requires a datetime or numeric index")
+
+        numeric = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c].dtype)
+                   and not pd.api.types.is_extension_array_dtype(df[c].dtype)]
+        other = [c for c in df.columns if c not in numeric]
+
+        arrays: List[np.ndarray] = [index_values] + [
+            np.ascontiguousarray(df[c].to_numpy()) for c in numeric
+        ]
+        offsets = []
+        total = 0
+        for array in arrays:
+            offsets.append(total)
+            # Keep every column 8-byte aligned
+            total += -(-array.nbytes // 8) * 8
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(total, 1))
+        for array, offset in zip(arrays, offsets):
+            target = np.ndarray(array.shape, dtype=array.dtype, buffer=self._shm.buf, offset=offset)
+            target[:] = array
+
+        index_dtype = str(index_values.dtype)
+        tz = getattr(index, 'tz', None)
+        if tz is not None:
+            # Datetime values are stored as UTC; the zone travels in the handle
+            index_dtype = f"{index_dtype}|{tz}"
+
+        self.handle = SharedFrameHandle(
+            name=self._shm.name,
+            nrows=len(df),
+            index_dtype=index_dtype,
+            index_name=index.name,
+            columns=tuple(
+                (c, str(a.dtype), off) for c, a, off in zip(numeric, arrays[1:], offsets[1:])
+            ),
+            extra=df[other].copy() if other else None,
+            column_order=tuple(df.columns),
+        )
+
+    def unlink(self):
+        """Release the shared-memory block"""
+        if self._shm is not None:
+            self._shm.close()
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+            self._shm = None
+
+    def __enter__(self) -> 'SharedFrame':
+        return self
+
+    def __exit__(self, *exc):
+        self.unlink()
+
+
+# Per-process cache of frames rebuilt from shared memory: name -> DataFrame
+_attached: Dict[str, pd.DataFrame] = {}
+
+
+# Shared-memory blocks kept open for zero-copy frames: name -> SharedMemory
+_blocks: Dict[str, shared_memory.SharedMemory] = {}
+
+
+def _build_frame(handle: SharedFrameHandle, buf, copy: bool) -> pd.DataFrame:
+    """Assemble a DataFrame from the columns packed in a shared buffer"""
+    def column_array(dtype: str, offset: int) -> np.ndarray:
+        array = np.ndarray((handle.nrows,), dtype=np.dtype(dtype), buffer=buf, offset=offset)
+        if copy:
+            return array.copy()
+        # Other processes read the same block, so views must stay read-only
+        array.flags.writeable = False
+        return array
+
+    index_dtype, _, tz = handle.index_dtype.partition('|')
+    index = pd.Index(column_array(index_dtype, 0), name=handle.index_name, copy=False)
+    if tz:
+        index = pd.DatetimeIndex(index).tz_localize('UTC').tz_convert(tz)
+
+    data = {column: column_array(dtype, offset) for column, dtype, offset in handle.columns}
+    df = pd.DataFrame(data, index=index, copy=False)
+    if handle.extra is not None:
+        for column in handle.extra.columns:
+            df[column] = handle.extra[column].values
+    if handle.column_order:
+        df = df[list(handle.column_order)]
+    return df
+
+
+def attach_frame(handle: SharedFrameHandle, max_cached: int = 4, copy: bool = True) -> pd.DataFrame:
+    """
+    Rebuild a DataFrame from a SharedFrameHandle.
+
+    By default the block is read once per process and the resulting frame is
+    cached, so every later task on the same data reuses it. The data is
+    copied out of shared memory, which keeps the frame valid after the owner
+    unlinks the block.
+
+    With copy=False the frame's columns are read-only views of the shared
+    block, which stays mapped until release_frame() is called. Use this in
+    long-lived workers (e.g. a pool initializer) so that N workers share one
+    copy of the data; the owner must not unlink the block while they run.
+
+    Args:
+        handle: Handle produced by SharedFrame
+        max_cached: Maximum number of copied frames cached in this process
+        copy: Copy the data out of shared memory (False attaches zero-copy)
+
+    Returns:
+        DataFrame equal to the published one
+    """
+    if not copy:
+        shm = _blocks.get(handle.name)
+        if shm is None:
+            shm = shared_memory.SharedMemory(name=handle.name)
+            _blocks[handle.name] = shm
+        return _build_frame(handle, shm.buf, copy=False)
+
+    cached = _attached.get(handle.name)
+    if cached is not None:
+        return cached
+
+    shm = shared_memory.SharedMemory(name=handle.name)
+    try:
+        buf = shm.buf
+        df = _build_frame(handle, buf, copy=True)
+        del buf
+    finally:
+        shm.close()
+
+    while len(_attached) >= max_cached:
+        _attached.pop(next(iter(_attached)))
+    _attached[handle.name] = df
+    return df
+
+
+def release_frame(name: str):
+    """Drop a cached frame or zero-copy mapping in this process (no-op if absent)"""
+    _attached.pop(name, None)
+    shm = _blocks.pop(name, None)
+    if shm is not None:
+        try:
+            shm.close()
+        except BufferError:
+            # Frames built on the block are still alive; the mapping is
+            # released when they are garbage collected
+            pass
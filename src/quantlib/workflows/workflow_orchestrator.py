@@ -90,7 +90,8 @@ class WorkflowOrchestrator:
                     data_df=self.data_df,
                     strategy_config=test_strategy_config,
                     config=self.config,
-                    symbol=self.symbol
+                    symbol=self.symbol,
+                    metrics=[self.objective]
                 )
                 
                 # Get objective value
@@ -127,7 +128,8 @@ class WorkflowOrchestrator:
                 data_df=self.data_df,
                 strategy_config=test_strategy_config,
                 config=self.config,
-                symbol=self.symbol
+                symbol=self.symbol,
+                metrics=[self.objective]
             )
             
             # Get objective value
@@ -6,6 +6,7 @@ from datetime import datetime, timedelta
 from quantlib.data import DataStore
 from quantlib.data.fetcher_registry import get_registry
 from quantlib.data.config import get_available_sources, get_default_data_source
+from quantlib.utils.frame_cache import CachedDataStore
 from streamlit_app.utils.streamlit_helpers import (
     get_database_symbols,
     get_symbol_metadata,
@@ -811,7 +812,7 @@ def _handle_fetch(symbol, start_date, end_date, use_cache, force_refresh, db_con
         try:
             registry = get_registry()
             fetcher = registry.create(source=data_source)
-            store = DataStore()
+            store = CachedDataStore(DataStore())
             start_str = start_date.strftime('%Y-%m-%d')
             end_str = end_date.strftime('%Y-%m-%d')
             
@@ -44,11 +44,11 @@ def metrics_table_component(results: dict):
     
     # Calculate metrics - try using RiskCalculator if available
     try:
-        trades_df = results.get('trades', pd.DataFrame())
+        ledger = results.get('round_trips', pd.DataFrame())
         calculator = RiskCalculator(
             returns=returns,
             equity_curve=equity_curve,
-            trades=trades_df if not trades_df.empty else None,
+            trades=ledger if not ledger.empty else None,
         )
         all_metrics = calculator.get_flat_metrics()
         
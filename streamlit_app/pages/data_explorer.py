@@ -18,7 +18,7 @@ import pandas as pd
 import numpy as np
 from streamlit_app.utils.streamlit_helpers import init_session_state
 from streamlit_app.components.data_fetcher import data_fetcher_component
-from quantlib.indicators import sma, ema, rsi, bollinger_bands, macd
+from quantlib.indicators import IndicatorSet
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
@@ -269,9 +269,23 @@ with main_tabs[0]:
         else:
             fig.add_trace(trace)
         
+        # Compute the selected indicators together (shared intermediates once)
+        indicator_set = IndicatorSet()
+        if show_sma:
+            indicator_set.add('sma', window=sma_window)
+        if show_ema:
+            indicator_set.add('ema', window=ema_window)
+        if show_bb:
+            indicator_set.add('bollinger_bands', window=bb_window)
+        if show_macd:
+            indicator_set.add('macd', fast=macd_fast, slow=macd_slow, signal=9)
+        if show_rsi:
+            indicator_set.add('rsi', window=rsi_window)
+        indicator_values = indicator_set.compute(data) if len(indicator_set) else {}
+        
         # Add indicators
         if show_sma:
-            sma_values = sma(close_prices, sma_window)
+            sma_values = indicator_values['sma']
             sma_trace = go.Scatter(
                 x=data.index,
                 y=sma_values.values,
@@ -285,7 +299,7 @@ with main_tabs[0]:
                 fig.add_trace(sma_trace)
         
         if show_ema:
-            ema_values = ema(close_prices, ema_window)
+            ema_values = indicator_values['ema']
             ema_trace = go.Scatter(
                 x=data.index,
                 y=ema_values.values,
@@ -299,7 +313,7 @@ with main_tabs[0]:
                 fig.add_trace(ema_trace)
         
         if show_bb:
-            bb = bollinger_bands(close_prices, bb_window)
+            bb = indicator_values['bollinger_bands']
             if price_row:
                 fig.add_trace(go.Scatter(
                     x=data.index,
@@ -354,7 +368,7 @@ with main_tabs[0]:
                 ))
         
         if show_macd:
-            macd_result = macd(close_prices, macd_fast, macd_slow, 9)
+            macd_result = indicator_values['macd']
             if price_row:
                 fig.add_trace(go.Scatter(
                     x=data.index,
@@ -388,7 +402,7 @@ with main_tabs[0]:
         
         # RSI subplot
         if show_rsi:
-            rsi_values = rsi(close_prices, rsi_window)
+            rsi_values = indicator_values['rsi']
             rsi_trace = go.Scatter(
                 x=data.index,
                 y=rsi_values.values,
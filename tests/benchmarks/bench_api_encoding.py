@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+API response encoding benchmark
+
+Times the row-oriented JSON encoding of /data/fetch and
+/indicators/calculate (one dict per point) against the columnar encoding
+in api.utils.columnar on random minute bars, and compares the JSON sizes.
+The row-oriented encoders are copied here so the benchmark runs without
+the API's web dependencies.
+
+Usage:
+    python -m tests.benchmarks.bench_api_encoding [n_bars]
+"""
+
+import json
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from api.utils.columnar import dataframe_to_columnar, encode_timestamps, encode_values
+
+
+def records_dataframe(df):
+    """Row-oriented encoding of /data/fetch (dataframe_to_dict_list)"""
+    df = df.reset_index()
+    df.rename(columns={df.columns[0]: "Date"}, inplace=True)
+    df["Date"] = df["Date"].astype(str)
+    return df.to_dict("records")
+
+
+def records_series(series):
+    """Row-oriented encoding of /indicators/calculate (serialize_series)"""
+    return [
+        {
+            'timestamp': idx.isoformat() if hasattr(idx, 'isoformat') else str(idx),
+            'value': float(val) if pd.notna(val) else None
+        }
+        for idx, val in series.items()
+    ]
+
+
+def make_bars(n_bars, seed=0):
+    """Random OHLCV minute bars"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n_bars)))
+    index = pd.date_range('2015-01-01', periods=n_bars, freq='min', name='Date')
+    return pd.DataFrame({
+        'Open': close, 'High': close * 1.001, 'Low': close * 0.999, 'Close': close,
+        'Volume': rng.integers(100, 10_000, n_bars).astype(float),
+    }, index=index)
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def compare(n_bars, verbose=False):
+    """
+    Encode n_bars bars and a 20-bar SMA both ways.
+
+    Returns:
+        Dictionary of payload -> (records seconds, columnar seconds,
+        records JSON bytes, columnar JSON bytes)
+    """
+    bars = make_bars(n_bars)
+    sma = bars['Close'].rolling(20).mean()
+    cases = {
+        'data/fetch': (lambda: records_dataframe(bars), lambda: dataframe_to_columnar(bars)),
+        'indicator series': (
+            lambda: records_series(sma),
+            lambda: {'timestamps': encode_timestamps(sma.index), 'values': encode_values(sma)},
+        ),
+    }
+
+    results = {}
+    for name, (records, columnar) in cases.items():
+        rows, rows_time = _timed(records)
+        columns, columns_time = _timed(columnar)
+        sizes = len(json.dumps(rows)), len(json.dumps(columns))
+        results[name] = (rows_time, columns_time) + sizes
+        if verbose:
+            print(f"  {name:17s} records {rows_time:7.3f}s {sizes[0] / 1e6:7.1f} MB   "
+                  f"columnar {columns_time:7.3f}s {sizes[1] / 1e6:7.1f} MB   "
+                  f"{rows_time / columns_time:5.1f}x faster, {sizes[0] / sizes[1]:4.1f}x smaller")
+    return results
+
+
+def main():
+    n_bars = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{n_bars:,} minute bars")
+    compare(n_bars, verbose=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Batch indicator benchmark
+
+Times the batch indicators against a loop over the single-series
+functions for two workloads: screening a universe (one window, many
+symbols) and sweeping a parameter (many windows, one symbol).
+
+Usage:
+    python -m tests.benchmarks.bench_batch_indicators [n_symbols]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from quantlib.indicators import sma, ema, rsi, roc, bollinger_bands, atr
+from quantlib.indicators import batch_sma, batch_ema, batch_rsi, batch_roc, batch_bollinger_bands, batch_atr
+
+
+def make_universe(n_bars, n_symbols, seed=0):
+    """Random close, high and low matrices (one column per symbol)"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_bars, n_symbols)), axis=0))
+    spread = np.abs(rng.normal(0, 0.005, (n_bars, n_symbols))) * close
+    index = pd.date_range('2015-01-01', periods=n_bars, freq='B')
+    columns = [f'SYM{i:04d}' for i in range(n_symbols)]
+    frame = lambda values: pd.DataFrame(values, index=index, columns=columns)
+    return frame(close), frame(close + spread), frame(close - spread)
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def screen(n_bars, n_symbols):
+    """One window over every symbol: loop of single-series calls vs one batch call"""
+    close, high, low = make_universe(n_bars, n_symbols)
+    cases = {
+        'sma': (lambda: [sma(close[c], 20) for c in close], lambda: batch_sma(close, 20)),
+        'ema': (lambda: [ema(close[c], 20) for c in close], lambda: batch_ema(close, 20)),
+        'rsi': (lambda: [rsi(close[c], 14) for c in close], lambda: batch_rsi(close, 14)),
+        'roc': (lambda: [roc(close[c], 10) for c in close], lambda: batch_roc(close, 10)),
+        'bollinger_bands': (lambda: [bollinger_bands(close[c], 20) for c in close],
+                            lambda: batch_bollinger_bands(close, 20)),
+        'atr': (lambda: [atr(high[c], low[c], close[c], 14) for c in close],
+                lambda: batch_atr(high, low, close, 14)),
+    }
+    return {name: (_timed(loop), _timed(batch)) for name, (loop, batch) in cases.items()}
+
+
+def sweep(n_bars, windows):
+    """Many windows over one symbol"""
+    close, _, _ = make_universe(n_bars, 1)
+    series = close.iloc[:, 0]
+    cases = {
+        'sma': (lambda: [sma(series, w) for w in windows], lambda: batch_sma(series, windows)),
+        'ema': (lambda: [ema(series, w) for w in windows], lambda: batch_ema(series, windows)),
+        'rsi': (lambda: [rsi(series, w) for w in windows], lambda: batch_rsi(series, windows)),
+        'roc': (lambda: [roc(series, w) for w in windows], lambda: batch_roc(series, windows)),
+    }
+    return {name: (_timed(loop), _timed(batch)) for name, (loop, batch) in cases.items()}
+
+
+def _report(timings):
+    for name, (loop_time, batch_time) in timings.items():
+        print(f"  {name:16s} loop {loop_time:8.3f}s   batch {batch_time:8.3f}s   "
+              f"{loop_time / batch_time:7.1f}x")
+
+
+def main():
+    n_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+    print(f"Universe screen: {n_symbols:,} symbols x 2,520 bars")
+    _report(screen(2_520, n_symbols))
+    windows = list(range(5, 51))
+    print(f"Parameter sweep: windows 5-50 on 100,000 bars")
+    _report(sweep(100_000, windows))
+
+
+if __name__ == '__main__':
+    main()
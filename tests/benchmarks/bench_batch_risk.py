@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Batched risk metrics benchmark
+
+Scores N synthetic strategy runs of T periods with one BatchRiskCalculator
+and compares against building a RiskCalculator per run (timed on a sample
+of runs and extrapolated).
+
+Usage:
+    python -m tests.benchmarks.bench_batch_risk [n_runs] [n_periods]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from quantlib.risk import RiskCalculator, BatchRiskCalculator
+
+
+def main():
+    n_runs = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    n_periods = int(sys.argv[2]) if len(sys.argv) > 2 else 2_520
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0.0003, 0.01, (n_periods, n_runs))
+    equity = 100_000 * np.cumprod(1 + returns, axis=0)
+    print(f"{n_runs:,} runs x {n_periods:,} periods")
+
+    start = time.perf_counter()
+    BatchRiskCalculator(returns, equity).get_flat_metrics()
+    batch_time = time.perf_counter() - start
+    print(f"  batched:          {batch_time:.2f}s")
+
+    sample = min(n_runs, 50)
+    index = pd.date_range('2000-01-01', periods=n_periods, freq='D')
+    start = time.perf_counter()
+    for j in range(sample):
+        RiskCalculator(
+            pd.Series(returns[:, j], index=index), pd.Series(equity[:, j], index=index)
+        ).get_flat_metrics()
+    per_run = (time.perf_counter() - start) / sample
+    print(f"  per-run (est.):   {per_run * n_runs:.2f}s ({per_run * 1000:.1f} ms/run, "
+          f"{per_run * n_runs / batch_time:.0f}x slower)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Drawdown analytics benchmark
+
+Times the drawdown functions and RiskCalculator.calculate_drawdown_metrics on
+a long synthetic equity curve (1M minute bars by default).
+
+Usage:
+    python -m tests.benchmarks.bench_drawdown [n_points]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from quantlib.risk import (
+    RiskCalculator,
+    average_drawdown_duration,
+    drawdown_duration,
+    drawdown_recovery_time,
+    drawdown_table,
+)
+
+
+def make_equity(n_points: int) -> pd.Series:
+    """Generate a random-walk equity curve on minute bars"""
+    rng = np.random.default_rng(0)
+    equity = 100_000 * np.exp(np.cumsum(rng.normal(0, 0.0005, n_points)))
+    return pd.Series(equity, index=pd.date_range('2020-01-01', periods=n_points, freq='min'))
+
+
+def main():
+    n_points = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    equity = make_equity(n_points)
+    print(f"{n_points:,}-point equity curve")
+
+    for func in (drawdown_duration, average_drawdown_duration, drawdown_recovery_time, drawdown_table):
+        start = time.perf_counter()
+        result = func(equity)
+        elapsed = time.perf_counter() - start
+        detail = f", {len(result):,} episodes" if func is drawdown_table else ""
+        print(f"  {func.__name__:<28} {elapsed * 1000:8.1f} ms{detail}")
+
+    calculator = RiskCalculator(returns=equity.pct_change().dropna(), equity_curve=equity)
+    start = time.perf_counter()
+    calculator.calculate_drawdown_metrics()
+    print(f"  {'calculate_drawdown_metrics':<28} {(time.perf_counter() - start) * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Event queue benchmark
+
+Times BacktestEngine.run with a strategy that places a market order on
+every bar, so each bar queues a market event, an order and a fill. The
+previous loop (a locking queue.PriorityQueue of (timestamp, counter,
+event) tuples and an isinstance chain) is reproduced as
+PriorityQueueEngine. The queues are also timed on their own, with the
+same three events per bar and no-op handlers.
+
+Usage:
+    python -m tests.benchmarks.bench_event_queue [n_bars]
+"""
+
+import sys
+import time
+from queue import PriorityQueue
+
+import numpy as np
+import pandas as pd
+
+from quantlib.backtesting import (
+    BacktestEngine, EventQueue, FillEvent, MarketEvent, OrderEvent, SignalEvent
+)
+
+
+class ClearablePriorityQueue(PriorityQueue):
+    """PriorityQueue with the clear() the engine calls between runs"""
+
+    def clear(self):
+        with self.mutex:
+            self.queue.clear()
+
+
+class PriorityQueueEngine(BacktestEngine):
+    """Previous event loop: PriorityQueue plus isinstance dispatch"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.events = ClearablePriorityQueue()
+        self._event_counter = 0
+
+    def _add_event(self, event):
+        self._event_counter += 1
+        self.events.put((event.timestamp, self._event_counter, event))
+
+    def _process_events(self):
+        while not self.events.empty():
+            timestamp, counter, event = self.events.get()
+            if timestamp > self.current_time:
+                self.events.put((timestamp, counter, event))
+                break
+            if isinstance(event, SignalEvent):
+                self._on_signal(event)
+            elif isinstance(event, OrderEvent):
+                self._on_order(event)
+            elif isinstance(event, FillEvent):
+                self._on_fill(event)
+
+
+class OrderEveryBar:
+    """Buys on even bars and sells on odd bars"""
+
+    def __init__(self):
+        self.bar = 0
+
+    def on_data(self, context, bar):
+        context.place_order('SPY', 10, 'BUY' if self.bar % 2 == 0 else 'SELL')
+        self.bar += 1
+
+
+def make_bars(n_bars, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n_bars)))
+    return pd.DataFrame({
+        'Open': close, 'High': close * 1.001, 'Low': close * 0.999, 'Close': close, 'Volume': 1e6,
+    }, index=pd.date_range('2020-01-01', periods=n_bars, freq='min'))
+
+
+def queue_only(index):
+    """Put a market event, an order and a fill per bar and dispatch them, both ways"""
+    def handle(event):
+        pass
+
+    events = []
+    for timestamp in index:
+        events.append((
+            MarketEvent(timestamp),
+            OrderEvent(timestamp, 'SPY', 'MARKET', 10, 'BUY'),
+            FillEvent(timestamp, 'SPY', 10, 'BUY', 100.0),
+        ))
+
+    start = time.perf_counter()
+    queue, counter = PriorityQueue(), 0
+    for timestamp, bar_events in zip(index, events):
+        for event in bar_events:
+            counter += 1
+            queue.put((event.timestamp, counter, event))
+        while not queue.empty():
+            event_time, event_counter, event = queue.get()
+            if event_time > timestamp:
+                queue.put((event_time, event_counter, event))
+                break
+            if isinstance(event, SignalEvent):
+                handle(event)
+            elif isinstance(event, OrderEvent):
+                handle(event)
+            elif isinstance(event, FillEvent):
+                handle(event)
+    queue_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    queue = EventQueue()
+    handlers = {MarketEvent: None, SignalEvent: handle, OrderEvent: handle, FillEvent: handle}
+    for timestamp, bar_events in zip(index, events):
+        for event in bar_events:
+            queue.put(event)
+        for event in queue.due(timestamp):
+            handler = handlers[type(event)]
+            if handler is not None:
+                handler(event)
+    return queue_time, time.perf_counter() - start
+
+
+def run(engine_class, data):
+    engine = engine_class(commission=1.0, recording='equity_only')
+    start = time.perf_counter()
+    results = engine.run(OrderEveryBar(), data, symbol='SPY')
+    return time.perf_counter() - start, results
+
+
+def main():
+    n_bars = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    data = make_bars(n_bars)
+    queue_time, queue_results = run(PriorityQueueEngine, data)
+    deque_time, deque_results = run(BacktestEngine, data)
+    pd.testing.assert_frame_equal(deque_results['trades'], queue_results['trades'])
+
+    print(f"Event loop: {n_bars:,} bars, one market order per bar ({len(deque_results['trades']):,} fills)")
+    print(f"  PriorityQueue  {queue_time:8.3f}s")
+    print(f"  EventQueue     {deque_time:8.3f}s   {queue_time / deque_time:7.1f}x")
+
+    queue_time, deque_time = queue_only(data.index)
+    print(f"Queues alone: {n_bars:,} bars x 3 events")
+    print(f"  PriorityQueue  {queue_time:8.3f}s")
+    print(f"  EventQueue     {deque_time:8.3f}s   {queue_time / deque_time:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Frame cache benchmark
+
+Times repeated loads of the same symbol (a backtest benchmark, a paper
+trading warm-up) from a SQLite-backed store, with and without the
+FrameCache in front of it. Each repeat asks for a different sub-range of
+the first load, as successive backtests over one history do.
+
+Usage:
+    python -m tests.benchmarks.bench_frame_cache [n_loads]
+"""
+
+import sqlite3
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from quantlib.utils.frame_cache import CachedDataStore, FrameCache
+
+
+class SQLiteStore:
+    """Minimal DataStore over an in-memory SQLite table of daily bars"""
+
+    data_source = 'sqlite'
+
+    def __init__(self, symbols, n_bars, seed=0):
+        rng = np.random.default_rng(seed)
+        dates = pd.date_range('1990-01-01', periods=n_bars, freq='B', name='Date')
+        self.connection = sqlite3.connect(':memory:')
+        for symbol in symbols:
+            close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, n_bars)))
+            bars = pd.DataFrame({
+                'symbol': symbol, 'Open': close, 'High': close * 1.01,
+                'Low': close * 0.99, 'Close': close, 'Volume': 1e6,
+            }, index=dates)
+            bars.to_sql('ohlcv', self.connection, if_exists='append', index_label='Date')
+        self.connection.execute('CREATE INDEX idx_symbol_date ON ohlcv (symbol, Date)')
+
+    def load(self, symbol, start=None, end=None, interval='1d'):
+        query = 'SELECT Date, Open, High, Low, Close, Volume FROM ohlcv WHERE symbol = ?'
+        params = [symbol]
+        if start is not None:
+            query += ' AND Date >= ?'
+            params.append(str(pd.Timestamp(start)))
+        if end is not None:
+            query += ' AND Date < ?'
+            params.append(str(pd.Timestamp(end) + pd.Timedelta(days=1)))
+        data = pd.read_sql(query, self.connection, params=params, parse_dates=['Date'])
+        return data.set_index('Date')
+
+    def save(self, symbol, data, **kwargs):
+        pass
+
+
+def _timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def repeated_loads(store, n_loads):
+    """Load SPY over the full history, then n_loads shifting 10-year windows"""
+    store.load('SPY', start='1995-01-01', end='2024-12-31')
+    starts = pd.date_range('1995-01-01', '2014-12-31', periods=n_loads)
+    for start in starts:
+        store.load('SPY', start=start.strftime('%Y-%m-%d'), end=(start + pd.DateOffset(years=10)).strftime('%Y-%m-%d'))
+
+
+def main():
+    n_loads = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    store = SQLiteStore(['SPY', 'QQQ', 'IWM'], n_bars=9_000)
+    cache = FrameCache()
+    cached_store = CachedDataStore(store, cache)
+
+    uncached_time = _timed(lambda: repeated_loads(store, n_loads))
+    cached_time = _timed(lambda: repeated_loads(cached_store, n_loads))
+    print(f"Repeated loads: {n_loads} sub-range loads of SPY (9,000 bars in store)")
+    print(f"  store        {uncached_time:8.3f}s")
+    print(f"  frame cache  {cached_time:8.3f}s   {uncached_time / cached_time:7.1f}x")
+    print(f"  cache stats  {cache.stats()}")
+
+
+if __name__ == '__main__':
+    main()
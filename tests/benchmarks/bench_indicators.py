@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Indicator kernel benchmark
+
+Compares the NumPy implementations of cci, volume_profile, atr and adx with
+the previous pandas versions (rolling apply with a Python lambda, a per-bar
+loop with .iloc writes, concat + row-wise max) on random OHLCV bars, and
+asserts that both give the same numbers.
+
+The old volume_profile started from an all-NaN Series, so every bin came
+out NaN; the reference below starts from zeros to give the intended result.
+
+Usage:
+    python -m tests.benchmarks.bench_indicators [n_bars]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from quantlib.indicators import cci, volume_profile, atr, adx
+
+
+def reference_cci(high, low, close, window=20):
+    tp = (high + low + close) / 3
+    sma_tp = tp.rolling(window=window).mean()
+    mad = tp.rolling(window=window).apply(lambda x: np.mean(np.abs(x - x.mean())))
+    return (tp - sma_tp) / (0.015 * mad)
+
+
+def reference_volume_profile(price, volume, bins=20):
+    bin_edges = np.linspace(price.min(), price.max(), bins + 1)
+    bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
+    volume_by_price = pd.Series(0.0, index=bin_centers)
+    for i in range(len(price)):
+        bin_idx = np.digitize(price.iloc[i], bin_edges) - 1
+        bin_idx = max(0, min(bin_idx, len(bin_centers) - 1))
+        volume_by_price.iloc[bin_idx] += volume.iloc[i]
+    return pd.DataFrame({'price': bin_centers, 'volume': volume_by_price.values})
+
+
+def _reference_true_range(high, low, close):
+    tr1 = high - low
+    tr2 = abs(high - close.shift(1))
+    tr3 = abs(low - close.shift(1))
+    return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+
+
+def reference_atr(high, low, close, window=14):
+    return _reference_true_range(high, low, close).rolling(window=window).mean()
+
+
+def reference_adx(high, low, close, window=14):
+    tr = _reference_true_range(high, low, close)
+    up_move = high - high.shift(1)
+    down_move = low.shift(1) - low
+    plus_dm = pd.Series(np.where((up_move > down_move) & (up_move > 0), up_move, 0), index=high.index)
+    minus_dm = pd.Series(np.where((down_move > up_move) & (down_move > 0), down_move, 0), index=high.index)
+    atr_values = tr.rolling(window=window).mean()
+    plus_di = 100 * (plus_dm.rolling(window=window).mean() / atr_values)
+    minus_di = 100 * (minus_dm.rolling(window=window).mean() / atr_values)
+    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+    return dx.rolling(window=window).mean()
+
+
+def make_bars(n_bars, seed=0):
+    """Random OHLCV bars"""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, n_bars)))
+    spread = np.abs(rng.normal(0, 0.002, n_bars)) * close
+    index = pd.date_range('2020-01-01', periods=n_bars, freq='min')
+    return pd.DataFrame({
+        'High': close + spread,
+        'Low': close - spread,
+        'Close': close,
+        'Volume': rng.integers(100, 10_000, n_bars).astype(float),
+    }, index=index)
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def compare(n_bars, verbose=False):
+    """
+    Run old and new implementations on n_bars bars and assert they agree.
+
+    Returns:
+        Dictionary of indicator name -> (old seconds, new seconds)
+    """
+    bars = make_bars(n_bars)
+    high, low, close, volume = bars['High'], bars['Low'], bars['Close'], bars['Volume']
+    cases = {
+        'cci': (reference_cci, cci, (high, low, close)),
+        'volume_profile': (reference_volume_profile, volume_profile, (close, volume)),
+        'atr': (reference_atr, atr, (high, low, close)),
+        'adx': (reference_adx, adx, (high, low, close)),
+    }
+
+    timings = {}
+    for name, (old_func, new_func, args) in cases.items():
+        expected, old_time = _timed(old_func, *args)
+        actual, new_time = _timed(new_func, *args)
+        if isinstance(expected, pd.DataFrame):
+            pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=1e-9)
+        else:
+            pd.testing.assert_series_equal(actual, expected, check_exact=False, rtol=1e-9, check_names=False)
+        timings[name] = (old_time, new_time)
+        if verbose:
+            print(f"  {name:15s} old {old_time:8.3f}s   new {new_time:8.3f}s   "
+                  f"{old_time / new_time:7.1f}x")
+    return timings
+
+
+def main():
+    n_bars = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"{n_bars:,} bars (results match)")
+    compare(n_bars, verbose=True)
+
+
+if __name__ == '__main__':
+    main()
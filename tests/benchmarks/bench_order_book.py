@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Pending order book benchmark
+
+Times OrderManager with a ladder of resting limit and stop orders against
+the previous list scan, which checked every pending order of the symbol on
+every bar and cancelled by scanning every symbol. The list scan is copied
+here as ScanOrderManager.
+
+Usage:
+    python -m tests.benchmarks.bench_order_book [n_orders] [n_bars]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from quantlib.backtesting import OrderEvent, OrderManager, OrderStatus
+
+
+class ScanOrderManager(OrderManager):
+    """Previous OrderManager: one list of pending orders per symbol"""
+
+    def add_order(self, order):
+        self.pending_orders.setdefault(order.symbol.upper(), []).append(order)
+        self.order_history.append(order)
+
+    def cancel_order(self, order_id):
+        for orders in self.pending_orders.values():
+            for order in orders:
+                if order.order_id == order_id and order.status == OrderStatus.PENDING:
+                    order.status = OrderStatus.CANCELLED
+                    orders.remove(order)
+                    return True
+        return False
+
+    def check_orders(self, symbol, high, low, close, current_time):
+        orders = self.pending_orders.get(symbol.upper())
+        if not orders:
+            return []
+        fills = []
+        orders_to_remove = []
+        for order in orders:
+            if order.status != OrderStatus.PENDING:
+                orders_to_remove.append(order)
+                continue
+            if order.time_in_force.value == 'DAY' and order.timestamp.date() != current_time.date():
+                order.status = OrderStatus.CANCELLED
+                orders_to_remove.append(order)
+                continue
+            fill_event = self._check_order_execution(order, high, low, close, current_time)
+            if fill_event:
+                fills.append(fill_event)
+                order.filled_quantity += fill_event.quantity
+                if order.filled_quantity >= order.quantity:
+                    order.status = OrderStatus.FILLED
+                    orders_to_remove.append(order)
+        for order in orders_to_remove:
+            if order in orders:
+                orders.remove(order)
+        return fills
+
+
+def make_bars(n_bars, seed=0):
+    """Random walk high/low/close around 100"""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 0.5, n_bars))
+    spread = np.abs(rng.normal(0, 0.5, n_bars))
+    index = pd.date_range('2020-01-01', periods=n_bars, freq='B')
+    return index, close + spread, close - spread, close
+
+
+def ladder(n_orders, timestamp):
+    """Resting buy limits / sell stops below 100 and sell limits / buy stops above it"""
+    orders = []
+    offsets = np.linspace(5, 50, n_orders // 4)
+    for i, offset in enumerate(offsets):
+        orders.append(OrderEvent(timestamp, 'SPY', 'LIMIT', 1, 'BUY', limit_price=100 - offset, order_id=f'bl{i}'))
+        orders.append(OrderEvent(timestamp, 'SPY', 'LIMIT', 1, 'SELL', limit_price=100 + offset, order_id=f'sl{i}'))
+        orders.append(OrderEvent(timestamp, 'SPY', 'STOP', 1, 'SELL', stop_price=100 - offset, order_id=f'ss{i}'))
+        orders.append(OrderEvent(timestamp, 'SPY', 'STOP', 1, 'BUY', stop_price=100 + offset, order_id=f'bs{i}'))
+    return orders
+
+
+def run(manager_class, n_orders, n_bars):
+    """Check every bar, then cancel a tenth of the remaining orders"""
+    index, high, low, close = make_bars(n_bars)
+    manager = manager_class()
+    for order in ladder(n_orders, index[0]):
+        manager.add_order(order)
+
+    start = time.perf_counter()
+    n_fills = 0
+    for pos, timestamp in enumerate(index):
+        n_fills += len(manager.check_orders('SPY', high[pos], low[pos], close[pos], timestamp))
+    check_time = time.perf_counter() - start
+
+    remaining = [order.order_id for order in manager.get_pending_orders()]
+    start = time.perf_counter()
+    for order_id in remaining[::10]:
+        manager.cancel_order(order_id)
+    cancel_time = time.perf_counter() - start
+    return check_time, cancel_time, n_fills, len(remaining[::10])
+
+
+def main():
+    n_orders = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    n_bars = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    scan_check, scan_cancel, scan_fills, n_cancels = run(ScanOrderManager, n_orders, n_bars)
+    book_check, book_cancel, book_fills, _ = run(OrderManager, n_orders, n_bars)
+    assert scan_fills == book_fills
+
+    print(f"Resting orders: {n_orders:,} limit/stop orders, {n_bars:,} bars, {book_fills:,} fills")
+    print(f"  check_orders  scan {scan_check:8.3f}s   book {book_check:8.3f}s   {scan_check / book_check:7.1f}x")
+    print(f"  cancel x{n_cancels:<5d} scan {scan_cancel:8.3f}s   book {book_cancel:8.3f}s   "
+          f"{scan_cancel / book_cancel:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
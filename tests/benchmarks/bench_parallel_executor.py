@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+ParallelExecutor per-task overhead benchmark
+
+Runs a batch of trivial tasks against a large OHLCV frame two ways:
+
+    pickled: a fresh ProcessPoolExecutor per batch with the frame sent along
+             with every task (how a bound task method behaves)
+    shared:  ParallelExecutor with the frame registered once in shared memory
+             and a pool kept alive across batches
+
+and reports the per-task overhead of each.
+
+Usage:
+    python -m tests.benchmarks.bench_parallel_executor [n_rows] [n_tasks]
+"""
+
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from quantlib.workflows import ParallelExecutor, get_shared_data
+from tests.benchmarks.bench_event_loop import make_data
+
+
+def pickled_task(task):
+    """Task that receives the frame in its arguments"""
+    return {'last': float(task['data']['Close'].iloc[-1])}
+
+
+def shared_task(task):
+    """Task that reads the frame registered with the executor"""
+    return {'last': float(get_shared_data('ohlcv')['Close'].iloc[-1])}
+
+
+def run_pickled(data, n_tasks, n_workers):
+    """One fresh pool per batch, frame pickled into each task"""
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        futures = [executor.submit(pickled_task, {'data': data, 'i': i}) for i in range(n_tasks)]
+        return [f.result() for f in futures]
+
+
+def main():
+    n_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    n_tasks = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    data = make_data(n_rows)
+
+    with ParallelExecutor() as executor:
+        n_workers = executor.n_workers
+        print(f"{n_rows:,} rows, {n_tasks} tasks, {n_workers} workers")
+
+        for batch in range(2):
+            start = time.perf_counter()
+            run_pickled(data, n_tasks, n_workers)
+            elapsed = time.perf_counter() - start
+            print(f"  pickled, batch {batch + 1}: {elapsed:.2f}s ({elapsed / n_tasks * 1000:.1f} ms/task)")
+
+        start = time.perf_counter()
+        executor.register_data('ohlcv', data)
+        print(f"  shared,  register:  {time.perf_counter() - start:.2f}s (once)")
+
+        tasks = [{'i': i} for i in range(n_tasks)]
+        for batch in range(2):
+            start = time.perf_counter()
+            executor.execute_batch(tasks, shared_task)
+            elapsed = time.perf_counter() - start
+            print(f"  shared,  batch {batch + 1}: {elapsed:.2f}s ({elapsed / n_tasks * 1000:.1f} ms/task)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Portfolio benchmark
+
+Times a bar loop over a 1,000-symbol universe: a few fills per bar
+(add_position + record_transaction) and a mark to market of every symbol,
+with the dict-based Portfolio and the array-backed CompactPortfolio. The
+compact portfolio is timed with the same price dict and with a price
+vector aligned to its slots.
+
+Usage:
+    python -m tests.benchmarks.bench_portfolio [n_symbols] [n_bars]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from quantlib.portfolio import CompactPortfolio, Portfolio
+
+
+def make_market(n_symbols, n_bars, fills_per_bar=5, seed=0):
+    rng = np.random.default_rng(seed)
+    symbols = [f'SYM{i:04d}' for i in range(n_symbols)]
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, (n_bars, n_symbols)), axis=0))
+    traded = rng.integers(0, n_symbols, (n_bars, fills_per_bar))
+    quantity = rng.integers(1, 100, (n_bars, fills_per_bar))
+    return symbols, prices, traded, quantity
+
+
+def run(portfolio, symbols, prices, traded, quantity, vector_prices):
+    timestamps = pd.date_range('2020-01-01', periods=len(prices), freq='min')
+    equity = np.empty(len(prices))
+    current_prices = dict.fromkeys(symbols, 0.0)
+    if vector_prices:
+        # Intern the universe once so slots line up with the price columns
+        portfolio.price_vector(current_prices)
+
+    start = time.perf_counter()
+    for bar, timestamp in enumerate(timestamps):
+        row = prices[bar]
+        for slot, qty in zip(traded[bar], quantity[bar]):
+            symbol = symbols[slot]
+            portfolio.add_position(symbol, int(qty))
+            portfolio.record_transaction(symbol, int(qty), row[slot], 'BUY', timestamp, 1.0)
+        if vector_prices:
+            equity[bar] = portfolio.get_total_equity(row)
+        else:
+            current_prices.update(zip(symbols, row.tolist()))
+            equity[bar] = portfolio.get_total_equity(current_prices)
+    return time.perf_counter() - start, equity
+
+
+def main():
+    n_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    n_bars = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    market = make_market(n_symbols, n_bars)
+
+    dict_time, dict_equity = run(Portfolio(), *market, vector_prices=False)
+    compact_time, compact_equity = run(CompactPortfolio(), *market, vector_prices=False)
+    vector_time, vector_equity = run(CompactPortfolio(), *market, vector_prices=True)
+    np.testing.assert_allclose(compact_equity, dict_equity, rtol=1e-12)
+    np.testing.assert_allclose(vector_equity, dict_equity, rtol=1e-12)
+
+    print(f"Portfolio: {n_symbols:,} symbols, {n_bars:,} bars, 5 fills + mark to market per bar")
+    print(f"  Portfolio (dict)            {dict_time:8.3f}s")
+    print(f"  CompactPortfolio (dict)     {compact_time:8.3f}s   {dict_time / compact_time:7.1f}x")
+    print(f"  CompactPortfolio (vector)   {vector_time:8.3f}s   {dict_time / vector_time:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
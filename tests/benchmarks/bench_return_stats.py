@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Shared return statistics benchmark
+
+Times RiskCalculator.calculate_all on a 10-year daily series and a
+1M-point minute series, and the return-based metrics (ratios, VaR,
+distribution) computed from the Series each time versus from one shared
+ReturnStats.
+
+Usage:
+    python -m tests.benchmarks.bench_return_stats [n_minutes]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from quantlib.risk import RiskCalculator, ReturnStats
+from quantlib.risk import metrics, var
+
+
+def return_metrics(returns, periods, return_stats=None):
+    """Every return-based metric calculate_all reports"""
+    return [
+        metrics.sharpe_ratio(returns, 0.0, periods, return_stats),
+        metrics.sortino_ratio(returns, 0.0, periods, return_stats),
+        metrics.annualized_volatility(returns, periods, return_stats),
+        metrics.omega_ratio(returns, 0.0, periods, return_stats),
+        metrics.tail_ratio(returns, return_stats=return_stats),
+        metrics.skewness(returns, return_stats),
+        metrics.kurtosis(returns, return_stats),
+        var.historical_var(returns, 0.95, return_stats),
+        var.parametric_var(returns, 0.95, return_stats),
+        var.monte_carlo_var(returns, 0.95, 10_000, 0, return_stats),
+        var.cvar(returns, 0.95, return_stats),
+    ]
+
+
+def best_of(func, repeat):
+    """Fastest of several runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    n_minutes = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    cases = [
+        ('10y daily', pd.date_range('2010-01-01', periods=2_520, freq='B'), 252, 20),
+        (f'{n_minutes:,} minutes', pd.date_range('2020-01-01', periods=n_minutes, freq='min'), 252 * 390, 3),
+    ]
+
+    for label, index, periods, repeat in cases:
+        returns = pd.Series(rng.normal(0.0002, 0.01, len(index)), index=index)
+        equity = 100_000 * (1 + returns).cumprod()
+        print(label)
+
+        all_time = best_of(
+            lambda: RiskCalculator(returns, equity, periods=periods, var_random_seed=0).calculate_all(),
+            repeat
+        )
+        print(f"  calculate_all:              {all_time * 1000:8.1f} ms")
+
+        series_time = best_of(lambda: return_metrics(returns, periods), repeat)
+        stats_time = best_of(lambda: return_metrics(returns, periods, ReturnStats(returns)), repeat)
+        print(f"  return metrics, per Series: {series_time * 1000:8.1f} ms")
+        print(f"  return metrics, ReturnStats:{stats_time * 1000:8.1f} ms "
+              f"({series_time / stats_time:.1f}x faster)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Scheduler benchmark
+
+Times Scheduler.check_and_execute over a year of minute bars with a
+handful of typical rules, three ways: polling every rule on every bar (the
+previous behaviour, reproduced with should_execute), the compiled
+schedule a backtest uses, and the next-fire-time heap used live.
+
+Usage:
+    python -m tests.benchmarks.bench_scheduler [n_events]
+"""
+
+import sys
+import time as timer
+from datetime import time
+
+import pandas as pd
+
+from quantlib.backtesting import Scheduler, TimeRule
+
+
+class PollingScheduler(Scheduler):
+    """Previous Scheduler: evaluate every rule on every bar"""
+
+    def check_and_execute(self, context):
+        current_time = context.current_time
+        for event in self.events:
+            if event.should_execute(current_time):
+                if event.last_executed is None or event.last_executed < current_time:
+                    event.execute(context)
+
+
+class Context:
+    current_time = None
+
+
+RULES = [
+    (TimeRule.EVERY_HOUR, {}),
+    (TimeRule.EVERY_30_MINUTES, {}),
+    (TimeRule.EVERY_DAY, {'time_of_day': time(15, 55)}),
+    (TimeRule.EVERY_WEEK, {'day_of_week': 0, 'time_of_day': time(10, 0)}),
+    (TimeRule.EVERY_MONTH, {'day_of_month': 1, 'time_of_day': time(9, 31)}),
+    (TimeRule.MARKET_OPEN, {}),
+    (TimeRule.MARKET_CLOSE, {}),
+]
+
+
+def trading_minutes(days):
+    """Minute bars of regular sessions over the given number of business days"""
+    sessions = pd.bdate_range('2023-01-02', periods=days)
+    offsets = pd.timedelta_range('9h30min', '15h59min', freq='min')
+    return pd.DatetimeIndex([day + offset for day in sessions for offset in offsets])
+
+
+def run(scheduler, index, n_events, compile_index):
+    calls = [0]
+    for i in range(n_events):
+        rule, kwargs = RULES[i % len(RULES)]
+        scheduler.schedule(rule, lambda context: calls.__setitem__(0, calls[0] + 1), **kwargs)
+
+    start = timer.perf_counter()
+    if compile_index:
+        scheduler.compile(index)
+    context = Context()
+    for timestamp in index:
+        context.current_time = timestamp
+        scheduler.check_and_execute(context)
+    return timer.perf_counter() - start, calls[0]
+
+
+def main():
+    n_events = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    index = trading_minutes(252)
+    polling_time, polling_calls = run(PollingScheduler(), index, n_events, False)
+    compiled_time, compiled_calls = run(Scheduler(), index, n_events, True)
+    heap_time, heap_calls = run(Scheduler(), index, n_events, False)
+    assert polling_calls == compiled_calls == heap_calls
+
+    print(f"Scheduler: {n_events} events over {len(index):,} minute bars ({polling_calls:,} callbacks)")
+    print(f"  polling   {polling_time:8.3f}s")
+    print(f"  compiled  {compiled_time:8.3f}s   {polling_time / compiled_time:7.1f}x")
+    print(f"  heap      {heap_time:8.3f}s   {polling_time / heap_time:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
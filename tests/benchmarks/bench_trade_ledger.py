@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Round-trip ledger benchmark
+
+Times round_trips() on a synthetic fills table (random buys and sells over
+a few symbols, with position flips) against a per-fill FIFO loop with a
+deque of open lots per symbol, and checks that both give the same P&L.
+
+Usage:
+    python -m tests.benchmarks.bench_trade_ledger [n_fills]
+"""
+
+import sys
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from quantlib.backtesting import round_trips
+
+
+def loop_round_trips(fills):
+    """FIFO matching one fill at a time; returns the net P&L of each lot"""
+    lots = {}
+    pnl = []
+    for symbol, quantity, direction, price, commission in zip(
+        fills['symbol'], fills['quantity'], fills['direction'], fills['price'], fills['commission']
+    ):
+        book = lots.setdefault(symbol, deque())
+        sign = 1.0 if direction == 'BUY' else -1.0
+        remaining = float(quantity)
+        while remaining > 0 and book and book[0][0] != sign:
+            lot = book[0]
+            matched = min(remaining, lot[1])
+            lot_commission = lot[3] * matched / lot[4] + commission * matched / quantity
+            pnl.append(lot[0] * (price - lot[2]) * matched - lot_commission)
+            lot[1] -= matched
+            remaining -= matched
+            if lot[1] <= 0:
+                book.popleft()
+        if remaining > 0:
+            book.append([sign, remaining, price, commission, float(quantity)])
+    return np.array(pnl)
+
+
+def make_fills(n_fills, n_symbols=20, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'timestamp': pd.date_range('2000-01-01', periods=n_fills, freq='min'),
+        'symbol': rng.choice([f'SYM{i}' for i in range(n_symbols)], n_fills),
+        'quantity': rng.integers(1, 100, n_fills).astype(float),
+        'direction': rng.choice(['BUY', 'SELL'], n_fills),
+        'price': 100 + rng.normal(0, 5, n_fills),
+        'commission': 1.0,
+    })
+
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    n_fills = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    fills = make_fills(n_fills)
+    loop_time, loop_pnl = _timed(lambda: loop_round_trips(fills))
+    ledger_time, ledger = _timed(lambda: round_trips(fills))
+    assert len(ledger) == len(loop_pnl)
+    np.testing.assert_allclose(ledger['pnl'].to_numpy(), loop_pnl, rtol=1e-9, atol=1e-6)
+
+    print(f"Round trips: {n_fills:,} fills over 20 symbols -> {len(ledger):,} closed lots")
+    print(f"  FIFO loop    {loop_time:8.3f}s")
+    print(f"  round_trips  {ledger_time:8.3f}s   {loop_time / ledger_time:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
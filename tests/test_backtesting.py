@@ -0,0 +1,643 @@
+"""Tests for the backtesting engine"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+import pandas as pd
+import numpy as np
+from quantlib.backtesting import BacktestEngine, SimulatedBroker
+from quantlib.backtesting.vectorized import positions_from_signals
+
+
+STRATEGY_DIR = Path(__file__).parent.parent / 'src' / 'quantlib' / 'strategy_library' / 'strategies'
+
+LIBRARY_STRATEGIES = [
+    ('momentum/moving_average_crossover.py', 'MovingAverageCrossover', {'short_window': 10, 'long_window': 30}),
+    ('momentum/rsi_strategy.py', 'RSIStrategy', {'rsi_window': 14}),
+    ('momentum/macd_strategy.py', 'MACDStrategy', {}),
+    ('mean_reversion/bollinger_bands_strategy.py', 'BollingerBandsStrategy', {'bb_window': 20}),
+]
+
+
+def load_library_strategy(path, class_name, params):
+    """Load a bundled strategy class from the strategy library"""
+    spec = importlib.util.spec_from_file_location(class_name, STRATEGY_DIR / path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return getattr(module, class_name)(params)
+
+
+@pytest.fixture
+def sample_data():
+    """Create sample OHLCV data"""
+    rng = np.random.default_rng(42)
+    days = 500
+    dates = pd.date_range('2020-01-01', periods=days, freq='D')
+    prices = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, days)))
+    return pd.DataFrame({
+        'Open': prices * (1 + rng.normal(0, 0.005, days)),
+        'High': prices * (1 + np.abs(rng.normal(0, 0.01, days))),
+        'Low': prices * (1 - np.abs(rng.normal(0, 0.01, days))),
+        'Close': prices,
+        'Volume': rng.integers(1_000_000, 10_000_000, days),
+    }, index=dates)
+
+
+def test_positions_from_signals():
+    """Test entry/exit conversion to target positions"""
+    entries = np.array([False, True, False, False, False, True])
+    exits = np.array([False, False, False, True, False, False])
+    positions = positions_from_signals(entries, exits, size=100)
+    np.testing.assert_array_equal(positions, [0, 100, 100, 0, 0, 100])
+
+
+def test_broker_batch_matches_scalar():
+    """Test vectorized execution uses the same rules as calculate_execution"""
+    broker = SimulatedBroker(commission_type='percentage', commission=0.1, slippage=0.001)
+    quantities = np.array([100, 50])
+    prices = np.array([10.0, 20.0])
+    is_buy = np.array([True, False])
+
+    exec_prices, commissions = broker.calculate_execution_batch(quantities, prices, is_buy)
+
+    from quantlib.backtesting import OrderEvent
+    for i, direction in enumerate(['BUY', 'SELL']):
+        order = OrderEvent(pd.Timestamp('2020-01-01'), 'TEST', 'MARKET', int(quantities[i]), direction)
+        price, commission = broker.calculate_execution(order, prices[i], None)
+        assert exec_prices[i] == price
+        assert commissions[i] == commission
+
+
+@pytest.mark.parametrize('path,class_name,params', LIBRARY_STRATEGIES)
+@pytest.mark.parametrize('commission_type,commission,slippage', [
+    ('fixed', 1.0, 0.0),
+    ('percentage', 0.1, 0.001),
+])
+def test_vectorized_parity(sample_data, path, class_name, params, commission_type, commission, slippage):
+    """Test run_vectorized reproduces the event-driven engine on bundled strategies"""
+    engine_kwargs = dict(commission=commission, commission_type=commission_type, slippage=slippage)
+
+    event_engine = BacktestEngine(**engine_kwargs)
+    event_results = event_engine.run(
+        load_library_strategy(path, class_name, params), sample_data, symbol='TEST'
+    )
+
+    strategy = load_library_strategy(path, class_name, params)
+    vector_engine = BacktestEngine(**engine_kwargs)
+    vector_results = vector_engine.run_vectorized(
+        strategy.target_positions(sample_data), sample_data, symbol='TEST'
+    )
+
+    assert event_results['num_trades'] > 0
+    pd.testing.assert_series_equal(
+        vector_results['equity_curve'], event_results['equity_curve'], check_freq=False
+    )
+    pd.testing.assert_frame_equal(vector_results['trades'], event_results['trades'])
+    assert vector_results['total_commission'] == pytest.approx(event_results['total_commission'])
+    assert vector_results['final_equity'] == pytest.approx(event_results['final_equity'])
+    assert vector_results['portfolio'].get_positions() == event_results['portfolio'].get_positions()
+
+    # Engine state after the run matches the event-driven engine too
+    pd.testing.assert_series_equal(
+        vector_engine.get_results()['equity_curve'], vector_results['equity_curve']
+    )
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(vector_engine.equity_curve), pd.DataFrame(event_engine.equity_curve)
+    )
+
+
+@pytest.mark.parametrize('recording', ['full', 'equity_only', 'none'])
+def test_vectorized_recording_levels(sample_data, recording):
+    """Test run_vectorized records the same bars as run() at every recording level"""
+    path, class_name, params = LIBRARY_STRATEGIES[0]
+
+    event_engine = BacktestEngine(recording=recording)
+    event_results = event_engine.run(load_library_strategy(path, class_name, params), sample_data, symbol='TEST')
+    vector_engine = BacktestEngine(recording=recording)
+    vector_engine.run_vectorized(
+        load_library_strategy(path, class_name, params).target_positions(sample_data), sample_data, symbol='TEST'
+    )
+
+    vector_results = vector_engine.get_results()
+    pd.testing.assert_series_equal(vector_results['equity_curve'], event_results['equity_curve'])
+    pd.testing.assert_frame_equal(vector_results['positions_history'], event_results['positions_history'])
+    assert len(vector_engine.equity_curve) == len(event_engine.equity_curve)
+
+
+def test_vectorized_entries_exits(sample_data):
+    """Test run_vectorized with entry/exit arrays and a date range"""
+    close = sample_data['Close']
+    entries = close > close.rolling(20).mean()
+    exits = close < close.rolling(20).mean()
+
+    engine = BacktestEngine()
+    results = engine.run_vectorized(entries, sample_data, exits=exits, size=10, start='2020-03-01')
+
+    assert results['equity_curve'].index[0] >= pd.Timestamp('2020-03-01')
+    assert set(results['trades']['quantity']) == {10}
+    assert results['equity_curve'].iloc[0] == engine.initial_capital
+
+
+def test_vectorized_length_mismatch(sample_data):
+    """Test run_vectorized rejects misaligned arrays"""
+    engine = BacktestEngine()
+    with pytest.raises(ValueError):
+        engine.run_vectorized(np.zeros(10), sample_data)
+
+
+def test_bar_feed_dict_compatibility(sample_data):
+    """Test that bars from the feed behave like the old row dicts"""
+    from quantlib.backtesting.feed import BarFeed
+
+    feed = BarFeed(sample_data)
+    rows = list(sample_data.iterrows())
+
+    for (timestamp, bar), (expected_ts, expected_row) in zip(feed, rows[:5]):
+        assert timestamp == expected_ts
+        assert bar['Close'] == expected_row['Close']
+        assert bar.get('High') == expected_row['High']
+        assert bar.get('Missing', 0) == 0
+        assert 'Volume' in bar
+        assert bar.to_dict() == expected_row.to_dict()
+
+    assert len(feed) == len(sample_data)
+
+
+class EachSymbolStrategy:
+    """Buys every symbol it sees on a fixed bar and sells it later"""
+
+    def __init__(self, buy_bar=5, sell_bar=50, quantity=10):
+        self.buy_bar = buy_bar
+        self.sell_bar = sell_bar
+        self.quantity = quantity
+        self.counts = {}
+
+    def on_data(self, context, data):
+        bars = data if isinstance(data, dict) else {context.symbol: data}
+        for symbol in bars:
+            count = self.counts.get(symbol, 0) + 1
+            self.counts[symbol] = count
+            if count == self.buy_bar:
+                context.place_order(symbol, self.quantity, 'BUY')
+            elif count == self.sell_bar:
+                context.place_order(symbol, self.quantity, 'SELL')
+
+
+@pytest.fixture
+def multi_data(sample_data):
+    """Three symbols on partially overlapping calendars"""
+    return {
+        'AAA': sample_data,
+        'BBB': sample_data.iloc[100:300] * 0.5,
+        'CCC': sample_data.iloc[::2] * 2.0,
+    }
+
+
+def test_multi_asset_single_symbol_parity(sample_data):
+    """Test a one-symbol dict reproduces the single-symbol run"""
+    single = BacktestEngine().run(EachSymbolStrategy(), sample_data, symbol='TEST')
+    multi = BacktestEngine().run(EachSymbolStrategy(), {'TEST': sample_data})
+
+    pd.testing.assert_series_equal(multi['equity_curve'], single['equity_curve'])
+    pd.testing.assert_frame_equal(multi['trades'], single['trades'])
+
+
+def test_multi_asset_merged_index(multi_data):
+    """Test symbols are merged on the union calendar and marked to market"""
+    engine = BacktestEngine(commission=0.0)
+    strategy = EachSymbolStrategy(sell_bar=10_000)
+    results = engine.run(strategy, multi_data)
+
+    equity = results['equity_curve']
+    assert len(equity) == len(multi_data['AAA'])
+    assert strategy.counts == {'AAA': 500, 'BBB': 200, 'CCC': 250}
+    assert set(results['trades']['symbol']) == {'AAA', 'BBB', 'CCC'}
+
+    # Final equity marks every position at its latest close
+    positions = results['portfolio'].get_positions()
+    last_close = {symbol: df['Close'].iloc[-1] for symbol, df in multi_data.items()}
+    expected = results['portfolio'].get_cash() + sum(
+        quantity * last_close[symbol] for symbol, quantity in positions.items()
+    )
+    assert equity.iloc[-1] == pytest.approx(expected)
+
+
+@pytest.mark.skipif(not hasattr(pd.DatetimeIndex, 'as_unit'), reason="Index units need pandas >= 2.0")
+def test_multi_asset_mixed_index_units(sample_data):
+    """Test indexes stored in different units merge in time order"""
+    from quantlib.backtesting.feed import MultiBarFeed
+
+    a = sample_data.iloc[:5].copy()
+    a.index = a.index.as_unit('ns')
+    b = sample_data.iloc[1:6].copy()
+    b.index = b.index.as_unit('s')
+    feed = MultiBarFeed({'A': a, 'B': b})
+
+    steps = [(timestamp, sorted(bars)) for timestamp, bars in feed]
+    assert [timestamp for timestamp, _ in steps] == list(sample_data.index[:6])
+    assert steps[0][1] == ['A']
+    assert steps[1][1] == ['A', 'B']
+    assert steps[-1][1] == ['B']
+
+
+def test_multi_asset_panel_input(multi_data):
+    """Test long/panel frames are equivalent to a dict of frames"""
+    panel = pd.concat(multi_data, names=['symbol', 'timestamp'])
+
+    from_dict = BacktestEngine().run(EachSymbolStrategy(), multi_data)
+    from_panel = BacktestEngine().run(EachSymbolStrategy(), panel)
+
+    pd.testing.assert_series_equal(from_panel['equity_curve'], from_dict['equity_curve'])
+    pd.testing.assert_frame_equal(from_panel['trades'], from_dict['trades'])
+
+
+def test_compact_portfolio_parity(multi_data):
+    """Test the array-backed portfolio reproduces the dict-based one"""
+    from quantlib.portfolio import CompactPortfolio
+
+    strategy = EachSymbolStrategy(sell_bar=220)
+    expected = BacktestEngine().run(strategy, multi_data)
+    strategy = EachSymbolStrategy(sell_bar=220)
+    results = BacktestEngine(portfolio_class=CompactPortfolio).run(strategy, multi_data)
+
+    pd.testing.assert_series_equal(results['equity_curve'], expected['equity_curve'])
+    pd.testing.assert_frame_equal(results['positions_history'], expected['positions_history'])
+    portfolio, reference = results['portfolio'], expected['portfolio']
+    assert isinstance(portfolio, CompactPortfolio)
+    assert portfolio.get_positions() == reference.get_positions()
+    assert dict(portfolio.cost_basis) == pytest.approx(reference.cost_basis)
+    assert portfolio.get_realized_pnl() == pytest.approx(reference.get_realized_pnl())
+    prices = {symbol: df['Close'].iloc[-1] for symbol, df in multi_data.items()}
+    assert portfolio.get_total_equity(portfolio.price_vector(prices)) == pytest.approx(
+        reference.get_total_equity(prices)
+    )
+
+
+def test_multi_asset_pending_orders(multi_data):
+    """Test pending orders are checked for every symbol"""
+
+    class LimitStrategy:
+        def initialize(self, context):
+            for symbol, df in multi_data.items():
+                order = OrderEvent(
+                    context.current_time, symbol, 'LIMIT', 5, 'BUY',
+                    limit_price=float(df['Low'].min()) * 1.01
+                )
+                context.engine.order_manager.add_order(order)
+
+    from quantlib.backtesting import OrderEvent
+    results = BacktestEngine().run(LimitStrategy(), multi_data)
+
+    assert results['portfolio'].get_positions() == {'AAA': 5, 'BBB': 5, 'CCC': 5}
+
+
+def test_multi_asset_framework_cross_section(multi_data):
+    """Test framework models receive every symbol with a bar at each timestamp"""
+    from quantlib.algorithm import (
+        AlgorithmFramework, ManualUniverse, AlphaModel, EqualWeightingPortfolio
+    )
+
+    class RecordingAlpha(AlphaModel):
+        def __init__(self):
+            self.seen = []
+
+        def update(self, context, data):
+            self.seen.append(set(data))
+            for df in data.values():
+                assert len(df) == 1 and df.index[0] == context.current_time
+            return []
+
+    alpha = RecordingAlpha()
+    framework = AlgorithmFramework(
+        universe=ManualUniverse(['AAA', 'BBB', 'CCC']),
+        alpha=alpha,
+        portfolio=EqualWeightingPortfolio(),
+    )
+    BacktestEngine().run(framework, multi_data)
+
+    assert len(alpha.seen) == len(multi_data['AAA'])
+    assert {'AAA', 'BBB', 'CCC'} in alpha.seen
+    assert {'AAA'} in alpha.seen
+
+
+@pytest.mark.parametrize('recording', ['equity_only', 'none'])
+def test_recording_levels(sample_data, recording):
+    """Test reduced recording levels keep the metrics they promise"""
+    full = BacktestEngine().run(EachSymbolStrategy(), sample_data, symbol='TEST')
+    lean = BacktestEngine(recording=recording).run(EachSymbolStrategy(), sample_data, symbol='TEST')
+
+    assert lean['positions_history'].empty
+    assert lean['final_equity'] == full['final_equity']
+    assert lean['total_return'] == pytest.approx(full['total_return'])
+    if recording == 'equity_only':
+        pd.testing.assert_series_equal(lean['equity_curve'], full['equity_curve'])
+    else:
+        assert list(lean['equity_curve'].index) == [sample_data.index[0], sample_data.index[-1]]
+
+
+def test_recorder_positions_change_log():
+    """Test positions are stored only when they change"""
+    from quantlib.backtesting.recorder import EquityRecorder
+
+    recorder = EquityRecorder('full', capacity=2)
+    dates = pd.date_range('2020-01-01', periods=5, freq='D')
+    holdings = [{}, {'A': 10}, {'A': 10}, {'A': 10, 'B': 5}, {'B': 5}]
+    for i, (timestamp, positions) in enumerate(zip(dates, holdings)):
+        recorder.record(timestamp, 100.0 + i, 50.0, positions)
+
+    assert len(recorder) == 5
+    assert len(recorder._change_positions) == 4
+    history = recorder.positions_history()
+    assert history['positions'].tolist() == holdings
+    assert recorder.positions_at(2) == {'A': 10}
+    np.testing.assert_array_equal(recorder.equity, [100.0, 101.0, 102.0, 103.0, 104.0])
+
+
+def test_engine_equity_curve_attribute(sample_data):
+    """Test engine.equity_curve still lists the recorded bars"""
+    engine = BacktestEngine()
+    results = engine.run(EachSymbolStrategy(), sample_data, symbol='TEST')
+
+    curve = engine.equity_curve
+    assert len(curve) == len(sample_data)
+    assert [row['equity'] for row in curve] == results['equity_curve'].tolist()
+    assert curve[10]['positions'] == {'TEST': 10}
+    with pytest.raises(AttributeError):
+        engine.equity_curve = []
+
+def test_invalid_recording_level():
+    """Test unknown recording levels are rejected"""
+    with pytest.raises(ValueError):
+        BacktestEngine(recording='everything')
+
+
+def test_order_book_checks_only_triggered_orders(sample_data):
+    """Test the price-indexed order book fills exactly the orders a full scan would"""
+    from quantlib.backtesting import OrderEvent, OrderManager, OrderStatus, TimeInForce
+
+    rng = np.random.default_rng(0)
+    manager = OrderManager()
+    orders = []
+    start = sample_data.index[0]
+    for i, price in enumerate(rng.uniform(60, 140, 400)):
+        order_type = ['LIMIT', 'STOP', 'STOP_LIMIT', 'TRAILING_STOP'][i % 4]
+        kwargs = {
+            'LIMIT': {'limit_price': price},
+            'STOP': {'stop_price': price},
+            'STOP_LIMIT': {'stop_price': price, 'limit_price': price * 1.01},
+            'TRAILING_STOP': {'trailing_percent': 0.05},
+        }[order_type]
+        tif = TimeInForce.DAY if i % 7 == 0 else TimeInForce.GTC
+        order = OrderEvent(start, 'SPY', order_type, 1, ['BUY', 'SELL'][i % 2],
+                           time_in_force=tif, order_id=f'o{i}', **kwargs)
+        manager.add_order(order)
+        orders.append(order)
+
+    assert manager.cancel_order('o3')
+    assert not manager.cancel_order('o3')
+
+    for timestamp, bar in sample_data.iloc[:100].iterrows():
+        pending = manager.get_pending_orders('SPY')
+        expired = {id(o) for o in pending if o.time_in_force == TimeInForce.DAY and o.timestamp.date() != timestamp.date()}
+        expected = [
+            manager._check_order_execution(o, bar['High'], bar['Low'], bar['Close'], timestamp)
+            for o in pending if id(o) not in expired
+        ]
+        expected = [(f.direction, f.price) for f in expected if f is not None]
+        fills = manager.check_orders('spy', bar['High'], bar['Low'], bar['Close'], timestamp)
+        assert [(f.direction, f.price) for f in fills] == expected
+
+    statuses = [order.status for order in orders]
+    assert statuses[3] == OrderStatus.CANCELLED
+    assert statuses[7] == OrderStatus.CANCELLED  # DAY order expired
+    assert OrderStatus.FILLED in statuses
+    assert len(manager.get_pending_orders()) == statuses.count(OrderStatus.PENDING)
+
+
+def test_limit_order_fills_once():
+    """Test a resting limit order fills once, not on every bar that reaches its price"""
+    from quantlib.backtesting import OrderEvent, OrderManager, OrderStatus
+
+    manager = OrderManager()
+    start = pd.Timestamp('2020-01-02')
+    order = OrderEvent(start, 'SPY', 'LIMIT', 10, 'BUY', limit_price=99.0)
+    manager.add_order(order)
+
+    fills = []
+    for i in range(4):
+        fills += manager.check_orders('SPY', 101.0, 98.0, 100.0, start + pd.Timedelta(minutes=i))
+
+    assert [(f.quantity, f.price) for f in fills] == [(10, 99.0)]
+    assert order.status == OrderStatus.FILLED and order.filled_quantity == 10
+    assert manager.get_pending_orders('SPY') == []
+
+
+def test_compiled_schedule_matches_rules():
+    """Test compiled and live schedules fire exactly where the rules match"""
+    from datetime import time
+    from quantlib.backtesting import Scheduler, TimeRule
+
+    index = pd.date_range('2024-01-01 09:00', '2024-02-29 16:30', freq='15min')
+    index = index[(index.hour >= 9) & (index.hour <= 16)]
+    rules = [
+        (TimeRule.EVERY_HOUR, {}),
+        (TimeRule.EVERY_DAY, {'time_of_day': time(15, 45)}),
+        (TimeRule.EVERY_WEEK, {'day_of_week': 2, 'time_of_day': time(10, 0)}),
+        (TimeRule.EVERY_MONTH, {}),
+        (TimeRule.MARKET_OPEN, {}),
+    ]
+
+    class Context:
+        current_time = None
+
+    fired = {}
+    for compiled in (True, False):
+        scheduler = Scheduler()
+        log = fired[compiled] = []
+        for number, (rule, kwargs) in enumerate(rules):
+            scheduler.schedule(rule, lambda context, number=number, log=log: log.append((number, context.current_time)), **kwargs)
+        if compiled:
+            scheduler.compile(index)
+        context = Context()
+        for timestamp in index:
+            context.current_time = timestamp
+            scheduler.check_and_execute(context)
+
+    expected = [
+        (number, timestamp)
+        for timestamp in index
+        for number, event in enumerate(scheduler.events)
+        if event.should_execute(timestamp)
+    ]
+    assert fired[True] == expected
+    assert fired[False] == expected
+
+
+def test_engine_runs_scheduled_events(sample_data):
+    """Test events scheduled in initialize run on their bars during a backtest"""
+    from quantlib.backtesting import TimeRule
+
+    class MonthlyStrategy:
+        def initialize(self, context):
+            self.runs = []
+            context.engine.scheduler.schedule(
+                TimeRule.EVERY_MONTH, lambda ctx: self.runs.append(ctx.current_time), day_of_month=15
+            )
+
+        def on_data(self, context, bar):
+            pass
+
+    strategy = MonthlyStrategy()
+    BacktestEngine().run(strategy, sample_data)
+
+    assert strategy.runs == [t for t in sample_data.index if t.day == 15]
+
+
+def test_event_queue_matches_priority_order():
+    """Test events come out by timestamp, then insertion, even when put out of order"""
+    from itertools import count
+    from queue import PriorityQueue
+    from quantlib.backtesting import EventQueue, MarketEvent
+
+    rng = np.random.default_rng(0)
+    times = pd.date_range('2021-01-01', periods=20, freq='D')
+    queue, reference, counter = EventQueue(), PriorityQueue(), count()
+    popped, expected = [], []
+    for step, now in enumerate(times):
+        for _ in range(rng.integers(0, 4)):
+            # Mostly current-bar events, some late or early
+            event = MarketEvent(times[min(max(step + rng.integers(-3, 3), 0), 19)])
+            queue.put(event)
+            reference.put((event.timestamp, next(counter), event))
+        popped.extend(queue.due(now))
+        while not reference.empty() and reference.queue[0][0] <= now:
+            expected.append(reference.get()[2])
+
+    assert popped == expected
+    assert len(queue) == reference.qsize()
+
+
+def test_engine_drops_events_left_from_previous_run(sample_data):
+    """Test orders placed on a run's last bar do not fill in the next run"""
+    class BuyLastBar:
+        def __init__(self):
+            self.bars = 0
+
+        def on_data(self, context, bar):
+            self.bars += 1
+            if self.bars == len(sample_data):
+                context.place_order('TEST', 1, 'BUY')
+
+    engine = BacktestEngine()
+    engine.run(BuyLastBar(), sample_data, symbol='TEST')
+    results = engine.run(EachSymbolStrategy(buy_bar=10_000), sample_data, symbol='TEST')
+    assert results['trades'].empty
+
+def test_round_trips_fifo():
+    """Test fills are matched first-in first-out, including a position flip"""
+    from quantlib.backtesting import round_trips
+
+    times = pd.date_range('2021-01-01', periods=4, freq='D')
+    fills = pd.DataFrame({
+        'timestamp': times,
+        'symbol': ['SPY', 'spy', 'SPY', 'SPY'],
+        'quantity': [10, 10, 15, 10],
+        'direction': ['BUY', 'buy', 'SELL', 'SELL'],
+        'price': [100.0, 110.0, 120.0, 90.0],
+        'commission': [1.0, 1.0, 1.5, 1.0],
+    })
+    ledger = round_trips(fills)
+
+    assert ledger['side'].tolist() == ['LONG', 'LONG', 'LONG']
+    assert ledger['quantity'].tolist() == [10, 5, 5]
+    assert ledger['entry_price'].tolist() == [100.0, 110.0, 110.0]
+    assert ledger['exit_price'].tolist() == [120.0, 120.0, 90.0]
+    assert ledger['entry_time'].tolist() == [times[0], times[1], times[1]]
+    np.testing.assert_allclose(ledger['gross_pnl'], [200.0, 50.0, -100.0])
+    np.testing.assert_allclose(ledger['commission'], [2.0, 1.0, 1.0])
+    np.testing.assert_allclose(ledger['pnl'], [198.0, 49.0, -101.0])
+    assert ledger['mae'].isna().all()
+
+
+def test_engine_results_include_round_trips(sample_data):
+    """Test the engine's ledger closes every unit its fills opened"""
+    strategy = load_library_strategy(*LIBRARY_STRATEGIES[0])
+    results = BacktestEngine(commission=1.0).run(strategy, sample_data, symbol='SPY')
+    trades, ledger = results['trades'], results['round_trips']
+
+    assert not ledger.empty
+    signed = np.where(trades['direction'] == 'BUY', trades['quantity'], -trades['quantity'])
+    assert 2 * ledger['quantity'].sum() + abs(signed.sum()) == pytest.approx(trades['quantity'].sum())
+    assert (ledger['exit_time'] >= ledger['entry_time']).all()
+    assert (ledger['mfe'] >= ledger['mae']).all()
+
+
+def ma_crossover_factory(params):
+    """Module-level (picklable) strategy factory for walk-forward tests"""
+    return load_library_strategy('momentum/moving_average_crossover.py', 'MovingAverageCrossover', params)
+
+
+WALKFORWARD_RANGES = {
+    'short_window': {'min': 5, 'max': 10, 'step': 5, 'type': 'int'},
+    'long_window': {'min': 20, 'max': 30, 'step': 10, 'type': 'int'},
+}
+
+
+def assert_metrics_equal(actual, expected):
+    """Compare metric dicts, ignoring the randomized Monte Carlo VaR"""
+    assert actual.keys() == expected.keys()
+    for key in expected:
+        if key != 'var_monte_carlo_var':
+            np.testing.assert_equal(actual[key], expected[key])
+
+
+@pytest.mark.parametrize('anchor', [False, True])
+def test_walkforward_parallel_matches_serial(sample_data, anchor):
+    """Test n_jobs fan-out gives the same windows as the serial run"""
+    from quantlib.backtesting import WalkForwardAnalyzer
+
+    analyzer = WalkForwardAnalyzer(train_size=200, test_size=100, anchor=anchor)
+    serial = analyzer.run_analysis(ma_crossover_factory, sample_data, 'TEST', WALKFORWARD_RANGES)
+    parallel = analyzer.run_analysis(
+        ma_crossover_factory, sample_data, 'TEST', WALKFORWARD_RANGES, n_jobs=2
+    )
+
+    assert serial['total_windows'] == parallel['total_windows'] == 3
+    for s, p in zip(serial['windows'], parallel['windows']):
+        assert s['optimized_parameters'] == p['optimized_parameters']
+        assert_metrics_equal(p['train_metrics'], s['train_metrics'])
+        assert_metrics_equal(p['test_metrics'], s['test_metrics'])
+
+
+def test_walkforward_test_window_error(sample_data):
+    """Test a failing out-of-sample backtest raises its own error"""
+    from quantlib.backtesting import WalkForwardAnalyzer
+
+    class FailingTestWindows(WalkForwardAnalyzer):
+        def _run_backtest(self, strategy_factory, data, *args, **kwargs):
+            if len(data) == self.test_size:
+                raise RuntimeError("test window failed")
+            return super()._run_backtest(strategy_factory, data, *args, **kwargs)
+
+    analyzer = FailingTestWindows(train_size=200, test_size=100)
+    with pytest.raises(RuntimeError, match="test window failed"):
+        analyzer.run_analysis(ma_crossover_factory, sample_data, 'TEST', WALKFORWARD_RANGES)
+
+
+def test_walkforward_anchored_windows(sample_data):
+    """Test anchored training windows expand from the start and reuse train metrics"""
+    from quantlib.backtesting import WalkForwardAnalyzer
+
+    analyzer = WalkForwardAnalyzer(train_size=200, test_size=100, anchor=True)
+    results = analyzer.run_analysis(ma_crossover_factory, sample_data, 'TEST', WALKFORWARD_RANGES)
+
+    for window in results['windows']:
+        assert window['train_start_date'] == sample_data.index[0]
+        train_data = sample_data.loc[:window['train_end_date']]
+        expected = analyzer._run_backtest(
+            ma_crossover_factory, train_data, 'TEST', window['optimized_parameters'],
+            initial_capital=100000.0, commission=1.0, slippage=0.0,
+            commission_type='fixed', risk_free_rate=0.0,
+        )
+        assert_metrics_equal(window['train_metrics'], expected['metrics'])
@@ -0,0 +1,61 @@
+"""Tests for the DataStore frame cache"""
+
+import pandas as pd
+from quantlib.utils.frame_cache import FrameCache, CachedDataStore
+
+
+class RecordingStore:
+    """In-memory stand-in for DataStore that records its loads"""
+
+    data_source = 'yahoo'
+
+    def __init__(self):
+        dates = pd.date_range('2015-01-01', '2020-12-31', freq='B', name='Date')
+        self.data = pd.DataFrame({'Close': range(len(dates))}, index=dates, dtype=float)
+        self.loads = []
+
+    def load(self, symbol, start=None, end=None, interval='1d'):
+        self.loads.append((symbol, start, end))
+        return self.data.loc[start:end].copy()
+
+    def save(self, symbol, data, **kwargs):
+        pass
+
+
+def test_frame_cache_serves_sub_ranges():
+    """Test that loads inside a cached range are sliced from memory"""
+    store = RecordingStore()
+    cached_store = CachedDataStore(store, FrameCache())
+
+    cached_store.load('SPY', start='2016-01-01', end='2019-12-31')
+    result = cached_store.load('spy', start='2017-03-01', end='2017-06-30')
+    pd.testing.assert_frame_equal(result, store.data.loc['2017-03-01':'2017-06-30'])
+    assert len(store.loads) == 1
+
+    # A range outside the cached one loads the union
+    cached_store.load('SPY', start='2015-06-01', end='2016-06-30')
+    assert store.loads[-1] == ('SPY', '2015-06-01', '2019-12-31')
+
+    stats = cached_store.cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 2
+    assert stats['entries'] == 1
+
+    cached_store.save('SPY', result)
+    assert cached_store.cache.stats()['entries'] == 0
+
+
+def test_frame_cache_evicts_least_recently_used():
+    """Test that the cache stays within its memory bound"""
+    store = RecordingStore()
+    nbytes = store.data.memory_usage(index=True, deep=True).sum()
+    cache = FrameCache(max_bytes=int(nbytes * 2))
+    cached_store = CachedDataStore(store, cache)
+
+    for symbol in ['AAA', 'BBB', 'AAA', 'CCC']:
+        cached_store.load(symbol)
+
+    assert cache.cached_range('yahoo', 'AAA') is not None
+    assert cache.cached_range('yahoo', 'BBB') is None
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['bytes'] <= cache.max_bytes
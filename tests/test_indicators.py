@@ -3,7 +3,7 @@
 import pytest
 import pandas as pd
 import numpy as np
-from quantlib.indicators import sma, ema, rsi, bollinger_bands, atr
+from quantlib.indicators import sma, ema, rsi, bollinger_bands, atr, volume_profile
 
 
 @pytest.fixture
@@ -81,6 +81,83 @@ def test_atr():
         assert (valid > 0).all()
 
 
+def _reference_cci(high, low, close, window=20):
+    """Previous pandas cci (rolling apply with a Python lambda)"""
+    tp = (high + low + close) / 3
+    sma_tp = tp.rolling(window=window).mean()
+    mad = tp.rolling(window=window).apply(lambda x: np.mean(np.abs(x - x.mean())))
+    return (tp - sma_tp) / (0.015 * mad)
+
+
+def _reference_volume_profile(price, volume, bins=20):
+    """Previous per-bar volume_profile loop (starting from zeros, not NaN)"""
+    bin_edges = np.linspace(price.min(), price.max(), bins + 1)
+    bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
+    volume_by_price = pd.Series(0.0, index=bin_centers)
+    for i in range(len(price)):
+        bin_idx = np.digitize(price.iloc[i], bin_edges) - 1
+        bin_idx = max(0, min(bin_idx, len(bin_centers) - 1))
+        volume_by_price.iloc[bin_idx] += volume.iloc[i]
+    return pd.DataFrame({'price': bin_centers, 'volume': volume_by_price.values})
+
+
+def _reference_true_range(high, low, close):
+    tr1 = high - low
+    tr2 = abs(high - close.shift(1))
+    tr3 = abs(low - close.shift(1))
+    return pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+
+
+def _reference_atr(high, low, close, window=14):
+    """Previous pandas atr"""
+    return _reference_true_range(high, low, close).rolling(window=window).mean()
+
+
+def _reference_adx(high, low, close, window=14):
+    """Previous pandas adx"""
+    tr = _reference_true_range(high, low, close)
+    up_move = high - high.shift(1)
+    down_move = low.shift(1) - low
+    plus_dm = pd.Series(np.where((up_move > down_move) & (up_move > 0), up_move, 0), index=high.index)
+    minus_dm = pd.Series(np.where((down_move > up_move) & (down_move > 0), down_move, 0), index=high.index)
+    atr_values = tr.rolling(window=window).mean()
+    plus_di = 100 * (plus_dm.rolling(window=window).mean() / atr_values)
+    minus_di = 100 * (minus_dm.rolling(window=window).mean() / atr_values)
+    dx = 100 * abs(plus_di - minus_di) / (plus_di + minus_di)
+    return dx.rolling(window=window).mean()
+
+
+def test_numpy_kernels_match_pandas_versions():
+    """Test cci, volume_profile, atr and adx against the previous pandas implementations"""
+    from quantlib.indicators import cci, adx
+
+    rng = np.random.default_rng(0)
+    close = pd.Series(100 * np.exp(np.cumsum(rng.normal(0, 0.001, 2_000))),
+                      index=pd.date_range('2020-01-01', periods=2_000, freq='min'))
+    spread = np.abs(rng.normal(0, 0.002, 2_000)) * close
+    high, low = close + spread, close - spread
+    volume = pd.Series(rng.integers(100, 10_000, 2_000).astype(float), index=close.index)
+
+    for actual, expected in [
+        (cci(high, low, close), _reference_cci(high, low, close)),
+        (atr(high, low, close), _reference_atr(high, low, close)),
+        (adx(high, low, close), _reference_adx(high, low, close)),
+    ]:
+        pd.testing.assert_series_equal(actual, expected, check_exact=False, rtol=1e-9, check_names=False)
+    pd.testing.assert_frame_equal(volume_profile(close, volume), _reference_volume_profile(close, volume),
+                                  check_exact=False, rtol=1e-9)
+
+
+def test_volume_profile_totals():
+    """Test volume profile assigns every bar's volume to a bin"""
+    price = pd.Series([10.0, 11.0, np.nan, 12.0, 20.0])
+    volume = pd.Series([100.0, 200.0, 300.0, np.nan, 400.0])
+
+    profile = volume_profile(price, volume, bins=2)
+
+    assert profile['volume'].tolist() == [300.0, 400.0]
+
+
 def test_sma_window_validation():
     """Test SMA with invalid window"""
     prices = pd.Series([100, 101, 102, 103, 104])
@@ -90,3 +167,171 @@ def test_sma_window_validation():
     
     with pytest.raises(ValueError):
         sma(prices, window=-1)
+
+
+@pytest.fixture
+def ohlc():
+    """Create sample OHLC data with a flat stretch"""
+    rng = np.random.default_rng(7)
+    close = 4000 + np.cumsum(rng.normal(0, 1, 1000))
+    close[300:330] = close[300]
+    return pd.DataFrame({
+        'High': close + rng.random(1000),
+        'Low': close - rng.random(1000),
+        'Close': close,
+    })
+
+
+def _stream(indicator, *columns):
+    """Feed columns through a streaming indicator and collect its values"""
+    values = [indicator.update(*row) for row in zip(*columns)]
+    if isinstance(values[0], dict):
+        return pd.DataFrame(values)
+    return pd.Series(values, dtype=float)
+
+
+def test_streaming_single_input(ohlc):
+    """Test streaming SMA/EMA/RSI match the batch indicators"""
+    from quantlib.indicators import streaming
+
+    close = ohlc['Close']
+    pd.testing.assert_series_equal(_stream(streaming.SMA(20), close), sma(close, 20),
+                                   check_names=False, rtol=1e-10)
+    pd.testing.assert_series_equal(_stream(streaming.EMA(20), close), ema(close, 20),
+                                   check_names=False, rtol=1e-10)
+    pd.testing.assert_series_equal(_stream(streaming.RSI(14), close), rsi(close, 14),
+                                   check_names=False, rtol=1e-10)
+
+
+def test_streaming_multi_output(ohlc):
+    """Test streaming MACD/Bollinger/ATR/Stochastic match the batch indicators"""
+    from quantlib.indicators import streaming, macd, stochastic
+
+    high, low, close = ohlc['High'], ohlc['Low'], ohlc['Close']
+    pd.testing.assert_frame_equal(_stream(streaming.MACD(), close), macd(close), rtol=1e-10)
+    pd.testing.assert_frame_equal(_stream(streaming.BollingerBands(20, 2.0), close),
+                                  bollinger_bands(close, 20, 2.0), rtol=1e-10)
+    pd.testing.assert_series_equal(_stream(streaming.ATR(14), high, low, close),
+                                   atr(high, low, close, 14), check_names=False, rtol=1e-10)
+    pd.testing.assert_frame_equal(_stream(streaming.Stochastic(14, 3), high, low, close),
+                                  stochastic(high, low, close, 14, 3), rtol=1e-10)
+
+
+def test_streaming_ready_and_reset():
+    """Test warm-up, readiness and reset of streaming indicators"""
+    from quantlib.indicators import streaming
+    from quantlib.indicators.streaming import SMA, RingBuffer
+
+    indicator = SMA(3)
+    assert np.isnan(indicator.update(1.0)) and not indicator.ready
+    indicator.update(2.0)
+    assert indicator.update(3.0) == 2.0 and indicator.ready
+    assert indicator.update(7.0) == 4.0
+
+    indicator.reset()
+    assert indicator.count == 0 and not indicator.ready
+
+    # After reset every indicator reproduces a fresh instance
+    rng = np.random.default_rng(1)
+    close = 100 + np.cumsum(rng.normal(0, 1, 60))
+    bars = [(c + 1.0, c - 1.0, c) for c in close]
+    for make, args in [
+        (lambda: streaming.SMA(5), [(c,) for c in close]),
+        (lambda: streaming.EMA(5), [(c,) for c in close]),
+        (lambda: streaming.RSI(14), [(c,) for c in close]),
+        (lambda: streaming.MACD(), [(c,) for c in close]),
+        (lambda: streaming.BollingerBands(20, 2.0), [(c,) for c in close]),
+        (lambda: streaming.ATR(14), bars),
+        (lambda: streaming.Stochastic(14, 3), bars),
+    ]:
+        used = make()
+        for row in args[::-1]:
+            used.update(*row)
+        used.reset()
+        fresh = make()
+        for row in args:
+            assert repr(used.update(*row)) == repr(fresh.update(*row))
+
+    with pytest.raises(TypeError):
+        streaming.StreamingIndicator()
+
+    buffer = RingBuffer(3)
+    for value in range(5):
+        buffer.append(value)
+    assert buffer.values() == [2, 3, 4]
+
+    with pytest.raises(ValueError):
+        SMA(0)
+
+
+def test_indicator_set_matches_functions(ohlc):
+    """Test IndicatorSet results equal the standalone indicators and share nodes"""
+    from quantlib.indicators import IndicatorSet, macd, adx, keltner_channels
+
+    high, low, close = ohlc['High'], ohlc['Low'], ohlc['Close']
+    indicators = (IndicatorSet()
+                  .add('sma', window=20)
+                  .add('bollinger_bands', window=20)
+                  .add('macd')
+                  .add('atr', window=14)
+                  .add('adx', window=14)
+                  .add('keltner_channels', name='keltner', window=14, atr_mult=1.5))
+    results = indicators.compute(ohlc)
+
+    pd.testing.assert_series_equal(results['sma'], sma(close, 20))
+    pd.testing.assert_frame_equal(results['bollinger_bands'], bollinger_bands(close, 20))
+    pd.testing.assert_frame_equal(results['macd'], macd(close))
+    pd.testing.assert_series_equal(results['atr'], atr(high, low, close, 14))
+    pd.testing.assert_series_equal(results['adx'], adx(high, low, close, 14))
+    pd.testing.assert_frame_equal(results['keltner'], keltner_channels(high, low, close, 14, 1.5))
+
+    # One true range and one 14-bar mean of it serve ATR, ADX and Keltner
+    plan = indicators.plan()
+    assert sum(1 for node in plan if node[0] == 'true_range') == 1
+    assert sum(1 for node in plan if node[0] == 'rolling_mean' and node[1][0] == 'true_range') == 1
+    assert sum(1 for node in plan if node[0] == 'rolling_mean' and node[1] == ('column', 'Close')) == 1
+
+    with pytest.raises(ValueError):
+        IndicatorSet().add('obv').compute(ohlc)
+    with pytest.raises(ValueError):
+        IndicatorSet().add('sma', span=5)
+
+
+def test_batch_indicators_match_functions():
+    """Test batch indicators over symbols x windows match the single-series functions"""
+    from quantlib.indicators import (
+        batch_sma, batch_ema, batch_rsi, batch_roc, batch_bollinger_bands, batch_atr, roc
+    )
+
+    rng = np.random.default_rng(3)
+    close = pd.DataFrame(100 * np.exp(np.cumsum(rng.normal(0, 0.01, (400, 6)), axis=0)),
+                         columns=list('ABCDEF'))
+    close.iloc[:30, 1] = np.nan           # listed later
+    close.iloc[200:205, 2] = np.nan       # trading halt
+    close.iloc[100:140, 3] = close.iloc[100, 3]  # flat stretch
+    high, low = close * 1.01, close * 0.99
+    windows = [5, 14]
+
+    results = {
+        'sma': (batch_sma(close, windows), lambda s, w: sma(s, w)),
+        'ema': (batch_ema(close, windows), lambda s, w: ema(s, w)),
+        'rsi': (batch_rsi(close, windows), lambda s, w: rsi(s, w)),
+        'roc': (batch_roc(close, windows), lambda s, w: roc(s, w)),
+        'atr': (batch_atr(high, low, close, windows),
+                lambda s, w: atr(high[s.name], low[s.name], s, w)),
+    }
+    for name, (batch, single) in results.items():
+        assert batch.columns.names == ['window', None]
+        for window in windows:
+            for symbol in close.columns:
+                pd.testing.assert_series_equal(batch[(window, symbol)], single(close[symbol], window),
+                                               check_names=False, rtol=1e-9)
+
+    bands = batch_bollinger_bands(close['A'], 20)
+    expected = bollinger_bands(close['A'], 20)
+    for band in ('upper', 'middle', 'lower'):
+        pd.testing.assert_series_equal(bands[band], expected[band], check_names=False, rtol=1e-9)
+
+    assert batch_sma(close.to_numpy(), windows).shape == (2, 400, 6)
+    with pytest.raises(ValueError):
+        batch_sma(close, [5, 0])
@@ -1,5 +1,6 @@
 """Tests for risk metrics"""
 
+import math
 import pytest
 import pandas as pd
 import numpy as np
@@ -19,7 +20,11 @@ from quantlib.risk import (
     win_rate,
     profit_factor,
     average_win_loss,
+    cvar,
+    parametric_var,
+    ReturnStats,
     RiskCalculator,
+    StreamingRiskTracker,
 )
 
 
@@ -209,6 +214,27 @@ def test_average_win_loss():
     assert stats['win_loss_ratio'] > 0
 
 
+def test_return_stats_fast_path(sample_returns):
+    """Test metrics computed from ReturnStats match the Series versions"""
+    stats = ReturnStats(sample_returns)
+
+    assert sharpe_ratio(sample_returns, 0.02, return_stats=stats) == pytest.approx(sharpe_ratio(sample_returns, 0.02))
+    assert sortino_ratio(sample_returns, return_stats=stats) == pytest.approx(sortino_ratio(sample_returns))
+    assert annualized_volatility(sample_returns, return_stats=stats) == pytest.approx(annualized_volatility(sample_returns))
+    assert omega_ratio(sample_returns, return_stats=stats) == pytest.approx(omega_ratio(sample_returns))
+    assert skewness(sample_returns, stats) == pytest.approx(skewness(sample_returns))
+    assert kurtosis(sample_returns, stats) == pytest.approx(kurtosis(sample_returns))
+    assert parametric_var(sample_returns, return_stats=stats) == pytest.approx(parametric_var(sample_returns))
+    assert cvar(sample_returns, 0.9, stats) == pytest.approx(cvar(sample_returns, 0.9))
+    # Percentiles are read from the sorted returns with NumPy's interpolation
+    assert tail_ratio(sample_returns, return_stats=stats) == tail_ratio(sample_returns)
+    assert historical_var(sample_returns, 0.99, stats) == historical_var(sample_returns, 0.99)
+
+    # NaN is skipped like the pandas reductions
+    with_nan = pd.concat([sample_returns, pd.Series([np.nan])])
+    assert ReturnStats(with_nan).std == pytest.approx(with_nan.std())
+
+
 def test_risk_calculator_basic(sample_returns, sample_equity):
     """Test RiskCalculator basic functionality"""
     calculator = RiskCalculator(
@@ -287,6 +313,87 @@ def test_risk_calculator_flat_metrics(sample_returns, sample_equity):
     assert 'var_historical_var' in flat_metrics
 
 
+def test_risk_calculator_compute_selected(sample_returns, sample_equity):
+    """Test RiskCalculator.compute evaluates only the requested metrics"""
+    calculator = RiskCalculator(
+        returns=sample_returns,
+        equity_curve=sample_equity,
+        var_random_seed=42,
+    )
+
+    selected = calculator.compute(['sharpe_ratio', 'max_drawdown_pct', 'var_cvar'])
+
+    # Requested names are kept; unprefixed names resolve to their category
+    assert list(selected) == ['sharpe_ratio', 'max_drawdown_pct', 'var_cvar']
+    assert 'metric:sortino_ratio' not in calculator._memo
+    assert 'metric:var_monte_carlo_var' not in calculator._memo
+
+    flat_metrics = RiskCalculator(
+        returns=sample_returns,
+        equity_curve=sample_equity,
+        var_random_seed=42,
+    ).get_flat_metrics()
+    assert selected['sharpe_ratio'] == flat_metrics['sharpe_ratio']
+    assert selected['max_drawdown_pct'] == flat_metrics['drawdown_max_drawdown_pct']
+    assert selected['var_cvar'] == flat_metrics['var_cvar']
+
+    # Metrics without their inputs are left out
+    assert RiskCalculator(returns=sample_returns).compute(['calmar_ratio']) == {}
+
+    with pytest.raises(ValueError):
+        calculator.compute(['not_a_metric'])
+
+
+def test_streaming_risk_tracker_matches_batch(sample_equity):
+    """Test StreamingRiskTracker agrees with the batch metrics after every window shift"""
+    tracker = StreamingRiskTracker(window=50)
+    for equity in sample_equity:
+        tracker.update(equity)
+
+    returns = sample_equity.pct_change().dropna().iloc[-50:]
+    metrics = tracker.get_metrics()
+    assert metrics['sharpe_ratio'] == pytest.approx(sharpe_ratio(returns))
+    assert metrics['annualized_volatility'] == pytest.approx(annualized_volatility(returns))
+    assert metrics['var_historical_var'] == pytest.approx(historical_var(returns))
+    assert metrics['drawdown_max_drawdown'] == pytest.approx(max_drawdown(sample_equity))
+    assert metrics['drawdown_max_drawdown_pct'] == pytest.approx(max_drawdown_pct(sample_equity))
+    assert metrics['drawdown_average_drawdown_duration'] == pytest.approx(
+        average_drawdown_duration(sample_equity)
+    )
+    assert metrics['num_observations'] == len(sample_equity)
+
+    with pytest.raises(ValueError):
+        StreamingRiskTracker(window=1)
+
+
+def test_streaming_risk_tracker_flat_metrics(sample_equity):
+    """Test the full metric set is available and the window stats resync without drift"""
+    tracker = StreamingRiskTracker(window=50)
+    for equity in sample_equity:
+        tracker.update(equity)
+
+    batch = RiskCalculator(
+        returns=sample_equity.pct_change().dropna(), equity_curve=sample_equity
+    ).get_flat_metrics()
+    flat = tracker.get_flat_metrics()
+    assert set(batch) <= set(flat)
+
+    window_returns = sample_equity.pct_change().dropna().iloc[-50:]
+    assert flat['sortino_ratio'] == pytest.approx(
+        RiskCalculator(returns=window_returns).get_flat_metrics()['sortino_ratio']
+    )
+
+    # Each time the window turns over, the running stats are recomputed exactly
+    resyncs = 0
+    for equity in np.tile(sample_equity.to_numpy(), 3):
+        tracker.update(equity)
+        if tracker._evictions == 0:
+            resyncs += 1
+            window = list(tracker._returns)
+            assert tracker._mean == math.fsum(window) / len(window)
+    assert resyncs > 0
+
+
 def test_risk_calculator_empty_returns():
     """Test RiskCalculator with empty returns raises error"""
     empty_returns = pd.Series(dtype=float)
@@ -304,3 +411,117 @@ def test_historical_var_invalid_confidence():
     
     with pytest.raises(ValueError):
         historical_var(returns, confidence_level=-0.1)
+
+
+def test_monte_carlo_simulation_bands(sample_returns):
+    """Test Monte Carlo returns percentile bands and opt-in float32 paths"""
+    from quantlib.risk import monte_carlo_simulation
+
+    result = monte_carlo_simulation(sample_returns, n_simulations=500, random_seed=7)
+    assert 'simulations' not in result
+    bands = result['bands']
+    assert bands['periods'][-1] == len(sample_returns) - 1
+    assert np.all(bands['p5'] <= bands['p50']) and np.all(bands['p50'] <= bands['p95'])
+    assert bands['p50'][-1] == pytest.approx(result['percentiles']['p50'])
+
+    with_paths = monte_carlo_simulation(
+        sample_returns, n_simulations=500, random_seed=7, return_paths=True
+    )
+    assert with_paths['simulations'].dtype == np.float32
+    assert with_paths['simulations'].shape == (500, len(sample_returns))
+    np.testing.assert_allclose(with_paths['simulations'][:, -1], result['final_values'], rtol=1e-6)
+
+
+def test_monte_carlo_reproducible_across_jobs(sample_equity):
+    """Test a seed gives the same results serially and in a process pool"""
+    from quantlib.risk import monte_carlo_metrics
+
+    serial = monte_carlo_metrics(sample_equity, n_simulations=400, random_seed=3, chunk_size=100)
+    parallel = monte_carlo_metrics(
+        sample_equity, n_simulations=400, random_seed=3, chunk_size=100, n_jobs=2
+    )
+    assert serial == parallel
+    assert serial['max_drawdown']['p95'] <= 0
+
+
+def test_block_bootstrap_indices():
+    """Test block bootstrap draws runs of consecutive (wrapping) observations"""
+    from quantlib.risk.monte_carlo import bootstrap_indices
+
+    indices = bootstrap_indices(np.random.default_rng(0), n_obs=10, n_paths=4, n_periods=12, block_size=4)
+    assert indices.shape == (4, 12)
+    blocks = indices.reshape(4, 3, 4)
+    np.testing.assert_array_equal(np.diff(blocks, axis=2) % 10, 1)
+
+
+def test_drawdown_durations_and_recovery():
+    """Test run-length drawdown durations and recovery times on a known curve"""
+    from quantlib.risk import drawdown_duration, drawdown_recovery_time
+
+    equity = pd.Series([100, 90, 80, 95, 100, 105, 100, 110, 108],
+                       index=pd.date_range('2020-01-01', periods=9, freq='D'))
+    assert drawdown_duration(equity).tolist() == [0, 1, 2, 3, 0, 0, 1, 0, 1]
+    assert drawdown_recovery_time(equity).tolist() == [0, 3, 2, 1, 0, 0, 1, 0, 0]
+    assert average_drawdown_duration(equity) == pytest.approx(5 / 3)
+
+
+def test_drawdown_table():
+    """Test drawdown episodes with start, trough, recovery, depth and duration"""
+    from quantlib.risk import drawdown_table
+
+    dates = pd.date_range('2020-01-01', periods=9, freq='D')
+    equity = pd.Series([100, 90, 80, 95, 100, 105, 100, 110, 108], index=dates)
+    table = drawdown_table(equity)
+
+    assert table['start'].tolist() == [dates[1], dates[6], dates[8]]
+    assert table['trough'].tolist() == [dates[2], dates[6], dates[8]]
+    assert table['recovery'].iloc[0] == dates[4]
+    assert pd.isna(table['recovery'].iloc[2])
+    assert table['depth'].tolist() == [-20.0, -5.0, -2.0]
+    assert table['duration'].tolist() == [3, 1, 1]
+    assert table['depth'].min() == max_drawdown(equity)
+
+    assert drawdown_table(pd.Series([1.0, 2.0, 3.0])).empty
+
+
+def test_batch_risk_calculator_matches_single():
+    """Test the batched calculator reproduces get_flat_metrics for every run"""
+    from quantlib.risk import BatchRiskCalculator
+
+    rng = np.random.default_rng(1)
+    returns = rng.normal(0.0005, 0.01, (300, 6))
+    returns[:, 2] = 0.0  # flat run: zero volatility edge cases
+    equity = 100000 * np.vstack([np.ones(6), np.cumprod(1 + returns, axis=0)])
+    dates = pd.date_range('2020-01-01', periods=301, freq='D')
+
+    batch = RiskCalculator.from_matrix(
+        returns, equity[1:], risk_free_rate=0.02, var_random_seed=11
+    )
+    assert isinstance(batch, BatchRiskCalculator)
+    table = BatchRiskCalculator.from_equity(
+        pd.DataFrame(equity, index=dates, columns=list('abcdef')),
+        risk_free_rate=0.02, var_random_seed=11
+    ).get_flat_metrics()
+    assert list(table.index) == list('abcdef')
+
+    for j, name in enumerate(table.index):
+        curve = pd.Series(equity[:, j], index=dates)
+        expected = RiskCalculator(
+            curve.pct_change().dropna(), curve, risk_free_rate=0.02, var_random_seed=11
+        ).get_flat_metrics()
+        assert list(expected) == list(table.columns)
+        np.testing.assert_allclose(
+            table.loc[name].to_numpy(dtype=float),
+            np.array(list(expected.values()), dtype=float),
+            rtol=1e-9, atol=1e-12
+        )
+
+
+def test_batch_risk_calculator_rejects_nan():
+    """Test ragged (NaN-padded) matrices are rejected"""
+    from quantlib.risk import BatchRiskCalculator
+
+    returns = np.full((10, 2), 0.01)
+    returns[3, 1] = np.nan
+    with pytest.raises(ValueError):
+        BatchRiskCalculator(returns)
@@ -0,0 +1,96 @@
+"""Tests for workflow utilities"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+import pandas as pd
+import numpy as np
+from quantlib.workflows import ParallelExecutor, get_shared_data
+from quantlib.workflows.shared_data import SharedFrame, attach_frame
+
+
+def _attach(handle):
+    """Worker helper: rebuild a shared frame and report a checksum"""
+    df = attach_frame(handle)
+    return df, float(df['Close'].sum())
+
+
+def _shared_close_sum(task):
+    """Worker helper: read the registered frame"""
+    df = get_shared_data('ohlcv')
+    return {'value': float(df['Close'].sum()) * task['scale'],
+            'writeable': df['Close'].to_numpy().flags.writeable}
+
+
+def _crash_or_echo(task):
+    """Worker helper: kill the worker process when asked to"""
+    if task.get('crash'):
+        os._exit(1)
+    return {'value': task['value']}
+
+
+@pytest.fixture
+def ohlcv():
+    """Create sample OHLCV data with a non-numeric column"""
+    rng = np.random.default_rng(0)
+    dates = pd.date_range('2020-01-01', periods=250, freq='D', tz='US/Eastern', name='Date')
+    close = 100 + np.cumsum(rng.normal(0, 1, 250))
+    return pd.DataFrame({
+        'Open': close,
+        'High': close + 1,
+        'Low': close - 1,
+        'Close': close,
+        'Volume': rng.integers(1_000, 10_000, 250),
+        'Symbol': 'TEST',
+    }, index=dates)
+
+
+def test_shared_frame_round_trip(ohlcv):
+    """Test a frame published in shared memory is rebuilt exactly in a worker"""
+    with SharedFrame(ohlcv) as shared:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            df, checksum = pool.submit(_attach, shared.handle).result()
+
+    pd.testing.assert_frame_equal(df, ohlcv, check_freq=False)
+    assert checksum == pytest.approx(ohlcv['Close'].sum())
+
+
+def test_shared_frame_cached_per_process(ohlcv):
+    """Test repeated attaches reuse the same frame"""
+    with SharedFrame(ohlcv) as shared:
+        first = attach_frame(shared.handle)
+        second = attach_frame(shared.handle)
+    assert first is second
+
+
+def test_shared_frame_requires_numeric_index():
+    """Test frames with a string index are rejected"""
+    df = pd.DataFrame({'Close': [1.0, 2.0]}, index=['a', 'b'])
+    with pytest.raises(ValueError):
+        SharedFrame(df)
+
+
+def test_parallel_executor_shared_data(ohlcv):
+    """Test registered data reaches workers read-only and the pool persists"""
+    with ParallelExecutor(n_workers=1) as executor:
+        executor.register_data('ohlcv', ohlcv)
+        first = executor.execute_batch([{'scale': 1}, {'scale': 2}], _shared_close_sum)
+        pool = executor._executor
+        second = executor.execute_batch([{'scale': 3}], _shared_close_sum)
+        assert executor._executor is pool
+
+    total = ohlcv['Close'].sum()
+    assert [r['value'] for r in first + second] == pytest.approx([total, 2 * total, 3 * total])
+    assert not any(r['writeable'] for r in first + second)
+    assert executor._executor is None
+
+
+def test_parallel_executor_restarts_broken_pool():
+    """Test a crashed worker fails its batch and the next batch gets a fresh pool"""
+    with ParallelExecutor(n_workers=1) as executor:
+        failed = executor.execute_batch([{'crash': True}, {'value': 1}], _crash_or_echo)
+        assert all('error' in r for r in failed)
+        assert executor._executor is None
+
+        assert executor.execute_batch([{'value': 2}], _crash_or_echo) == [{'value': 2}]